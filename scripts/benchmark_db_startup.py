@@ -0,0 +1,50 @@
+"""database startup benchmark."""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+STARTUP = "from devildex.database import db_manager; db_manager.init_db()"
+STARTUP_WITH_ALEMBIC = f"{STARTUP}; db_manager.DatabaseManager._run_migrations()"
+
+
+def _time_startup(code: str, runs: int) -> float:
+    """Return the median seconds a fresh interpreter takes to run code."""
+    env = {key: value for key, value in os.environ.items() if key != "DEVILDEX_TESTING"}
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Compare cold database startup with and without running Alembic.
+
+    Both runs use the application's database, which is first brought up to
+    the head revision, as any start of the application would do.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per variant.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    _time_startup(STARTUP_WITH_ALEMBIC, 1)
+    with_alembic = _time_startup(STARTUP_WITH_ALEMBIC, args.runs)
+    current_schema = _time_startup(STARTUP, args.runs)
+    logger.info(f"Startup running Alembic:      {with_alembic * 1000:.0f} ms")
+    logger.info(f"Startup with current schema:  {current_schema * 1000:.0f} ms")
+    logger.info(
+        f"Saved per start:              {(with_alembic - current_schema) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -50,9 +50,6 @@ class RecipeImporter:
         package_name: str,
         builder_type: str,
         requirements: list[str],
-        version_range: str | None = None,
-        source_url: str | None = None,
-        notes: str | None = None,
     ) -> bool:
         """Save or updates ProjectDocRequirements in the database."""
         # Ensure PackageInfo exists
@@ -73,9 +70,6 @@ class RecipeImporter:
         )
         if doc_req:
             doc_req.requirements = requirements
-            doc_req.version_range = version_range
-            doc_req.source_url = source_url
-            doc_req.notes = notes
             logger.info(
                 f"Updated ProjectDocRequirements for {package_name} ({builder_type})"
             )
@@ -84,25 +78,22 @@ class RecipeImporter:
                 package_name=package_name,
                 builder_type=builder_type,
                 requirements=requirements,
-                version_range=version_range,
-                source_url=source_url,
-                notes=notes,
             )
             self.db_session.add(doc_req)
             logger.info(
                 f"Added new ProjectDocRequirements for {package_name} ({builder_type})"
             )
-            try:
-                self.db_session.commit()
-            except Exception:
-                self.db_session.rollback()
-                logger.exception(
-                    f"Error saving ProjectDocRequirements for {package_name}"
-                    f" ({builder_type})"
-                )
-                return False
-            else:
-                return True
+        try:
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            logger.exception(
+                f"Error saving ProjectDocRequirements for {package_name}"
+                f" ({builder_type})"
+            )
+            return False
+        else:
+            return True
 
     def import_recipes(self, source: str | Path) -> bool:
         """Import documentation recipes from a local file path or a URL.
@@ -131,9 +122,6 @@ class RecipeImporter:
             package_name = recipe.get("package_name")
             builder_type = recipe.get("builder_type")
             requirements = recipe.get("requirements")
-            version_range = recipe.get("version_range")
-            source_url = recipe.get("source_url")
-            notes = recipe.get("notes")
             if not all([package_name, builder_type, requirements]):
                 logger.warning(f"Skipping malformed recipe: {recipe}")
                 continue
@@ -141,9 +129,6 @@ class RecipeImporter:
                 package_name=package_name,
                 builder_type=builder_type,
                 requirements=requirements,
-                version_range=version_range,
-                source_url=source_url,
-                notes=notes,
             ):
                 success_count += 1
             else:
@@ -179,17 +164,17 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
     init_db(database_url=args.db_url)
-    db_manager = DatabaseManager(database_url=args.db_url)
-    importer = RecipeImporter(db_session=db_manager.get_session())
     source_path_or_url: str | Path
     if Path(args.source).exists():
         source_path_or_url = Path(args.source)
     else:
         source_path_or_url = args.source
-    if importer.import_recipes(source_path_or_url):
-        logger.info("Recipe import process completed successfully.")
-    else:
-        logger.error("Recipe import process failed.")
+    with DatabaseManager.get_session() as session:
+        importer = RecipeImporter(db_session=session)
+        if importer.import_recipes(source_path_or_url):
+            logger.info("Recipe import process completed successfully.")
+        else:
+            logger.error("Recipe import process failed.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+"""Add generation_failure table.
+
+Revision ID: c4a9f1d07b52
+Revises: b7e2d41c9a35
+Create Date: 2026-10-18 14:03:27.604118
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9f1d07b52"
+down_revision: Union[str, Sequence[str], None] = "b7e2d41c9a35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The initial revision creates tables from the current models, so a fresh
+    # database may already have the table.
+    if sa.inspect(op.get_bind()).has_table("generation_failure"):
+        return
+    op.create_table(
+        "generation_failure",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("package_name", sa.String(), nullable=False),
+        sa.Column("package_version", sa.String(), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("error_class", sa.String(), nullable=False),
+        sa.Column("failure_count", sa.Integer(), nullable=False),
+        sa.Column("last_failure_utc", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("retry_after_utc", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "package_name",
+            "package_version",
+            "stage",
+            name="uq_generation_failure_package_version_stage",
+        ),
+    )
+    op.create_index(
+        op.f("ix_generation_failure_id"), "generation_failure", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_generation_failure_package_name"),
+        "generation_failure",
+        ["package_name"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_generation_failure_retry_after_utc"),
+        "generation_failure",
+        ["retry_after_utc"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_generation_failure_retry_after_utc"), table_name="generation_failure"
+    )
+    op.drop_index(
+        op.f("ix_generation_failure_package_name"), table_name="generation_failure"
+    )
+    op.drop_index(op.f("ix_generation_failure_id"), table_name="generation_failure")
+    op.drop_table("generation_failure")
@@ -0,0 +1,70 @@
+"""Add generation_checkpoint table.
+
+Revision ID: d81e6b3f0a27
+Revises: c4a9f1d07b52
+Create Date: 2026-10-18 16:41:09.382715
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d81e6b3f0a27"
+down_revision: Union[str, Sequence[str], None] = "c4a9f1d07b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The initial revision creates tables from the current models, so a fresh
+    # database may already have the table.
+    if sa.inspect(op.get_bind()).has_table("generation_checkpoint"):
+        return
+    op.create_table(
+        "generation_checkpoint",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("package_name", sa.String(), nullable=False),
+        sa.Column("package_version", sa.String(), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("source_path", sa.Text(), nullable=False),
+        sa.Column("source_digest", sa.String(), nullable=False),
+        sa.Column("doc_type", sa.String(), nullable=False),
+        sa.Column("sphinx_doc_path", sa.Text(), nullable=True),
+        sa.Column("env_key", sa.String(), nullable=True),
+        sa.Column("updated_utc", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "package_name",
+            "package_version",
+            name="uq_generation_checkpoint_package_version",
+        ),
+    )
+    op.create_index(
+        op.f("ix_generation_checkpoint_id"),
+        "generation_checkpoint",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_generation_checkpoint_package_name"),
+        "generation_checkpoint",
+        ["package_name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_generation_checkpoint_package_name"),
+        table_name="generation_checkpoint",
+    )
+    op.drop_index(
+        op.f("ix_generation_checkpoint_id"), table_name="generation_checkpoint"
+    )
+    op.drop_table("generation_checkpoint")
@@ -0,0 +1,70 @@
+"""Add docset lookup indexes.
+
+Revision ID: e5b07c93d2f1
+Revises: d81e6b3f0a27
+Create Date: 2026-10-18 18:12:44.905163
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b07c93d2f1"
+down_revision: Union[str, Sequence[str], None] = "d81e6b3f0a27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DOCSET_KEY = ["package_name", "package_version"]
+INDEXES = {
+    "ix_docset_package_name_status_version": (
+        "docset",
+        ["package_name", "status", "package_version"],
+    ),
+    "ix_project_docset_association_docset_id": (
+        "project_docset_association",
+        ["docset_id", "project_id"],
+    ),
+}
+
+
+def _docset_key_is_unique(inspector: sa.Inspector) -> bool:
+    """Tell whether a unique constraint or index already covers the docset key."""
+    unique_columns = [
+        constraint["column_names"]
+        for constraint in inspector.get_unique_constraints("docset")
+    ] + [
+        index["column_names"]
+        for index in inspector.get_indexes("docset")
+        if index["unique"]
+    ]
+    return DOCSET_KEY in unique_columns
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The initial revision creates tables from the current models, so a fresh
+    # database may already have the unique constraint and the indexes.
+    inspector = sa.inspect(op.get_bind())
+    if not _docset_key_is_unique(inspector):
+        op.create_index(
+            "ix_docset_package_name_version", "docset", DOCSET_KEY, unique=True
+        )
+    for name, (table, columns) in INDEXES.items():
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
+    if "ix_docset_package_name_version" in {
+        index["name"] for index in inspector.get_indexes("docset")
+    }:
+        op.drop_index("ix_docset_package_name_version", table_name="docset")
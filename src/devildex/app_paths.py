@@ -63,6 +63,27 @@ class AppPaths:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @property
+    def build_env_cache_dir(self) -> Path:
+        """Directory holding the reusable build environments."""
+        path = self.user_cache_dir / BUILD_ENV_CACHE_SUBDIR
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @property
+    def sphinx_doctree_cache_dir(self) -> Path:
+        """Directory holding the Sphinx doctrees kept between builds."""
+        path = self.user_cache_dir / SPHINX_DOCTREE_CACHE_SUBDIR
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @property
+    def mkdocs_build_cache_dir(self) -> Path:
+        """Directory holding the MkDocs configs and sites kept between builds."""
+        path = self.user_cache_dir / MKDOCS_BUILD_CACHE_SUBDIR
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
     @property
     def docsets_base_dir(self) -> Path:
         """Directory base default per i docset generated.
@@ -76,6 +97,23 @@ class AppPaths:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @property
+    def docset_store_dir(self) -> Path:
+        """Directory of the content store shared by all docset versions.
+
+        It sits in user_data_dir next to the docsets so they can hardlink it.
+        """
+        path = self.user_data_dir / DOCSET_STORE_SUBDIR
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @property
+    def theme_assets_dir(self) -> Path:
+        """Directory of the theme asset bundles that docsets link to."""
+        path = self.user_data_dir / THEME_ASSETS_SUBDIR
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
     @property
     def database_path(self) -> Path:
         """Path per il file del database dell application.
@@ -128,3 +166,8 @@ if __name__ == "__main__":
     logger.info(f"Settings File Path:      {paths.settings_file_path}")
 ACTIVE_PROJECT_REGISTRY_SUBDIR = "registered_projects"
 ACTIVE_PROJECT_REGISTRATION_FILENAME = "current_registered_project.json"
+BUILD_ENV_CACHE_SUBDIR = "build_envs"
+SPHINX_DOCTREE_CACHE_SUBDIR = "sphinx_doctrees"
+MKDOCS_BUILD_CACHE_SUBDIR = "mkdocs_builds"
+DOCSET_STORE_SUBDIR = "docset_store"
+THEME_ASSETS_SUBDIR = "theme_assets"
@@ -9,6 +9,55 @@ from devildex.app_paths import AppPaths
 
 logger = logging.getLogger(__name__)
 
+PIPELINE_DEFAULT_WORKERS = {"fetch": 4, "env": 2, "build": 2}
+
+DEFAULT_CONFIG = {
+    "mcp_server_dev": {
+        "enabled": "false",
+        "hide_gui_when_enabled": "false",
+        "db_workers": "4",
+    },
+    "build": {
+        "installer_backend": "auto",
+        "env_cache_enabled": "true",
+        "env_cache_max_entries": "8",
+        "incremental_builds": "true",
+        "max_build_cores": "0",
+        "install_timeout": "1800",
+        "build_timeout": "3600",
+        "memory_limit_mb": "8192",
+        "cpu_limit_seconds": "3600",
+        "static_api_docs": "true",
+        "pydoctor_fast_path": "true",
+        "dedupe_docsets": "true",
+        "shared_theme_assets": "true",
+        "archive_docsets": "false",
+        "precompress_docsets": "true",
+        "prebuilt_docs": "true",
+        "prewarm_envs": "true",
+        "failure_backoff_seconds": "300",
+        "failure_backoff_max_seconds": "86400",
+        "resume_generations": "true",
+    },
+    "pipeline": {
+        "fetch_workers": "4",
+        "env_workers": "2",
+        "build_workers": "2",
+    },
+    "docset_server": {
+        "enabled": "true",
+        "port": "8002",
+    },
+    "database": {
+        "wal": "true",
+        "busy_timeout_ms": "5000",
+        "mmap_size_mb": "64",
+        "cache_size_mb": "16",
+        "pool_size": "8",
+        "max_overflow": "8",
+    },
+}
+
 
 class ConfigManager:
     """Config manager class."""
@@ -29,6 +78,15 @@ class ConfigManager:
         self._config_path = self.app_paths.devildex_ini_path
         self._load_config()
 
+    @property
+    def _settings(self) -> configparser.ConfigParser:
+        """Return the loaded settings, or the defaults if none are loaded."""
+        if self._config is None:
+            defaults = configparser.ConfigParser()
+            defaults.read_dict(DEFAULT_CONFIG)
+            return defaults
+        return self._config
+
     def _load_config(self) -> None:
         self._config = configparser.ConfigParser()
         if self._config_path and self._config_path.exists():
@@ -45,9 +103,7 @@ class ConfigManager:
                 f"Configuration file not found at: {self._config_path}."
                 " Creating with default settings."
             )
-            self._config.add_section("mcp_server_dev")
-            self._config.set("mcp_server_dev", "enabled", "false")
-            self._config.set("mcp_server_dev", "hide_gui_when_enabled", "false")
+            self._config.read_dict(DEFAULT_CONFIG)
             if self._config_path:
                 try:
                     self._config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -64,17 +120,21 @@ class ConfigManager:
 
     def get_mcp_server_enabled(self) -> bool:
         """Get mcp server enabled setting."""
-        return self._config.getboolean("mcp_server_dev", "enabled", fallback=False)
+        return self._settings.getboolean("mcp_server_dev", "enabled", fallback=False)
 
     def get_mcp_server_hide_gui_when_enabled(self) -> bool:
         """Get mcp server hide gui when enabled setting."""
-        return self._config.getboolean(
+        return self._settings.getboolean(
             "mcp_server_dev", "hide_gui_when_enabled", fallback=False
         )
 
     def get_mcp_server_port(self) -> int:
         """Get mcp server port setting."""
-        return self._config.getint("mcp_server_dev", "port", fallback=8001)
+        return self._settings.getint("mcp_server_dev", "port", fallback=8001)
+
+    def get_mcp_db_workers(self) -> int:
+        """Get the threads MCP tools run their database and file reads in."""
+        return max(1, self._settings.getint("mcp_server_dev", "db_workers", fallback=4))
 
     def set_mcp_server_enabled(self, value: bool) -> None:
         """Set mcp server enabled setting."""
@@ -88,6 +148,136 @@ class ConfigManager:
         """Set mcp server port setting."""
         self._config.set("mcp_server_dev", "port", str(value))
 
+    def get_installer_backend(self) -> str:
+        """Get the installer backend used for build environments."""
+        return self._settings.get("build", "installer_backend", fallback="auto")
+
+    def set_installer_backend(self, value: str) -> None:
+        """Set the installer backend used for build environments."""
+        if not self._config.has_section("build"):
+            self._config.add_section("build")
+        self._config.set("build", "installer_backend", value)
+
+    def get_env_cache_enabled(self) -> bool:
+        """Get whether build environments are cached and reused."""
+        return self._settings.getboolean("build", "env_cache_enabled", fallback=True)
+
+    def get_env_cache_max_entries(self) -> int:
+        """Get the maximum number of cached build environments."""
+        return self._settings.getint("build", "env_cache_max_entries", fallback=8)
+
+    def get_incremental_builds(self) -> bool:
+        """Get whether builders reuse their previous output and caches."""
+        return self._settings.getboolean("build", "incremental_builds", fallback=True)
+
+    def get_max_build_cores(self) -> int:
+        """Get how many cores builds may share, 0 meaning all of them."""
+        return max(0, self._settings.getint("build", "max_build_cores", fallback=0))
+
+    def get_stage_timeout(self, stage: str) -> int:
+        """Get the wall-clock timeout in seconds of a stage, 0 meaning none."""
+        return max(0, self._settings.getint("build", f"{stage}_timeout", fallback=0))
+
+    def get_memory_limit_mb(self) -> int:
+        """Get the address-space limit of builder processes, 0 meaning none."""
+        return max(0, self._settings.getint("build", "memory_limit_mb", fallback=0))
+
+    def get_cpu_limit_seconds(self) -> int:
+        """Get the CPU-time limit of builder processes, 0 meaning none."""
+        return max(0, self._settings.getint("build", "cpu_limit_seconds", fallback=0))
+
+    def get_static_api_docs(self) -> bool:
+        """Get whether docstrings are first documented from the AST alone."""
+        return self._settings.getboolean("build", "static_api_docs", fallback=True)
+
+    def get_pydoctor_fast_path(self) -> bool:
+        """Get whether pydoctor runs from the shared tool env without the project."""
+        return self._settings.getboolean("build", "pydoctor_fast_path", fallback=True)
+
+    def get_dedupe_docsets(self) -> bool:
+        """Get whether docset files are deduplicated in the content store."""
+        return self._settings.getboolean("build", "dedupe_docsets", fallback=True)
+
+    def get_shared_theme_assets(self) -> bool:
+        """Get whether docsets link to shared theme assets instead of copies."""
+        return self._settings.getboolean("build", "shared_theme_assets", fallback=True)
+
+    def get_archive_docsets(self) -> bool:
+        """Get whether finished docsets are packed into a single zip archive."""
+        return self._settings.getboolean("build", "archive_docsets", fallback=False)
+
+    def get_precompress_docsets(self) -> bool:
+        """Get whether gzip/brotli variants of docset files are built."""
+        return self._settings.getboolean("build", "precompress_docsets", fallback=True)
+
+    def get_prebuilt_docs(self) -> bool:
+        """Get whether docs prebuilt on Read the Docs are used before building."""
+        return self._settings.getboolean("build", "prebuilt_docs", fallback=True)
+
+    def get_prewarm_envs(self) -> bool:
+        """Get whether the active project's recipe environments are pre-built."""
+        return self._settings.getboolean("build", "prewarm_envs", fallback=True)
+
+    def get_failure_backoff_seconds(self) -> int:
+        """Get the wait before retrying a failed package, 0 to always retry."""
+        return max(
+            0, self._settings.getint("build", "failure_backoff_seconds", fallback=300)
+        )
+
+    def get_failure_backoff_max_seconds(self) -> int:
+        """Get the longest wait before retrying a repeatedly failing package."""
+        return max(
+            0,
+            self._settings.getint(
+                "build", "failure_backoff_max_seconds", fallback=86400
+            ),
+        )
+
+    def get_resume_generations(self) -> bool:
+        """Get whether generations resume from their last completed stage."""
+        return self._settings.getboolean("build", "resume_generations", fallback=True)
+
+    def get_pipeline_workers(self, stage: str) -> int:
+        """Get the worker count of a batch generation stage, at least 1."""
+        fallback = PIPELINE_DEFAULT_WORKERS.get(stage, 1)
+        return max(
+            1, self._settings.getint("pipeline", f"{stage}_workers", fallback=fallback)
+        )
+
+    def get_docset_server_enabled(self) -> bool:
+        """Get whether docsets are served over the local HTTP server."""
+        return self._settings.getboolean("docset_server", "enabled", fallback=True)
+
+    def get_docset_server_port(self) -> int:
+        """Get the preferred port of the local docset HTTP server."""
+        return self._settings.getint("docset_server", "port", fallback=8002)
+
+    def get_db_wal(self) -> bool:
+        """Get whether the SQLite database uses write-ahead logging."""
+        return self._settings.getboolean("database", "wal", fallback=True)
+
+    def get_db_busy_timeout_ms(self) -> int:
+        """Get how long a connection waits for a locked database."""
+        return max(
+            0, self._settings.getint("database", "busy_timeout_ms", fallback=5000)
+        )
+
+    def get_db_mmap_size_mb(self) -> int:
+        """Get how much of the database file is memory-mapped, 0 to disable."""
+        return max(0, self._settings.getint("database", "mmap_size_mb", fallback=64))
+
+    def get_db_cache_size_mb(self) -> int:
+        """Get the page cache size of each database connection."""
+        return max(1, self._settings.getint("database", "cache_size_mb", fallback=16))
+
+    def get_db_pool_size(self) -> int:
+        """Get the number of database connections kept open, at least 1."""
+        return max(1, self._settings.getint("database", "pool_size", fallback=8))
+
+    def get_db_max_overflow(self) -> int:
+        """Get the connections opened beyond the pool size under load."""
+        return max(0, self._settings.getint("database", "max_overflow", fallback=8))
+
     def save_config(self) -> None:
         """Save the configuration to the file."""
         if self._config_path:
@@ -26,3 +26,7 @@ COL_WIDTHS: dict[str, int] = {
     "status": COL_WIDTH_STATUS,
     "docset_status": COL_WIDTH_DOCSET_STATUS,
 }
+DOCSTRINGS_ENV_NAME = "docstrings"
+DOCSTRINGS_TOOL_PACKAGES: list[str] = ["pdoc3", "pydoctor"]
+PYDOCTOR_TOOL_ENV_NAME = "pydoctor-tool"
+PYDOCTOR_TOOL_PACKAGES: list[str] = ["pydoctor"]
@@ -1,20 +1,30 @@
 """core module."""
 
+import functools
 import logging
 import shutil
 import threading
 import uuid
+from collections import Counter
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from devildex.app_paths import AppPaths
 from devildex.config_manager import ConfigManager
 from devildex.database import db_manager as database
-from devildex.database.models import Docset, PackageDetails
+from devildex.database.models import (
+    DocRecipe,
+    DocsetRow,
+    PackageDetails,
+    StageCheckpoint,
+    project_docset_association,
+)
+from devildex.docset_server.server import DocsetServer
 from devildex.local_data_parse import registered_project_parser
 from devildex.local_data_parse.common_read import (
     get_explicit_dependencies_from_project_config,
@@ -25,9 +35,28 @@ from devildex.local_data_parse.external_venv_scanner import (
 from devildex.local_data_parse.registered_project_parser import RegisteredProjectData
 from devildex.mcp_server.mcp_server_manager import McpServerManager
 from devildex.orchestrator.documentation_orchestrator import Orchestrator
+from devildex.orchestrator.pipeline import ENV_STAGE, GenerationPipeline, PipelineJob
+from devildex.utils.docset_archive import (
+    ARCHIVE_SUFFIX,
+    archive_path_for,
+    forget_archive,
+    is_docset_archive,
+    pack_docset,
+)
+from devildex.utils.docset_store import DocsetStore, store_docset_tree
+from devildex.utils.precompress import precompress_docset
+from devildex.utils.progress import (
+    TASK_LOGS_SUBDIR,
+    TaskProgress,
+    bind_task_progress,
+    task_context,
+)
+from devildex.utils.venv_cache import BuildEnvCache
 
 logger = logging.getLogger(__name__)
 
+DOCSET_STATUS_UNKNOWN = "unknown"
+
 
 class TaskStatus(Enum):
     """Task status enumeration."""
@@ -55,7 +84,13 @@ class DevilDexCore:
         self.registered_project_path: Optional[str] = None
         self.registered_project_python_executable: Optional[str] = None
         self.mcp_server_manager: Optional[McpServerManager] = None
+        self.docset_server: Optional[DocsetServer] = None
+        self.generation_pipeline: Optional[GenerationPipeline] = None
         self._tasks: dict[str, dict[str, Any]] = {}
+        self._prewarmed: set[tuple[str, Optional[str]]] = set()
+        self._in_flight_lock = threading.Lock()
+        self._generating: Counter[tuple[str, Optional[str]]] = Counter()
+        self._prewarming: dict[tuple[str, Optional[str]], threading.Event] = {}
         self.gui_warning_callback = gui_warning_callback
 
         if docset_base_output_path:
@@ -76,11 +111,23 @@ class DevilDexCore:
     def shutdown(self) -> None:
         """Shut down the core services."""
         self.stop_mcp_server()
+        self.stop_docset_server()
+        if self.generation_pipeline is not None:
+            self.generation_pipeline.close()
+            self.generation_pipeline = None
 
     def _run_generation_task(
         self, task_id: str, package_data: dict, force: bool
     ) -> None:
         """Run docset generation in a separate thread."""
+        progress = self._tasks[task_id].get("progress") or TaskProgress(task_id)
+        with bind_task_progress(progress):
+            self._run_generation_steps(task_id, package_data, force)
+
+    def _run_generation_steps(
+        self, task_id: str, package_data: dict, force: bool
+    ) -> None:
+        """Validate the inputs, build the docset and record the result."""
         self._tasks[task_id]["status"] = TaskStatus.RUNNING
         package_name = package_data.get("name")
 
@@ -91,22 +138,19 @@ class DevilDexCore:
             if not validation_result:
                 return
 
-            package_name, package_version, project_urls = validation_result
+            details = self._package_details(*validation_result)
+            self._wait_for_prewarm(details, self._claim_generation(details))
+            try:
+                orchestrator = self._execute_orchestration(task_id, details)
+                if not orchestrator:
+                    return
 
-            details = PackageDetails(
-                name=str(package_name),
-                version=str(package_version),
-                project_urls=project_urls if isinstance(project_urls, dict) else {},
-            )
-
-            orchestrator = self._execute_orchestration(task_id, details)
-            if not orchestrator:
-                return
-
-            generation_result = orchestrator.grab_build_doc()
-            self._process_generation_result(
-                task_id, generation_result, orchestrator, details
-            )
+                generation_result = orchestrator.grab_build_doc()
+                self._process_generation_result(
+                    task_id, generation_result, orchestrator, details
+                )
+            finally:
+                self._release_generation(details)
 
         except Exception as e:
             logger.exception(
@@ -152,28 +196,119 @@ class DevilDexCore:
             self._tasks[task_id]["status"] = TaskStatus.COMPLETED
             return None
 
+        if not force:
+            failure = database.DatabaseManager.get_active_generation_failure(
+                str(package_name), str(package_version)
+            )
+            if failure:
+                logger.info(
+                    f"Core: {package_name} v{package_version} failed recently."
+                    f" Skipping generation until {failure['retry_after']}."
+                )
+                self._tasks[task_id]["failure"] = failure
+                self._tasks[task_id]["result"] = (
+                    False,
+                    f"Skipped {package_name} v{package_version}: its"
+                    f" {failure['stage']} stage failed {failure['failures']} time(s)"
+                    f" with {failure['error_class']}. Next attempt after"
+                    f" {failure['retry_after']}. Use force=True to retry now.",
+                )
+                self._tasks[task_id]["status"] = TaskStatus.FAILED
+                return None
+
         return str(package_name), str(package_version), project_urls
 
     def _execute_orchestration(
         self, task_id: str, details: PackageDetails
     ) -> Optional[Orchestrator]:
         """Create and run the orchestrator."""
-        orchestrator = Orchestrator(
-            package_details=details, base_output_dir=self.docset_base_output_path
-        )
+        orchestrator = self._create_orchestrator(details)
         orchestrator.start_scan()
         detected_type = orchestrator.get_detected_doc_type()
 
         if detected_type == "unknown":
-            last_op_msg = orchestrator.get_last_operation_result()
-            msg = f"unable to determine il tipo di documentation per {details.name}."
-            if isinstance(last_op_msg, str) and last_op_msg:
-                msg += f" Detail: {last_op_msg}"
-            self._tasks[task_id]["result"] = (False, msg)
-            self._tasks[task_id]["status"] = TaskStatus.FAILED
+            self._fail_undetected(task_id, orchestrator, details)
             return None
         return orchestrator
 
+    def _fail_undetected(
+        self, task_id: str, orchestrator: Orchestrator, details: PackageDetails
+    ) -> None:
+        """Record that no documentation type was found for a package."""
+        last_op_msg = orchestrator.get_last_operation_result()
+        msg = f"unable to determine il tipo di documentation per {details.name}."
+        if isinstance(last_op_msg, str) and last_op_msg:
+            msg += f" Detail: {last_op_msg}"
+        self._tasks[task_id]["result"] = (False, msg)
+        self._tasks[task_id]["status"] = TaskStatus.FAILED
+        self._record_failure(task_id, orchestrator, details)
+
+    def _record_failure(
+        self, task_id: str, orchestrator: Orchestrator, details: PackageDetails
+    ) -> None:
+        """Record the failed stage so retries of the package back off."""
+        config = ConfigManager()
+        backoff_seconds = config.get_failure_backoff_seconds()
+        failure = orchestrator.failure
+        if not backoff_seconds or failure is None:
+            return
+        try:
+            self._tasks[task_id]["failure"] = database.record_generation_failure(
+                details.name,
+                str(details.version),
+                failure.stage,
+                failure.error_class,
+                backoff_seconds,
+                config.get_failure_backoff_max_seconds(),
+            )
+        except SQLAlchemyError:
+            logger.exception(f"Core: Could not record the failure of {details.name}")
+
+    @staticmethod
+    def _package_details(
+        package_name: str, package_version: str, project_urls: object
+    ) -> PackageDetails:
+        """Build the details of a package to generate, with its doc recipe."""
+        return PackageDetails(
+            name=str(package_name),
+            version=str(package_version),
+            project_urls=project_urls if isinstance(project_urls, dict) else {},
+            doc_recipe=database.DatabaseManager.get_doc_recipe(str(package_name)),
+        )
+
+    def _create_orchestrator(self, details: PackageDetails) -> Orchestrator:
+        """Create the orchestrator of a package, resuming from its checkpoint.
+
+        Every stage the orchestrator completes is checkpointed in the
+        database, unless resuming is disabled in the configuration.
+        """
+        if not ConfigManager().get_resume_generations():
+            return Orchestrator(
+                package_details=details, base_output_dir=self.docset_base_output_path
+            )
+        if details.checkpoint is None and details.version:
+            details.checkpoint = database.DatabaseManager.get_generation_checkpoint(
+                details.name, str(details.version)
+            )
+        return Orchestrator(
+            package_details=details,
+            base_output_dir=self.docset_base_output_path,
+            on_checkpoint=functools.partial(self._save_checkpoint, details),
+        )
+
+    @staticmethod
+    def _save_checkpoint(details: PackageDetails, checkpoint: StageCheckpoint) -> None:
+        """Store the checkpoint of a package's generation."""
+        try:
+            database.save_generation_checkpoint(
+                details.name, str(details.version), checkpoint
+            )
+        except SQLAlchemyError:
+            logger.exception(
+                f"Core: Could not record the {checkpoint.stage} checkpoint"
+                f" of {details.name}"
+            )
+
     def _process_generation_result(
         self,
         task_id: str,
@@ -183,10 +318,15 @@ class DevilDexCore:
     ) -> None:
         """Process the result of the docset generation."""
         if isinstance(generation_result, str):
-            self._tasks[task_id]["result"] = (True, generation_result)
+            docset_path = self._finalize_docset_output(Path(generation_result))
+            self._tasks[task_id]["result"] = (True, str(docset_path))
             self._tasks[task_id]["status"] = TaskStatus.COMPLETED
             self._update_database_on_success(
-                details.name, details.version, details.project_urls
+                details.name,
+                details.version,
+                details.project_urls,
+                docset_path,
+                orchestrator.resolved_recipe,
             )
         elif not generation_result:
             last_op_detail = orchestrator.get_last_operation_result()
@@ -197,6 +337,7 @@ class DevilDexCore:
                 error_msg += " Specified operation is failed."
             self._tasks[task_id]["result"] = (False, error_msg)
             self._tasks[task_id]["status"] = TaskStatus.FAILED
+            self._record_failure(task_id, orchestrator, details)
         else:
             unexpected_msg = (
                 f"Unexpected result ({type(generation_result)}) "
@@ -205,11 +346,68 @@ class DevilDexCore:
             self._tasks[task_id]["result"] = (False, unexpected_msg)
             self._tasks[task_id]["status"] = TaskStatus.FAILED
 
+    @staticmethod
+    def _finalize_docset_output(docset_path: Path) -> Path:
+        """Precompress a finished docset and pack it if archiving is enabled.
+
+        Returns:
+            The archive, or the docset directory if it was not packed.
+
+        """
+        if not docset_path.is_dir():
+            return docset_path
+        if ConfigManager().get_precompress_docsets():
+            try:
+                precompress_docset(docset_path)
+            except OSError:
+                logger.exception(f"Core: Could not precompress docset {docset_path}")
+        archive_path = archive_path_for(docset_path)
+        if not ConfigManager().get_archive_docsets():
+            if archive_path.is_file():
+                forget_archive(archive_path)
+                archive_path.unlink()
+                logger.info(f"Core: Removed outdated docset archive {archive_path}")
+            return docset_path
+        try:
+            return pack_docset(docset_path)
+        except OSError:
+            logger.exception(f"Core: Could not pack docset {docset_path}")
+            return docset_path
+
+    @staticmethod
+    def _store_docset(
+        docset_path: Path, previous_manifest: dict[str, str]
+    ) -> dict[str, str]:
+        """Deduplicate a generated docset into the content store.
+
+        Returns:
+            The manifest of the docset, or an empty one if it was not stored.
+
+        """
+        store_dir = AppPaths().docset_store_dir
+        if not ConfigManager().get_dedupe_docsets() or not docset_path.is_dir():
+            DocsetStore(store_dir).release(previous_manifest.values())
+            return {}
+        try:
+            return store_docset_tree(store_dir, docset_path, previous_manifest)
+        except OSError:
+            logger.exception(f"Core: Could not store docset {docset_path}")
+            return {}
+
     @staticmethod
     def _update_database_on_success(
-        package_name: str, package_version: str, project_urls: dict
+        package_name: str,
+        package_version: str,
+        project_urls: dict,
+        docset_path: Optional[Path] = None,
+        recipe: Optional[DocRecipe] = None,
     ) -> None:
-        """Update the database after a successful docset generation."""
+        """Update the database after a successful docset generation.
+
+        The recipe the docset was built with, if known, is recorded so the
+        next build of the package can follow it. Recorded failures and the
+        generation checkpoint of the package version are dropped.
+        """
         with database.get_session() as session:
             docset = (
                 session.query(database.Docset)
@@ -239,7 +437,22 @@ class DevilDexCore:
                     package_info=package_info,
                 )
                 session.add(docset)
+            if docset_path is not None:
+                docset.manifest = DevilDexCore._store_docset(
+                    docset_path, docset.manifest
+                )
+            for finished in (database.GenerationFailure, database.GenerationCheckpoint):
+                session.query(finished).filter_by(
+                    package_name=package_name, package_version=package_version
+                ).delete()
             session.commit()
+        if recipe is not None:
+            try:
+                database.save_doc_recipe(package_name, recipe)
+            except SQLAlchemyError:
+                logger.exception(
+                    f"Core: Could not record the doc recipe of {package_name}"
+                )
 
     @staticmethod
     def query_project_names() -> list[str]:
@@ -322,10 +535,11 @@ class DevilDexCore:
 
     @staticmethod
     def delete_docset_build(docset_path_str: str) -> tuple[bool, str]:
-        """Delete a docset build directory and its parent if empty."""
+        """Delete a docset build directory or archive and its parent if empty."""
         try:
             path_of_specific_docset_build = Path(docset_path_str)
-            if (
+            is_archive = is_docset_archive(path_of_specific_docset_build)
+            if not is_archive and (
                 not path_of_specific_docset_build.exists()
                 or not path_of_specific_docset_build.is_dir()
             ):
@@ -337,7 +551,11 @@ class DevilDexCore:
                 return False, msg
 
             package_level_docset_dir = path_of_specific_docset_build.parent
-            shutil.rmtree(path_of_specific_docset_build)
+            if is_archive:
+                forget_archive(path_of_specific_docset_build)
+                path_of_specific_docset_build.unlink()
+            else:
+                shutil.rmtree(path_of_specific_docset_build)
             logger.info(
                 f"Successfully deleted docset build: {path_of_specific_docset_build}"
             )
@@ -397,6 +615,7 @@ class DevilDexCore:
         ):
             database.init_db(database_url=db_url)
             logger.info("Core: Database initialized.")
+            self._collect_store_garbage()
         else:
             logger.info("Core: Database already initialized and bound to correct URL.")
         logger.info("Core: Database initialized.")
@@ -409,33 +628,37 @@ class DevilDexCore:
             "Core: Populating DB using initial_package_source - Total:"
             f" {len(initial_package_source)} packages."
         )
+        packages_to_store = []
         for pkg_detail in initial_package_source:
             pkg_name = pkg_detail.name
             pkg_version = pkg_detail.version
             pkg_summary = getattr(pkg_detail, "summary", None) or getattr(
                 pkg_detail, "description", "N/A"
             )
-            pkg_project_urls = pkg_detail.project_urls
 
             if pkg_name and pkg_version:
-                logger.debug(f"Core: Processing for DB: {pkg_name} v{pkg_version}")
-                build_dict = {
-                    "package_name": str(pkg_name),
-                    "package_version": str(pkg_version),
-                    "summary": str(pkg_summary) if pkg_summary else None,
-                    "project_urls": pkg_project_urls,
-                    "initial_docset_status": pkg_detail.status,
-                }
-                if not is_fallback_data and project_db_name:
-                    build_dict["project_name"] = project_db_name
-                    build_dict["project_path"] = project_db_path
-                    build_dict["python_executable"] = project_db_python_exec
-                database.ensure_package_entities_exist(**build_dict)
+                packages_to_store.append(
+                    {
+                        "package_name": str(pkg_name),
+                        "package_version": str(pkg_version),
+                        "summary": str(pkg_summary) if pkg_summary else None,
+                        "project_urls": pkg_detail.project_urls,
+                        "initial_docset_status": pkg_detail.status,
+                    }
+                )
             else:
                 logger.warning(
                     "Core: Skipped record from initial_package_source due to "
                     f"missing name or version: {pkg_detail}"
                 )
+        project_kwargs = {}
+        if not is_fallback_data and project_db_name:
+            project_kwargs = {
+                "project_name": project_db_name,
+                "project_path": project_db_path,
+                "python_executable": project_db_python_exec,
+            }
+        database.bulk_ensure_package_entities(packages_to_store, **project_kwargs)
 
         logger.info("Core: Initial DB population completed.")
 
@@ -447,21 +670,31 @@ class DevilDexCore:
             grid_data_to_return = self._bootstrap_database_loop_docsets(
                 docsets_to_load_from_db
             )
+        if project_db_name and not is_fallback_data:
+            self.prewarm_environments()
         return grid_data_to_return
 
+    def _collect_store_garbage(self) -> None:
+        """Drop store objects left unreferenced by interrupted builds or deletes."""
+        removed = DocsetStore(self.app_paths.docset_store_dir).collect_garbage()
+        if removed:
+            logger.info(f"Core: Removed {removed} unreferenced docset store objects.")
+
     @staticmethod
     def _bootstrap_database_read_db(
         project_db_name: str, session: Session
-    ) -> list[Docset]:
-        docsets_to_load_from_db: list[database.Docset] = []
+    ) -> list[DocsetRow]:
+        docsets_to_load_from_db: list[DocsetRow] = []
         if project_db_name:
-            current_project_obj = (
-                session.query(database.RegisteredProject)
-                .filter_by(project_name=project_db_name)
-                .first()
+            project_id = session.scalar(
+                select(database.RegisteredProject.id).where(
+                    database.RegisteredProject.project_name == project_db_name
+                )
             )
-            if current_project_obj:
-                docsets_to_load_from_db = list(current_project_obj.docsets)
+            if project_id is not None:
+                docsets_to_load_from_db = database.get_docset_rows(
+                    session, project_db_name
+                )
                 logger.info(
                     f"Core: Loading {len(docsets_to_load_from_db)} "
                     f"docsets for project '{project_db_name}'."
@@ -472,9 +705,7 @@ class DevilDexCore:
                     "DB for loading its docsets."
                 )
         else:
-            docsets_to_load_from_db = list(
-                session.scalars(select(database.Docset)).all()
-            )
+            docsets_to_load_from_db = database.get_docset_rows(session)
             logger.info(
                 "Core: No active project, loading all "
                 f"{len(docsets_to_load_from_db)} docsets from DB."
@@ -483,21 +714,11 @@ class DevilDexCore:
 
     @staticmethod
     def _bootstrap_database_loop_docsets(
-        docsets_to_load_from_db: list[Docset],
+        docsets_to_load_from_db: list[DocsetRow],
     ) -> list[dict[str, Any]]:
-        grid_data_to_return: list[dict[str, Any]] = []
-        for db_docset in docsets_to_load_from_db:
-            pkg_info = db_docset.package_info
-            grid_row = {
-                "id": db_docset.id,
-                "name": db_docset.package_name,
-                "version": db_docset.package_version,
-                "description": pkg_info.summary if pkg_info else "N/A",
-                "docset_status": db_docset.status,
-            }
-            if pkg_info and pkg_info.project_urls:
-                grid_row["project_urls"] = pkg_info.project_urls
-            grid_data_to_return.append(grid_row)
+        grid_data_to_return = [
+            docset_row.as_grid_row() for docset_row in docsets_to_load_from_db
+        ]
 
         logger.info(
             f"Core: Loaded {len(grid_data_to_return)} records from DB for the grid."
@@ -511,31 +732,55 @@ class DevilDexCore:
             or not self.docset_base_output_path.exists()
         ):
             return []
-        return [d.name for d in self.docset_base_output_path.iterdir() if d.is_dir()]
+        package_dirs: list[str] = []
+        for entry in self.docset_base_output_path.iterdir():
+            if entry.is_dir():
+                name = entry.name
+            elif is_docset_archive(entry):
+                name = entry.name.removesuffix(ARCHIVE_SUFFIX)
+            else:
+                continue
+            if name not in package_dirs:
+                package_dirs.append(name)
+        return package_dirs
+
+    @staticmethod
+    def _docset_at(docset_path: Path) -> Optional[Path]:
+        """Return the docset directory at docset_path, or its archive."""
+        if docset_path.is_dir():
+            return docset_path
+        if is_docset_archive(archive_path_for(docset_path)):
+            return archive_path_for(docset_path)
+        return None
 
     def get_docset_path(
         self, package_name: str, version: Optional[str] = None
     ) -> Optional[Path]:
-        """Construct and return the path to a specific docset."""
+        """Construct and return the path to a specific docset.
+
+        A packed docset is returned as the path of its archive.
+        """
         if not self.docset_base_output_path:
             return None
         base_path = self.docset_base_output_path / package_name
         if version:
-            docset_path = base_path / version
-            if docset_path.is_dir():
-                return docset_path
-            else:
+            docset_path = self._docset_at(base_path / version)
+            if not docset_path:
                 logger.warning(
                     f"Docset path for {package_name} version {version} "
-                    f"not found at {docset_path}"
+                    f"not found at {base_path / version}"
                 )
-                return None
+            return docset_path
 
         if (base_path / "index.html").is_file():
             return base_path
+        if is_docset_archive(archive_path_for(base_path)):
+            return archive_path_for(base_path)
 
-        for subdir in base_path.iterdir():
-            if subdir.is_dir() and (subdir / "index.html").is_file():
+        for subdir in base_path.iterdir() if base_path.is_dir() else []:
+            if (
+                subdir.is_dir() and (subdir / "index.html").is_file()
+            ) or is_docset_archive(subdir):
                 logger.info(
                     f"Auto-detected docset in subdirectory: {subdir.name} "
                     f"for package {package_name}"
@@ -552,32 +797,42 @@ class DevilDexCore:
     def get_all_docsets_info() -> list[dict[str, Any]]:
         """Retrieve information for all docsets from the database."""
         with database.get_session() as session:
-            docsets = session.scalars(select(database.Docset)).all()
+            rows = session.execute(
+                select(
+                    database.Docset.package_name,
+                    database.Docset.package_version,
+                    database.Docset.status,
+                )
+            )
             return [
-                {
-                    "name": d.package_name,
-                    "version": d.package_version,
-                    "status": d.status,
-                }
-                for d in docsets
+                {"name": name, "version": version, "status": status}
+                for name, version, status in rows
             ]
 
     @staticmethod
     def get_docsets_info_for_project(project_name: str) -> list[dict[str, Any]]:
         """Retrieve information for docsets associated with a specific project."""
         with database.get_session() as session:
-            docsets = session.scalars(
-                select(database.Docset)
-                .join(database.Docset.associated_projects)
+            rows = session.execute(
+                select(
+                    database.Docset.package_name,
+                    database.Docset.package_version,
+                    database.Docset.status,
+                )
+                .join(
+                    project_docset_association,
+                    project_docset_association.c.docset_id == database.Docset.id,
+                )
+                .join(
+                    database.RegisteredProject,
+                    database.RegisteredProject.id
+                    == project_docset_association.c.project_id,
+                )
                 .where(database.RegisteredProject.project_name == project_name)
-            ).all()
+            )
             return [
-                {
-                    "name": d.package_name,
-                    "version": d.package_version,
-                    "status": d.status,
-                }
-                for d in docsets
+                {"name": name, "version": version, "status": status}
+                for name, version, status in rows
             ]
 
     def search_for_docset(
@@ -585,13 +840,17 @@ class DevilDexCore:
     ) -> list[dict[str, Any]]:
         """Search for docsets matching the given package name and optional version."""
         with database.get_session() as session:
-            query = select(database.Docset).where(
+            query = select(
+                database.Docset.package_name,
+                database.Docset.package_version,
+                database.Docset.status,
+            ).where(
                 database.Docset.package_name == package_name,
                 database.Docset.status == TaskStatus.COMPLETED.value,
             )
             if version:
                 query = query.where(database.Docset.package_version == version)
-            docsets = session.scalars(query).all()
+            docsets = session.execute(query).all()
             valid_docsets = []
             for d in docsets:
                 docset_path = self.get_docset_path(d.package_name, d.package_version)
@@ -623,6 +882,8 @@ class DevilDexCore:
                 )
                 return False
 
+            store = DocsetStore(self.app_paths.docset_store_dir)
+            all_deleted = True
             for docset in docsets_to_delete:
                 path_to_delete = self.get_docset_path(
                     docset.package_name, docset.package_version
@@ -635,28 +896,76 @@ class DevilDexCore:
                             f"'{docset.package_name}' "
                             f"version '{docset.package_version}': {msg}"
                         )
+                        all_deleted = False
+                        continue
                 else:
                     logger.warning(
                         f"Core: Docset path not found for '{docset.package_name}' "
                         f"version '{docset.package_version}'. Deleting only from DB."
                     )
 
+                store.release(docset.manifest.values())
                 session.delete(docset)
                 logger.info(
                     f"Core: Deleted docset '{docset.package_name}' version "
                     f"'{docset.package_version}' from database."
                 )
             session.commit()
-            return True
+            return all_deleted
+
+    def delete_docset_files(
+        self, package_name: str, version: Optional[str], docset_path_str: str
+    ) -> tuple[bool, str]:
+        """Delete the files of a docset and reset its database record.
+
+        The record and its project links are kept, so the docset can be
+        generated again. Its store objects are released, its manifest is
+        cleared and its status reset. A docset without a record only has
+        its files deleted.
+        """
+        success, message = self.delete_docset_build(docset_path_str)
+        if not success or not version:
+            return success, message
+        try:
+            with database.get_session() as session:
+                docset = session.scalars(
+                    select(database.Docset).where(
+                        database.Docset.package_name == package_name,
+                        database.Docset.package_version == version,
+                    )
+                ).first()
+                if docset is not None:
+                    DocsetStore(self.app_paths.docset_store_dir).release(
+                        docset.manifest.values()
+                    )
+                    docset.manifest = {}
+                    docset.status = DOCSET_STATUS_UNKNOWN
+                    session.commit()
+        except SQLAlchemyError as e:
+            logger.exception(
+                f"Core: Could not reset the docset record of {package_name}"
+                f" {version}"
+            )
+            return False, str(e)
+        return True, message
 
-    def generate_docset(self, package_data: dict, force: bool = False) -> str:
-        """Initiate asynchronous docset generation and return a task ID."""
+    def _create_task(self) -> str:
+        """Register a new pending generation task and return its ID."""
         task_id = str(uuid.uuid4())
         self._tasks[task_id] = {
             "status": TaskStatus.PENDING,
             "result": None,
             "thread": None,
+            "progress": TaskProgress(
+                task_id,
+                self.app_paths.user_log_dir / TASK_LOGS_SUBDIR / f"{task_id}.log",
+            ),
         }
+        return task_id
+
+    def generate_docset(self, package_data: dict, force: bool = False) -> str:
+        """Initiate asynchronous docset generation and return a task ID."""
+        task_id = self._create_task()
 
         thread = threading.Thread(
             target=self._run_generation_task,
@@ -667,8 +976,223 @@ class DevilDexCore:
 
         return task_id
 
+    def generate_docsets(self, packages: list[dict], force: bool = False) -> list[str]:
+        """Initiate docset generation for several packages at once.
+
+        The packages go through the generation pipeline, so sources of one
+        package are fetched while another one builds. Each package gets its
+        own task, polled with get_task_status like generate_docset's.
+
+        Returns:
+            The task IDs, in the order of packages.
+
+        """
+        if self.generation_pipeline is None:
+            self.generation_pipeline = GenerationPipeline()
+        task_ids = []
+        for package_data in packages:
+            task_id = self._create_task()
+            task_ids.append(task_id)
+            progress = self._tasks[task_id]["progress"]
+            validation_result = self._validate_generation_inputs(
+                task_id, package_data, force
+            )
+            if not validation_result:
+                progress.close()
+                continue
+            details = self._package_details(*validation_result)
+            orchestrator = self._create_orchestrator(details)
+            prewarm = self._claim_generation(details)
+            self.generation_pipeline.submit(
+                PipelineJob(
+                    orchestrator=orchestrator,
+                    on_done=functools.partial(
+                        self._finish_pipeline_task, task_id, details
+                    ),
+                    context=task_context(progress),
+                    on_start=functools.partial(
+                        self._start_pipeline_task, task_id, details, prewarm
+                    ),
+                )
+            )
+        return task_ids
+
+    def _claim_generation(self, details: PackageDetails) -> Optional[threading.Event]:
+        """Mark a package version as being generated, so it is not pre-warmed.
+
+        Returns:
+            The event set when the package's in-flight pre-warm ends, if it
+            has one. The generation must wait for it before fetching, as
+            fetching empties the sources directory the pre-warm uses.
+
+        """
+        key = (details.name, details.version)
+        with self._in_flight_lock:
+            self._generating[key] += 1
+            return self._prewarming.get(key)
+
+    def _release_generation(self, details: PackageDetails) -> None:
+        """Record that a generation of a package version has ended."""
+        key = (details.name, details.version)
+        with self._in_flight_lock:
+            self._generating[key] -= 1
+            if self._generating[key] <= 0:
+                del self._generating[key]
+
+    @staticmethod
+    def _wait_for_prewarm(
+        details: PackageDetails, prewarm: Optional[threading.Event]
+    ) -> None:
+        """Wait until an in-flight pre-warm of the package has ended."""
+        if prewarm is not None and not prewarm.is_set():
+            logger.info(
+                f"Core: Waiting for the pre-warm of {details.name}"
+                f" v{details.version} to finish before generating it."
+            )
+            prewarm.wait()
+
+    def prewarm_environments(self) -> int:
+        """Install the build environments of the active project in the background.
+
+        Packages of the active project that have a doc recipe but no
+        completed docset are fetched and get their recipe's environment
+        installed through the generation pipeline, without being built. A
+        later generation then finds the environment in the cache. Each
+        package version is pre-warmed once per session, and never while it
+        is being generated; a generation started during a pre-warm waits
+        for it to end. No more packages are queued than the cache has free
+        slots, so pre-warmed environments do not evict each other.
+
+        Returns:
+            The number of packages queued.
+
+        """
+        config = ConfigManager()
+        if not (
+            self.registered_project_name
+            and config.get_prewarm_envs()
+            and config.get_env_cache_enabled()
+        ):
+            return 0
+        free_slots = BuildEnvCache(
+            cache_dir=self.app_paths.build_env_cache_dir
+        ).free_slots()
+        with self._in_flight_lock:
+            busy = self._prewarmed | self._generating.keys()
+        pending = [
+            details
+            for details in database.DatabaseManager.get_project_packages_with_recipes(
+                self.registered_project_name
+            )
+            if details.status != TaskStatus.COMPLETED.value
+            and (details.name, details.version) not in busy
+        ][:free_slots]
+        candidates = [
+            (details, self._create_orchestrator(details)) for details in pending
+        ]
+        if not candidates:
+            return 0
+        if self.generation_pipeline is None:
+            self.generation_pipeline = GenerationPipeline()
+        packages = []
+        with self._in_flight_lock:
+            for details, orchestrator in candidates:
+                key = (details.name, details.version)
+                if key in self._generating or key in self._prewarming:
+                    continue
+                self._prewarmed.add(key)
+                self._prewarming[key] = threading.Event()
+                packages.append(details)
+                # Submitted under the lock, so a generation claiming this
+                # package afterwards is queued behind the pre-warm.
+                self.generation_pipeline.submit(
+                    PipelineJob(
+                        orchestrator=orchestrator,
+                        on_done=functools.partial(self._finish_prewarm, key),
+                        stop_after=ENV_STAGE,
+                    )
+                )
+        if not packages:
+            return 0
+        logger.info(
+            f"Core: Pre-warming {len(packages)} build environments for project"
+            f" '{self.registered_project_name}'."
+        )
+        return len(packages)
+
+    @staticmethod
+    def _log_prewarm_result(
+        orchestrator: Orchestrator, result: Union[str, bool]
+    ) -> None:
+        """Log how pre-warming a package's environment went."""
+        name = orchestrator.package_details.name
+        if result:
+            logger.info(f"Core: Build environment of {name} is ready.")
+        else:
+            logger.warning(f"Core: Could not pre-warm the build environment of {name}.")
+
+    def _finish_prewarm(
+        self,
+        key: tuple[str, Optional[str]],
+        orchestrator: Orchestrator,
+        result: Union[str, bool],
+    ) -> None:
+        """Log a pre-warm's result and release generations waiting for it."""
+        try:
+            self._log_prewarm_result(orchestrator, result)
+        finally:
+            with self._in_flight_lock:
+                prewarm = self._prewarming.pop(key, None)
+            if prewarm is not None:
+                prewarm.set()
+
+    def _start_pipeline_task(
+        self,
+        task_id: str,
+        details: PackageDetails,
+        prewarm: Optional[threading.Event],
+    ) -> None:
+        """Start a pipeline task once the package's pre-warm, if any, ended."""
+        self._wait_for_prewarm(details, prewarm)
+        self._mark_task_running(task_id)
+
+    def _mark_task_running(self, task_id: str) -> None:
+        """Record that a pipeline task has started."""
+        self._tasks[task_id]["status"] = TaskStatus.RUNNING
+
+    def _finish_pipeline_task(
+        self,
+        task_id: str,
+        details: PackageDetails,
+        orchestrator: Orchestrator,
+        generation_result: Union[str, bool],
+    ) -> None:
+        """Record the outcome of a package that left the generation pipeline."""
+        try:
+            if orchestrator.get_detected_doc_type() == "unknown":
+                self._fail_undetected(task_id, orchestrator, details)
+            else:
+                self._process_generation_result(
+                    task_id, generation_result, orchestrator, details
+                )
+        except Exception as e:
+            logger.exception(
+                "Core: An unexpected error occurred during docset generation"
+                f" for {details.name}."
+            )
+            self._tasks[task_id]["result"] = (False, f"Unexpected error: {e!s}")
+            self._tasks[task_id]["status"] = TaskStatus.FAILED
+        finally:
+            self._release_generation(details)
+            self._tasks[task_id]["progress"].close()
+
     def get_task_status(self, task_id: str) -> dict[str, Any]:
-        """Get the status and result of a docset generation task."""
+        """Get the status and result of a docset generation task.
+
+        Tasks that failed, or were skipped because the package failed
+        recently, also report the recorded failure under "failure", with
+        the failed stage, the error class and the next retry time.
+        """
         task_info = self._tasks.get(task_id)
         if task_info is None:
             return {"status": TaskStatus.FAILED.value, "result": "Task not found."}
@@ -684,10 +1208,16 @@ class DevilDexCore:
             else:
                 task_info["status"] = TaskStatus.FAILED
 
-        return {
+        status = {
             "status": task_info["status"].value,
             "result": task_info["result"],
         }
+        progress = task_info.get("progress")
+        if progress is not None:
+            status["progress"] = progress.snapshot()
+        if task_info.get("failure"):
+            status["failure"] = task_info["failure"]
+        return status
 
     def start_mcp_server_if_enabled(self, db_url: str) -> bool:
         """Start the MCP server if it is enabled in the configuration."""
@@ -707,6 +1237,34 @@ class DevilDexCore:
             logger.info("Core: MCP server is disabled. Not starting.")
             return False
 
+    def start_docset_server_if_enabled(self) -> bool:
+        """Start the local docset HTTP server if it is enabled."""
+        config = ConfigManager()
+        if not config.get_docset_server_enabled() or not self.docset_base_output_path:
+            logger.info("Core: Docset server is disabled. Not starting.")
+            return False
+        if not self.docset_server:
+            self.docset_server = DocsetServer(
+                self.docset_base_output_path,
+                port=config.get_docset_server_port(),
+                extra_roots=[self.app_paths.theme_assets_dir],
+            )
+        return self.docset_server.start()
+
+    def stop_docset_server(self) -> None:
+        """Stop the local docset HTTP server if it is running."""
+        if self.docset_server:
+            self.docset_server.stop()
+            self.docset_server = None
+
+    def get_docset_url(
+        self, docset_path: Path, page: str = "index.html"
+    ) -> Optional[str]:
+        """Return the docset server URL of a page, if the server is running."""
+        if not self.docset_server:
+            return None
+        return self.docset_server.url_for(docset_path, page)
+
     def stop_mcp_server(self) -> None:
         """Stop the MCP server if it is running."""
         if self.mcp_server_manager:
@@ -4,8 +4,11 @@ from .db_manager import DatabaseManager as DatabaseManager
 from .db_manager import Docset as Docset
 from .db_manager import PackageInfo as PackageInfo
 from .db_manager import RegisteredProject as RegisteredProject
+from .db_manager import bulk_ensure_package_entities as bulk_ensure_package_entities
 from .db_manager import ensure_package_entities_exist as ensure_package_entities_exist
 from .db_manager import get_session as get_session
 from .db_manager import init_db as init_db
+from .db_manager import record_generation_failure as record_generation_failure
+from .db_manager import save_doc_recipe as save_doc_recipe
+from .db_manager import save_generation_checkpoint as save_generation_checkpoint
 from .models import Base as Base
-
@@ -1,37 +1,59 @@
 """docset database module."""
 
+import datetime
+import json
 import logging
 import os
 import sys
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Optional, cast
 
-from alembic import command
-from alembic.config import Config
 from sqlalchemy import (
     Engine,
     Executable,
     Result,
     create_engine,
+    event,
+    func,
+    make_url,
     select,
+    text,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as SQLAlchemySession
 from sqlalchemy.orm import selectinload, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from devildex.app_paths import AppPaths
+from devildex.config_manager import ConfigManager
 
 from .models import (
+    DocRecipe,
     Docset,
+    DocsetRow,
+    GenerationCheckpoint,
+    GenerationFailure,
+    PackageDetails,
     PackageInfo,
+    ProjectDocRequirements,
     RegisteredProject,
+    StageCheckpoint,
+    decode_project_urls,
     project_docset_association,
 )
 
 logger = logging.getLogger(__name__)
 
+SQLITE_IN_MEMORY_DATABASES = ("", ":memory:")
+BULK_LOOKUP_CHUNK_SIZE = 500
+# The newest Alembic revision shipped with this build. Keep it in step with
+# the head of alembic/versions whenever a migration is added.
+SCHEMA_HEAD_REVISION = "e5b07c93d2f1"
+
 
 def get_base_path() -> Path:
     """Get the base path for resources, whether running as script or bundled."""
@@ -41,6 +63,53 @@ def get_base_path() -> Path:
         return Path(__file__).parent.parent
 
 
+def _engine_options(database_url: str, config: ConfigManager) -> dict[str, Any]:
+    """Return the create_engine options for a SQLite database.
+
+    Connections wait up to the busy timeout for a lock instead of failing
+    with "database is locked". A file database gets a connection pool
+    sized for the generation threads, the GUI and the MCP server.
+    """
+    options: dict[str, Any] = {
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": config.get_db_busy_timeout_ms() / 1000,
+        },
+        "echo": False,
+    }
+    if (make_url(database_url).database or "") not in SQLITE_IN_MEMORY_DATABASES:
+        options["pool_size"] = config.get_db_pool_size()
+        options["max_overflow"] = config.get_db_max_overflow()
+    return options
+
+
+def _set_sqlite_pragmas(engine: Engine, config: ConfigManager) -> None:
+    """Tune every new connection of engine for concurrent access.
+
+    Write-ahead logging lets readers and the writer work at the same time.
+    With it, synchronous=NORMAL only syncs at checkpoints and stays safe
+    against corruption.
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout={config.get_db_busy_timeout_ms()}",
+        f"PRAGMA mmap_size={config.get_db_mmap_size_mb() * 1024 * 1024}",
+        f"PRAGMA cache_size=-{config.get_db_cache_size_mb() * 1024}",
+    ]
+    if config.get_db_wal():
+        pragmas[:0] = ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(
+        dbapi_connection: DBAPIConnection, _connection_record: ConnectionPoolEntry
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 class DatabaseNotInitializedError(RuntimeError):
     """Raised when an operation is attempted before the database is initialized."""
 
@@ -112,47 +181,13 @@ class DatabaseManager:
         Includes the associated project name, if present.
         Filters by project if project_name_filter is provided.
         """
-        grid_data_to_return: list[dict[str, Any]] = []
-
-        stmt = select(Docset).options(
-            selectinload(Docset.package_info),
-            selectinload(Docset.associated_projects),
-        )
-
-        if project_name_filter:
-            stmt = stmt.join(Docset.associated_projects).where(
-                RegisteredProject.project_name == project_name_filter
-            )
-
-        stmt = stmt.order_by(Docset.package_name, Docset.package_version)
-
         try:
             with get_session() as session:
-                result = cls.execute_statement(stmt, session)
-                docsets_from_db = result.scalars().unique().all()
-
-                for db_docset in docsets_from_db:
-                    pkg_info = db_docset.package_info
-
-                    associated_project_name_for_display: Optional[str] = None
-                    if db_docset.associated_projects:
-                        associated_project_name_for_display = (
-                            db_docset.associated_projects[0].project_name
-                        )
-
-                    grid_row = {
-                        "id": db_docset.id,
-                        "name": db_docset.package_name,
-                        "version": db_docset.package_version,
-                        "description": (
-                            pkg_info.summary if pkg_info and pkg_info.summary else "N/A"
-                        ),
-                        "docset_status": db_docset.status,
-                        "project_name": associated_project_name_for_display,
-                    }
-                    if pkg_info and pkg_info.project_urls:
-                        grid_row["project_urls"] = pkg_info.project_urls
-                    grid_data_to_return.append(grid_row)
+                docset_rows = get_docset_rows(session, project_name_filter)
+                grid_data_to_return = [
+                    row.as_grid_row() | {"project_name": row.project_name}
+                    for row in docset_rows
+                ]
 
                 view_type = (
                     f"project '{project_name_filter}'"
@@ -205,41 +240,74 @@ class DatabaseManager:
 
         logger.info(f"Initializing database at: {database_url}")
 
+        config = ConfigManager()
         cls._engine = create_engine(
-            database_url,
-            connect_args={"check_same_thread": False},
-            echo=False,
+            database_url, **_engine_options(database_url, config)
         )
+        if cls._engine.dialect.name == "sqlite":
+            _set_sqlite_pragmas(cls._engine, config)
         cls._session_local = sessionmaker(
             autocommit=False, autoflush=False, bind=cls._engine
         )
 
         if not os.environ.get("DEVILDEX_TESTING"):
-            try:
-                logger.info("Checking for database migrations...")
-
-                base_path = Path(get_base_path())
-                if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-                    # PyInstaller bundle paths
-                    alembic_ini_path = base_path / "devildex" / "alembic.ini"
-                    alembic_script_location = base_path / "devildex" / "alembic"
-                else:
-                    # Development environment paths
-                    alembic_ini_path = Path(__file__).parent.parent / "alembic.ini"
-                    alembic_script_location = Path(__file__).parent.parent / "alembic"
-
-                alembic_cfg = Config(str(alembic_ini_path))
-                alembic_cfg.set_main_option(
-                    "script_location", str(alembic_script_location)
-                )
-
-                command.upgrade(alembic_cfg, "head")
+            if cls._schema_is_current():
                 logger.info(
-                    "--- DIRECT PRINT: DATABASE MIGRATION COMPLETED."
-                    " APPLICATION CONTINUES. ---",
+                    f"Database schema is at revision {SCHEMA_HEAD_REVISION}, "
+                    "skipping migrations."
                 )
-            except Exception:
-                logger.exception("Failed to run database migrations.")
+            else:
+                cls._run_migrations()
+
+    @classmethod
+    def _schema_is_current(cls) -> bool:
+        """Tell whether the database is stamped with the bundled head revision.
+
+        This reads alembic_version directly, so starting against an
+        up-to-date database never imports Alembic.
+        """
+        if cls._engine is None:
+            return False
+        try:
+            with cls._engine.connect() as connection:
+                stored_revisions = connection.execute(
+                    text("SELECT version_num FROM alembic_version")
+                ).scalars()
+                return list(stored_revisions) == [SCHEMA_HEAD_REVISION]
+        except SQLAlchemyError:
+            return False
+
+    @staticmethod
+    def _run_migrations() -> None:
+        """Upgrade the database schema to the head revision with Alembic."""
+        try:
+            # Imported here, as Alembic is slow to import and only needed when
+            # the schema is behind.
+            from alembic import command  # noqa: PLC0415
+            from alembic.config import Config  # noqa: PLC0415
+
+            logger.info("Checking for database migrations...")
+
+            base_path = Path(get_base_path())
+            if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+                # PyInstaller bundle paths
+                alembic_ini_path = base_path / "devildex" / "alembic.ini"
+                alembic_script_location = base_path / "devildex" / "alembic"
+            else:
+                # Development environment paths
+                alembic_ini_path = Path(__file__).parent.parent / "alembic.ini"
+                alembic_script_location = Path(__file__).parent.parent / "alembic"
+
+            alembic_cfg = Config(str(alembic_ini_path))
+            alembic_cfg.set_main_option("script_location", str(alembic_script_location))
+
+            command.upgrade(alembic_cfg, "head")
+            logger.info(
+                "--- DIRECT PRINT: DATABASE MIGRATION COMPLETED."
+                " APPLICATION CONTINUES. ---",
+            )
+        except Exception:
+            logger.exception("Failed to run database migrations.")
 
     @classmethod
     def get_project_details_by_name(
@@ -272,6 +340,129 @@ class DatabaseManager:
             )
             return None
 
+    @classmethod
+    def get_doc_recipe(cls, package_name: str) -> Optional[DocRecipe]:
+        """Return the most recently recorded doc recipe of a package, if any."""
+        stmt = (
+            select(ProjectDocRequirements)
+            .where(ProjectDocRequirements.package_name == package_name)
+            .order_by(ProjectDocRequirements.id.desc())
+            .limit(1)
+        )
+        try:
+            with get_session() as session:
+                doc_req = cls.execute_statement(stmt, session).scalar_one_or_none()
+                if doc_req is None:
+                    return None
+                return DocRecipe(doc_req.builder_type, doc_req.requirements)
+        except SQLAlchemyError:
+            logger.exception(f"Error retrieving the doc recipe of '{package_name}'")
+            return None
+
+    @classmethod
+    def get_project_packages_with_recipes(
+        cls, project_name: str
+    ) -> list[PackageDetails]:
+        """Return the packages of a project that have a doc recipe.
+
+        Each package carries its docset status and most recent recipe.
+        """
+        docsets_stmt = (
+            select(Docset)
+            .options(selectinload(Docset.package_info))
+            .join(Docset.associated_projects)
+            .where(RegisteredProject.project_name == project_name)
+        )
+        recipes_stmt = (
+            select(ProjectDocRequirements)
+            .join(
+                Docset,
+                Docset.package_name == ProjectDocRequirements.package_name,
+            )
+            .join(Docset.associated_projects)
+            .where(RegisteredProject.project_name == project_name)
+            .order_by(ProjectDocRequirements.id)
+        )
+        try:
+            with get_session() as session:
+                recipes = {
+                    doc_req.package_name: DocRecipe(
+                        doc_req.builder_type, doc_req.requirements
+                    )
+                    for doc_req in cls.execute_statement(recipes_stmt, session)
+                    .scalars()
+                    .unique()
+                }
+                docsets = cls.execute_statement(docsets_stmt, session).scalars().all()
+                return [
+                    PackageDetails(
+                        name=docset.package_name,
+                        version=docset.package_version,
+                        project_urls=(
+                            docset.package_info.project_urls
+                            if docset.package_info
+                            else {}
+                        ),
+                        status=docset.status,
+                        doc_recipe=recipes[docset.package_name],
+                    )
+                    for docset in docsets
+                    if docset.package_name in recipes
+                ]
+        except SQLAlchemyError:
+            logger.exception(f"Error retrieving the doc recipes of '{project_name}'")
+            return []
+
+    @classmethod
+    def get_active_generation_failure(
+        cls, package_name: str, package_version: str
+    ) -> Optional[dict[str, Any]]:
+        """Return the failure still holding back a package version, if any.
+
+        A failure holds the package back until its retry time has passed.
+        """
+        stmt = (
+            select(GenerationFailure)
+            .where(
+                GenerationFailure.package_name == package_name,
+                GenerationFailure.package_version == package_version,
+                GenerationFailure.retry_after_utc
+                > datetime.datetime.now(datetime.timezone.utc),
+            )
+            .order_by(GenerationFailure.retry_after_utc.desc())
+            .limit(1)
+        )
+        try:
+            with get_session() as session:
+                failure = cls.execute_statement(stmt, session).scalar_one_or_none()
+                return failure.as_dict() if failure else None
+        except SQLAlchemyError:
+            logger.exception(
+                f"Error retrieving generation failures of '{package_name}'"
+                f" v{package_version}"
+            )
+            return None
+
+    @classmethod
+    def get_generation_checkpoint(
+        cls, package_name: str, package_version: str
+    ) -> Optional[StageCheckpoint]:
+        """Return the checkpoint a package version's generation resumes from."""
+        stmt = select(GenerationCheckpoint).where(
+            GenerationCheckpoint.package_name == package_name,
+            GenerationCheckpoint.package_version == package_version,
+        )
+        try:
+            with get_session() as session:
+                checkpoint = cls.execute_statement(stmt, session).scalar_one_or_none()
+                return checkpoint.as_checkpoint() if checkpoint else None
+        except SQLAlchemyError:
+            logger.exception(
+                f"Error retrieving the generation checkpoint of '{package_name}'"
+                f" v{package_version}"
+            )
+            return None
+
     @classmethod
     def close_db(cls) -> None:
         """Close the database engine."""
@@ -319,6 +510,71 @@ def get_session() -> Generator[SQLAlchemySession, None, None]:
         yield db_session
 
 
+def get_docset_rows(
+    session: SQLAlchemySession, project_name: Optional[str] = None
+) -> list[DocsetRow]:
+    """Read docsets with their package details in a single query.
+
+    The columns are selected directly, so no ORM objects are loaded. Each
+    row names one project the docset is associated with: project_name if
+    given, which also limits the rows to that project's docsets.
+    """
+    if project_name:
+        project_column = RegisteredProject.project_name
+    else:
+        project_column = (
+            select(func.min(RegisteredProject.project_name))
+            .join(
+                project_docset_association,
+                project_docset_association.c.project_id == RegisteredProject.id,
+            )
+            .where(project_docset_association.c.docset_id == Docset.id)
+            .scalar_subquery()
+        )
+    stmt = select(
+        Docset.id,
+        Docset.package_name,
+        Docset.package_version,
+        Docset.status,
+        PackageInfo.summary,
+        PackageInfo._project_urls_json,
+        project_column,
+    ).outerjoin(PackageInfo, PackageInfo.package_name == Docset.package_name)
+    if project_name:
+        stmt = (
+            stmt.join(
+                project_docset_association,
+                project_docset_association.c.docset_id == Docset.id,
+            )
+            .join(
+                RegisteredProject,
+                RegisteredProject.id == project_docset_association.c.project_id,
+            )
+            .where(RegisteredProject.project_name == project_name)
+        )
+    stmt = stmt.order_by(Docset.package_name, Docset.package_version)
+    return [
+        DocsetRow(
+            id=docset_id,
+            package_name=package_name,
+            package_version=package_version,
+            status=status,
+            summary=summary,
+            project_urls=decode_project_urls(project_urls_json, package_name),
+            project_name=docset_project_name,
+        )
+        for (
+            docset_id,
+            package_name,
+            package_version,
+            status,
+            summary,
+            project_urls_json,
+            docset_project_name,
+        ) in DatabaseManager.execute_statement(stmt, session)
+    ]
+
+
 def _ensure_package_info(
     session: SQLAlchemySession,
     package_name: str,
@@ -375,6 +631,42 @@ def _ensure_docset(
     return docset
 
 
+def _get_or_create_registered_project(
+    session: SQLAlchemySession,
+    project_name: str,
+    project_path: Optional[str],
+    python_executable: Optional[str],
+) -> RegisteredProject:
+    """Return the RegisteredProject named project_name, creating it if needed.
+
+    Raises:
+        ValueError: If the project is new and project_path or
+            python_executable are missing.
+
+    """
+    registered_project_obj = (
+        session.query(RegisteredProject).filter_by(project_name=project_name).first()
+    )
+    if registered_project_obj:
+        return registered_project_obj
+    logger.info(f"RegisteredProject '{project_name}' not found, creating...")
+    if not project_path or not python_executable:
+        msg = (
+            f"To create a new RegisteredProject '{project_name}', "
+            "project_path and python_executable must be provided."
+        )
+        logger.error(msg)
+        raise ValueError(msg)
+    registered_project_obj = RegisteredProject(
+        project_name=project_name,
+        project_path=str(project_path),
+        python_executable=str(python_executable),
+    )
+    session.add(registered_project_obj)
+    logger.info(f"New RegisteredProject '{project_name}' added to session.")
+    return registered_project_obj
+
+
 def _ensure_registered_project_and_association(
     session: SQLAlchemySession,
     project_name: Optional[str],
@@ -389,26 +681,9 @@ def _ensure_registered_project_and_association(
     if not project_name:
         return None
 
-    registered_project_obj = (
-        session.query(RegisteredProject).filter_by(project_name=project_name).first()
+    registered_project_obj = _get_or_create_registered_project(
+        session, project_name, project_path, python_executable
     )
-    if not registered_project_obj:
-        logger.info(f"RegisteredProject '{project_name}' not found, creating...")
-        if not project_path or not python_executable:
-            msg = (
-                f"To create a new RegisteredProject '{project_name}', "
-                "project_path and python_executable must be provided."
-            )
-            logger.error(msg)
-            raise ValueError(msg)
-        registered_project_obj = RegisteredProject(
-            project_name=project_name,
-            project_path=str(project_path),
-            python_executable=str(python_executable),
-        )
-        session.add(registered_project_obj)
-        logger.info(f"New RegisteredProject '{project_name}' added to session.")
-
     if docset not in registered_project_obj.docsets:
         registered_project_obj.docsets.append(docset)
         logger.info(
@@ -492,6 +767,271 @@ def ensure_package_entities_exist(  # noqa: PLR0913
     return pkg_info, docset, registered_project_obj
 
 
+def _docset_ids(
+    session: SQLAlchemySession, pairs: set[tuple[str, str]]
+) -> dict[tuple[str, str], int]:
+    """Return the ids of the docsets of the given (name, version) pairs."""
+    names = sorted({name for name, _ in pairs})
+    ids: dict[tuple[str, str], int] = {}
+    for start in range(0, len(names), BULK_LOOKUP_CHUNK_SIZE):
+        rows = session.execute(
+            select(Docset.id, Docset.package_name, Docset.package_version).where(
+                Docset.package_name.in_(names[start : start + BULK_LOOKUP_CHUNK_SIZE])
+            )
+        )
+        for docset_id, name, version in rows:
+            if (name, version) in pairs:
+                ids[(name, version)] = docset_id
+    return ids
+
+
+def bulk_ensure_package_entities(
+    packages: Sequence[dict[str, Any]],
+    project_name: Optional[str] = None,
+    project_path: Optional[str] = None,
+    python_executable: Optional[str] = None,
+) -> int:
+    """Ensure the entities of many packages in a single transaction.
+
+    This is the set-based counterpart of ensure_package_entities_exist.
+    PackageInfo rows are upserted with INSERT ... ON CONFLICT and missing
+    docsets are inserted, all in one executemany each. When project_name is
+    given, every docset is associated with the project the same way. The
+    number of statements does not grow with the number of packages.
+
+    Args:
+        packages: One dict per package with the package_name,
+            package_version, summary, project_urls and initial_docset_status
+            arguments of ensure_package_entities_exist. Only package_name
+            and package_version are required.
+        project_name: (Optional) Name of the project.
+        project_path: (Optional) Path of the project (required if
+            project_name is for a new project).
+        python_executable: (Optional) Python executable path (required if
+            project_name is for a new project).
+
+    Returns:
+        The number of docsets ensured.
+
+    Raises:
+        ValueError: If project_name is provided for a new project but
+                    project_path or python_executable are missing.
+
+    """
+    if not packages:
+        return 0
+    package_info_rows = [
+        {
+            "package_name": package["package_name"],
+            "summary": package.get("summary"),
+            "project_urls": (
+                json.dumps(package["project_urls"])
+                if package.get("project_urls")
+                else None
+            ),
+        }
+        for package in packages
+    ]
+    package_info_insert = sqlite_insert(PackageInfo.__table__)
+    package_info_upsert = package_info_insert.on_conflict_do_update(
+        index_elements=["package_name"],
+        set_={
+            "summary": func.coalesce(
+                func.nullif(package_info_insert.excluded.summary, ""),
+                PackageInfo.__table__.c.summary,
+            ),
+            "project_urls": func.coalesce(
+                package_info_insert.excluded.project_urls,
+                PackageInfo.__table__.c.project_urls,
+            ),
+        },
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+    docset_rows = [
+        {
+            "package_name": package["package_name"],
+            "package_version": package["package_version"],
+            "status": package.get("initial_docset_status") or "unknown",
+            "index_file_name": package.get("index_file_name") or "index.html",
+            "generation_timestamp_utc": now,
+        }
+        for package in packages
+    ]
+    with get_session() as session:
+        try:
+            session.execute(package_info_upsert, package_info_rows)
+            pairs = {
+                (row["package_name"], row["package_version"]) for row in docset_rows
+            }
+            existing = _docset_ids(session, pairs)
+            missing_rows = [
+                row
+                for row in docset_rows
+                if (row["package_name"], row["package_version"]) not in existing
+            ]
+            if missing_rows:
+                session.execute(
+                    sqlite_insert(Docset.__table__).on_conflict_do_nothing(),
+                    missing_rows,
+                )
+                existing = _docset_ids(session, pairs)
+            if project_name:
+                project = _get_or_create_registered_project(
+                    session, project_name, project_path, python_executable
+                )
+                session.flush()
+                session.execute(
+                    sqlite_insert(project_docset_association).on_conflict_do_nothing(),
+                    [
+                        {"project_id": project.id, "docset_id": docset_id}
+                        for docset_id in existing.values()
+                    ],
+                )
+            session.commit()
+        except Exception:
+            logger.exception("Error while ensuring package entities in bulk.")
+            session.rollback()
+            raise
+    logger.info(
+        f"Ensured entities of {len(pairs)} package versions"
+        + (f" for project '{project_name}'." if project_name else ".")
+    )
+    return len(pairs)
+
+
+def save_doc_recipe(package_name: str, recipe: DocRecipe) -> None:
+    """Record the recipe a package's documentation was built with.
+
+    The recipe replaces the one stored for the same builder type. A recipe
+    for a new builder type is added and becomes the package's most recent.
+    """
+    with get_session() as session:
+        _ensure_package_info(session, package_name, None, None)
+        doc_req = (
+            session.query(ProjectDocRequirements)
+            .filter_by(package_name=package_name, builder_type=recipe.builder_type)
+            .first()
+        )
+        if doc_req is None:
+            doc_req = ProjectDocRequirements(
+                package_name=package_name, builder_type=recipe.builder_type
+            )
+            session.add(doc_req)
+        doc_req.requirements = recipe.requirements
+        try:
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            logger.exception(
+                f"Error saving the {recipe.builder_type} doc recipe of"
+                f" '{package_name}'"
+            )
+            raise
+        logger.info(f"Saved the {recipe.builder_type} doc recipe of '{package_name}'.")
+
+
+def record_generation_failure(  # noqa: PLR0913
+    package_name: str,
+    package_version: str,
+    stage: str,
+    error_class: str,
+    backoff_seconds: int,
+    max_backoff_seconds: int,
+) -> dict[str, Any]:
+    """Record a failed generation stage of a package version.
+
+    Args:
+        package_name: The name of the package.
+        package_version: The version of the package.
+        stage: The generation stage that failed.
+        error_class: The kind of error the stage failed with.
+        backoff_seconds: The wait after the first failure. It doubles with
+            every further failure of the same stage.
+        max_backoff_seconds: The longest wait.
+
+    Returns:
+        The failure as reported in task statuses.
+
+    """
+    with get_session() as session:
+        failure = (
+            session.query(GenerationFailure)
+            .filter_by(
+                package_name=package_name,
+                package_version=package_version,
+                stage=stage,
+            )
+            .first()
+        )
+        if failure is None:
+            failure = GenerationFailure(
+                package_name=package_name,
+                package_version=package_version,
+                stage=stage,
+            )
+            session.add(failure)
+        failure.register(
+            error_class,
+            backoff_seconds,
+            max_backoff_seconds,
+            datetime.datetime.now(datetime.timezone.utc),
+        )
+        try:
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            logger.exception(
+                f"Error recording the {stage} failure of '{package_name}'"
+                f" v{package_version}"
+            )
+            raise
+        logger.info(
+            f"Recorded {stage} failure #{failure.failure_count} of"
+            f" '{package_name}' v{package_version} ({error_class})."
+        )
+        return failure.as_dict()
+
+
+def save_generation_checkpoint(
+    package_name: str, package_version: str, checkpoint: StageCheckpoint
+) -> None:
+    """Record the last generation stage a package version completed.
+
+    The checkpoint replaces the one stored for the package version.
+    """
+    with get_session() as session:
+        row = (
+            session.query(GenerationCheckpoint)
+            .filter_by(package_name=package_name, package_version=package_version)
+            .first()
+        )
+        if row is None:
+            row = GenerationCheckpoint(
+                package_name=package_name, package_version=package_version
+            )
+            session.add(row)
+        row.stage = checkpoint.stage
+        row.source_path = checkpoint.source_path
+        row.source_digest = checkpoint.source_digest
+        row.doc_type = checkpoint.doc_type
+        row.sphinx_doc_path = checkpoint.sphinx_doc_path
+        row.env_key = checkpoint.env_key
+        row.updated_utc = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            logger.exception(
+                f"Error saving the {checkpoint.stage} checkpoint of"
+                f" '{package_name}' v{package_version}"
+            )
+            raise
+        logger.debug(
+            f"Saved the {checkpoint.stage} checkpoint of '{package_name}'"
+            f" v{package_version}."
+        )
+
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
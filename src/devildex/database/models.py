@@ -11,6 +11,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -28,9 +29,81 @@ project_docset_association = Table(
         "project_id", Integer, ForeignKey("registered_project.id"), primary_key=True
     ),
     Column("docset_id", Integer, ForeignKey("docset.id"), primary_key=True),
+    Index("ix_project_docset_association_docset_id", "docset_id", "project_id"),
 )
 
 
+@dataclass
+class DocRecipe:
+    """A known-good way to build the documentation of a package."""
+
+    builder_type: str
+    requirements: list[str] = field(default_factory=list)
+
+
+@dataclass
+class StageCheckpoint:
+    """What the generation stages a package completed found, to resume from.
+
+    stage is the last completed stage. source_digest fingerprints the
+    fetched sources and env_key names the cached build environment, if the
+    builder has one.
+    """
+
+    stage: str
+    source_path: str
+    source_digest: str
+    doc_type: str
+    sphinx_doc_path: str | None = None
+    env_key: str | None = None
+
+
+@dataclass(frozen=True)
+class DocsetRow:
+    """A docset with its package summary and URLs, read as plain columns."""
+
+    id: int
+    package_name: str
+    package_version: str
+    status: str
+    summary: str | None = None
+    project_urls: dict[str, str] = field(default_factory=dict)
+    project_name: str | None = None
+
+    def as_grid_row(self) -> dict[str, Any]:
+        """Return the row as the grid shows it."""
+        grid_row: dict[str, Any] = {
+            "id": self.id,
+            "name": self.package_name,
+            "version": self.package_version,
+            "description": self.summary or "N/A",
+            "docset_status": self.status,
+        }
+        if self.project_urls:
+            grid_row["project_urls"] = self.project_urls
+        return grid_row
+
+
+def decode_project_urls(
+    project_urls_json: str | None, package_name: str
+) -> dict[str, str]:
+    """Decode the project_urls JSON stored for a package."""
+    if project_urls_json:
+        try:
+
+            return json.loads(project_urls_json)  # type: ignore[no-any-return]
+        except json.JSONDecodeError:
+
+            logger = logging.getLogger(__name__)
+            logger.exception(
+                "Error nel decoding project_urls JSON per package_info "
+                f"{package_name}: "
+                f"{project_urls_json}"
+            )
+            return {}
+    return {}
+
+
 @dataclass
 class PackageDetails:
     """Contains details of a  software package."""
@@ -42,6 +115,8 @@ class PackageDetails:
     vcs_url: str | None = None
     rtd_url: str | None = None
     status: str = "unknown"
+    doc_recipe: DocRecipe | None = None
+    checkpoint: StageCheckpoint | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PackageDetails":
@@ -70,22 +145,7 @@ class PackageInfo(Base):  # type: ignore[valid-type,misc]
     @property
     def project_urls(self) -> dict[str, str]:
         """Get project_urls come dictionary."""
-        if self._project_urls_json:
-            try:
-
-                return json.loads(
-                    self._project_urls_json
-                )  # type: ignore[no-any-return]
-            except json.JSONDecodeError:
-
-                logger = logging.getLogger(__name__)
-                logger.exception(
-                    "Error nel decoding project_urls JSON per package_info "
-                    f"{self.package_name}: "
-                    f"{self._project_urls_json}"
-                )
-                return {}
-        return {}
+        return decode_project_urls(self._project_urls_json, self.package_name)
 
     @project_urls.setter
     def project_urls(self, value: dict[str, str]) -> None:
@@ -149,6 +209,7 @@ class Docset(Base):  # type: ignore[valid-type,misc]
     )
     status = Column(String, nullable=False, default="unknown")
     notes = Column(Text, nullable=True)
+    _manifest_json = Column("manifest_json", Text, nullable=True)
 
     package_info = relationship("PackageInfo", back_populates="docsets")
 
@@ -162,8 +223,37 @@ class Docset(Base):  # type: ignore[valid-type,misc]
         UniqueConstraint(
             "package_name", "package_version", name="uq_docset_package_name_version"
         ),
+        Index(
+            "ix_docset_package_name_status_version",
+            "package_name",
+            "status",
+            "package_version",
+        ),
     )
 
+    @property
+    def manifest(self) -> dict[str, str]:
+        """Get the content-store manifest, mapping file paths to digests."""
+        if self._manifest_json:
+            try:
+                return json.loads(self._manifest_json)
+            except json.JSONDecodeError:
+                logger = logging.getLogger(__name__)
+                logger.exception(
+                    f"Error decoding manifest JSON for docset {self.package_name} "
+                    f"v{self.package_version}"
+                )
+                return {}
+        return {}
+
+    @manifest.setter
+    def manifest(self, value: dict[str, str]) -> None:
+        """Set the content-store manifest, converting it to JSON."""
+        if value:
+            self._manifest_json = json.dumps(value, sort_keys=True)
+        else:
+            self._manifest_json = None
+
     def __repr__(self) -> str:
         """Implement repr method."""
         return (
@@ -222,3 +312,120 @@ class ProjectDocRequirements(Base):  # type: ignore[valid-type,misc]
             f"package_name='{self.package_name}', "
             f"builder_type='{self.builder_type}')>"
         )
+
+
+class GenerationFailure(Base):  # type: ignore[valid-type,misc]
+    """Model for repeated docset generation failures of a package version.
+
+    One row is kept per generation stage. Every failure doubles the time
+    before the next attempt, up to a maximum.
+    """
+
+    __tablename__ = "generation_failure"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    package_name = Column(String, nullable=False, index=True)
+    package_version = Column(String, nullable=False)
+    stage = Column(String, nullable=False)
+    error_class = Column(String, nullable=False)
+    failure_count = Column(Integer, nullable=False, default=0)
+    last_failure_utc = Column(DateTime(timezone=True), nullable=False)
+    retry_after_utc = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "package_name",
+            "package_version",
+            "stage",
+            name="uq_generation_failure_package_version_stage",
+        ),
+    )
+
+    def register(
+        self,
+        error_class: str,
+        backoff_seconds: int,
+        max_backoff_seconds: int,
+        now: datetime.datetime,
+    ) -> None:
+        """Count one more failure and push the next attempt back."""
+        self.error_class = error_class
+        self.failure_count = (self.failure_count or 0) + 1
+        delay = min(
+            max_backoff_seconds, backoff_seconds * 2 ** (self.failure_count - 1)
+        )
+        self.last_failure_utc = now
+        self.retry_after_utc = now + datetime.timedelta(seconds=delay)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Describe the failure for task status reports."""
+        return {
+            "package": self.package_name,
+            "version": self.package_version,
+            "stage": self.stage,
+            "error_class": self.error_class,
+            "failures": self.failure_count,
+            "last_failure": _as_utc(self.last_failure_utc).isoformat(),
+            "retry_after": _as_utc(self.retry_after_utc).isoformat(),
+        }
+
+    def __repr__(self) -> str:
+        """Implement repr method."""
+        return (
+            f"<GenerationFailure(package_name='{self.package_name}', "
+            f"version='{self.package_version}', stage='{self.stage}', "
+            f"failures={self.failure_count})>"
+        )
+
+
+class GenerationCheckpoint(Base):  # type: ignore[valid-type,misc]
+    """Model for the last generation stage a package version completed."""
+
+    __tablename__ = "generation_checkpoint"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    package_name = Column(String, nullable=False, index=True)
+    package_version = Column(String, nullable=False)
+    stage = Column(String, nullable=False)
+    source_path = Column(Text, nullable=False)
+    source_digest = Column(String, nullable=False)
+    doc_type = Column(String, nullable=False)
+    sphinx_doc_path = Column(Text, nullable=True)
+    env_key = Column(String, nullable=True)
+    updated_utc = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "package_name",
+            "package_version",
+            name="uq_generation_checkpoint_package_version",
+        ),
+    )
+
+    def as_checkpoint(self) -> StageCheckpoint:
+        """Return the checkpoint the orchestrator resumes from."""
+        return StageCheckpoint(
+            stage=self.stage,
+            source_path=self.source_path,
+            source_digest=self.source_digest,
+            doc_type=self.doc_type,
+            sphinx_doc_path=self.sphinx_doc_path,
+            env_key=self.env_key,
+        )
+
+    def __repr__(self) -> str:
+        """Implement repr method."""
+        return (
+            f"<GenerationCheckpoint(package_name='{self.package_name}', "
+            f"version='{self.package_version}', stage='{self.stage}')>"
+        )
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    """Return value as an aware UTC datetime.
+
+    SQLite gives back naive datetimes even for timezone aware columns.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
@@ -0,0 +1 @@
+"""Docset HTTP server package."""
@@ -0,0 +1,505 @@
+"""docset http server module."""
+
+import email.utils
+import functools
+import logging
+import mimetypes
+import threading
+import zipfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional, Union
+from urllib.parse import quote, unquote, urlsplit
+
+from devildex.utils.docset_archive import (
+    ARCHIVE_SUFFIX,
+    INDEX_PAGE,
+    archive_path_for,
+    is_docset_archive,
+    normalize_member,
+    open_archive,
+)
+from devildex.utils.precompress import available_encodings, fresh_variant
+from devildex.utils.staging import swap_in_progress
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DOCSETS_ROUTE = "/docsets/"
+CACHE_CONTROL = "no-cache"
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+MEMORY_CACHE_ENTRIES = 256
+MEMORY_CACHE_MAX_BYTES = 512 * 1024
+SEND_CHUNK_SIZE = 64 * 1024
+SERVER_STOP_TIMEOUT_SECONDS = 5
+
+
+class UnsatisfiableRangeError(Exception):
+    """The requested byte range lies outside the resource."""
+
+
+@dataclass(frozen=True)
+class DocsetResource:
+    """One representation of a docset file, ready to be sent."""
+
+    name: str
+    size: int
+    etag: str
+    last_modified: float
+    encoding: Optional[str]
+    read: Callable[[int, int], bytes]
+
+    @property
+    def content_type(self) -> str:
+        """Return the content type of the file, with a charset for text."""
+        content_type = mimetypes.guess_type(self.name)[0] or DEFAULT_CONTENT_TYPE
+        if content_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+        return content_type
+
+
+@dataclass(frozen=True)
+class Redirect:
+    """A docset directory requested without its trailing slash."""
+
+    location: str
+
+
+@functools.lru_cache(maxsize=MEMORY_CACHE_ENTRIES)
+def _cached_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """Return the content of a small file, cached until it changes."""
+    return Path(path).read_bytes()
+
+
+@functools.lru_cache(maxsize=MEMORY_CACHE_ENTRIES)
+def _cached_member(archive_path: str, mtime_ns: int, member: str) -> bytes:
+    """Return the content of a small archive member, cached until it changes."""
+    return open_archive(Path(archive_path)).read(member)
+
+
+def _read_file_range(path: Path, start: int, length: int) -> bytes:
+    """Read part of a file without loading the rest."""
+    with path.open("rb") as handle:
+        handle.seek(start)
+        return handle.read(length)
+
+
+def _file_resource(path: Path, name: str, encoding: Optional[str]) -> DocsetResource:
+    """Describe a file on disk."""
+    stat = path.stat()
+    if stat.st_size <= MEMORY_CACHE_MAX_BYTES:
+
+        def read(start: int, length: int) -> bytes:
+            content = _cached_file(str(path), stat.st_mtime_ns, stat.st_size)
+            return content[start : start + length]
+
+    else:
+
+        def read(start: int, length: int) -> bytes:
+            return _read_file_range(path, start, length)
+
+    return DocsetResource(
+        name=name,
+        size=stat.st_size,
+        etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        last_modified=stat.st_mtime,
+        encoding=encoding,
+        read=read,
+    )
+
+
+def _member_resource(
+    archive_path: Path, info: zipfile.ZipInfo, name: str, encoding: Optional[str]
+) -> DocsetResource:
+    """Describe a file inside a docset archive."""
+    stat = archive_path.stat()
+
+    def read(start: int, length: int) -> bytes:
+        if info.file_size <= MEMORY_CACHE_MAX_BYTES:
+            content = _cached_member(str(archive_path), stat.st_mtime_ns, info.filename)
+        else:
+            content = open_archive(archive_path).read(info.filename)
+        return content[start : start + length]
+
+    return DocsetResource(
+        name=name,
+        size=info.file_size,
+        etag=f'"{info.CRC:08x}-{info.file_size:x}"',
+        last_modified=stat.st_mtime,
+        encoding=encoding,
+        read=read,
+    )
+
+
+def parse_accept_encoding(header: Optional[str]) -> set[str]:
+    """Return the content codings a client accepts."""
+    accepted = set()
+    for token in (header or "").split(","):
+        coding, _, params = token.partition(";")
+        if params.replace(" ", "").lower() in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def parse_byte_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Parse a single byte range into inclusive start and end offsets.
+
+    Multiple or malformed ranges return None, so the whole file is sent.
+
+    Raises:
+        UnsatisfiableRangeError: If the range starts past the end of the file.
+
+    """
+    unit, _, byte_range = header.partition("=")
+    first, separator, last = byte_range.strip().partition("-")
+    if unit.strip().lower() != "bytes" or "," in byte_range or not separator:
+        return None
+    if not first:
+        if not last.isdigit():
+            return None
+        if int(last) == 0 or size == 0:
+            raise UnsatisfiableRangeError(header)
+        return max(0, size - int(last)), size - 1
+    if not first.isdigit() or (last and not last.isdigit()):
+        return None
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise UnsatisfiableRangeError(header)
+    return start, end
+
+
+class DocsetLocator:
+    """Map request paths to docset files, on disk or inside archives."""
+
+    def __init__(self, docsets_dir: Path, extra_roots: Iterable[Path] = ()) -> None:
+        """Initialize the DocsetLocator.
+
+        Args:
+            docsets_dir: The directory holding all docsets.
+            extra_roots: Other directories that docsets may link into,
+                such as the shared theme asset bundles.
+
+        """
+        self.docsets_dir = docsets_dir
+        self.allowed_roots = [docsets_dir.resolve()] + [
+            root.resolve() for root in extra_roots
+        ]
+
+    def locate(
+        self, request_path: str, accepted: set[str]
+    ) -> Union[DocsetResource, Redirect, None]:
+        """Find the best representation of a requested docset file.
+
+        Args:
+            request_path: The URL path below the docsets route.
+            accepted: The content codings the client accepts.
+
+        Returns:
+            The file to send, a redirect for a directory, or None if the
+            path does not name a docset file.
+
+        """
+        member = normalize_member(request_path)
+        if member is None:
+            return None
+        if request_path.endswith("/"):
+            member = f"{member}/{INDEX_PAGE}"
+        candidate = self.docsets_dir / member
+        if candidate.is_file():
+            return self._file(candidate, accepted)
+        if candidate.is_dir() or is_docset_archive(archive_path_for(candidate)):
+            return Redirect(f"{DOCSETS_ROUTE}{quote(member)}/")
+        return self._archive_member(member, accepted)
+
+    def is_updating(self, request_path: str) -> bool:
+        """Tell whether the docset a request points into is being replaced."""
+        member = normalize_member(request_path)
+        if member is None:
+            return False
+        parts = member.split("/")
+        return any(
+            swap_in_progress(self.docsets_dir.joinpath(*parts[:depth]))
+            for depth in range(1, len(parts) + 1)
+        )
+
+    def _is_allowed(self, path: Path) -> bool:
+        """Check that a file resolves inside the docsets or a linked root."""
+        resolved = path.resolve()
+        return any(resolved.is_relative_to(root) for root in self.allowed_roots)
+
+    def _file(self, path: Path, accepted: set[str]) -> Optional[DocsetResource]:
+        """Describe a file on disk, preferring a fresh precompressed variant."""
+        if not self._is_allowed(path):
+            return None
+        for encoding in available_encodings():
+            if encoding.name in accepted:
+                variant = fresh_variant(path, encoding)
+                if variant:
+                    return _file_resource(variant, path.name, encoding.name)
+        return _file_resource(path, path.name, None)
+
+    def _archive_member(
+        self, member: str, accepted: set[str]
+    ) -> Union[DocsetResource, Redirect, None]:
+        """Describe a file of the packed docset that member points into."""
+        parts = member.split("/")
+        for split_at in range(len(parts) - 1, 0, -1):
+            archive_path = archive_path_for(
+                self.docsets_dir.joinpath(*parts[:split_at])
+            )
+            if not is_docset_archive(archive_path) or not self._is_allowed(
+                archive_path
+            ):
+                continue
+            page = "/".join(parts[split_at:])
+            archive = open_archive(archive_path)
+            info = archive.info(page)
+            if info is None:
+                if archive.has_page(f"{page}/{INDEX_PAGE}"):
+                    return Redirect(f"{DOCSETS_ROUTE}{quote(member)}/")
+                return None
+            for encoding in available_encodings():
+                variant_info = archive.info(page + encoding.suffix)
+                if encoding.name in accepted and variant_info:
+                    return _member_resource(
+                        archive_path, variant_info, page, encoding.name
+                    )
+            return _member_resource(archive_path, info, page, None)
+        return None
+
+
+class DocsetRequestHandler(BaseHTTPRequestHandler):
+    """Serve docset files with validators, ranges and precompressed variants."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_DocsetHTTPServer"
+
+    def do_GET(self) -> None:
+        """Send a docset file."""
+        self._serve(send_body=True)
+
+    def do_HEAD(self) -> None:
+        """Send the headers of a docset file."""
+        self._serve(send_body=False)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Log requests at debug level instead of writing to stderr."""
+        logger.debug("Docset server: " + format, *args)
+
+    def _serve(self, send_body: bool) -> None:
+        """Answer a GET or HEAD request."""
+        path = unquote(urlsplit(self.path).path)
+        if not path.startswith(DOCSETS_ROUTE):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        try:
+            found = self.server.locator.locate(
+                path[len(DOCSETS_ROUTE) :],
+                parse_accept_encoding(self.headers.get("Accept-Encoding")),
+            )
+        except (OSError, zipfile.BadZipFile, KeyError):
+            logger.exception(f"Docset server: could not read {path}")
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR)
+            return
+        if found is None and self.server.locator.is_updating(
+            path[len(DOCSETS_ROUTE) :]
+        ):
+            self.send_error(
+                HTTPStatus.SERVICE_UNAVAILABLE, "The docset is being updated."
+            )
+        elif found is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+        elif isinstance(found, Redirect):
+            self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+            self.send_header("Location", found.location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self._is_not_modified(found):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_validators(found)
+            self.end_headers()
+        else:
+            self._send_resource(found, send_body)
+
+    def _is_not_modified(self, resource: DocsetResource) -> bool:
+        """Check the request's validators against the resource."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or resource.etag in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if not if_modified_since:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return int(resource.last_modified) <= since.timestamp()
+
+    def _requested_range(self, resource: DocsetResource) -> Optional[tuple[int, int]]:
+        """Return the byte range to send, honouring If-Range.
+
+        Raises:
+            UnsatisfiableRangeError: If the range starts past the end.
+
+        """
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if not range_header or (if_range and if_range.strip() != resource.etag):
+            return None
+        return parse_byte_range(range_header, resource.size)
+
+    def _send_validators(self, resource: DocsetResource) -> None:
+        """Send the headers a client needs to revalidate its copy."""
+        self.send_header("ETag", resource.etag)
+        self.send_header(
+            "Last-Modified",
+            email.utils.formatdate(resource.last_modified, usegmt=True),
+        )
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _send_resource(self, resource: DocsetResource, send_body: bool) -> None:
+        """Send a whole file or the requested part of it."""
+        try:
+            byte_range = self._requested_range(resource)
+        except UnsatisfiableRangeError:
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header("Content-Range", f"bytes */{resource.size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        start, end = byte_range or (0, resource.size - 1)
+        if byte_range:
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{resource.size}")
+        else:
+            self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", resource.content_type)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        if resource.encoding:
+            self.send_header("Content-Encoding", resource.encoding)
+        self._send_validators(resource)
+        self.end_headers()
+        if not send_body:
+            return
+        try:
+            for offset in range(start, end + 1, SEND_CHUNK_SIZE):
+                length = min(SEND_CHUNK_SIZE, end + 1 - offset)
+                self.wfile.write(resource.read(offset, length))
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Docset server: client closed the connection early.")
+
+
+class _DocsetHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that knows where the docsets are."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], locator: DocsetLocator) -> None:
+        """Initialize the server and bind it."""
+        self.locator = locator
+        super().__init__(address, DocsetRequestHandler)
+
+
+class DocsetServer:
+    """Serve the docsets over HTTP from a background thread of the app.
+
+    The viewer and MCP clients load pages from this server instead of from
+    ``file://`` URLs. Responses carry ETag and Last-Modified validators so
+    revisits are answered with 304, support byte ranges, and use the gzip
+    or brotli variants stored at build time when the client accepts them.
+    Packed docsets are served straight from their archives.
+    """
+
+    def __init__(
+        self,
+        docsets_dir: Path,
+        port: int = 0,
+        host: str = DEFAULT_HOST,
+        extra_roots: Iterable[Path] = (),
+    ) -> None:
+        """Initialize the DocsetServer."""
+        self.docsets_dir = docsets_dir
+        self.host = host
+        self.port = port
+        self.locator = DocsetLocator(docsets_dir, extra_roots)
+        self._httpd: Optional[_DocsetHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL of the docsets route."""
+        return f"http://{self.host}:{self.port}{DOCSETS_ROUTE}"
+
+    def is_running(self) -> bool:
+        """Check whether the server is serving requests."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Bind the server and serve requests in a daemon thread.
+
+        If the configured port is taken, a free port is used instead.
+        """
+        if self.is_running():
+            return True
+        try:
+            self._httpd = _DocsetHTTPServer((self.host, self.port), self.locator)
+        except OSError:
+            logger.warning(
+                f"Docset server: port {self.port} is not available, using a free one."
+            )
+            try:
+                self._httpd = _DocsetHTTPServer((self.host, 0), self.locator)
+            except OSError:
+                logger.exception("Docset server: could not bind.")
+                return False
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="docset-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Docset server listening on {self.base_url}")
+        return True
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread:
+            self._thread.join(timeout=SERVER_STOP_TIMEOUT_SECONDS)
+            self._thread = None
+
+    def url_for(self, docset_path: Path, page: str = INDEX_PAGE) -> Optional[str]:
+        """Return the URL of a page of a docset directory or archive.
+
+        Returns:
+            The URL, or None if the server is not running or the docset is
+            not below the served directory.
+
+        """
+        if not self.is_running():
+            return None
+        if is_docset_archive(docset_path):
+            docset_path = docset_path.with_name(
+                docset_path.name.removesuffix(ARCHIVE_SUFFIX)
+            )
+        try:
+            relative = docset_path.resolve().relative_to(self.docsets_dir.resolve())
+        except ValueError:
+            return None
+        member = normalize_member(f"{relative.as_posix()}/{page}")
+        if member is None:
+            return None
+        return self.base_url + quote(member)
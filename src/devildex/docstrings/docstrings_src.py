@@ -16,6 +16,7 @@ from typing import Optional
 import pdoc  # type: ignore[import-untyped]
 
 from devildex import info
+from devildex.theming.asset_bundle import PDOC3_THEME_ASSETS, install_theme_assets
 from devildex.utils.venv_cm import IsolatedVenvManager
 from devildex.utils.venv_utils import (
     execute_command,
@@ -121,7 +122,7 @@ class DocStringsSrc:
         return pdoc_command_args
 
     def _copy_theme_static_files(self, validated_docs_path: Path) -> None:
-        """Copy static files from the theme directory if specified."""
+        """Provide static files from the theme directory if specified."""
         if self.template_dir and (self.template_dir / "static").is_dir():
             source_static_dir = self.template_dir / "static"
             destination_static_dir: Path
@@ -146,14 +147,12 @@ class DocStringsSrc:
                 )
                 destination_static_dir.unlink()
 
-            destination_static_dir.mkdir(parents=True, exist_ok=True)
-
-            shutil.copytree(
-                source_static_dir, destination_static_dir, dirs_exist_ok=True
+            install_theme_assets(
+                PDOC3_THEME_ASSETS, source_static_dir, destination_static_dir
             )
 
             logger.info(
-                "DocstringsSrc: copied static files from the theme to %s",
+                "DocstringsSrc: provided static files from the theme at %s",
                 destination_static_dir,
             )
 
@@ -0,0 +1,1011 @@
+"""static API documentation module.
+
+Modules, classes, functions, signatures and docstrings are read from the
+abstract syntax tree of the sources, so nothing is installed or imported.
+The result is rendered with pdoc3 templates through documentation objects
+that stand in for the ones pdoc builds from imported modules.
+"""
+
+import ast
+import html
+import inspect
+import logging
+import re
+import textwrap
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import partial
+from multiprocessing import get_context
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Optional, TypeVar, Union
+
+import pdoc  # type: ignore[import-untyped]
+from mako.lookup import TemplateLookup
+from mako.template import Template
+from pdoc.html_helpers import _linkify, minify_html  # type: ignore[import-untyped]
+
+from devildex.theming.asset_bundle import PDOC3_THEME_ASSETS, install_theme_assets
+
+logger = logging.getLogger(__name__)
+
+INIT_FILENAME = "__init__.py"
+PDOC_TEMPLATES_DIR = Path(pdoc.__file__).parent / "templates"
+PARALLEL_MIN_MODULES = 16
+NBSP = "\N{NBSP}"
+
+PARAM_POSITIONAL_ONLY = "positional_only"
+PARAM_POSITIONAL_OR_KEYWORD = "positional_or_keyword"
+PARAM_VAR_POSITIONAL = "var_positional"
+PARAM_KEYWORD_ONLY = "keyword_only"
+PARAM_VAR_KEYWORD = "var_keyword"
+
+PROPERTY_DECORATORS = {"property", "cached_property"}
+NON_METHOD_DECORATORS = {"staticmethod", "classmethod"}
+SKIPPED_DECORATOR_ATTRIBUTES = {"setter", "deleter"}
+
+T = TypeVar("T")
+R = TypeVar("R")
+LinkFunction = Callable[..., str]
+
+
+@dataclass
+class ParamInfo:
+    """One parameter of a function signature."""
+
+    name: str
+    kind: str = PARAM_POSITIONAL_OR_KEYWORD
+    annotation: str = ""
+    default: Optional[str] = None
+
+
+@dataclass
+class FunctionInfo:
+    """A function or method as found in the source."""
+
+    name: str
+    docstring: str
+    params: list[ParamInfo]
+    return_annotation: str = ""
+    is_async: bool = False
+    is_method: bool = False
+    source: str = ""
+
+
+@dataclass
+class VariableInfo:
+    """A module, class or instance variable, or a property."""
+
+    name: str
+    docstring: str
+    annotation: str = ""
+    instance_var: bool = False
+    kind: str = "var"
+
+
+@dataclass
+class ClassInfo:
+    """A class with its own (not inherited) members."""
+
+    name: str
+    docstring: str
+    bases: list[str]
+    init_params: Optional[list[ParamInfo]]
+    functions: list[FunctionInfo] = field(default_factory=list)
+    variables: list[VariableInfo] = field(default_factory=list)
+    source: str = ""
+
+
+@dataclass
+class ModuleInfo:
+    """Everything documented in one module."""
+
+    name: str
+    path: str
+    docstring: str
+    is_package: bool
+    docformat: Optional[str] = None
+    classes: list[ClassInfo] = field(default_factory=list)
+    functions: list[FunctionInfo] = field(default_factory=list)
+    variables: list[VariableInfo] = field(default_factory=list)
+
+
+def _is_public(name: str) -> bool:
+    """Return whether name is exported, following pdoc's rule."""
+    return not name.startswith("_")
+
+
+def _dotted_name(node: ast.AST) -> Optional[str]:
+    """Return the dotted name of a Name/Attribute chain, ignoring subscripts."""
+    if isinstance(node, ast.Subscript):
+        return _dotted_name(node.value)
+    if isinstance(node, ast.Call):
+        return _dotted_name(node.func)
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = _dotted_name(node.value)
+        return f"{parent}.{node.attr}" if parent else None
+    return None
+
+
+def _annotation_text(node: Optional[ast.AST]) -> str:
+    """Return an annotation as source text, unquoting string annotations."""
+    if node is None:
+        return ""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return ast.unparse(node)
+
+
+def _string_value(node: ast.AST) -> Optional[str]:
+    """Return the cleaned text of a bare string statement, if node is one."""
+    if (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    ):
+        return inspect.cleandoc(node.value.value)
+    return None
+
+
+def _assignment_targets(node: ast.AST) -> list[ast.AST]:
+    """Return the targets of an assignment statement."""
+    if isinstance(node, ast.Assign):
+        return list(node.targets)
+    if isinstance(node, ast.AnnAssign):
+        return [node.target]
+    return []
+
+
+def _pep224_docstrings(body: list[ast.stmt]) -> dict[int, str]:
+    """Map the index of each assignment in body to the string that follows it."""
+    docstrings: dict[int, str] = {}
+    for index, (node, following) in enumerate(zip(body, body[1:], strict=False)):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            docstring = _string_value(following)
+            if docstring is not None:
+                docstrings[index] = docstring
+    return docstrings
+
+
+def _parse_params(arguments: ast.arguments) -> list[ParamInfo]:
+    """Convert ast.arguments into ParamInfo entries in signature order."""
+    positional = [*arguments.posonlyargs, *arguments.args]
+    defaults: list[Optional[ast.expr]] = [None] * (
+        len(positional) - len(arguments.defaults)
+    ) + list(arguments.defaults)
+    params = []
+    for index, (arg, default) in enumerate(zip(positional, defaults, strict=True)):
+        kind = (
+            PARAM_POSITIONAL_ONLY
+            if index < len(arguments.posonlyargs)
+            else PARAM_POSITIONAL_OR_KEYWORD
+        )
+        params.append(
+            ParamInfo(
+                arg.arg,
+                kind,
+                _annotation_text(arg.annotation),
+                ast.unparse(default) if default is not None else None,
+            )
+        )
+    if arguments.vararg:
+        params.append(
+            ParamInfo(
+                arguments.vararg.arg,
+                PARAM_VAR_POSITIONAL,
+                _annotation_text(arguments.vararg.annotation),
+            )
+        )
+    for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults, strict=True):
+        params.append(
+            ParamInfo(
+                arg.arg,
+                PARAM_KEYWORD_ONLY,
+                _annotation_text(arg.annotation),
+                ast.unparse(default) if default is not None else None,
+            )
+        )
+    if arguments.kwarg:
+        params.append(
+            ParamInfo(
+                arguments.kwarg.arg,
+                PARAM_VAR_KEYWORD,
+                _annotation_text(arguments.kwarg.annotation),
+            )
+        )
+    return params
+
+
+def _dataclass_init_params(node: ast.ClassDef) -> list[ParamInfo]:
+    """Return the parameters of the __init__ generated for a dataclass."""
+    params = [ParamInfo("self")]
+    for child in node.body:
+        if not isinstance(child, ast.AnnAssign) or not isinstance(
+            child.target, ast.Name
+        ):
+            continue
+        annotation = _annotation_text(child.annotation)
+        if annotation.startswith(("ClassVar", "typing.ClassVar")):
+            continue
+        default = None
+        if isinstance(child.value, ast.Call) and _dotted_name(child.value.func) in (
+            "field",
+            "dataclasses.field",
+        ):
+            keywords = {k.arg: k.value for k in child.value.keywords}
+            if "default" in keywords:
+                default = ast.unparse(keywords["default"])
+            elif "default_factory" in keywords:
+                default = "<factory>"
+        elif child.value is not None:
+            default = ast.unparse(child.value)
+        params.append(
+            ParamInfo(child.target.id, annotation=annotation, default=default)
+        )
+    return params
+
+
+class _ModuleParser:
+    """Extract a ModuleInfo from the source of one module."""
+
+    def __init__(self, module_name: str, path: Path, is_package: bool) -> None:
+        """Initialize the _ModuleParser."""
+        self.module_name = module_name
+        self.path = path
+        self.is_package = is_package
+        self.lines: list[str] = []
+        self.imports: dict[str, str] = {}
+        self.local_names: set[str] = set()
+
+    def parse(self) -> ModuleInfo:
+        """Parse the module. Raises SyntaxError, ValueError or OSError."""
+        source_bytes = self.path.read_bytes()
+        tree = ast.parse(source_bytes, filename=str(self.path))
+        self.lines = source_bytes.decode("utf-8", errors="replace").splitlines()
+        self._collect_names(tree.body)
+        exported = self._exported_names(tree.body)
+
+        def is_documented(name: str) -> bool:
+            return name in exported if exported is not None else _is_public(name)
+
+        info = ModuleInfo(
+            name=self.module_name,
+            path=str(self.path),
+            docstring=ast.get_docstring(tree) or "",
+            is_package=self.is_package,
+            docformat=self._docformat(tree.body),
+        )
+        var_docstrings = _pep224_docstrings(tree.body)
+        for index, node in enumerate(tree.body):
+            if isinstance(node, ast.ClassDef) and is_documented(node.name):
+                info.classes.append(self._parse_class(node))
+            elif isinstance(
+                node, (ast.FunctionDef, ast.AsyncFunctionDef)
+            ) and is_documented(node.name):
+                function = self._parse_function(node, is_method=False)
+                info.functions = [f for f in info.functions if f.name != node.name]
+                info.functions.append(function)
+            elif index in var_docstrings:
+                for target in _assignment_targets(node):
+                    if isinstance(target, ast.Name) and is_documented(target.id):
+                        info.variables.append(
+                            VariableInfo(
+                                target.id,
+                                var_docstrings[index],
+                                _annotation_text(getattr(node, "annotation", None)),
+                            )
+                        )
+        return info
+
+    def _collect_names(self, body: list[ast.stmt]) -> None:
+        """Record imported aliases and the names defined at module level."""
+        for node in body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    local = alias.asname or alias.name.split(".")[0]
+                    self.imports[local] = alias.name if alias.asname else local
+            elif isinstance(node, ast.ImportFrom):
+                base = self._resolve_relative(node.module, node.level)
+                for alias in node.names:
+                    if alias.name != "*":
+                        self.imports[alias.asname or alias.name] = (
+                            f"{base}.{alias.name}" if base else alias.name
+                        )
+            elif isinstance(
+                node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+            ):
+                self.local_names.add(node.name)
+
+    def _resolve_relative(self, module: Optional[str], level: int) -> str:
+        """Return the absolute name of a possibly relative import."""
+        if not level:
+            return module or ""
+        package_parts = self.module_name.split(".")
+        if not self.is_package:
+            package_parts = package_parts[:-1]
+        if level > 1:
+            package_parts = package_parts[: -(level - 1)]
+        return ".".join([*package_parts, module] if module else package_parts)
+
+    def _resolve_reference(self, dotted: str) -> str:
+        """Return the fully qualified name a dotted name refers to."""
+        head, _, rest = dotted.partition(".")
+        if head in self.imports:
+            target = self.imports[head]
+        elif head in self.local_names:
+            target = f"{self.module_name}.{head}"
+        else:
+            return dotted
+        return f"{target}.{rest}" if rest else target
+
+    @staticmethod
+    def _exported_names(body: list[ast.stmt]) -> Optional[set[str]]:
+        """Return the names listed in a literal __all__, if there is one."""
+        for node in body:
+            for target in _assignment_targets(node):
+                if isinstance(target, ast.Name) and target.id == "__all__":
+                    try:
+                        names = ast.literal_eval(node.value)
+                    except ValueError:
+                        return None
+                    return {name for name in names if isinstance(name, str)}
+        return None
+
+    @staticmethod
+    def _docformat(body: list[ast.stmt]) -> Optional[str]:
+        """Return the literal value of __docformat__, if set."""
+        for node in body:
+            for target in _assignment_targets(node):
+                if isinstance(target, ast.Name) and target.id == "__docformat__":
+                    value = getattr(node, "value", None)
+                    if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                        return value.value
+        return None
+
+    def _node_source(
+        self, node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> str:
+        """Return the dedented source of node including its decorators."""
+        start = min([d.lineno for d in node.decorator_list] + [node.lineno])
+        end = node.end_lineno or node.lineno
+        return textwrap.dedent("\n".join(self.lines[start - 1 : end]))
+
+    def _parse_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], is_method: bool
+    ) -> FunctionInfo:
+        """Extract a function or method."""
+        return FunctionInfo(
+            name=node.name,
+            docstring=ast.get_docstring(node) or "",
+            params=_parse_params(node.args),
+            return_annotation=_annotation_text(node.returns),
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            is_method=is_method,
+            source=self._node_source(node),
+        )
+
+    def _parse_class(self, node: ast.ClassDef) -> ClassInfo:
+        """Extract a class and its own public members."""
+        bases = []
+        for base in node.bases:
+            dotted = _dotted_name(base)
+            if dotted and dotted != "object":
+                bases.append(self._resolve_reference(dotted))
+        decorators = {
+            (_dotted_name(d) or "").rsplit(".", 1)[-1] for d in node.decorator_list
+        }
+        init_node = next(
+            (
+                n
+                for n in node.body
+                if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and n.name == "__init__"
+            ),
+            None,
+        )
+        init_params = None
+        if init_node is not None:
+            init_params = _parse_params(init_node.args)
+        elif "dataclass" in decorators:
+            init_params = _dataclass_init_params(node)
+        docstring = ast.get_docstring(node) or ""
+        if init_node is not None and ast.get_docstring(init_node):
+            docstring = f"{docstring}\n\n{ast.get_docstring(init_node)}".strip()
+        class_info = ClassInfo(
+            name=node.name,
+            docstring=docstring,
+            bases=bases,
+            init_params=init_params,
+            source=self._node_source(node),
+        )
+        self._parse_class_body(node, class_info, "dataclass" in decorators)
+        if init_node is not None:
+            class_info.variables.extend(self._instance_variables(init_node))
+        return class_info
+
+    def _parse_class_body(
+        self, node: ast.ClassDef, class_info: ClassInfo, is_dataclass: bool
+    ) -> None:
+        """Add the methods, properties and class variables of node."""
+        members: dict[str, Union[FunctionInfo, VariableInfo]] = {}
+        var_docstrings = _pep224_docstrings(node.body)
+        for index, child in enumerate(node.body):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if not _is_public(child.name):
+                    continue
+                member = self._parse_member_function(child)
+                if member is not None:
+                    members[child.name] = member
+            elif isinstance(child, ast.ClassDef) and _is_public(child.name):
+                members[child.name] = VariableInfo(
+                    child.name, ast.get_docstring(child) or ""
+                )
+            else:
+                for target in _assignment_targets(child):
+                    if isinstance(target, ast.Name) and _is_public(target.id):
+                        annotation = _annotation_text(
+                            getattr(child, "annotation", None)
+                        )
+                        members[target.id] = VariableInfo(
+                            target.id,
+                            var_docstrings.get(index, ""),
+                            annotation,
+                            instance_var=is_dataclass and bool(annotation),
+                        )
+        for member in members.values():
+            if isinstance(member, FunctionInfo):
+                class_info.functions.append(member)
+            else:
+                class_info.variables.append(member)
+
+    def _parse_member_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> Optional[Union[FunctionInfo, VariableInfo]]:
+        """Extract a method, or a property as an instance variable."""
+        decorator_names = [_dotted_name(d) or "" for d in node.decorator_list]
+        if any(
+            name.rsplit(".", 1)[-1] in SKIPPED_DECORATOR_ATTRIBUTES
+            for name in decorator_names
+        ):
+            return None
+        short_names = {name.rsplit(".", 1)[-1] for name in decorator_names}
+        if short_names & PROPERTY_DECORATORS:
+            return VariableInfo(
+                node.name,
+                ast.get_docstring(node) or "",
+                _annotation_text(node.returns),
+                instance_var=True,
+                kind="prop",
+            )
+        return self._parse_function(
+            node, is_method=not short_names & NON_METHOD_DECORATORS
+        )
+
+    @staticmethod
+    def _instance_variables(
+        init_node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+    ) -> list[VariableInfo]:
+        """Return the documented ``self.x = ...`` assignments of __init__."""
+        if not init_node.args.args:
+            return []
+        self_name = init_node.args.args[0].arg
+        var_docstrings = _pep224_docstrings(init_node.body)
+        variables = []
+        for index, docstring in var_docstrings.items():
+            node = init_node.body[index]
+            for target in _assignment_targets(node):
+                if (
+                    isinstance(target, ast.Attribute)
+                    and isinstance(target.value, ast.Name)
+                    and target.value.id == self_name
+                    and _is_public(target.attr)
+                ):
+                    variables.append(
+                        VariableInfo(
+                            target.attr,
+                            docstring,
+                            _annotation_text(getattr(node, "annotation", None)),
+                            instance_var=True,
+                        )
+                    )
+        return variables
+
+
+def parse_module(
+    module_name: str, path: Path, is_package: bool
+) -> Optional[ModuleInfo]:
+    """Extract the documentation of one module from its source.
+
+    Returns:
+        The module's documentation, or None if the file cannot be parsed.
+
+    """
+    try:
+        return _ModuleParser(module_name, path, is_package).parse()
+    except (SyntaxError, ValueError, OSError) as e:
+        logger.warning("Skipping %s (%s): %s", module_name, path, e)
+        return None
+
+
+def discover_modules(package_root: Path) -> list[tuple[str, Path, bool]]:
+    """List the public modules of the package rooted at package_root.
+
+    Returns:
+        Tuples of module name, source file and whether it is a package.
+
+    """
+    modules: list[tuple[str, Path, bool]] = []
+    pending = [(package_root.name, package_root)]
+    while pending:
+        package_name, package_dir = pending.pop()
+        modules.append((package_name, package_dir / INIT_FILENAME, True))
+        for child in sorted(package_dir.iterdir()):
+            if not _is_public(child.name) or child.name.startswith("."):
+                continue
+            if child.is_dir() and (child / INIT_FILENAME).is_file():
+                pending.append((f"{package_name}.{child.name}", child))
+            elif child.is_file() and child.suffix == ".py" and "." not in child.stem:
+                modules.append((f"{package_name}.{child.stem}", child, False))
+    return modules
+
+
+def _format_annotation(
+    annotation: str, link: Optional[LinkFunction], module: pdoc.Module
+) -> str:
+    """Format an annotation the way pdoc does, linking known names."""
+    if not annotation:
+        return ""
+    text = annotation.replace(" ", NBSP)
+    if link:
+        text = re.sub(r"[\w\.]+", partial(_linkify, link=link, module=module), text)
+    return text
+
+
+def _format_param(
+    param: ParamInfo,
+    annotate: bool,
+    link: Optional[LinkFunction],
+    module: pdoc.Module,
+) -> str:
+    """Format one parameter like pdoc does."""
+    annotation = _format_annotation(param.annotation, link, module) if annotate else ""
+    formatted = param.name
+    if annotation:
+        formatted += f":{NBSP}{annotation}"
+    if param.default is not None:
+        default = param.default
+        if link and ("<" in default or ">" in default):
+            default = html.escape(default)
+        formatted += f"{NBSP}={NBSP}{default}" if annotation else f"={default}"
+    if param.kind == PARAM_VAR_POSITIONAL:
+        return f"*{formatted}"
+    if param.kind == PARAM_VAR_KEYWORD:
+        return f"**{formatted}"
+    return formatted
+
+
+def _format_params(
+    params: Iterable[ParamInfo],
+    annotate: bool,
+    link: Optional[LinkFunction],
+    module: pdoc.Module,
+) -> list[str]:
+    """Format parameters like pdoc.Function.params, with / and * markers."""
+    formatted_params: list[str] = []
+    keyword_only = False
+    positional_only = False
+    for param in params:
+        if not _is_public(param.name) and param.default is not None:
+            continue
+        if param.kind == PARAM_POSITIONAL_ONLY:
+            positional_only = True
+        elif positional_only:
+            formatted_params.append("/")
+            positional_only = False
+        if param.kind == PARAM_VAR_POSITIONAL:
+            keyword_only = True
+        if param.kind == PARAM_KEYWORD_ONLY and not keyword_only:
+            keyword_only = True
+            formatted_params.append("*")
+        formatted_params.append(_format_param(param, annotate, link, module))
+    if positional_only:
+        formatted_params.append("/")
+    return formatted_params
+
+
+def _init_doc(
+    doc: pdoc.Doc,
+    name: str,
+    module: Optional[pdoc.Module],
+    obj: SimpleNamespace,
+    docstring: str,
+) -> None:
+    """Run pdoc.Doc.__init__ without letting it read a docstring from obj."""
+    pdoc.Doc.__init__(doc, name, module, obj, docstring)
+    if not docstring:
+        doc.docstring = ""
+
+
+class _StaticSourceMixin:
+    """Serve the source text captured from the AST."""
+
+    _static_source = ""
+
+    @property
+    def source(self) -> str:
+        """Return the dedented source of the object."""
+        return self._static_source
+
+
+class StaticModule(pdoc.Module):
+    """A pdoc.Module built from a ModuleInfo instead of an imported module."""
+
+    def __init__(
+        self,
+        info: ModuleInfo,
+        context: pdoc.Context,
+        supermodule: Optional["StaticModule"] = None,
+    ) -> None:
+        """Initialize the StaticModule."""
+        attributes: dict[str, Any] = {"__name__": info.name, "__file__": info.path}
+        if info.docformat:
+            attributes["__docformat__"] = info.docformat
+        _init_doc(self, info.name, self, SimpleNamespace(**attributes), info.docstring)
+        self.supermodule = supermodule
+        self._context = context
+        self._is_inheritance_linked = True
+        self._skipped_submodules: set[str] = set()
+        self._is_package = info.is_package
+        self.doc: dict[str, pdoc.Doc] = {}
+        context[self.refname] = self
+        for class_info in info.classes:
+            self._add(StaticClass(class_info, self))
+        for function_info in info.functions:
+            self._add(StaticFunction(function_info, self))
+        for variable_info in info.variables:
+            self._add(StaticVariable(variable_info, self))
+
+    def _add(self, dobj: pdoc.Doc) -> None:
+        """Register a member in this module and the shared context."""
+        self.doc[dobj.name] = dobj
+        self._context[dobj.refname] = dobj
+        for member in getattr(dobj, "doc", {}).values():
+            self._context[member.refname] = member
+
+    def add_submodule(self, submodule: "StaticModule") -> None:
+        """Attach a sub-module, as pdoc does while walking a package."""
+        self.doc[submodule.name.rsplit(".", 1)[-1]] = submodule
+
+    @property
+    def is_package(self) -> bool:
+        """Whether the module is a package."""
+        return self._is_package
+
+    @property
+    def is_namespace(self) -> bool:
+        """Whether the module is a namespace package; never for parsed sources."""
+        return False
+
+    @property
+    def __pdoc__(self) -> dict:
+        """Return the ``__pdoc__`` overrides; not available without importing."""
+        return {}
+
+
+class StaticClass(_StaticSourceMixin, pdoc.Class):
+    """A pdoc.Class built from a ClassInfo."""
+
+    def __init__(self, info: ClassInfo, module: StaticModule) -> None:
+        """Initialize the StaticClass."""
+        _init_doc(
+            self,
+            info.name,
+            module,
+            SimpleNamespace(__qualname__=info.name),
+            info.docstring,
+        )
+        self._static_source = info.source
+        self.bases = info.bases
+        self.init_params = info.init_params
+        self.doc: dict[str, Union[pdoc.Function, pdoc.Variable]] = {}
+        for function_info in info.functions:
+            self.doc[function_info.name] = StaticFunction(function_info, module, self)
+        for variable_info in info.variables:
+            self.doc[variable_info.name] = StaticVariable(variable_info, module, self)
+
+    def _ancestors(self) -> Iterable[pdoc.Doc]:
+        """Yield the ancestors breadth-first, documented or not."""
+        seen = {self.refname}
+        pending = list(self.bases)
+        while pending:
+            refname = pending.pop(0)
+            if refname in seen:
+                continue
+            seen.add(refname)
+            dobj = self.module._context.get(refname) or pdoc.External(refname)
+            yield dobj
+            if isinstance(dobj, StaticClass):
+                pending.extend(dobj.bases)
+
+    def mro(self, only_documented: bool = False) -> list[pdoc.Doc]:
+        """Return the ancestors, as far as they can be resolved statically."""
+        ancestors = list(self._ancestors())
+        if only_documented:
+            return [a for a in ancestors if isinstance(a, StaticClass)]
+        return ancestors
+
+    def subclasses(self) -> list["StaticClass"]:
+        """Return the documented classes that list this class as a base."""
+        return sorted(
+            dobj
+            for dobj in self.module._context.values()
+            if isinstance(dobj, StaticClass) and self.refname in dobj.bases
+        )
+
+    def params(
+        self, *, annotate: bool = False, link: Optional[LinkFunction] = None
+    ) -> list[str]:
+        """Return the constructor parameters, without ``self``."""
+        init_params = self.init_params
+        if init_params is None:
+            init_params = next(
+                (
+                    a.init_params
+                    for a in self.mro(only_documented=True)
+                    if a.init_params is not None
+                ),
+                None,
+            )
+        if not init_params:
+            return []
+        return _format_params(init_params[1:], annotate, link, self.module)
+
+
+class StaticFunction(_StaticSourceMixin, pdoc.Function):
+    """A pdoc.Function built from a FunctionInfo."""
+
+    def __init__(
+        self,
+        info: FunctionInfo,
+        module: StaticModule,
+        cls: Optional[StaticClass] = None,
+    ) -> None:
+        """Initialize the StaticFunction."""
+        qualname = f"{cls.qualname}.{info.name}" if cls else info.name
+        _init_doc(
+            self,
+            info.name,
+            module,
+            SimpleNamespace(__qualname__=qualname),
+            info.docstring,
+        )
+        self.cls = cls
+        self._static_source = info.source
+        self._info = info
+
+    @property
+    def is_method(self) -> bool:
+        """Whether this is a normal method rather than a static or class method."""
+        return self._info.is_method
+
+    @property
+    def _is_async(self) -> bool:
+        return self._info.is_async
+
+    def return_annotation(self, *, link: Optional[LinkFunction] = None) -> str:
+        """Return the formatted return annotation, or an empty string."""
+        return _format_annotation(self._info.return_annotation, link, self.module)
+
+    def params(
+        self, *, annotate: bool = False, link: Optional[LinkFunction] = None
+    ) -> list[str]:
+        """Return the formatted parameters."""
+        return _format_params(self._info.params, annotate, link, self.module)
+
+
+class StaticVariable(pdoc.Variable):
+    """A pdoc.Variable built from a VariableInfo."""
+
+    def __init__(
+        self,
+        info: VariableInfo,
+        module: StaticModule,
+        cls: Optional[StaticClass] = None,
+    ) -> None:
+        """Initialize the StaticVariable."""
+        super().__init__(
+            info.name,
+            module,
+            info.docstring,
+            cls=cls,
+            instance_var=info.instance_var,
+            kind=info.kind,
+        )
+        self._annotation = info.annotation
+
+    @property
+    def source(self) -> str:
+        """Variables are shown without source."""
+        return ""
+
+    def type_annotation(self, *, link: Optional[LinkFunction] = None) -> str:
+        """Return the formatted annotation, or an empty string."""
+        return _format_annotation(self._annotation, link, self.module)
+
+
+def build_doc_model(infos: Iterable[ModuleInfo]) -> dict[str, StaticModule]:
+    """Create linked documentation objects for the parsed modules.
+
+    Returns:
+        The modules by name, sharing one pdoc.Context.
+
+    """
+    context = pdoc.Context()
+    modules: dict[str, StaticModule] = {}
+    for info in sorted(infos, key=lambda i: i.name.count(".")):
+        supermodule = modules.get(info.name.rpartition(".")[0])
+        module = StaticModule(info, context, supermodule)
+        modules[info.name] = module
+        if supermodule is not None:
+            supermodule.add_submodule(module)
+    return modules
+
+
+def template_lookup(template_dir: Optional[Path] = None) -> TemplateLookup:
+    """Return a lookup that prefers template_dir over pdoc's own templates."""
+    directories = [str(PDOC_TEMPLATES_DIR)]
+    if template_dir:
+        directories.insert(0, str(template_dir))
+    return TemplateLookup(directories=directories, cache_args={"cached": True})
+
+
+def template_config(lookup: TemplateLookup) -> dict[str, Any]:
+    """Return the template variables of pdoc's config.mako and the theme's."""
+    mako_internals = Template("").module.__dict__.keys()  # noqa: S702
+    config: dict[str, Any] = {}
+    for config_module in (
+        Template(filename=str(PDOC_TEMPLATES_DIR / "config.mako")).module,  # noqa: S702
+        lookup.get_template("/config.mako").module,
+    ):
+        config.update(
+            (name, getattr(config_module, name, None))
+            for name in config_module.__dict__
+            if name not in mako_internals
+        )
+    return config
+
+
+class StaticRenderer:
+    """Render the pages of a parsed package with a pdoc3 template set."""
+
+    def __init__(
+        self, infos: Iterable[ModuleInfo], template_dir: Optional[Path] = None
+    ) -> None:
+        """Initialize the StaticRenderer."""
+        self.modules = build_doc_model(infos)
+        self.lookup = template_lookup(template_dir)
+        self.config = template_config(self.lookup)
+
+    def render(self, module_name: str) -> str:
+        """Return the minified HTML page of one module."""
+        module = self.modules[module_name]
+        template = self.lookup.get_template("/html.mako")
+        page = template.render(module=module, **self.config).strip()
+        return minify_html(page) + "\n"
+
+    def render_to_file(self, module_name: str, output_dir: Path) -> Optional[Path]:
+        """Write the page of one module below output_dir, at pdoc's URL."""
+        page_path = output_dir / self.modules[module_name].url()
+        try:
+            page = self.render(module_name)
+            page_path.parent.mkdir(parents=True, exist_ok=True)
+            # The old page may be hardlinked to other docset versions.
+            page_path.unlink(missing_ok=True)
+            page_path.write_text(page, encoding="utf-8")
+        except Exception:
+            logger.exception("Could not render the page of %s", module_name)
+            return None
+        return page_path
+
+
+_worker_state: dict[str, StaticRenderer] = {}
+
+
+def _init_render_worker(infos: list[ModuleInfo], template_dir: Optional[Path]) -> None:
+    """Build the documentation model once in each worker process."""
+    _worker_state["renderer"] = StaticRenderer(infos, template_dir)
+
+
+def _render_in_worker(module_name: str, output_dir: Path) -> Optional[Path]:
+    """Render one module with the worker's model."""
+    return _worker_state["renderer"].render_to_file(module_name, output_dir)
+
+
+def _parse_entry(entry: tuple[str, Path, bool]) -> Optional[ModuleInfo]:
+    """Parse one entry of discover_modules."""
+    return parse_module(*entry)
+
+
+def _map_in_processes(
+    function: Callable[[T], R],
+    items: list[T],
+    workers: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
+) -> list[R]:
+    """Map function over items in a pool of spawned worker processes."""
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        return list(executor.map(function, items, chunksize=4))
+
+
+def generate_api_docs(
+    package_root: Path,
+    output_dir: Path,
+    template_dir: Optional[Path] = None,
+    workers: int = 1,
+) -> list[Path]:
+    """Write pdoc-style HTML pages for a package without importing it.
+
+    Parsing and rendering are spread over worker processes when the package
+    has at least PARALLEL_MIN_MODULES modules and more than one worker is
+    allowed. If the pool cannot be used, the work is done in this process.
+
+    Args:
+        package_root: The directory of the package, containing __init__.py.
+        output_dir: Where the package directory of pages is created.
+        template_dir: A pdoc3 template directory to render with.
+        workers: The maximum number of worker processes.
+
+    Returns:
+        The written pages.
+
+    """
+    entries = discover_modules(package_root)
+    parallel = workers > 1 and len(entries) >= PARALLEL_MIN_MODULES
+    if parallel:
+        try:
+            infos = [i for i in _map_in_processes(_parse_entry, entries, workers) if i]
+            names = [info.name for info in infos]
+            pages = _map_in_processes(
+                partial(_render_in_worker, output_dir=output_dir),
+                names,
+                workers,
+                initializer=_init_render_worker,
+                initargs=(infos, template_dir),
+            )
+        except (BrokenProcessPool, OSError):
+            logger.warning(
+                "Worker pool unavailable, documenting %s serially.",
+                package_root.name,
+                exc_info=True,
+            )
+            parallel = False
+    if not parallel:
+        infos = [i for i in (_parse_entry(entry) for entry in entries) if i]
+        renderer = StaticRenderer(infos, template_dir)
+        pages = [renderer.render_to_file(info.name, output_dir) for info in infos]
+    written = [page for page in pages if page is not None]
+    logger.info(
+        "Documented %d of %d modules of %s from source.",
+        len(written),
+        len(entries),
+        package_root.name,
+    )
+    return written
+
+
+def copy_theme_static_files(template_dir: Optional[Path], docs_dir: Path) -> None:
+    """Provide the theme's static directory next to the generated pages."""
+    if template_dir and (template_dir / "static").is_dir():
+        install_theme_assets(
+            PDOC3_THEME_ASSETS, template_dir / "static", docs_dir / "static"
+        )
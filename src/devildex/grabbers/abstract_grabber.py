@@ -35,3 +35,17 @@ class AbstractGrabber(ABC):
         :return: True if the grabber can handle the project, False otherwise.
         """
         pass
+
+    def prepare_environment(self, source_path: Path, context: "BuildContext") -> bool:
+        """Install the build environment ahead of generate_docset.
+
+        Builders whose environments are cached override this, so that the
+        environment of one project can be installed while another one builds.
+        The default does nothing.
+
+        :param source_path: The path to the source code.
+        :param context: The build context containing necessary information
+            for the build process.
+        :return: False if the environment could not be installed, True otherwise.
+        """
+        return True
@@ -0,0 +1,79 @@
+"""Docstrings Builder module."""
+
+import dataclasses
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from devildex.config_manager import ConfigManager
+from devildex.grabbers.abstract_grabber import AbstractGrabber
+from devildex.grabbers.pdoc3_builder import Pdoc3Builder
+from devildex.grabbers.pydoctor_builder import PydoctorBuilder
+from devildex.grabbers.static_api_builder import StaticApiBuilder
+from devildex.info import PROJECT_ROOT
+from devildex.scanner.scanner import _find_python_package_root, has_docstrings
+
+if TYPE_CHECKING:
+    from devildex.orchestrator.context import BuildContext
+
+logger = logging.getLogger(__name__)
+
+THEMING_DIR = PROJECT_ROOT / "src" / "devildex" / "theming"
+PDOC3_THEME_DIR = THEMING_DIR / "devildex_pdoc3_theme"
+PYDOCTOR_THEME_DIR = THEMING_DIR / "devildex_pydoctor_theme"
+
+
+class DocstringsBuilder(AbstractGrabber):
+    """A grabber for projects documented only by their docstrings.
+
+    It tries the static API engine first, then pdoc3, then pydoctor. The
+    underlying builders are only created when they are needed.
+    """
+
+    BUILDER_NAME = "docstrings"
+
+    def can_handle(self, source_path: Path, context: "BuildContext") -> bool:
+        """Determine if the project has docstrings to document."""
+        return has_docstrings(str(source_path))
+
+    @staticmethod
+    def package_input_folder(source_path: Path) -> Path:
+        """Return the package directory to document within source_path."""
+        python_package_root = _find_python_package_root(source_path)
+        if python_package_root:
+            logger.info(
+                "DocstringsBuilder: Found Python package root for docstrings: "
+                f"{python_package_root}"
+            )
+            return python_package_root
+        logger.warning(
+            "DocstringsBuilder: Could not find a specific Python package root. "
+            f"Falling back to the source path for docstrings: {source_path}"
+        )
+        return source_path
+
+    def generate_docset(
+        self, source_path: Path, output_path: Path, context: "BuildContext"
+    ) -> str | bool:
+        """Generate API documentation with the first engine that succeeds."""
+        input_folder = self.package_input_folder(source_path)
+        context = dataclasses.replace(context, source_root=input_folder)
+        for engine_name, builder in self._engines():
+            logger.info(f"DocstringsBuilder: Attempting {engine_name} generation...")
+            if builder.generate_docset(
+                source_path=input_folder, output_path=output_path, context=context
+            ):
+                logger.info(f"DocstringsBuilder: {engine_name} generation successful.")
+                return str(output_path / context.project_name)
+            logger.warning(f"DocstringsBuilder: {engine_name} generation failed.")
+        logger.error("DocstringsBuilder: every docstrings engine failed.")
+        return False
+
+    @staticmethod
+    def _engines() -> Iterator[tuple[str, AbstractGrabber]]:
+        """Yield the engines to try, in order, creating each one when reached."""
+        if ConfigManager().get_static_api_docs():
+            yield "static API", StaticApiBuilder(template_dir=PDOC3_THEME_DIR)
+        yield "pdoc3", Pdoc3Builder(template_dir=PDOC3_THEME_DIR)
+        yield "Pydoctor", PydoctorBuilder(template_dir=PYDOCTOR_THEME_DIR)
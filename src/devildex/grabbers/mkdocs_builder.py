@@ -1,15 +1,25 @@
 """MkDocsBuilder class for generating documentation using MkDocs."""
 
+import hashlib
+import json
 import logging
 import shutil
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 import yaml
 
+from devildex.app_paths import AppPaths
+from devildex.config_manager import ConfigManager
 from devildex.grabbers.abstract_grabber import AbstractGrabber
-from devildex.utils.venv_cm import IsolatedVenvManager
+from devildex.utils.staging import (
+    discard_staging_dir,
+    prepare_staging_dir,
+    swap_into_place,
+)
+from devildex.utils.venv_cache import build_env_manager, compute_env_key
 from devildex.utils.venv_utils import (
     execute_command,
     install_project_and_dependencies_in_venv,
@@ -17,6 +27,7 @@ from devildex.utils.venv_utils import (
 
 if TYPE_CHECKING:
     from devildex.orchestrator.context import BuildContext
+    from devildex.utils.venv_cm import IsolatedVenvManager
 
 logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
@@ -26,6 +37,8 @@ if not logger.hasHandlers():
 
 MKDOCS_CONFIG_FILE = "mkdocs.yml"
 REQUIREMENTS_FILENAME = "requirements.txt"
+MKDOCS_SITE_SUBDIR = "site"
+MKDOCS_BUILD_STATE_FILENAME = "build_state.json"
 
 BUILT_IN_MARKER = "built-in"
 
@@ -271,6 +284,158 @@ def _find_mkdocs_doc_requirements_file(
     return None
 
 
+def _prepare_mkdocs_build_env(
+    venv: "IsolatedVenvManager",
+    context: "BuildContext",
+    required_mkdocs_pkgs: list[str],
+    doc_requirements_path: Optional[Path],
+) -> bool:
+    """Install MkDocs and the project in venv unless it was reused."""
+    if venv.reused:
+        return True
+    logger.info(
+        "MkDocs related packages to install for %s: %s",
+        context.project_slug,
+        required_mkdocs_pkgs,
+    )
+    install_success = install_project_and_dependencies_in_venv(
+        pip_executable=venv.pip_executable,
+        project_name=context.project_slug,
+        project_root_for_install=context.project_root_for_install,
+        doc_requirements_path=doc_requirements_path,
+        base_packages_to_install=required_mkdocs_pkgs,
+    )
+    if install_success:
+        venv.mark_ready()
+    return install_success
+
+
+def _fingerprint_mkdocs_config(config_file_path: Path, source_path: Path) -> str:
+    """Hash the project's mkdocs.yml together with where it was checked out.
+
+    The processed config holds absolute paths into the source tree, so a
+    checkout in another place needs a fresh resolution.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(source_path.resolve()).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(config_file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _fingerprint_docs_tree(docs_dir: Path) -> str:
+    """Hash the list of files below docs_dir.
+
+    ``mkdocs build --dirty`` only rebuilds pages whose source is newer than
+    the output, so it misses the navigation changes caused by added, removed
+    or renamed pages. Those change this fingerprint.
+    """
+    digest = hashlib.sha256()
+    if docs_dir.is_dir():
+        for file_path in sorted(p for p in docs_dir.rglob("*") if p.is_file()):
+            digest.update(file_path.relative_to(docs_dir).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass
+class MkDocsBuildCache:
+    """The resolved config and the built site of one package version.
+
+    The processed mkdocs.yml and the packages it needs are reused while the
+    project's mkdocs.yml is unchanged. The site directory is kept between
+    builds so unchanged projects can be rebuilt with ``--dirty``.
+    """
+
+    cache_dir: Path
+
+    @property
+    def config_file(self) -> Path:
+        """The processed mkdocs.yml passed to ``mkdocs build``."""
+        return self.cache_dir / MKDOCS_CONFIG_FILE
+
+    @property
+    def site_dir(self) -> Path:
+        """The persistent directory MkDocs builds into."""
+        return self.cache_dir / MKDOCS_SITE_SUBDIR
+
+    @property
+    def state_file(self) -> Path:
+        """The file recording fingerprints and the state of the site."""
+        return self.cache_dir / MKDOCS_BUILD_STATE_FILENAME
+
+    def load_state(self) -> dict[str, Any]:
+        """Return the recorded state, or an empty dict if there is none."""
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def save_state(self, state: dict[str, Any]) -> None:
+        """Record state for the next build."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.state_file.write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+    def cached_resolution(
+        self, config_fingerprint: str
+    ) -> Optional[tuple[dict, list[str]]]:
+        """Return the processed config and packages if they are still valid."""
+        state = self.load_state()
+        if state.get("config_fingerprint") != config_fingerprint:
+            return None
+        try:
+            with open(self.config_file, encoding="utf-8") as f:
+                config = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(config, dict):
+            return None
+        return config, list(state.get("packages", []))
+
+    def store_resolution(
+        self, config_fingerprint: str, config: dict, packages: list[str]
+    ) -> None:
+        """Write the processed config and forget the state of the site."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            yaml.dump(config, f)
+        self.save_state(
+            {"config_fingerprint": config_fingerprint, "packages": packages}
+        )
+
+    def can_build_dirty(self, docs_fingerprint: str) -> bool:
+        """Whether the site is complete and the set of pages is unchanged."""
+        state = self.load_state()
+        return (
+            bool(state.get("site_built"))
+            and state.get("docs_fingerprint") == docs_fingerprint
+            and self.site_dir.is_dir()
+        )
+
+    def mark_site(self, docs_fingerprint: str, built: bool) -> None:
+        """Record whether the site directory holds a complete build."""
+        state = self.load_state()
+        state["docs_fingerprint"] = docs_fingerprint
+        state["site_built"] = built
+        self.save_state(state)
+
+
+def _publish_site(site_dir: Path, final_output_dir: Path) -> None:
+    """Copy the built site next to final_output_dir and swap it into place.
+
+    The site directory itself stays in the cache for the next dirty build,
+    so the published docset never shares files MkDocs rewrites later.
+    """
+    staging_dir = prepare_staging_dir(final_output_dir, seed_from_final=False)
+    try:
+        shutil.copytree(site_dir, staging_dir, symlinks=True, dirs_exist_ok=True)
+        swap_into_place(staging_dir, final_output_dir)
+    except OSError:
+        discard_staging_dir(staging_dir)
+        raise
+
+
 class MkDocsBuilder(AbstractGrabber):
     """A builder for generating documentation using MkDocs."""
 
@@ -386,22 +551,50 @@ class MkDocsBuilder(AbstractGrabber):
             return None
         return mkdocs_config_file_path, mkdocs_config_content
 
-    def generate_docset(
-        self, source_path: Path, output_path: Path, context: "BuildContext"
-    ) -> bool:
-        """Generate MkDocs documentation in an isolated environment."""
-        logger.info(
-            "\n--- Starting Isolated MkDocs Build for %s v%s ---",
-            context.project_slug,
-            context.version_identifier,
+    @staticmethod
+    def _build_cache(context: "BuildContext") -> Optional[MkDocsBuildCache]:
+        """Return the build cache of this version, or None if not incremental."""
+        if not ConfigManager().get_incremental_builds():
+            return None
+        return MkDocsBuildCache(
+            AppPaths().mkdocs_build_cache_dir
+            / context.project_slug
+            / context.version_identifier
         )
+
+    def _resolve_mkdocs_config(
+        self, source_path: Path, build_cache: Optional[MkDocsBuildCache]
+    ) -> Optional[tuple[dict, list[str]]]:
+        """Return the processed config and the packages the build needs.
+
+        With a build cache the result of a previous resolution is reused
+        while the project's mkdocs.yml is unchanged.
+        """
+        config_fingerprint = ""
+        if build_cache is not None:
+            mkdocs_config_file_path = _find_mkdocs_config_file(source_path)
+            if mkdocs_config_file_path is not None:
+                config_fingerprint = _fingerprint_mkdocs_config(
+                    mkdocs_config_file_path, source_path
+                )
+                cached = build_cache.cached_resolution(config_fingerprint)
+                if cached is not None:
+                    logger.info("Reusing resolved MkDocs config for %s", source_path)
+                    return cached
         path_check_result = self._path_check(source_path)
         if path_check_result is None:
-            return False
+            return None
         _mkdocs_config_file_path, mkdocs_config_content = path_check_result
-        final_output_dir = (
-            Path(output_path) / context.project_slug / context.version_identifier
-        ).resolve()
+        required_mkdocs_pkgs = _gather_mkdocs_required_packages(mkdocs_config_content)
+        if build_cache is not None:
+            build_cache.store_resolution(
+                config_fingerprint, mkdocs_config_content, required_mkdocs_pkgs
+            )
+        return mkdocs_config_content, required_mkdocs_pkgs
+
+    @staticmethod
+    def _clean_output_dir(final_output_dir: Path) -> bool:
+        """Remove and recreate the output directory of a non-incremental build."""
         try:
             if final_output_dir.exists():
                 shutil.rmtree(final_output_dir)
@@ -412,30 +605,212 @@ class MkDocsBuilder(AbstractGrabber):
                 final_output_dir,
             )
             return False
+        return True
+
+    @staticmethod
+    def _run_mkdocs_build(  # noqa: PLR0913
+        venv: "IsolatedVenvManager",
+        source_path: Path,
+        context: "BuildContext",
+        config_file_path: Path,
+        site_dir: Path,
+        dirty: bool = False,
+    ) -> bool:
+        """Run ``mkdocs build`` and report whether it succeeded."""
+        mkdocs_command_list = [
+            str(venv.python_executable),
+            "-m",
+            "mkdocs",
+            "build",
+            "--config-file",
+            str(config_file_path),
+            "--site-dir",
+            str(site_dir),
+        ]
+        if dirty:
+            mkdocs_command_list.append("--dirty")
+        logger.info("Executing MkDocs: %s", " ".join(mkdocs_command_list))
+        stdout, stderr, return_code = execute_command(
+            mkdocs_command_list,
+            f"MkDocs build for {context.project_slug}",
+            cwd=source_path,
+        )
+        if return_code != 0:
+            logger.error(
+                "MkDocs build for %s failed. Return code: %s",
+                context.project_slug,
+                return_code,
+            )
+            logger.error("MkDocs stdout:\n%s", stdout)
+            logger.error("MkDocs stderr:\n%s", stderr)
+            return False
+        logger.info(
+            "MkDocs build for %s completed successfully.",
+            context.project_slug,
+        )
+        return True
+
+    def _build_with_temp_config(
+        self,
+        venv: "IsolatedVenvManager",
+        source_path: Path,
+        context: "BuildContext",
+        mkdocs_config_content: dict,
+        final_output_dir: Path,
+    ) -> bool:
+        """Build straight into the output directory from a throwaway config."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, encoding="utf-8", suffix=".yml"
+        ) as temp_config_file:
+            yaml.dump(mkdocs_config_content, temp_config_file)
+        temp_config_file_path = Path(temp_config_file.name)
+        logger.info("Created temporary MkDocs config file: %s", temp_config_file_path)
         try:
-            with IsolatedVenvManager(
-                project_name=f"{context.project_slug}-{context.version_identifier}"
-            ) as venv:
-                required_mkdocs_pkgs = _gather_mkdocs_required_packages(
-                    mkdocs_config_content
-                )
+            return self._run_mkdocs_build(
+                venv, source_path, context, temp_config_file_path, final_output_dir
+            )
+        finally:
+            if temp_config_file_path.exists():
+                temp_config_file_path.unlink()
                 logger.info(
-                    "MkDocs related packages to install for %s: %s",
-                    context.project_slug,
-                    required_mkdocs_pkgs,
+                    "Cleaned up temporary MkDocs config file: %s",
+                    temp_config_file_path,
                 )
-                install_success = install_project_and_dependencies_in_venv(
-                    pip_executable=venv.pip_executable,
-                    project_name=context.project_slug,
-                    project_root_for_install=context.project_root_for_install,
-                    doc_requirements_path=_find_mkdocs_doc_requirements_file(
-                        source_path,
-                        context.project_root_for_install,
-                        context.project_slug,
-                    ),
-                    base_packages_to_install=required_mkdocs_pkgs,
+
+    def _build_incremental(  # noqa: PLR0913
+        self,
+        venv: "IsolatedVenvManager",
+        source_path: Path,
+        context: "BuildContext",
+        mkdocs_config_content: dict,
+        build_cache: MkDocsBuildCache,
+        final_output_dir: Path,
+    ) -> bool:
+        """Build into the cached site and swap a copy into the output directory.
+
+        The site is marked incomplete while MkDocs runs, so an interrupted or
+        failed build is followed by a clean one.
+        """
+        docs_dir = source_path / mkdocs_config_content.get("docs_dir", "docs")
+        docs_fingerprint = _fingerprint_docs_tree(docs_dir)
+        dirty = build_cache.can_build_dirty(docs_fingerprint)
+        logger.info(
+            "Building MkDocs site for %s %s",
+            context.project_slug,
+            "with --dirty" if dirty else "from scratch",
+        )
+        build_cache.mark_site(docs_fingerprint, built=False)
+        if not self._run_mkdocs_build(
+            venv,
+            source_path,
+            context,
+            build_cache.config_file,
+            build_cache.site_dir,
+            dirty=dirty,
+        ):
+            return False
+        build_cache.mark_site(docs_fingerprint, built=True)
+        _publish_site(build_cache.site_dir, final_output_dir)
+        return True
+
+    @staticmethod
+    def _build_env_manager(
+        context: "BuildContext",
+        required_mkdocs_pkgs: list[str],
+        doc_requirements_path: Optional[Path],
+    ) -> "IsolatedVenvManager":
+        """Return the venv manager of an MkDocs build."""
+        return build_env_manager(
+            project_name=f"{context.project_slug}-{context.version_identifier}",
+            cache_key=compute_env_key(
+                "mkdocs",
+                context.project_slug,
+                context.version_identifier,
+                required_mkdocs_pkgs,
+                [doc_requirements_path],
+                project_root=context.project_root_for_install,
+            ),
+        )
+
+    @staticmethod
+    def _select_requirements(
+        source_path: Path, context: "BuildContext", required_mkdocs_pkgs: list[str]
+    ) -> tuple[list[str], Optional[Path]]:
+        """Return the packages and requirements file the build installs."""
+        return context.select_requirements(
+            required_mkdocs_pkgs,
+            lambda: _find_mkdocs_doc_requirements_file(
+                source_path,
+                context.project_root_for_install,
+                context.project_slug,
+            ),
+        )
+
+    def prepare_environment(self, source_path: Path, context: "BuildContext") -> bool:
+        """Install MkDocs, its plugins and the project into the cached env."""
+        if not ConfigManager().get_env_cache_enabled():
+            return True
+        try:
+            resolved = self._resolve_mkdocs_config(
+                source_path, self._build_cache(context)
+            )
+            if resolved is None:
+                return True
+            required_mkdocs_pkgs, doc_requirements_path = self._select_requirements(
+                source_path, context, resolved[1]
+            )
+            with self._build_env_manager(
+                context, required_mkdocs_pkgs, doc_requirements_path
+            ) as venv:
+                context.env_key = getattr(venv, "cache_key", None)
+                return _prepare_mkdocs_build_env(
+                    venv, context, required_mkdocs_pkgs, doc_requirements_path
                 )
-                if not install_success:
+        except (OSError, RuntimeError):
+            logger.exception(
+                "Could not prepare the build environment for %s",
+                context.project_slug,
+            )
+            return False
+
+    def generate_docset(
+        self, source_path: Path, output_path: Path, context: "BuildContext"
+    ) -> bool:
+        """Generate MkDocs documentation in an isolated environment.
+
+        With incremental builds enabled the resolved config and the built site
+        are kept per package version, unchanged projects are rebuilt with
+        ``--dirty`` and the result replaces the output directory in one step.
+        """
+        logger.info(
+            "\n--- Starting Isolated MkDocs Build for %s v%s ---",
+            context.project_slug,
+            context.version_identifier,
+        )
+        build_cache = self._build_cache(context)
+        try:
+            resolved = self._resolve_mkdocs_config(source_path, build_cache)
+        except OSError:
+            logger.exception("Error resolving MkDocs config in %s", source_path)
+            return False
+        if resolved is None:
+            return False
+        mkdocs_config_content, required_mkdocs_pkgs = resolved
+        final_output_dir = (
+            Path(output_path) / context.project_slug / context.version_identifier
+        ).resolve()
+        if build_cache is None and not self._clean_output_dir(final_output_dir):
+            return False
+        try:
+            required_mkdocs_pkgs, doc_requirements_path = self._select_requirements(
+                source_path, context, required_mkdocs_pkgs
+            )
+            with self._build_env_manager(
+                context, required_mkdocs_pkgs, doc_requirements_path
+            ) as venv:
+                if not _prepare_mkdocs_build_env(
+                    venv, context, required_mkdocs_pkgs, doc_requirements_path
+                ):
                     logger.error(
                         "CRITICAL: Installation of project/dependencies "
                         "(including MkDocs) for %s FAILED or had critical "
@@ -443,54 +818,23 @@ class MkDocsBuilder(AbstractGrabber):
                         context.project_slug,
                     )
                     return False
-                with tempfile.NamedTemporaryFile(
-                    mode="w", delete=False, encoding="utf-8", suffix=".yml"
-                ) as temp_config_file:
-                    yaml.dump(mkdocs_config_content, temp_config_file)
-                temp_config_file_path = Path(temp_config_file.name)
-                logger.info(
-                    "Created temporary MkDocs config file: %s",
-                    temp_config_file_path,
-                )
-                mkdocs_command_list = [
-                    str(venv.python_executable),
-                    "-m",
-                    "mkdocs",
-                    "build",
-                    "--config-file",
-                    str(temp_config_file_path),
-                    "--site-dir",
-                    str(final_output_dir),
-                ]
-                logger.info("Executing MkDocs: %s", " ".join(mkdocs_command_list))
-                try:
-                    stdout, stderr, return_code = execute_command(
-                        mkdocs_command_list,
-                        f"MkDocs build for {context.project_slug}",
-                        cwd=source_path,
-                    )
-                finally:
-                    if temp_config_file_path.exists():
-                        temp_config_file_path.unlink()
-                        logger.info(
-                            "Cleaned up temporary MkDocs config file: %s",
-                            temp_config_file_path,
-                        )
-                if return_code == 0:
-                    logger.info(
-                        "MkDocs build for %s completed successfully.",
-                        context.project_slug,
+                if build_cache is None:
+                    build_successful = self._build_with_temp_config(
+                        venv,
+                        source_path,
+                        context,
+                        mkdocs_config_content,
+                        final_output_dir,
                     )
-                    build_successful = True
                 else:
-                    logger.error(
-                        "MkDocs build for %s failed. Return code: %s",
-                        context.project_slug,
-                        return_code,
+                    build_successful = self._build_incremental(
+                        venv,
+                        source_path,
+                        context,
+                        mkdocs_config_content,
+                        build_cache,
+                        final_output_dir,
                     )
-                    logger.error("MkDocs stdout:\n%s", stdout)
-                    logger.error("MkDocs stderr:\n%s", stderr)
-                    build_successful = False
         except RuntimeError:
             logger.exception(
                 "Critical error during isolated build setup for %s",
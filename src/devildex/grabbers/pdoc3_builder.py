@@ -5,10 +5,13 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from devildex.grabbers.abstract_grabber import AbstractGrabber
-from devildex.utils.venv_cm import IsolatedVenvManager
+from devildex.utils.venv_cache import (
+    docstrings_env_manager,
+    docstrings_install_config,
+)
 from devildex.utils.venv_utils import (
     execute_command,
-    install_project_and_dependencies_in_venv,
+    install_environment_dependencies,
 )
 
 if TYPE_CHECKING:
@@ -52,53 +55,58 @@ class Pdoc3Builder(AbstractGrabber):
         """Generate documentation using pdoc3."""
         logger.info(f"Attempting to generate pdoc3 documentation for {source_path}")
 
-        venv_manager = IsolatedVenvManager(context.temp_dir / "pdoc3_venv")
-        try:
-            venv_manager.create_venv()
-            install_project_and_dependencies_in_venv(
-                venv_manager, source_path, context.project_name
-            )
-            # Install pdoc3
-            execute_command(
-                [venv_manager.pip_path, "install", "pdoc3"],
-                cwd=venv_manager.venv_path,
-                description="Installing pdoc3 in isolated venv",
+        package_root = context.resolve_package_source_path(context.project_name)
+        if not package_root:
+            logger.error(
+                "Pdoc3Builder: Could not resolve Python package root for "
+                "pdoc3 generation."
             )
+            return False
 
-            package_root = context.resolve_package_source_path(context.project_name)
-            if not package_root:
-                logger.error(
-                    "Pdoc3Builder: Could not resolve Python package root for "
-                    "pdoc3 generation."
+        try:
+            with docstrings_env_manager(
+                context.project_name, context.version_identifier, source_path
+            ) as venv:
+                if not venv.reused:
+                    if not install_environment_dependencies(
+                        venv.pip_executable,
+                        context.project_name,
+                        docstrings_install_config(source_path),
+                    ):
+                        logger.error(
+                            "Pdoc3Builder: Failed to install pdoc3 or project "
+                            "dependencies for %s.",
+                            context.project_name,
+                        )
+                        return False
+                    venv.mark_ready()
+
+                pythonpath_parent = package_root.parent
+                package_name = package_root.name
+                output_path.mkdir(parents=True, exist_ok=True)
+
+                pdoc_command = [
+                    venv.python_executable,
+                    "-m",
+                    "pdoc",
+                    "--html",
+                    "--output-dir",
+                    str(output_path),
+                ]
+
+                if self.template_dir:
+                    pdoc_command.extend(["--template-dir", str(self.template_dir)])
+
+                pdoc_command.append(package_name)
+
+                env = {"PYTHONPATH": str(pythonpath_parent)}
+
+                _, stderr, returncode = execute_command(
+                    pdoc_command,
+                    f"Generating pdoc3 documentation for {package_name}",
+                    cwd=pythonpath_parent,
+                    env=env,
                 )
-                return False
-
-            pythonpath_parent = package_root.parent
-            package_name = package_root.name
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            pdoc_command = [
-                venv_manager.python_path,
-                "-m",
-                "pdoc",
-                "--html",
-                "--output-dir",
-                str(output_path),
-            ]
-
-            if self.template_dir:
-                pdoc_command.extend(["--template-dir", str(self.template_dir)])
-
-            pdoc_command.append(package_name)
-
-            env = {"PYTHONPATH": str(pythonpath_parent)}
-
-            _, stderr, returncode = execute_command(
-                pdoc_command,
-                cwd=pythonpath_parent,
-                env=env,
-                description=f"Generating pdoc3 documentation for {package_name}",
-            )
 
             if returncode != 0:
                 logger.error(f"pdoc3 documentation generation failed: {stderr}")
@@ -118,5 +126,3 @@ class Pdoc3Builder(AbstractGrabber):
         except Exception:
             logger.exception("Error during pdoc3 documentation generation")
             return False
-        finally:
-            venv_manager.cleanup_venv()
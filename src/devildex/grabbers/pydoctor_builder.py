@@ -5,9 +5,11 @@ import shutil
 from pathlib import Path
 from typing import Optional
 
+from devildex.config_manager import ConfigManager
 from devildex.grabbers.abstract_grabber import AbstractGrabber
 from devildex.orchestrator.context import BuildContext
-from devildex.utils import venv_cm, venv_utils
+from devildex.theming.asset_bundle import PYDOCTOR_THEME_ASSETS, install_theme_assets
+from devildex.utils import venv_cache, venv_utils
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +50,13 @@ class PydoctorBuilder(AbstractGrabber):
     def generate_docset(
         self, source_path: Path, output_path: Path, context: BuildContext
     ) -> bool:
-        """Generate HTML documentation using Pydoctor in an isolated environment."""
+        """Generate HTML documentation using Pydoctor in an isolated environment.
+
+        pydoctor only parses sources, so by default it runs from the shared
+        pydoctor tool environment and the project is never installed. With
+        pydoctor_fast_path disabled it uses the project's docstrings
+        environment instead.
+        """
         logger.info(
             "PydoctorBuilder: Attempting to generate docs for %s", context.project_name
         )
@@ -64,62 +72,80 @@ class PydoctorBuilder(AbstractGrabber):
             pydoctor_output_dir,
         )
 
-        with venv_cm.IsolatedVenvManager(project_name=context.project_name) as i_venv:
-            python_executable = i_venv.python_executable
-            pip_executable = i_venv.pip_executable
+        if ConfigManager().get_pydoctor_fast_path():
+            env_manager = venv_cache.pydoctor_tool_env_manager()
+            install_config = venv_cache.pydoctor_tool_install_config(source_path)
+        else:
+            env_manager = venv_cache.docstrings_env_manager(
+                context.project_name, context.version_identifier, source_path
+            )
+            install_config = venv_cache.docstrings_install_config(source_path)
+
+        with env_manager as i_venv:
+            if not i_venv.reused:
+                if not venv_utils.install_environment_dependencies(
+                    i_venv.pip_executable, context.project_name, install_config
+                ):
+                    logger.error(
+                        "PydoctorBuilder: CRITICAL: Failed to install pydoctor or "
+                        "project dependencies for %s in venv. Aborting pydoctor "
+                        "build.",
+                        context.project_name,
+                    )
+                    return False
+                i_venv.mark_ready()
 
-            base_packages = ["pydoctor"]
-            install_config = venv_utils.InstallConfig(
-                project_root_for_install=source_path,
-                tool_specific_packages=base_packages,
-                scan_for_project_requirements=True,
-                install_project_editable=True,
+            return self._run_pydoctor(
+                i_venv.python_executable, source_path, pydoctor_output_dir, context
             )
 
-            if not venv_utils.install_environment_dependencies(
-                pip_executable, context.project_name, install_config
-            ):
-                logger.error(
-                    "PydoctorBuilder: CRITICAL: Failed to install pydoctor or project "
-                    "dependencies for %s in venv. Aborting pydoctor build.",
-                    context.project_name,
-                )
-                return False
+    def _run_pydoctor(
+        self,
+        python_executable: str,
+        source_path: Path,
+        pydoctor_output_dir: Path,
+        context: BuildContext,
+    ) -> bool:
+        """Run pydoctor on the source tree with the given interpreter."""
+        pydoctor_cwd = source_path.parent
+        module_to_document_name = source_path.name
 
-            pydoctor_cwd = source_path.parent
-            module_to_document_name = source_path.name
+        pydoctor_command = self._build_pydoctor_command(
+            python_executable, context, pydoctor_output_dir, module_to_document_name
+        )
 
-            pydoctor_command = self._build_pydoctor_command(
-                python_executable, context, pydoctor_output_dir, module_to_document_name
-            )
+        logger.info(
+            "PydoctorBuilder: Executing pydoctor command: %s (cwd: %s)",
+            " ".join(pydoctor_command),
+            pydoctor_cwd,
+        )
 
-            logger.info(
-                "PydoctorBuilder: Executing pydoctor command: %s (cwd: %s)",
-                " ".join(pydoctor_command),
-                pydoctor_cwd,
-            )
+        stdout, stderr, return_code = venv_utils.execute_command(
+            pydoctor_command,
+            f"Pydoctor build for {context.project_name}",
+            cwd=pydoctor_cwd,
+        )
 
-            stdout, stderr, return_code = venv_utils.execute_command(
-                pydoctor_command,
-                f"Pydoctor build for {context.project_name}",
-                cwd=pydoctor_cwd,
+        if return_code != 0:
+            logger.error(
+                "PydoctorBuilder: Pydoctor build failed for %s. Return Code: %s",
+                context.project_name,
+                return_code,
             )
-
-            if return_code != 0:
-                logger.error(
-                    "PydoctorBuilder: Pydoctor build failed for %s. Return Code: %s",
-                    context.project_name,
-                    return_code,
-                )
-                logger.error("Pydoctor Stdout:\n%s", stdout)
-                logger.error("Pydoctor Stderr:\n%s", stderr)
-                return False
-            else:
-                logger.info(
-                    "PydoctorBuilder: Pydoctor build for %s completed successfully.",
-                    context.project_name,
-                )
-                return True
+            logger.error("Pydoctor Stdout:\n%s", stdout)
+            logger.error("Pydoctor Stderr:\n%s", stderr)
+            return False
+        if self.template_dir and (self.template_dir / "static").is_dir():
+            install_theme_assets(
+                PYDOCTOR_THEME_ASSETS,
+                self.template_dir / "static",
+                pydoctor_output_dir / "static",
+            )
+        logger.info(
+            "PydoctorBuilder: Pydoctor build for %s completed successfully.",
+            context.project_name,
+        )
+        return True
 
     def can_handle(self, source_path: Path, context: BuildContext) -> bool:
         """Determine if the grabber can handle a given project."""
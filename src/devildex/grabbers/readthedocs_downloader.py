@@ -3,9 +3,14 @@
 import logging
 import os
 import shutil
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 
 import requests
 
@@ -17,6 +22,51 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 FILENAME_MAX_LENGTH = 60
+VERSIONS_API_URL = "https://readthedocs.org/api/v3/projects/{project_slug}/versions/"
+VERSIONS_PAGE_SIZE = 100
+VERSIONS_PAGE_WORKERS = 4
+VERSIONS_CACHE_TTL_SECONDS = 3600
+RTD_HOST_SUFFIXES = (".readthedocs.io", ".readthedocs-hosted.com", ".rtfd.io")
+RTD_PROJECTS_HOSTS = ("readthedocs.org", "www.readthedocs.org")
+
+_versions_cache: dict[str, tuple[float, list[dict]]] = {}
+_versions_cache_lock = threading.Lock()
+
+
+def rtd_project_slug(urls: Iterable[Optional[str]]) -> Optional[str]:
+    """Return the Read the Docs project slug of the first RTD-hosted URL.
+
+    Both project subdomains (``<slug>.readthedocs.io``) and project pages
+    (``readthedocs.org/projects/<slug>``) are recognized.
+    """
+    for url in urls:
+        if not url:
+            continue
+        parsed = urlparse(url if "//" in url else f"//{url}")
+        host = (parsed.hostname or "").lower()
+        for suffix in RTD_HOST_SUFFIXES:
+            if host.endswith(suffix) and host != suffix.lstrip("."):
+                return host.removesuffix(suffix)
+        parts = [part for part in parsed.path.split("/") if part]
+        if host in RTD_PROJECTS_HOSTS and len(parts) > 1 and parts[0] == "projects":
+            return parts[1].lower()
+    return None
+
+
+def clear_versions_cache() -> None:
+    """Forget the version lists fetched so far."""
+    with _versions_cache_lock:
+        _versions_cache.clear()
+
+
+def _fetch_versions_page(url: str, offset: int) -> dict:
+    """Fetch one page of a project's version list."""
+    logger.info(f"Fetching versions from {url} at offset {offset}")
+    response = requests.get(
+        url, params={"limit": VERSIONS_PAGE_SIZE, "offset": offset}, timeout=30
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 class ReadTheDocsDownloader(AbstractGrabber):
@@ -117,50 +167,128 @@ class ReadTheDocsDownloader(AbstractGrabber):
         return context.doc_type == "readthedocs"
 
     def _fetch_available_versions(self, project_slug: str) -> list[dict] | None:
-        """Fetch ALL available versions for a project from RTD API."""
-        all_versions_results = []
-        next_page_url = (
-            f"https://readthedocs.org/api/v3/projects/{project_slug}/versions/"
+        """Fetch ALL available versions for a project from RTD API.
+
+        The first page tells how many versions there are, the remaining
+        pages are then fetched concurrently. Lists are kept for a while, so
+        asking again for the same project costs no request.
+        """
+        with _versions_cache_lock:
+            cached = _versions_cache.get(project_slug)
+        if cached and time.monotonic() - cached[0] < VERSIONS_CACHE_TTL_SECONDS:
+            logger.info(f"Using cached version list for '{project_slug}'.")
+            return list(cached[1])
+
+        url = VERSIONS_API_URL.format(project_slug=project_slug)
+        logger.info(f"\nCalling API to list versions: {url}")
+        try:
+            first_page = _fetch_versions_page(url, 0)
+            all_versions_results = list(first_page.get("results", []))
+            total_count = first_page.get("count", len(all_versions_results))
+            page_size = len(all_versions_results)
+            offsets = (
+                list(range(page_size, total_count, page_size)) if page_size else []
+            )
+            if offsets:
+                with ThreadPoolExecutor(
+                    max_workers=min(VERSIONS_PAGE_WORKERS, len(offsets))
+                ) as pool:
+                    for page in pool.map(
+                        lambda offset: _fetch_versions_page(url, offset), offsets
+                    ):
+                        all_versions_results.extend(page.get("results", []))
+        except requests.exceptions.RequestException:
+            logger.exception(f"Error calling API list versions ({url})")
+            return None
+        except JSONDecodeError:
+            logger.exception(
+                f"Error decoding JSON response while listing versions ({url})"
+            )
+            return None
+
+        logger.info(
+            "API list versions: All pages fetched. Total versions found:"
+            f" {len(all_versions_results)} out of {total_count}."
         )
-        logger.info(f"\nCalling API to list versions (starting with): {next_page_url}")
+        with _versions_cache_lock:
+            _versions_cache[project_slug] = (time.monotonic(), all_versions_results)
+        return list(all_versions_results)
 
-        page_num = 1
-        while next_page_url:
-            try:
-                logger.info(f"Fetching page {page_num} from: {next_page_url}")
-                response = requests.get(next_page_url, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+    @staticmethod
+    def _match_exact_version(
+        available_versions: list[dict], version: str
+    ) -> dict | None:
+        """Return the active, built RTD version named exactly like version."""
+        wanted = {version.lower(), f"v{version}".lower()}
+        for candidate in available_versions:
+            names = {
+                str(candidate.get("slug", "")).lower(),
+                str(candidate.get("verbose_name", "")).lower(),
+            }
+            if (
+                names & wanted
+                and candidate.get("active") is True
+                and candidate.get("built") is True
+            ):
+                return candidate
+        return None
 
-                current_page_versions = data.get("results", [])
-                all_versions_results.extend(current_page_versions)
+    def find_prebuilt_download(
+        self, project_slug: str, version: str, download_format: str = "htmlzip"
+    ) -> str | None:
+        """Return the download URL of RTD's build of exactly this version.
 
-                total_count = data.get("count", len(all_versions_results))
+        Args:
+            project_slug: The Read the Docs project.
+            version: The package version, matched as-is or with a ``v`` prefix.
+            download_format: The offline format wanted.
 
-                logger.info(
-                    f"Page {page_num}: Fetched {len(current_page_versions)} versions. "
-                    f"Total fetched so far: {len(all_versions_results)}"
-                    f"out of {total_count}."
-                )
+        Returns:
+            The URL, or None if RTD has no such build.
 
-                next_page_url = data.get("next")
-                page_num += 1
+        """
+        available_versions = self._fetch_available_versions(project_slug)
+        if not available_versions:
+            return None
+        match = self._match_exact_version(available_versions, version)
+        if not match:
+            logger.info(
+                f"No Read the Docs build of '{project_slug}' for version {version}."
+            )
+            return None
+        if not match.get("downloads"):
+            match = self._fetch_version_details(project_slug, match["slug"])
+        return self._get_download_url(match, download_format) if match else None
 
-            except requests.exceptions.RequestException:
-                logger.exception(f"Error calling API list versions ({next_page_url})")
-                return None
-            except JSONDecodeError:
-                logger.exception(
-                    f"Error decoding JSON response while listing versions "
-                    f"({next_page_url})"
-                )
-                return None
+    def fetch_prebuilt_docset(self, file_url: str, target_dir: Path) -> bool:
+        """Download an htmlzip and extract its pages into target_dir.
 
-        logger.info(
-            "API list versions: All pages fetched. Total versions found:"
-            f" {len(all_versions_results)}."
-        )
-        return all_versions_results
+        The archive's single top-level folder is dropped, so index.html ends
+        up directly in target_dir. Any previous content is replaced.
+        """
+        target_dir.parent.mkdir(parents=True, exist_ok=True)
+        archive_path = target_dir.with_name(f".{target_dir.name}.download.zip")
+        staging_dir = target_dir.with_name(f".{target_dir.name}.extract")
+        if not self._download_file(file_url, archive_path):
+            return False
+        try:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.unpack_archive(archive_path, staging_dir, format="zip")
+            entries = list(staging_dir.iterdir())
+            pages_root = (
+                entries[0] if len(entries) == 1 and entries[0].is_dir() else staging_dir
+            )
+            if target_dir.exists():
+                shutil.rmtree(target_dir)
+            shutil.move(pages_root, target_dir)
+        except OSError:
+            logger.exception(f"Error extracting archive {archive_path}")
+            return False
+        finally:
+            archive_path.unlink(missing_ok=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        logger.info(f"Extracted prebuilt documentation into {target_dir}")
+        return True
 
     def _choose_best_version(
         self, available_versions: list[dict], preferred_versions: list[str]
@@ -4,17 +4,26 @@ import logging
 import os
 import shutil
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import requests
 
+from devildex.app_paths import AppPaths
+from devildex.config_manager import ConfigManager
 from devildex.grabbers.abstract_grabber import AbstractGrabber
 from devildex.info import PROJECT_ROOT
 from devildex.scanner.scanner import is_sphinx_project  # Import is_sphinx_project
-from devildex.utils.venv_cm import IsolatedVenvManager
+from devildex.utils.core_budget import get_core_budget
+from devildex.utils.staging import (
+    discard_staging_dir,
+    prepare_staging_dir,
+    staging_dir_for,
+    swap_into_place,
+)
+from devildex.utils.venv_cache import build_env_manager, compute_env_key
 from devildex.utils.venv_utils import (
     execute_command,
     install_project_and_dependencies_in_venv,
@@ -22,6 +31,7 @@ from devildex.utils.venv_utils import (
 
 if TYPE_CHECKING:
     from devildex.orchestrator.context import BuildContext
+    from devildex.utils.venv_cm import IsolatedVenvManager
 
 logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
@@ -31,6 +41,19 @@ if not logger.hasHandlers():
 
 CONF_SPHINX_FILE = "conf.py"
 REQUIREMENTS_FILENAME = "requirements.txt"
+SPHINX_PARALLEL_UNSAFE_MARKERS = (
+    "is not safe for parallel",
+    "safe for parallel reading, assuming it isn't",
+    "safe for parallel writing, assuming it isn't",
+)
+SPHINX_BASE_PACKAGES = [
+    "sphinx",
+    "pallets-sphinx-themes",
+    "sphinxcontrib.log-cabinet",
+    "sphinx-tabs",
+    "sphinx-autoapi",
+    "sphinx-copybutton",
+]
 
 
 @dataclass
@@ -82,6 +105,13 @@ class SphinxBuildContext:
     project_slug: str
     version_identifier: str
     base_output_dir: Path
+    doctree_dir: Path | None = None
+    base_packages: list[str] = field(default_factory=lambda: list(SPHINX_BASE_PACKAGES))
+
+    @property
+    def incremental(self) -> bool:
+        """Whether doctrees are kept and the output is built in staging."""
+        return self.doctree_dir is not None
 
     @property
     def conf_py_file(self) -> Path:
@@ -95,10 +125,25 @@ class SphinxBuildContext:
             Path(self.base_output_dir) / self.project_slug / self.version_identifier
         ).resolve()
 
+    @property
+    def build_output_dir(self) -> Path:
+        """The directory Sphinx writes into during the build."""
+        if self.incremental:
+            return staging_dir_for(self.final_output_dir)
+        return self.final_output_dir
+
+
+def _mentions_parallel_unsafe(sphinx_output: str) -> bool:
+    """Check whether Sphinx reported an extension as unsafe for -j."""
+    lowered = sphinx_output.lower()
+    return any(marker in lowered for marker in SPHINX_PARALLEL_UNSAFE_MARKERS)
+
 
 class SphinxBuilder(AbstractGrabber):
     """Builder for sphinx projects."""
 
+    _serial_only_projects: ClassVar[set[str]] = set()
+
     def generate_docset(
         self, source_path: Path, output_path: Path, context: "BuildContext"
     ) -> str | bool:
@@ -110,19 +155,7 @@ class SphinxBuilder(AbstractGrabber):
             context.project_slug,
             context.version_identifier,
         )
-        source_dir_p = source_path
-        clone_root_p = context.project_root_for_install
-        sphinx_build_ctx = SphinxBuildContext(
-            source_dir=source_dir_p,
-            clone_root=clone_root_p,
-            doc_requirements_file=self._find_sphinx_doc_requirements_file(
-                source_dir_p, clone_root_p, context.project_slug
-            ),
-            project_install_root=clone_root_p,
-            project_slug=context.project_slug,
-            version_identifier=context.version_identifier,
-            base_output_dir=output_path,
-        )
+        sphinx_build_ctx = self._sphinx_build_context(source_path, output_path, context)
 
         build_result: str | bool = False
         should_proceed = True
@@ -140,45 +173,16 @@ class SphinxBuilder(AbstractGrabber):
             logger.info(
                 "Sphinx HTML output directory: %s", sphinx_build_ctx.final_output_dir
             )
-            try:
-                if sphinx_build_ctx.final_output_dir.exists():
-                    logger.info(
-                        "Removing existing output directory: %s",
-                        sphinx_build_ctx.final_output_dir,
-                    )
-                    shutil.rmtree(sphinx_build_ctx.final_output_dir)
-                sphinx_build_ctx.final_output_dir.mkdir(parents=True, exist_ok=True)
-            except OSError:
-                logger.exception(
-                    "Error creating/cleaning output directory %s",
-                    sphinx_build_ctx.final_output_dir,
-                )
-                should_proceed = False
+            should_proceed = self._prepare_output_dir(sphinx_build_ctx)
 
         if should_proceed:
-            logger.debug(f"Entering IsolatedVenvManager for {context.project_slug}")
+            logger.debug(f"Entering build env manager for {context.project_slug}")
             try:
-                with IsolatedVenvManager(
-                    project_name=f"{sphinx_build_ctx.project_slug}-"
-                    f"{sphinx_build_ctx.version_identifier}"
-                ) as venv:
+                with self._build_env_manager(sphinx_build_ctx) as venv:
                     logger.debug(
-                        f"IsolatedVenvManager entered. Venv path: {venv.venv_path}"
-                    )
-                    install_success = install_project_and_dependencies_in_venv(
-                        pip_executable=venv.pip_executable,
-                        project_name=sphinx_build_ctx.project_slug,
-                        project_root_for_install=sphinx_build_ctx.project_install_root,
-                        doc_requirements_path=sphinx_build_ctx.doc_requirements_file,
-                        base_packages_to_install=[
-                            "sphinx",
-                            "pallets-sphinx-themes",
-                            "sphinxcontrib.log-cabinet",
-                            "sphinx-tabs",
-                            "sphinx-autoapi",
-                            "sphinx-copybutton",
-                        ],
+                        f"Build env manager entered. Venv path: {venv.venv_path}"
                     )
+                    install_success = self._prepare_build_env(venv, sphinx_build_ctx)
                     logger.debug(
                         "install_project_and_dependencies_in_venv"
                         f" returned: {install_success}"
@@ -193,48 +197,9 @@ class SphinxBuilder(AbstractGrabber):
                         )
                         build_result = False
                     else:
-                        sphinx_command_list = [
-                            venv.python_executable,
-                            "-m",
-                            "sphinx",
-                            "-b",
-                            "html",
-                            ".",
-                            str(sphinx_build_ctx.final_output_dir),
-                        ]
-                        sphinx_process_env = {"LC_ALL": "C"}
-                        logger.debug(
-                            "Executing Sphinx command: "
-                            f"{' '.join(sphinx_command_list)}"
-                        )
-                        logger.info(
-                            "Executing Sphinx: %s", " ".join(sphinx_command_list)
-                        )
-                        stdout, stderr, return_code = execute_command(
-                            sphinx_command_list,
-                            f"Sphinx build for {sphinx_build_ctx.project_slug}",
-                            cwd=sphinx_build_ctx.source_dir,
-                            env=sphinx_process_env,
+                        build_result = self._run_sphinx_build(
+                            venv.python_executable, sphinx_build_ctx
                         )
-                        logger.debug(
-                            f"Sphinx command returned: return_code={return_code},"
-                            f" stdout={stdout}, stderr={stderr}"
-                        )
-                        if return_code == 0:
-                            logger.info(
-                                "Sphinx build for %s completed successfully.",
-                                sphinx_build_ctx.project_slug,
-                            )
-                            build_result = str(sphinx_build_ctx.final_output_dir)
-                        else:
-                            logger.error(
-                                "Sphinx build for %s failed. Return code: %s",
-                                sphinx_build_ctx.project_slug,
-                                return_code,
-                            )
-                            logger.error("Sphinx stdout:\n%s", stdout)
-                            logger.error("Sphinx stderr:\n%s", stderr)
-                            build_result = False
 
             except RuntimeError:
                 logger.exception(
@@ -249,6 +214,8 @@ class SphinxBuilder(AbstractGrabber):
                 )
                 build_result = False
             finally:
+                if sphinx_build_ctx.incremental:
+                    discard_staging_dir(sphinx_build_ctx.build_output_dir)
                 logger.info(
                     "--- Finished Isolated Sphinx Build for %s ---",
                     sphinx_build_ctx.project_slug,
@@ -256,6 +223,211 @@ class SphinxBuilder(AbstractGrabber):
         logger.debug(f"SphinxBuilder.generate_docset returning: {build_result}")
         return build_result
 
+    def prepare_environment(self, source_path: Path, context: "BuildContext") -> bool:
+        """Install Sphinx and the project into the cached build environment."""
+        if not ConfigManager().get_env_cache_enabled():
+            return True
+        sphinx_build_ctx = self._sphinx_build_context(
+            source_path, context.base_output_dir, context
+        )
+        if not sphinx_build_ctx.conf_py_file.exists():
+            return True
+        try:
+            with self._build_env_manager(sphinx_build_ctx) as venv:
+                context.env_key = getattr(venv, "cache_key", None)
+                return self._prepare_build_env(venv, sphinx_build_ctx)
+        except RuntimeError:
+            logger.exception(
+                "Could not prepare the build environment for %s",
+                sphinx_build_ctx.project_slug,
+            )
+            return False
+
+    def _sphinx_build_context(
+        self, source_path: Path, output_path: Path, context: "BuildContext"
+    ) -> SphinxBuildContext:
+        """Describe the Sphinx build of a project."""
+        clone_root = context.project_root_for_install
+        base_packages, doc_requirements_file = context.select_requirements(
+            SPHINX_BASE_PACKAGES,
+            lambda: self._find_sphinx_doc_requirements_file(
+                source_path, clone_root, context.project_slug
+            ),
+        )
+        return SphinxBuildContext(
+            source_dir=source_path,
+            clone_root=clone_root,
+            doc_requirements_file=doc_requirements_file,
+            project_install_root=clone_root,
+            project_slug=context.project_slug,
+            version_identifier=context.version_identifier,
+            base_output_dir=output_path,
+            doctree_dir=self._doctree_cache_dir(context),
+            base_packages=base_packages,
+        )
+
+    @staticmethod
+    def _build_env_manager(
+        sphinx_build_ctx: SphinxBuildContext,
+    ) -> "IsolatedVenvManager":
+        """Return the venv manager of a Sphinx build."""
+        return build_env_manager(
+            project_name=f"{sphinx_build_ctx.project_slug}-"
+            f"{sphinx_build_ctx.version_identifier}",
+            cache_key=compute_env_key(
+                "sphinx",
+                sphinx_build_ctx.project_slug,
+                sphinx_build_ctx.version_identifier,
+                sphinx_build_ctx.base_packages,
+                [sphinx_build_ctx.doc_requirements_file],
+                project_root=sphinx_build_ctx.project_install_root,
+            ),
+        )
+
+    @staticmethod
+    def _doctree_cache_dir(context: "BuildContext") -> Path | None:
+        """Return the persistent doctree directory, or None if not incremental."""
+        if not ConfigManager().get_incremental_builds():
+            return None
+        return (
+            AppPaths().sphinx_doctree_cache_dir
+            / context.project_slug
+            / context.version_identifier
+        )
+
+    @staticmethod
+    def _prepare_output_dir(sphinx_build_ctx: SphinxBuildContext) -> bool:
+        """Create the directory Sphinx writes into.
+
+        Incremental builds start from a copy of the current output so Sphinx
+        only writes the pages whose sources changed. Otherwise the output is
+        removed and rebuilt from scratch.
+        """
+        final_output_dir = sphinx_build_ctx.final_output_dir
+        try:
+            if sphinx_build_ctx.incremental:
+                prepare_staging_dir(final_output_dir)
+                return True
+            if final_output_dir.exists():
+                logger.info("Removing existing output directory: %s", final_output_dir)
+                shutil.rmtree(final_output_dir)
+            final_output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            logger.exception(
+                "Error creating/cleaning output directory %s", final_output_dir
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _build_sphinx_command(
+        python_executable: str, sphinx_build_ctx: SphinxBuildContext, jobs: int = 1
+    ) -> list[str]:
+        """Build the sphinx-build command line."""
+        sphinx_command_list = [python_executable, "-m", "sphinx", "-b", "html"]
+        if jobs > 1:
+            sphinx_command_list.extend(["-j", str(jobs)])
+        if sphinx_build_ctx.doctree_dir is not None:
+            sphinx_command_list.extend(["-d", str(sphinx_build_ctx.doctree_dir)])
+        sphinx_command_list.extend([".", str(sphinx_build_ctx.build_output_dir)])
+        return sphinx_command_list
+
+    def _execute_sphinx(
+        self, python_executable: str, sphinx_build_ctx: SphinxBuildContext
+    ) -> tuple[str, str, int]:
+        """Run sphinx-build with as many jobs as the core budget allows.
+
+        Projects whose extensions are not parallel safe get a single core.
+        A parallel build that fails on a parallel-specific error is retried
+        serially, and the project is remembered as serial-only.
+        """
+        project_slug = sphinx_build_ctx.project_slug
+        max_jobs = 1 if project_slug in self._serial_only_projects else None
+        with get_core_budget().reserve(max_jobs) as jobs:
+            stdout, stderr, return_code = self._execute_sphinx_command(
+                self._build_sphinx_command(python_executable, sphinx_build_ctx, jobs),
+                sphinx_build_ctx,
+            )
+        if jobs > 1 and _mentions_parallel_unsafe(stdout + stderr):
+            logger.info(
+                "Sphinx extensions of %s are not parallel safe. "
+                "Future builds will run serially.",
+                project_slug,
+            )
+            self._serial_only_projects.add(project_slug)
+            if return_code != 0:
+                logger.warning(
+                    "Retrying the Sphinx build for %s serially.", project_slug
+                )
+                stdout, stderr, return_code = self._execute_sphinx_command(
+                    self._build_sphinx_command(python_executable, sphinx_build_ctx),
+                    sphinx_build_ctx,
+                )
+        return stdout, stderr, return_code
+
+    @staticmethod
+    def _execute_sphinx_command(
+        sphinx_command_list: list[str], sphinx_build_ctx: SphinxBuildContext
+    ) -> tuple[str, str, int]:
+        """Run one sphinx-build command line."""
+        sphinx_process_env = {"LC_ALL": "C"}
+        logger.info("Executing Sphinx: %s", " ".join(sphinx_command_list))
+        stdout, stderr, return_code = execute_command(
+            sphinx_command_list,
+            f"Sphinx build for {sphinx_build_ctx.project_slug}",
+            cwd=sphinx_build_ctx.source_dir,
+            env=sphinx_process_env,
+        )
+        logger.debug(
+            f"Sphinx command returned: return_code={return_code},"
+            f" stdout={stdout}, stderr={stderr}"
+        )
+        return stdout, stderr, return_code
+
+    def _run_sphinx_build(
+        self, python_executable: str, sphinx_build_ctx: SphinxBuildContext
+    ) -> str | bool:
+        """Run Sphinx and move the output into place on success."""
+        stdout, stderr, return_code = self._execute_sphinx(
+            python_executable, sphinx_build_ctx
+        )
+        if return_code != 0:
+            logger.error(
+                "Sphinx build for %s failed. Return code: %s",
+                sphinx_build_ctx.project_slug,
+                return_code,
+            )
+            logger.error("Sphinx stdout:\n%s", stdout)
+            logger.error("Sphinx stderr:\n%s", stderr)
+            return False
+        if sphinx_build_ctx.incremental:
+            swap_into_place(
+                sphinx_build_ctx.build_output_dir, sphinx_build_ctx.final_output_dir
+            )
+        logger.info(
+            "Sphinx build for %s completed successfully.",
+            sphinx_build_ctx.project_slug,
+        )
+        return str(sphinx_build_ctx.final_output_dir)
+
+    @staticmethod
+    def _prepare_build_env(
+        venv: "IsolatedVenvManager", sphinx_build_ctx: SphinxBuildContext
+    ) -> bool:
+        """Install Sphinx and the project in venv unless it was reused."""
+        if venv.reused:
+            return True
+        install_success = install_project_and_dependencies_in_venv(
+            pip_executable=venv.pip_executable,
+            project_name=sphinx_build_ctx.project_slug,
+            project_root_for_install=sphinx_build_ctx.project_install_root,
+            doc_requirements_path=sphinx_build_ctx.doc_requirements_file,
+            base_packages_to_install=sphinx_build_ctx.base_packages,
+        )
+        if install_success:
+            venv.mark_ready()
+        return install_success
+
     def can_handle(self, source_path: Path, context: "BuildContext") -> bool:
         """Determine if current grabber can handle a project."""
         return is_sphinx_project(str(source_path))
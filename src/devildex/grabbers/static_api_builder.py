@@ -0,0 +1,82 @@
+"""Static API Builder module."""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from devildex.docstrings.static_api import (
+    INIT_FILENAME,
+    copy_theme_static_files,
+    generate_api_docs,
+)
+from devildex.grabbers.abstract_grabber import AbstractGrabber
+from devildex.utils.core_budget import get_core_budget
+
+if TYPE_CHECKING:
+    from devildex.orchestrator.context import BuildContext
+
+logger = logging.getLogger(__name__)
+
+
+class StaticApiBuilder(AbstractGrabber):
+    """A grabber that documents a package from its sources alone.
+
+    Unlike pdoc3 it needs no virtual environment, installs nothing and
+    imports nothing, so it is the fast path for docstrings-only projects.
+    """
+
+    BUILDER_NAME = "static"
+
+    def __init__(self, template_dir: Optional[Path] = None) -> None:
+        """Initialize the StaticApiBuilder."""
+        self.template_dir = template_dir
+
+    @staticmethod
+    def _package_root(source_path: Path, context: "BuildContext") -> Optional[Path]:
+        """Return the package directory to document."""
+        if (source_path / INIT_FILENAME).is_file():
+            return source_path
+        package_root = context.resolve_package_source_path(context.project_name)
+        if package_root and (package_root / INIT_FILENAME).is_file():
+            return package_root
+        return None
+
+    def can_handle(self, source_path: Path, context: "BuildContext") -> bool:
+        """Determine if this grabber can handle the given project."""
+        if not source_path.is_dir():
+            return False
+        return self._package_root(source_path, context) is not None
+
+    def generate_docset(
+        self, source_path: Path, output_path: Path, context: "BuildContext"
+    ) -> bool:
+        """Generate API documentation by parsing the package sources."""
+        if not source_path.is_dir():
+            logger.error("StaticApiBuilder: %s is not a directory.", source_path)
+            return False
+        package_root = self._package_root(source_path, context)
+        if package_root is None:
+            logger.error(
+                "StaticApiBuilder: no Python package found in %s.", source_path
+            )
+            return False
+        logger.info("Generating static API documentation for %s", package_root)
+        try:
+            output_path.mkdir(parents=True, exist_ok=True)
+            with get_core_budget().reserve() as cores:
+                pages = generate_api_docs(
+                    package_root, output_path, self.template_dir, workers=cores
+                )
+            if not pages:
+                logger.error(
+                    "StaticApiBuilder: no pages generated for %s.", package_root
+                )
+                return False
+            copy_theme_static_files(self.template_dir, output_path / package_root.name)
+        except OSError:
+            logger.exception("Error during static API documentation generation")
+            return False
+        logger.info(
+            "Static API documentation successfully generated in %s", output_path
+        )
+        return True
@@ -3,6 +3,7 @@
 import logging
 import os
 import time
+import zipfile
 from pathlib import Path
 from typing import Any, Optional
 
@@ -27,6 +28,12 @@ from devildex.ui import (
     DocumentViewPanel,
     SettingsPanel,
 )
+from devildex.ui.document_view_panel import archive_page_url
+from devildex.utils.docset_archive import (
+    archive_path_for,
+    is_docset_archive,
+    open_archive,
+)
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -211,6 +218,9 @@ class DevilDexApp(wx.App):
             if potential_docset_path.exists() and potential_docset_path.is_dir():
                 found_specific_docset_subdir = potential_docset_path
                 return found_specific_docset_subdir
+            archive_path = archive_path_for(potential_docset_path)
+            if is_docset_archive(archive_path):
+                return archive_path
         return None
 
     @staticmethod
@@ -729,6 +739,10 @@ class DevilDexApp(wx.App):
             return
 
         docset_path = Path(docset_path_str)
+        if is_docset_archive(docset_path):
+            self._open_archived_docset(docset_path, package_name_for_display)
+            event.Skip()
+            return
         index_file_path = docset_path / "index.html"
 
         if not index_file_path.exists() or not index_file_path.is_file():
@@ -756,7 +770,10 @@ class DevilDexApp(wx.App):
 
         self.show_document(package_data_to_show=package_data_for_view)
         if self.document_view_panel:
-            local_url = index_file_path.as_uri()
+            local_url = (
+                self._docset_page_url(docset_path, index_file_path.name)
+                or index_file_path.as_uri()
+            )
             self.document_view_panel.load_url(local_url)
         else:
             wx.MessageBox(
@@ -767,6 +784,41 @@ class DevilDexApp(wx.App):
 
         event.Skip()
 
+    def _docset_page_url(self, docset_path: Path, page: str) -> Optional[str]:
+        """Return the local docset server URL of a page, if it is being served."""
+        if not self.core:
+            return None
+        return self.core.get_docset_url(docset_path, page)
+
+    def _open_archived_docset(self, archive_path: Path, package_name: str) -> None:
+        """Show the entry page of a packed docset straight from its archive."""
+        try:
+            entry_page = open_archive(archive_path).entry_page()
+        except (OSError, zipfile.BadZipFile):
+            logger.exception(f"GUI: Could not open docset archive {archive_path}")
+            entry_page = None
+        if not entry_page:
+            wx.MessageBox(
+                "Could not find 'index.html' or any other HTML "
+                f"file in the docset archive for '{package_name}'.\n"
+                f"Path checked: {archive_path}",
+                "Docset Entry Point Error",
+                wx.OK | wx.ICON_ERROR,
+            )
+            return
+        self.show_document(package_data_to_show={"name": package_name})
+        if self.document_view_panel:
+            self.document_view_panel.load_url(
+                self._docset_page_url(archive_path, entry_page)
+                or archive_page_url(archive_path, entry_page)
+            )
+        else:
+            wx.MessageBox(
+                "WebView component is not available. Cannot open docset.",
+                "Internal Error",
+                wx.OK | wx.ICON_ERROR,
+            )
+
     def on_generate_docset(self, event: wx.CommandEvent | None) -> None:
         """Handle generate docset action."""
         if self.selected_row_index is None:
@@ -939,6 +991,7 @@ class DevilDexApp(wx.App):
             self.core = DevilDexCore(
                 gui_warning_callback=self._display_mcp_warning_in_gui
             )
+            self.core.start_docset_server_if_enabled()
             self._initialize_data_and_managers()
         self.show_main_view()
 
@@ -983,7 +1036,9 @@ class DevilDexApp(wx.App):
                 )
                 return
 
-            success, message = self.core.delete_docset_build(docset_path_str)
+            success, message = self.core.delete_docset_files(
+                package_name, selected_package_data.get("version"), docset_path_str
+            )
 
             if success:
                 self._handle_delete_success(package_name)
@@ -1154,6 +1209,7 @@ def main() -> None:
             )
         else:
             core = DevilDexCore(docset_base_output_path=app_paths.docsets_base_dir)
+        core.start_docset_server_if_enabled()
         db_url_for_mcp = core.database_url
         if mcp_enabled:
             server_started = core.start_mcp_server_if_enabled(db_url_for_mcp)
@@ -1,22 +1,38 @@
 """mcp server module."""
 
+import asyncio
+import functools
 import logging
 import os
 import pathlib
-from typing import Any
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ParamSpec, TypeVar
 
 from fastmcp import FastMCP
 from markdownify import markdownify
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from devildex.config_manager import ConfigManager
 from devildex.core import DevilDexCore
 from devildex.database import db_manager as database
+from devildex.utils.docset_archive import (
+    is_docset_archive,
+    normalize_member,
+    open_archive,
+)
+from devildex.utils.staging import swap_in_progress
 
 mcp = FastMCP("Demo 🚀")
+server_logger = logging.getLogger(__name__)
 
 _core_instance: DevilDexCore | None = None
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
 
 def set_core_instance(core_instance: DevilDexCore) -> None:
     """Set the global core instance."""
@@ -24,6 +40,27 @@ def set_core_instance(core_instance: DevilDexCore) -> None:
     _core_instance = core_instance
 
 
+@functools.cache
+def _blocking_executor() -> ThreadPoolExecutor:
+    """Return the thread pool the tools run their blocking calls in.
+
+    Database sessions and docset reads are synchronous, so running them on
+    the event loop would stall every connected client. The pool's size
+    bounds how many run at once; further calls wait for a free thread.
+    """
+    return ThreadPoolExecutor(
+        max_workers=ConfigManager().get_mcp_db_workers(),
+        thread_name_prefix="devildex-mcp",
+    )
+
+
+async def _run_blocking(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run func in the blocking pool without holding up the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _blocking_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
 @mcp.tool
 async def get_docsets_list(
     project: str | None = None, all_projects: bool = False
@@ -36,12 +73,14 @@ async def get_docsets_list(
         return {"error": "invalid parameters: project or all_projects must be provided"}
 
     if project:
-        docsets = _core_instance.get_docsets_info_for_project(project_name=project)
+        docsets = await _run_blocking(
+            _core_instance.get_docsets_info_for_project, project_name=project
+        )
         server_logger.info(f"MCP Server: Docsets for project '{project}': {docsets}")
         return [d["name"] for d in docsets]
 
     if all_projects:
-        docsets = _core_instance.get_all_docsets_info()
+        docsets = await _run_blocking(_core_instance.get_all_docsets_info)
         server_logger.info(f"MCP Server: All docsets: {docsets}")
         return [d["name"] for d in docsets]
 
@@ -75,6 +114,16 @@ def _get_docset_root_path(
     server_logger.info(
         f"MCP Server: Attempting to access docset path: {docset_path_obj}"
     )
+    if (
+        docset_path_obj is None
+        and version
+        and _core_instance.docset_base_output_path
+        and swap_in_progress(_core_instance.docset_base_output_path / package / version)
+    ):
+        return None, (
+            f"Docset for package '{package}' version '{version}' is being updated."
+            " Try again shortly."
+        )
     if docset_path_obj is None:
         return None, f"Docset for package '{package}' version '{version}' not found."
     server_logger.info(
@@ -108,17 +157,42 @@ def _validate_page_path(
     return full_requested_page_path, None
 
 
+def _convert_page_content(content: str, page: str) -> tuple[str, None]:
+    """Convert HTML pages to Markdown and return other text as is."""
+    if page.lower().endswith((".html", ".htm")):
+        return _html_to_markdown(content), None
+    return content, None
+
+
+def _read_archive_page(
+    archive_path: pathlib.Path, page: str, package: str, version: str | None
+) -> tuple[str | None, str | None]:
+    """Read a page straight from a packed docset without extracting it."""
+    if normalize_member(page) is None:
+        return None, f"Invalid page path: path traversal attempt detected for '{page}'."
+    try:
+        archive = open_archive(archive_path)
+        if not archive.has_page(page):
+            return None, (
+                f"Page '{page}' not found in docset '{package}' version '{version}'."
+            )
+        return _convert_page_content(archive.read(page).decode("utf-8"), page)
+    except UnicodeDecodeError:
+        return None, (
+            f"Failed to decode content of page '{page}'. "
+            "It might not be a text file."
+        )
+    except (OSError, zipfile.BadZipFile) as e:
+        return None, f"File system error reading page '{page}': {e!s}"
+
+
 def _read_and_convert_content(
     file_path_obj: pathlib.Path, page: str
 ) -> tuple[str | None, str | None]:
     """Read file content and convert to Markdown if applicable."""
     try:
         with open(file_path_obj, encoding="utf-8") as content_file:
-            content = content_file.read()
-            if page.lower().endswith((".html", ".htm")):
-                return _html_to_markdown(content), None
-            else:
-                return content, None
+            return _convert_page_content(content_file.read(), page)
     except UnicodeDecodeError:
         return None, (
             f"Failed to decode content of page '{page}'. "
@@ -136,6 +210,33 @@ def _read_and_convert_content(
         )
 
 
+def _read_page(package: str, page: str, version: str | None) -> str | dict[str, str]:
+    """Read a docset page for get_page_content."""
+    docset_root_path_obj, error_message = _get_docset_root_path(package, version)
+    if error_message:
+        return {"error": error_message}
+
+    if is_docset_archive(docset_root_path_obj):
+        content, error_message = _read_archive_page(
+            docset_root_path_obj, page, package, version
+        )
+        return {"error": error_message} if error_message else content
+
+    full_requested_page_path_obj, error_message = _validate_page_path(
+        docset_root_path_obj, page, package, version
+    )
+    if error_message:
+        return {"error": error_message}
+
+    content, error_message = _read_and_convert_content(
+        full_requested_page_path_obj, page
+    )
+    if error_message:
+        return {"error": error_message}
+
+    return content
+
+
 @mcp.tool
 async def get_page_content(
     package: str, page: str = "index.html", version: str | None = None
@@ -162,31 +263,53 @@ async def get_page_content(
             error message if the page or docset could not be found or accessed.
 
     """
-    docset_root_path_obj, error_message = _get_docset_root_path(package, version)
-    if error_message:
-        return {"error": error_message}
+    return await _run_blocking(_read_page, package, page, version)
 
-    full_requested_page_path_obj, error_message = _validate_page_path(
-        docset_root_path_obj, page, package, version
-    )
-    if error_message:
-        return {"error": error_message}
 
-    content, error_message = _read_and_convert_content(
-        full_requested_page_path_obj, page
+@mcp.tool
+async def get_page_url(
+    package: str, page: str = "index.html", version: str | None = None
+) -> dict[str, str]:
+    """Get the local HTTP URL of a page within a docset.
+
+    The URL points at the DevilDex docset server, which answers with
+    caching validators, byte ranges and precompressed content.
+
+    Args:
+        package (str): The name of the package (e.g., "black").
+        page (str, optional): The page within the docset. Defaults to
+            "index.html".
+        version (str | None, optional): The version of the package's docset.
+            If not provided, the version is detected as in get_page_content.
+
+    Returns:
+        dict[str, str]: A dictionary with the "url" of the page, or an
+            "error" key with a descriptive message.
+
+    """
+    docset_root_path_obj, error_message = await _run_blocking(
+        _get_docset_root_path, package, version
     )
     if error_message:
         return {"error": error_message}
-
-    return content
+    if normalize_member(page) is None:
+        return {
+            "error": f"Invalid page path: path traversal attempt detected for '{page}'."
+        }
+    url = _core_instance.get_docset_url(docset_root_path_obj, page)
+    if not url:
+        return {"error": "The docset server is not running."}
+    return {"url": url}
 
 
 @mcp.tool
 async def delete_docset(package: str, version: str | None = None) -> dict[str, str]:
     """Delete a docset."""
-    n_found = len(_core_instance.search_for_docset(package, version))
+    n_found = len(
+        await _run_blocking(_core_instance.search_for_docset, package, version)
+    )
     if n_found == 1:
-        deleted = _core_instance.delete_docset(package, version)
+        deleted = await _run_blocking(_core_instance.delete_docset, package, version)
         if deleted:
             return {"info": f"Docset '{package}' deleted successfully."}
         else:
@@ -229,7 +352,9 @@ async def generate_docset(
         "version": version,
         "project_urls": project_urls or {},
     }
-    task_id = _core_instance.generate_docset(package_data=package_data, force=force)
+    task_id = await _run_blocking(
+        _core_instance.generate_docset, package_data=package_data, force=force
+    )
 
     return {
         "task_id": task_id,
@@ -238,6 +363,42 @@ async def generate_docset(
     }
 
 
+@mcp.tool
+async def generate_docsets(
+    packages: list[dict], force: bool = False
+) -> dict[str, list[str] | str]:
+    """Initiate docset generation for several packages and return their task IDs.
+
+    Each package is a dict with "package", "version" and optionally
+    "project_urls". Fetching, environment setup and builds of different
+    packages overlap.
+    """
+    if not _core_instance:
+        return {"error": "DevilDexCore not initialized in MCP server."}
+    if not packages or any(
+        not item.get("package") or not item.get("version") for item in packages
+    ):
+        return {"error": "invalid parameters: package and version must be provided"}
+
+    task_ids = await _run_blocking(
+        _core_instance.generate_docsets,
+        [
+            {
+                "name": item["package"],
+                "version": item["version"],
+                "project_urls": item.get("project_urls") or {},
+            }
+            for item in packages
+        ],
+        force=force,
+    )
+    return {
+        "task_ids": task_ids,
+        "status": "PENDING",
+        "message": "Docset generation initiated.",
+    }
+
+
 @mcp.custom_route("/mcp/health", methods=["GET"])
 async def health_check(request: Request) -> JSONResponse:
     """Health check endpoint."""
@@ -246,7 +407,6 @@ async def health_check(request: Request) -> JSONResponse:
 
 if __name__ == "__main__":
 
-    server_logger = logging.getLogger(__name__)
     server_logger.info("MCP server standalone mode started.")
     server_logger.info(f"Current Working Directory (subprocess): {os.getcwd()}")
 
@@ -276,6 +436,7 @@ if __name__ == "__main__":
     server_logger.info("Database initialized for standalone server.")
 
     set_core_instance(standalone_core)
+    standalone_core.start_docset_server_if_enabled()
 
     server_logger.info(f"Starting Uvicorn server on port {mcp_port}...")
 
@@ -0,0 +1,152 @@
+"""builder registry module."""
+
+import functools
+import importlib
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from devildex.grabbers.abstract_grabber import AbstractGrabber
+    from devildex.orchestrator.context import BuildContext
+
+logger = logging.getLogger(__name__)
+
+BUILDER_ENTRY_POINT_GROUP = "devildex.builders"
+PLUGIN_BUILDER_PRIORITY = 100
+
+
+@dataclass(frozen=True)
+class BuilderSpec:
+    """Where the builder of one doc type lives, without importing it."""
+
+    doc_type: str
+    target: str
+    priority: int = PLUGIN_BUILDER_PRIORITY
+
+    def load(self) -> type["AbstractGrabber"]:
+        """Import the builder class named by target ("module:Class")."""
+        module_name, _, class_name = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+BUILTIN_BUILDERS = (
+    BuilderSpec("sphinx", "devildex.grabbers.sphinx_builder:SphinxBuilder", 10),
+    BuilderSpec("mkdocs", "devildex.grabbers.mkdocs_builder:MkDocsBuilder", 20),
+    BuilderSpec(
+        "docstrings", "devildex.grabbers.docstrings_builder:DocstringsBuilder", 30
+    ),
+)
+
+
+@functools.cache
+def discover_builder_specs() -> tuple[BuilderSpec, ...]:
+    """Return the built-in builders and those of installed plugins, in order.
+
+    Plugins register a builder class under the ``devildex.builders`` entry
+    point group, named after the doc type it handles. A plugin using the
+    name of a built-in doc type replaces that builder. Entry points are
+    read once per process and nothing is imported here.
+    """
+    specs = {spec.doc_type: spec for spec in BUILTIN_BUILDERS}
+    for entry_point in entry_points(group=BUILDER_ENTRY_POINT_GROUP):
+        builtin = specs.get(entry_point.name)
+        specs[entry_point.name] = BuilderSpec(
+            entry_point.name,
+            entry_point.value,
+            builtin.priority if builtin else PLUGIN_BUILDER_PRIORITY,
+        )
+        logger.info(
+            f"Registered builder plugin '{entry_point.name}': {entry_point.value}"
+        )
+    return tuple(sorted(specs.values(), key=lambda spec: spec.priority))
+
+
+@dataclass(frozen=True)
+class Detection:
+    """The doc type detected for a project and what can_handle returned."""
+
+    doc_type: str
+    evidence: Any
+
+
+class BuilderRegistry:
+    """Pick and create the builder for a project on demand.
+
+    Builders are asked in priority order whether they can handle the
+    sources, and a builder is only imported and created when it is asked
+    or used. Answers are kept per source path, so repeated detection costs
+    nothing.
+    """
+
+    def __init__(self, specs: Optional[Iterable[BuilderSpec]] = None) -> None:
+        """Initialize the BuilderRegistry."""
+        self.specs = tuple(specs) if specs is not None else discover_builder_specs()
+        self._builders: dict[str, AbstractGrabber] = {}
+        self._answers: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def doc_types(self) -> list[str]:
+        """Return the registered doc types in detection order."""
+        return [spec.doc_type for spec in self.specs]
+
+    def builder(self, doc_type: str) -> Optional["AbstractGrabber"]:
+        """Return the builder for doc_type, creating it on first use."""
+        with self._lock:
+            if doc_type in self._builders:
+                return self._builders[doc_type]
+            spec = next((s for s in self.specs if s.doc_type == doc_type), None)
+            if spec is None:
+                return None
+            try:
+                builder = spec.load()()
+            except (ImportError, AttributeError, TypeError):
+                logger.exception(f"Could not load the builder for '{doc_type}'")
+                return None
+            self._builders[doc_type] = builder
+            return builder
+
+    def can_handle(
+        self, doc_type: str, source_path: Path, context: "BuildContext"
+    ) -> Any:  # noqa: ANN401
+        """Return what the builder's can_handle says, asking it only once."""
+        key = (doc_type, str(source_path))
+        if key not in self._answers:
+            builder = self.builder(doc_type)
+            self._answers[key] = (
+                builder.can_handle(source_path, context) if builder else False
+            )
+        return self._answers[key]
+
+    def detect(
+        self,
+        source_path: Path,
+        context: "BuildContext",
+        preferred: Optional[str] = None,
+    ) -> Optional[Detection]:
+        """Return the first doc type whose builder can handle the sources.
+
+        Args:
+            source_path: The project sources.
+            context: The build context handed to the builders.
+            preferred: A doc type known to work for the project, asked
+                before the others. When its builder handles the sources, no
+                other builder is consulted.
+
+        Returns:
+            The detected doc type, or None if no builder handles the sources.
+
+        """
+        doc_types = self.doc_types()
+        if preferred in doc_types:
+            doc_types.remove(preferred)
+            doc_types.insert(0, preferred)
+        for doc_type in doc_types:
+            evidence = self.can_handle(doc_type, source_path, context)
+            if evidence:
+                return Detection(doc_type, evidence)
+        return None
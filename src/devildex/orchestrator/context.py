@@ -2,11 +2,13 @@
 
 import logging
 import shutil
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from devildex.scanner.scanner import _find_python_package_root
+from devildex.utils.deps_utils import filter_requirements_lines
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,9 @@ class BuildContext:
     project_url: Optional[str] = None
     doc_type: Optional[str] = None
     download_format: Optional[str] = None
+    doc_requirements: Optional[list[str]] = None
+    resolved_requirements: Optional[list[str]] = None
+    env_key: Optional[str] = None
 
     temp_dir: Path = field(init=False)
     final_docs_dir: Path = field(init=False)
@@ -50,6 +55,35 @@ class BuildContext:
                 shutil.rmtree(dir_path)
             dir_path.mkdir(parents=True, exist_ok=True)
 
+    def select_requirements(
+        self,
+        base_packages: list[str],
+        find_requirements_file: Callable[[], Optional[Path]],
+    ) -> tuple[list[str], Optional[Path]]:
+        """Choose what a builder installs and record it in resolved_requirements.
+
+        Recorded doc_requirements are installed exactly, instead of the
+        builder's base packages and the requirements file found in the
+        sources, which is then not searched for.
+
+        Returns:
+            The packages to install and the requirements file to install, if
+            any.
+
+        """
+        if self.doc_requirements is not None:
+            self.resolved_requirements = list(self.doc_requirements)
+            return list(self.doc_requirements), None
+        requirements_file = find_requirements_file()
+        file_lines = []
+        if requirements_file and requirements_file.is_file():
+            file_lines = filter_requirements_lines(str(requirements_file)) or []
+        self.resolved_requirements = [
+            *base_packages,
+            *(line.strip() for line in file_lines if line.strip() not in base_packages),
+        ]
+        return base_packages, requirements_file
+
     def resolve_package_source_path(self, project_name: str) -> Optional[Path]:
         """Resolve the actual path to the main Python pkg/mod within the source_root.
 
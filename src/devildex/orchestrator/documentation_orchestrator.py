@@ -1,27 +1,56 @@
 """documentation orchestrator module."""
 
+import hashlib
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from devildex.database.models import PackageDetails
+from devildex.config_manager import ConfigManager
+from devildex.database.models import DocRecipe, PackageDetails, StageCheckpoint
 from devildex.fetcher import PackageSourceFetcher
-from devildex.grabbers.mkdocs_builder import MkDocsBuilder
-from devildex.grabbers.pdoc3_builder import Pdoc3Builder
-from devildex.grabbers.pydoctor_builder import PydoctorBuilder
-from devildex.grabbers.sphinx_builder import SphinxBuilder
+from devildex.grabbers.readthedocs_downloader import (
+    ReadTheDocsDownloader,
+    rtd_project_slug,
+)
 from devildex.info import PROJECT_ROOT
+from devildex.orchestrator.builder_registry import BuilderRegistry
 from devildex.orchestrator.context import BuildContext
-from devildex.scanner.scanner import (
-    _find_python_package_root,
-    has_docstrings,
-    is_mkdocs_project,
-    is_sphinx_project,
-)
+from devildex.scanner.scanner import cached_scans
+from devildex.theming.prebuilt import apply_prebuilt_theme
+from devildex.utils.venv_cache import BuildEnvCache
+
+PREBUILT_DOC_TYPE = "readthedocs"
+
+FETCH_STAGE = "fetch"
+ENV_STAGE = "env"
+BUILD_STAGE = "build"
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class StageFailure:
+    """The generation stage an orchestration failed in, and the kind of error."""
+
+    stage: str
+    error_class: str
+
+
+def source_digest(source_path: Path) -> str:
+    """Hash the list of files below source_path.
+
+    Only names are hashed, as builders patch files such as conf.py in place.
+    Sources that were removed or only partly extracted change the digest.
+    """
+    digest = hashlib.sha256()
+    for file_path in sorted(p for p in source_path.rglob("*") if p.is_file()):
+        digest.update(file_path.relative_to(source_path).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 class Orchestrator:
     """Implement orchestrator class which detects doc type and perform right action."""
 
@@ -29,20 +58,37 @@ class Orchestrator:
         self,
         package_details: PackageDetails,
         base_output_dir: Optional[Path | str] = None,
+        on_checkpoint: Optional[Callable[[StageCheckpoint], None]] = None,
+        prebuilt_docs: Optional[bool] = None,
     ) -> None:
-        """Implement class constructor."""
+        """Implement class constructor.
+
+        Args:
+            package_details: The package to document. Its checkpoint, if
+                any, lets the fetch and environment stages be skipped.
+            base_output_dir: Where docsets are written.
+            on_checkpoint: Called with a new checkpoint every time the
+                fetch or environment stage completes.
+            prebuilt_docs: Whether Read the Docs builds may be used instead
+                of building locally. None reads ``[build] prebuilt_docs``.
+
+        """
         self.package_details = package_details
+        self.checkpoint: Optional[StageCheckpoint] = package_details.checkpoint
+        self.on_checkpoint = on_checkpoint
         self.detected_doc_type = None
-        pdoc3_theme_path = (
-            PROJECT_ROOT / "src" / "devildex" / "theming" / "devildex_pdoc3_theme"
-        )
-        self.pdoc3_builder = Pdoc3Builder(template_dir=pdoc3_theme_path)
-        pydoctor_theme_path = (
-            PROJECT_ROOT / "src" / "devildex" / "theming" / "devildex_pydoctor_theme"
-        )
-        self.pydoctor_builder = PydoctorBuilder(template_dir=pydoctor_theme_path)
+        self.builder_registry = BuilderRegistry()
+        self._scan_cache: dict = {}
         self.last_operation_result = None
         self.sphinx_doc_path = None
+        self.prebuilt_docs = (
+            ConfigManager().get_prebuilt_docs()
+            if prebuilt_docs is None
+            else prebuilt_docs
+        )
+        self.prebuilt_docs_url: Optional[str] = None
+        self.resolved_recipe: Optional[DocRecipe] = None
+        self.failure: Optional[StageFailure] = None
         if base_output_dir:
             self.base_output_dir = Path(base_output_dir).resolve()
         else:
@@ -152,196 +198,262 @@ class Orchestrator:
             logger.debug("Orchestrator.fetch_repo returning False.")
             return False
 
-    @property
-    def _grabbers(self) -> dict:
-        """Property to dynamically build the grabbers' configuration."""
-        return {
-            "sphinx": {
-                "builder": SphinxBuilder(),
-                "context_args": {
-                    "project_name": self.package_details.name,
-                    "project_version": self.package_details.version,
-                    "base_output_dir": self.base_output_dir,
-                    "source_root": self._effective_source_path,
-                    "vcs_url": self.package_details.vcs_url,
-                    "project_slug": self.package_details.name,
-                    "version_identifier": self.package_details.version or "main",
-                    "project_root_for_install": self._effective_source_path,
-                    "project_url": self.package_details.vcs_url,
-                },
-            },
-            "mkdocs": {
-                "builder": MkDocsBuilder(),
-                "context_args": {
-                    "project_name": self.package_details.name,
-                    "project_version": self.package_details.version,
-                    "base_output_dir": self.base_output_dir,
-                    "source_root": self._effective_source_path,
-                    "project_slug": self.package_details.name,
-                    "version_identifier": self.package_details.version or "main",
-                    "project_root_for_install": self._effective_source_path,
-                },
-            },
-            "pydoctor": {
-                "builder": self.pydoctor_builder,
-                "context_args": {
-                    "project_name": self.package_details.name,
-                    "project_version": self.package_details.version,
-                    "base_output_dir": self.base_output_dir,
-                    "source_root": self._effective_source_path,
-                    "vcs_url": self.package_details.vcs_url,
-                    "project_slug": self.package_details.name,
-                    "version_identifier": self.package_details.version or "main",
-                    "project_root_for_install": self._effective_source_path,
-                    "project_url": self.package_details.vcs_url,
-                },
-            },
-            "pdoc3": {
-                "builder": self.pdoc3_builder,
-                "context_args": {
-                    "project_name": self.package_details.name,
-                    "project_version": self.package_details.version,
-                    "base_output_dir": self.base_output_dir,
-                    "source_root": self._effective_source_path,
-                    "vcs_url": self.package_details.vcs_url,
-                    "project_slug": self.package_details.name,
-                    "version_identifier": self.package_details.version or "main",
-                    "project_root_for_install": self._effective_source_path,
-                    "project_url": self.package_details.vcs_url,
-                },
-            },
-            "docstrings": {
-                "function": self._generate_docstrings_with_fallback,
-                "args": {
-                    "context": BuildContext(
-                        project_name=self.package_details.name,
-                        project_version=self.package_details.version,
-                        base_output_dir=self.base_output_dir,
-                        source_root=Path(self._get_docstrings_input_folder()),
-                        vcs_url=self.package_details.vcs_url,
-                    )
-                },
-            },
-        }
+    def _build_context(self) -> BuildContext:
+        """Create the build context shared by all builders.
 
-    def grab_build_doc(self) -> str | bool:
-        """Grab and build documentation."""
-        if self.detected_doc_type and self.detected_doc_type != "unknown":
-            grabber_config = self._grabbers.get(self.detected_doc_type)
-            if grabber_config:
-                try:
-                    if "builder" in grabber_config:
-                        builder = grabber_config["builder"]
-                        context_args = grabber_config["context_args"]
-                        build_context = BuildContext(**context_args)
-                        source_path = self._effective_source_path
-                        if self.detected_doc_type == "sphinx":
-                            source_path = Path(self.sphinx_doc_path)
-                        res = builder.generate_docset(
-                            source_path=source_path,
-                            output_path=self.base_output_dir,
-                            context=build_context,
-                        )
-                    else:
-                        method = grabber_config["function"]
-                        args = grabber_config["args"]
-                        res = method(**args)
-
-                    logger.info(f" DETECTED DOC TYPE: {self.detected_doc_type}")
-                    logger.info(f" RESULT FROM GRABBER: {res}")
-                    self.last_operation_result = res
-                except Exception:
-                    logger.exception(
-                        "Orchestrator: Exception during grab_build_doc for"
-                        f" {self.detected_doc_type}"
-                    )
-                    self.last_operation_result = False
-                else:
-                    return res
-            else:
-                self.last_operation_result = False
-                logger.error(
-                    f"Orchestrator: No grabber configuration found for type:"
-                    f" {self.detected_doc_type}"
-                )
-        elif not self.detected_doc_type:
-            self.last_operation_result = False
-            logger.error("no scan result, please call start_scan first")
-        else:
-            self.last_operation_result = False
-            logger.error("scan cannot detect any doc, unable to grab")
-        return self.last_operation_result
+        The requirements of the package's doc recipe are only handed to the
+        builder the recipe was recorded for.
+        """
+        recipe = self.package_details.doc_recipe
+        return BuildContext(
+            project_name=self.package_details.name,
+            project_version=self.package_details.version,
+            base_output_dir=self.base_output_dir,
+            source_root=self._effective_source_path,
+            vcs_url=self.package_details.vcs_url,
+            project_slug=self.package_details.name,
+            version_identifier=self.package_details.version or "main",
+            project_root_for_install=self._effective_source_path,
+            project_url=self.package_details.vcs_url,
+            doc_requirements=(
+                list(recipe.requirements)
+                if recipe and recipe.builder_type == self.detected_doc_type
+                else None
+            ),
+        )
 
-    def _get_docstrings_input_folder(self) -> str:
-        """Determine the correct input folder for docstrings generation.
+    def _documentation_urls(self) -> list[str]:
+        """Return the package's URLs, documentation links first."""
+        project_urls = self.package_details.project_urls or {}
+        docs_urls = [
+            url for label, url in project_urls.items() if "doc" in label.lower()
+        ]
+        other_urls = [url for url in project_urls.values() if url not in docs_urls]
+        return [*docs_urls, self.package_details.rtd_url or "", *other_urls]
 
-        It tries to find the Python package root within the effective source path.
+    def _find_prebuilt_docs(self) -> bool:
+        """Look for a Read the Docs htmlzip built for this exact version.
+
+        Packages whose sources were given locally are always built from them.
         """
-        if not self._effective_source_path:
-            logger.error(
-                "Orchestrator: _effective_source_path is not set, "
-                "cannot determine docstrings input folder."
+        details = self.package_details
+        if not self.prebuilt_docs or details.initial_source_path or not details.version:
+            return False
+        project_slug = rtd_project_slug(self._documentation_urls())
+        if not project_slug:
+            return False
+        self.prebuilt_docs_url = ReadTheDocsDownloader().find_prebuilt_download(
+            project_slug, details.version
+        )
+        return self.prebuilt_docs_url is not None
+
+    def _grab_prebuilt_docs(self) -> str | bool:
+        """Download the prebuilt docs and apply the DevilDex theme to them."""
+        target_dir = self._build_context().final_docs_dir
+        if not ReadTheDocsDownloader().fetch_prebuilt_docset(
+            self.prebuilt_docs_url, target_dir
+        ):
+            return False
+        try:
+            apply_prebuilt_theme(target_dir)
+        except OSError:
+            logger.exception(
+                f"Orchestrator: Could not theme the prebuilt docs in {target_dir}"
             )
-            return ""
+        return str(target_dir)
+
+    def _builder_source_path(self) -> Optional[Path]:
+        """Return the directory the detected builder works on."""
+        if self.detected_doc_type == "sphinx":
+            return Path(self.sphinx_doc_path)
+        return self._effective_source_path
 
-        python_package_root = _find_python_package_root(self._effective_source_path)
+    def prepare_environment(self) -> bool:
+        """Install the detected builder's environment ahead of grab_build_doc.
 
-        if python_package_root:
+        Returns:
+            False if the environment could not be installed, True otherwise,
+            including when the builder needs no environment.
+
+        """
+        if self.detected_doc_type in (None, "unknown", PREBUILT_DOC_TYPE):
+            return True
+        builder = self.builder_registry.builder(self.detected_doc_type)
+        if not builder:
+            return True
+        if self._environment_checkpointed():
             logger.info(
-                "Orchestrator: Found Python package root for docstrings: "
-                f"{python_package_root}"
+                "Orchestrator: Resuming after the environment stage for"
+                f" {self.package_details.name}"
             )
-            return str(python_package_root)
+            return True
+        context = self._build_context()
+        try:
+            with cached_scans(self._scan_cache):
+                prepared = builder.prepare_environment(
+                    self._builder_source_path(), context
+                )
+        except Exception as e:
+            logger.exception(
+                "Orchestrator: Exception while preparing the environment for"
+                f" {self.detected_doc_type}"
+            )
+            self.failure = StageFailure(ENV_STAGE, type(e).__name__)
+            prepared = False
+        if not prepared:
+            self.failure = self.failure or StageFailure(
+                ENV_STAGE, "EnvironmentInstallFailed"
+            )
+            self.last_operation_result = False
         else:
-            logger.warning(
-                "Orchestrator: Could not find a specific Python package root. "
-                "Falling back to effective source path for docstrings: "
-                f"{self._effective_source_path}"
+            self._save_checkpoint(ENV_STAGE, context.env_key)
+        return prepared
+
+    def _save_checkpoint(self, stage: str, env_key: Optional[str] = None) -> None:
+        """Record that stage completed, with what the stages so far found.
+
+        Packages whose sources were given locally have nothing to resume.
+        """
+        if self.package_details.initial_source_path:
+            return
+        self.checkpoint = StageCheckpoint(
+            stage=stage,
+            source_path=str(self._effective_source_path),
+            source_digest=source_digest(self._effective_source_path),
+            doc_type=self.detected_doc_type,
+            sphinx_doc_path=(
+                str(self.sphinx_doc_path) if self.sphinx_doc_path else None
+            ),
+            env_key=env_key,
+        )
+        if self.on_checkpoint:
+            self.on_checkpoint(self.checkpoint)
+
+    def _resume_from_checkpoint(self) -> bool:
+        """Take the sources and the scan result from the checkpoint.
+
+        The checkpoint is dropped when its sources are gone or changed.
+
+        Returns:
+            True if the fetch stage can be skipped.
+
+        """
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return False
+        source_path = Path(checkpoint.source_path)
+        if (
+            not source_path.is_dir()
+            or source_digest(source_path) != checkpoint.source_digest
+        ):
+            logger.info(
+                "Orchestrator: Sources of the checkpoint for"
+                f" {self.package_details.name} changed. Starting over."
             )
-            return str(self._effective_source_path)
-
-    def _generate_docstrings_with_fallback(self, context: BuildContext) -> str | bool:
-        logger.info("Orchestrator: Attempting pdoc3 generation...")
-        pdoc3_result = self.pdoc3_builder.generate_docset(
-            source_path=Path(self._get_docstrings_input_folder()),
-            output_path=self.base_output_dir,
-            context=context,
+            self.checkpoint = None
+            return False
+        self._effective_source_path = source_path
+        self.detected_doc_type = checkpoint.doc_type
+        self.sphinx_doc_path = (
+            Path(checkpoint.sphinx_doc_path) if checkpoint.sphinx_doc_path else None
+        )
+        logger.info(
+            f"Orchestrator: Resuming {self.package_details.name} after the"
+            f" {checkpoint.stage} stage. Sources at {source_path}"
         )
+        return True
 
-        if pdoc3_result:
-            logger.info("Orchestrator: pdoc3 generation successful.")
-            return str(self.base_output_dir / context.project_name)
-        else:
+    def _environment_checkpointed(self) -> bool:
+        """Check whether the checkpointed build environment is still installed."""
+        checkpoint = self.checkpoint
+        if checkpoint is None or checkpoint.stage != ENV_STAGE:
+            return False
+        return checkpoint.env_key is None or BuildEnvCache().is_ready(
+            checkpoint.env_key
+        )
+
+    def grab_build_doc(self) -> str | bool:
+        """Grab and build documentation."""
+        if not self.detected_doc_type:
+            self.last_operation_result = False
+            logger.error("no scan result, please call start_scan first")
+            return self.last_operation_result
+        if self.detected_doc_type == "unknown":
+            self.last_operation_result = False
+            logger.error("scan cannot detect any doc, unable to grab")
+            return self.last_operation_result
+        if self.detected_doc_type == PREBUILT_DOC_TYPE:
+            self.last_operation_result = self._grab_prebuilt_docs()
+            if self.last_operation_result:
+                return self.last_operation_result
             logger.warning(
-                "Orchestrator: pdoc3 generation failed. "
-                "Attempting Pydoctor generation..."
+                "Orchestrator: Prebuilt docs unavailable, building from sources."
             )
-            # For pydoctor, we need to pass source_path and output_path explicitly
-            source_path_for_pydoctor = Path(self._get_docstrings_input_folder())
-            output_path_for_pydoctor = self.base_output_dir
-            pydoctor_result = self.pydoctor_builder.generate_docset(
-                source_path=source_path_for_pydoctor,
-                output_path=output_path_for_pydoctor,
-                context=context,
+            self.start_scan(allow_prebuilt=False)
+            return self.grab_build_doc()
+        builder = self.builder_registry.builder(self.detected_doc_type)
+        if not builder:
+            self.last_operation_result = False
+            self.failure = StageFailure(BUILD_STAGE, "BuilderUnavailable")
+            logger.error(
+                f"Orchestrator: No builder registered for type:"
+                f" {self.detected_doc_type}"
             )
-            if pydoctor_result:
-                logger.info("Orchestrator: Pydoctor generation successful.")
-                return str(self.base_output_dir / context.project_name)
-            else:
-                logger.error("Orchestrator: Pydoctor generation also failed.")
-                return False
+            return self.last_operation_result
+        self.resolved_recipe = None
+        context = self._build_context()
+        try:
+            with cached_scans(self._scan_cache):
+                res = builder.generate_docset(
+                    source_path=self._builder_source_path(),
+                    output_path=self.base_output_dir,
+                    context=context,
+                )
+            logger.info(f" DETECTED DOC TYPE: {self.detected_doc_type}")
+            logger.info(f" RESULT FROM GRABBER: {res}")
+            self.last_operation_result = res
+            if res and context.resolved_requirements is not None:
+                self.resolved_recipe = DocRecipe(
+                    self.detected_doc_type, context.resolved_requirements
+                )
+            if not res:
+                self.failure = StageFailure(BUILD_STAGE, "BuildFailed")
+        except Exception as e:
+            logger.exception(
+                "Orchestrator: Exception during grab_build_doc for"
+                f" {self.detected_doc_type}"
+            )
+            self.failure = StageFailure(BUILD_STAGE, type(e).__name__)
+            self.last_operation_result = False
+        return self.last_operation_result
 
-    def start_scan(self) -> None:
-        """Start the scanning process."""
+    def start_scan(self, allow_prebuilt: bool = True) -> None:
+        """Start the scanning process.
+
+        Args:
+            allow_prebuilt: Whether docs already built on Read the Docs for
+                this version are used instead of building from sources.
+
+        """
         logger.debug(f"Orchestrator.start_scan called for {self.package_details.name}")
-        """Start the scanning process."""
         self.detected_doc_type = "unknown"
+        self.failure = None
+        if self._resume_from_checkpoint():
+            return
+        if allow_prebuilt and self._find_prebuilt_docs():
+            self.detected_doc_type = PREBUILT_DOC_TYPE
+            logger.info(
+                f"Orchestrator: Using prebuilt docs for {self.package_details.name}"
+                f" from {self.prebuilt_docs_url}"
+            )
+            return
         if not self.fetch_repo():
             logger.debug(
                 "Orchestrator: Failed to fetch or find repository sources."
                 " Scan cannot proceed."
             )
             self.detected_doc_type = "unknown"
+            self.failure = StageFailure(FETCH_STAGE, "SourcesUnavailable")
             logger.debug("Orchestrator.start_scan returning due to failed fetch_repo.")
             return
         if self._effective_source_path:
@@ -350,25 +462,30 @@ class Orchestrator:
                 "Orchestrator: Scanning effective source path: " f"{scan_path_str}"
             )
 
-            sphinx_path = is_sphinx_project(scan_path_str)
-            logger.debug(
-                f"is_sphinx_project('{scan_path_str}') returned: {sphinx_path}"
-            )
-            if sphinx_path:
-                self.detected_doc_type = "sphinx"
-                self.sphinx_doc_path = sphinx_path
-            elif is_mkdocs_project(scan_path_str):
-                self.detected_doc_type = "mkdocs"
-                logger.debug(f"is_mkdocs_project('{scan_path_str}') returned True.")
-            elif has_docstrings(scan_path_str):
-                self.detected_doc_type = "docstrings"
-                logger.debug(f"has_docstrings('{scan_path_str}') returned True.")
+            recipe = self.package_details.doc_recipe
+            with cached_scans(self._scan_cache):
+                detection = self.builder_registry.detect(
+                    self._effective_source_path,
+                    self._build_context(),
+                    preferred=recipe.builder_type if recipe else None,
+                )
+            if detection:
+                self.detected_doc_type = detection.doc_type
+                if detection.doc_type == "sphinx":
+                    self.sphinx_doc_path = detection.evidence
+                logger.debug(
+                    f"Builder for '{detection.doc_type}' can handle '{scan_path_str}'."
+                )
 
             if self.detected_doc_type == "unknown":
+                self.failure = StageFailure(FETCH_STAGE, "UnknownDocType")
                 logger.error(
                     f"Orchestrator: Scan of '{scan_path_str}' did not identify"
-                    " a specific doc type (Sphinx, Docstrings)."
+                    " a specific doc type "
+                    f"({', '.join(self.builder_registry.doc_types())})."
                 )
+            else:
+                self._save_checkpoint(FETCH_STAGE)
 
             logger.debug(
                 "Orchestrator: Scan complete. Detected doc type"
@@ -381,6 +498,7 @@ class Orchestrator:
                 "fetch_repo reported success. This should not happen."
             )
             self.detected_doc_type = "unknown"
+            self.failure = StageFailure(FETCH_STAGE, "SourcesUnavailable")
             logger.debug("Orchestrator.start_scan _effective_source_path is None.")
 
     def get_detected_doc_type(self) -> str:
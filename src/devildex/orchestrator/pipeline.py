@@ -0,0 +1,247 @@
+"""generation pipeline module."""
+
+import contextvars
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from devildex.config_manager import ConfigManager
+from devildex.orchestrator.documentation_orchestrator import (
+    BUILD_STAGE,
+    ENV_STAGE,
+    FETCH_STAGE,
+    Orchestrator,
+    StageFailure,
+)
+
+logger = logging.getLogger(__name__)
+
+GenerationResult = Union[str, bool]
+StageWork = Callable[[Orchestrator], Optional[GenerationResult]]
+
+_STOP = object()
+CLOSE_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass
+class PipelineJob:
+    """One orchestration travelling through the pipeline.
+
+    Every stage runs inside context, so context variables bound when the
+    job was created, such as the task's progress, follow it across worker
+    threads. A job with stop_after set leaves the pipeline with True once
+    that stage succeeds, without running the stages after it.
+    """
+
+    orchestrator: Orchestrator
+    on_done: Callable[[Orchestrator, GenerationResult], None]
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+    on_start: Optional[Callable[[], None]] = None
+    stop_after: Optional[str] = None
+
+
+def _fetch(orchestrator: Orchestrator) -> Optional[GenerationResult]:
+    """Fetch the sources and detect the doc type."""
+    orchestrator.start_scan()
+    if orchestrator.get_detected_doc_type() == "unknown":
+        return False
+    return None
+
+
+def _prepare_env(orchestrator: Orchestrator) -> Optional[GenerationResult]:
+    """Install the build environment."""
+    return None if orchestrator.prepare_environment() else False
+
+
+def _build(orchestrator: Orchestrator) -> GenerationResult:
+    """Build the docset."""
+    return orchestrator.grab_build_doc() or False
+
+
+class _Stage:
+    """A fixed pool of worker threads fed by a queue.
+
+    A job is handed to the next stage when the work returns None. Any other
+    value is the job's final result. The entry stage takes every submitted
+    job without blocking and reports when a job starts. Once closing is set
+    jobs are finished with False instead of being worked on or handed on.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        workers: int,
+        work: StageWork,
+        finish: Callable[[PipelineJob, GenerationResult], None],
+        closing: threading.Event,
+        next_stage: Optional["_Stage"] = None,
+        entry: bool = False,
+    ) -> None:
+        self.name = name
+        self.work = work
+        self.finish = finish
+        self.closing = closing
+        self.next_stage = next_stage
+        self.entry = entry
+        self.queue: queue.Queue = queue.Queue(maxsize=0 if entry else workers)
+        self.threads = [
+            threading.Thread(
+                target=self._run, name=f"devildex-{name}-{index}", daemon=True
+            )
+            for index in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def _run(self) -> None:
+        """Process jobs until told to stop."""
+        while True:
+            job = self.queue.get()
+            if job is _STOP:
+                return
+            if self.closing.is_set():
+                self.finish(job, False)
+                continue
+            try:
+                if self.entry and job.on_start:
+                    job.context.run(job.on_start)
+                result = job.context.run(self.work, job.orchestrator)
+            except Exception as e:
+                logger.exception(
+                    f"Pipeline: {self.name} stage failed for"
+                    f" {job.orchestrator.package_details.name}"
+                )
+                job.orchestrator.failure = StageFailure(self.name, type(e).__name__)
+                result = False
+            if result is None and job.stop_after == self.name:
+                result = True
+            if (
+                result is None
+                and self.next_stage is not None
+                and not self.closing.is_set()
+            ):
+                self.next_stage.queue.put(job)
+            else:
+                self.finish(job, False if result is None else result)
+
+    def drop_queued(self) -> None:
+        """Finish every job still waiting in the queue with False."""
+        while True:
+            try:
+                job = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not _STOP:
+                self.finish(job, False)
+
+    def stop(self, deadline: float) -> None:
+        """Tell the workers to stop and wait for them until deadline."""
+        try:
+            for _ in self.threads:
+                self.queue.put(_STOP, timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Full:
+            logger.warning(f"Pipeline: {self.name} workers are still busy.")
+            return
+        for thread in self.threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+
+class GenerationPipeline:
+    """Generate docsets with fetch, environment and build stages overlapping.
+
+    Each stage has its own bounded pool of workers, connected to the next by
+    a queue, so one package can download while another installs and a third
+    builds. A full queue holds back the stage feeding it. Closing the
+    pipeline cancels the jobs that have not started yet.
+    """
+
+    def __init__(
+        self,
+        fetch_workers: Optional[int] = None,
+        env_workers: Optional[int] = None,
+        build_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize the GenerationPipeline and start its workers."""
+        config = ConfigManager()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closing = threading.Event()
+        build = _Stage(
+            BUILD_STAGE,
+            build_workers or config.get_pipeline_workers(BUILD_STAGE),
+            _build,
+            self._finish,
+            self._closing,
+        )
+        env = _Stage(
+            ENV_STAGE,
+            env_workers or config.get_pipeline_workers(ENV_STAGE),
+            _prepare_env,
+            self._finish,
+            self._closing,
+            build,
+        )
+        fetch = _Stage(
+            FETCH_STAGE,
+            fetch_workers or config.get_pipeline_workers(FETCH_STAGE),
+            _fetch,
+            self._finish,
+            self._closing,
+            env,
+            entry=True,
+        )
+        self._stages = [fetch, env, build]
+
+    def submit(self, job: PipelineJob) -> None:
+        """Queue a job behind the others, or fail it if the pipeline is closed."""
+        with self._idle:
+            self._pending += 1
+        if self._closing.is_set():
+            self._finish(job, False)
+            return
+        self._stages[0].queue.put(job)
+
+    def _finish(self, job: PipelineJob, result: GenerationResult) -> None:
+        """Report a job's result and count it as done."""
+        try:
+            job.context.run(job.on_done, job.orchestrator, result)
+        except Exception:
+            logger.exception(
+                "Pipeline: completion callback failed for"
+                f" {job.orchestrator.package_details.name}"
+            )
+        finally:
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job is done.
+
+        Returns:
+            True if the pipeline is idle, False if the timeout expired.
+
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float = CLOSE_TIMEOUT_SECONDS) -> None:
+        """Cancel the queued jobs and stop the workers.
+
+        Jobs waiting in a queue are finished with False, so their callbacks
+        still run. Jobs already being worked on are not interrupted; the
+        workers are waited for at most timeout seconds and are left to end
+        on their own after that.
+        """
+        if self._closing.is_set():
+            return
+        self._closing.set()
+        for stage in self._stages:
+            stage.drop_queued()
+        deadline = time.monotonic() + timeout
+        for stage in self._stages:
+            stage.stop(deadline)
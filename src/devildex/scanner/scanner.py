@@ -1,12 +1,16 @@
 """scanner module."""
 
 import ast
+import contextvars
+import functools
 import logging
 import os
 import re
 import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from devildex.constants import CONF_FILENAME
 from devildex.scanner_utils.scanner_utils import (
@@ -20,7 +24,48 @@ logger = logging.getLogger(__name__)
 SCORE_MAX = 3
 MKDOCS_CONFIG_FILE = "mkdocs.yml"
 
+ScanFunction = TypeVar("ScanFunction", bound=Callable[..., Any])
 
+_scan_cache: contextvars.ContextVar[Optional[dict[tuple[str, str], Any]]] = (
+    contextvars.ContextVar("devildex_scan_cache", default=None)
+)
+
+
+@contextmanager
+def cached_scans(
+    cache: Optional[dict[tuple[str, str], Any]] = None,
+) -> Iterator[dict[tuple[str, str], Any]]:
+    """Reuse scan results within the current context.
+
+    While bound, each scan function runs once per path and later calls
+    return the stored result. Pass the same cache again to keep the
+    results across several phases of one build.
+    """
+    cache = {} if cache is None else cache
+    token = _scan_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _scan_cache.reset(token)
+
+
+def _cache_scan(function: ScanFunction) -> ScanFunction:
+    """Memoize a scan function by path while a scan cache is bound."""
+
+    @functools.wraps(function)
+    def wrapper(path: str | Path) -> Any:  # noqa: ANN401
+        cache = _scan_cache.get()
+        if cache is None:
+            return function(path)
+        key = (function.__name__, str(path))
+        if key not in cache:
+            cache[key] = function(path)
+        return cache[key]
+
+    return wrapper  # type: ignore[return-value]
+
+
+@_cache_scan
 def is_sphinx_project(project_path: str) -> Optional[Path]:
     """Scan project path to determine if it is a Sphinx project.
 
@@ -110,6 +155,7 @@ def is_sphinx_project(project_path: str) -> Optional[Path]:
     return None
 
 
+@_cache_scan
 def is_mkdocs_project(project_root_path: str | Path) -> bool:
     """Check if the given path is likely an MkDocs project by looking for mkdocs.yml."""
     root_path = Path(project_root_path)
@@ -244,6 +290,7 @@ def _check_file_for_docstrings(file_path: Path) -> bool:
     return False
 
 
+@_cache_scan
 def has_docstrings(project_path: str) -> bool:
     """Detect if a project has docstrings in its Python source files."""
     project_dir = Path(project_path)
@@ -257,6 +304,7 @@ def has_docstrings(project_path: str) -> bool:
     return False
 
 
+@_cache_scan
 def _find_python_package_root(scan_base_path: Path) -> Optional[Path]:
     """Attempt to find the root of the main Python package within a given base path.
 
@@ -47,6 +47,7 @@ class GenerationTaskManager:
         self.update_action_buttons_callback = update_action_buttons_callback
 
         self.active_tasks: dict[str, int] = {}
+        self.task_progress: dict[str, int] = {}
         self.animation_frames: list[str] = ["⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷"]
         self.current_animation_frame_idx: int = 0
         self.animation_timer: wx.Timer = wx.Timer(owner_for_timer)
@@ -128,8 +129,6 @@ class GenerationTaskManager:
             )
             return
 
-
-
         try:
             if not self.core:
                 error_message = "Error in thread: Core instance not available."
@@ -176,6 +175,9 @@ class GenerationTaskManager:
                     )
                     break
                 else:
+                    self._record_progress(
+                        package_id_for_completion, task_status_info.get("progress")
+                    )
                     logger_task_manager.debug(
                         f"Thread: Task {task_id} for {package_name_for_msg} "
                         f"is {current_status}. Polling again..."
@@ -206,6 +208,14 @@ class GenerationTaskManager:
                 row_index,
             )
 
+    def _record_progress(self, package_id: str, progress: Optional[dict]) -> None:
+        """Remember the latest percent-complete reported for a task."""
+        percent = (progress or {}).get("percent")
+        if percent is None:
+            self.task_progress.pop(package_id, None)
+        else:
+            self.task_progress[package_id] = percent
+
     def _handle_task_completion(
         self,
         success: bool,
@@ -225,6 +235,7 @@ class GenerationTaskManager:
             return
 
         original_row_idx_of_task = self.active_tasks.pop(package_id, -1)
+        self.task_progress.pop(package_id, None)
 
         if original_row_idx_of_task == -1:
             logger_task_manager.warning(
@@ -254,9 +265,15 @@ class GenerationTaskManager:
             docset_status_col_idx = self.owner_for_timer.docset_status_col_grid_idx
 
         if docset_status_col_idx != -1:
-            for _, row_idx in self.active_tasks.items():
+            for package_id, row_idx in self.active_tasks.items():
+                percent = self.task_progress.get(package_id)
+                cell_text = (
+                    current_frame_char
+                    if percent is None
+                    else f"{current_frame_char} {percent}%"
+                )
                 self.update_grid_cell_callback(
-                    row_idx, docset_status_col_idx, current_frame_char
+                    row_idx, docset_status_col_idx, cell_text
                 )
         if event:
             event.Skip()
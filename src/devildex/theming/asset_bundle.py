@@ -0,0 +1,140 @@
+"""shared theme asset bundle module."""
+
+import functools
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+from devildex.app_paths import AppPaths
+from devildex.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_LENGTH = 12
+BUNDLE_STAGING_SUFFIX = ".staging"
+PDOC3_THEME_ASSETS = "pdoc3"
+PYDOCTOR_THEME_ASSETS = "pydoctor"
+PREBUILT_THEME_ASSETS = "prebuilt"
+
+
+def default_assets_root() -> Path:
+    """Return the directory holding the published asset bundles."""
+    return AppPaths().theme_assets_dir
+
+
+@functools.cache
+def bundle_fingerprint(static_dir: Path) -> str:
+    """Return a digest of a theme's static tree, names and content included."""
+    digest = hashlib.sha256()
+    for path in sorted(p for p in static_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(static_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def publish_asset_bundle(
+    theme_name: str, static_dir: Path, assets_root: Optional[Path] = None
+) -> Path:
+    """Publish a theme's static files once, under a fingerprinted name.
+
+    The bundle of an unchanged theme is only written the first time. A new
+    release of the theme gets a new fingerprint, so docsets built against
+    the old one keep working.
+
+    Args:
+        theme_name: Short name of the theme, used as the bundle prefix.
+        static_dir: The theme's static directory.
+        assets_root: Where bundles are published. Defaults to the app's
+            theme assets directory.
+
+    Returns:
+        The directory of the published bundle.
+
+    """
+    assets_root = assets_root or default_assets_root()
+    bundle_dir = assets_root / f"{theme_name}-{bundle_fingerprint(static_dir)}"
+    if bundle_dir.is_dir():
+        return bundle_dir
+    staging_dir = bundle_dir.with_name(
+        f".{bundle_dir.name}.{os.getpid()}.{threading.get_ident()}"
+        f"{BUNDLE_STAGING_SUFFIX}"
+    )
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    shutil.copytree(static_dir, staging_dir)
+    try:
+        staging_dir.rename(bundle_dir)
+        logger.info("Published theme asset bundle %s", bundle_dir)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        if not bundle_dir.is_dir():
+            raise
+    return bundle_dir
+
+
+def _remove_path(path: Path) -> None:
+    """Remove a file, symlink or directory."""
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def link_asset_bundle(bundle_dir: Path, target: Path) -> bool:
+    """Make target a symlink to a published bundle.
+
+    The link is absolute because builders move their output after the
+    static files are in place. Where symlinks are not available the bundle
+    is copied instead.
+
+    Returns:
+        True if target was linked, False if it had to be copied.
+
+    """
+    _remove_path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        target.symlink_to(bundle_dir.resolve(), target_is_directory=True)
+    except OSError as e:
+        logger.debug("Could not link %s to %s (%s). Copying.", target, bundle_dir, e)
+        shutil.copytree(bundle_dir, target)
+        return False
+    return True
+
+
+def install_theme_assets(
+    theme_name: str,
+    static_dir: Path,
+    target: Path,
+    assets_root: Optional[Path] = None,
+) -> None:
+    """Make a theme's static files available at target.
+
+    With shared_theme_assets enabled, target links to the theme's shared
+    bundle. Otherwise the files are copied into the docset as before.
+
+    Args:
+        theme_name: Short name of the theme, used as the bundle prefix.
+        static_dir: The theme's static directory.
+        target: Where the docset's pages expect the static files.
+        assets_root: Where bundles are published.
+
+    """
+    if ConfigManager().get_shared_theme_assets():
+        try:
+            bundle_dir = publish_asset_bundle(theme_name, static_dir, assets_root)
+            link_asset_bundle(bundle_dir, target)
+        except OSError:
+            logger.exception(
+                "Could not use the shared %s asset bundle. Copying.", theme_name
+            )
+        else:
+            return
+    _remove_path(target)
+    shutil.copytree(static_dir, target)
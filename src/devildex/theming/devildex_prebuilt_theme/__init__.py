@@ -0,0 +1 @@
+"""prebuilt docs theme package."""
@@ -177,13 +177,6 @@ class ThemeManager:
             with self.sphinx_conf_file.open("w", encoding="utf-8") as f:
                 f.writelines(lines)
                 f.write("\n".join(devil_config))
-        shutil.copytree(
-            Path(self.settings["html_theme_path"][0])
-            / self.settings["html_theme"]
-            / "static",
-            static_dir,
-            dirs_exist_ok=True,
-        )
         if not conf_file or not conf_file.is_file():
             conf_file = next(
                 (p for p in self.potential_sphinx_conf_paths if p.is_file()), None
@@ -0,0 +1,69 @@
+"""prebuilt docs theming module."""
+
+import logging
+import os
+import re
+from pathlib import Path
+
+from devildex.theming.asset_bundle import PREBUILT_THEME_ASSETS, install_theme_assets
+
+logger = logging.getLogger(__name__)
+
+PREBUILT_THEME_DIR = Path(__file__).parent / "devildex_prebuilt_theme"
+PREBUILT_STATIC_DIRNAME = "_devildex"
+PREBUILT_STYLESHEET = "devildex_prebuilt.css"
+THEMED_MARKER = "data-devildex-theme"
+
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_ONLINE_SCRIPT_RE = re.compile(
+    r"<script\b[^>]*\bsrc=\"[^\"]*"
+    r"(?:readthedocs-(?:doc-embed|addons|analytics)\.js|/_/static/javascript/)"
+    r"[^\"]*\"[^>]*>\s*</script>\s*",
+    re.IGNORECASE,
+)
+
+
+def theme_page(html: str, stylesheet_href: str) -> str:
+    """Return a prebuilt page with the DevilDex stylesheet linked in.
+
+    Scripts that only work on the Read the Docs servers are dropped. Pages
+    already themed, or without a head, are returned unchanged.
+    """
+    if THEMED_MARKER in html or not _HEAD_END_RE.search(html):
+        return html
+    html = _ONLINE_SCRIPT_RE.sub("", html)
+    link = f'<link rel="stylesheet" href="{stylesheet_href}" {THEMED_MARKER}>\n'
+    return _HEAD_END_RE.sub(lambda match: link + match.group(0), html, count=1)
+
+
+def apply_prebuilt_theme(docset_dir: Path) -> int:
+    """Theme a docset that was downloaded already built.
+
+    The DevilDex overlay stylesheet is installed into the docset and linked
+    from every page, so the theme is applied after the fact instead of at
+    build time.
+
+    Args:
+        docset_dir: The extracted documentation.
+
+    Returns:
+        The number of pages that were changed.
+
+    """
+    static_dir = docset_dir / PREBUILT_STATIC_DIRNAME
+    install_theme_assets(
+        PREBUILT_THEME_ASSETS, PREBUILT_THEME_DIR / "static", static_dir
+    )
+    stylesheet = static_dir / PREBUILT_STYLESHEET
+    themed = 0
+    for page in sorted(docset_dir.rglob("*.html")):
+        if static_dir in page.parents:
+            continue
+        html = page.read_text(encoding="utf-8", errors="surrogateescape")
+        href = Path(os.path.relpath(stylesheet, page.parent)).as_posix()
+        themed_html = theme_page(html, href)
+        if themed_html != html:
+            page.write_text(themed_html, encoding="utf-8", errors="surrogateescape")
+            themed += 1
+    logger.info("Applied the DevilDex theme to %s pages in %s", themed, docset_dir)
+    return themed
@@ -1,6 +1,7 @@
 """A wx.Panel that encapsulates the document web view and its navigation controls."""
 
 import logging
+from pathlib import Path
 from typing import Callable
 
 import wx
@@ -8,6 +9,25 @@ import wx.html2
 
 logger = logging.getLogger(__name__)
 
+ARCHIVE_URL_SCHEME = "wxfs"
+_archive_fs_handler_added = False
+
+
+def archive_page_url(archive_path: Path, page: str) -> str:
+    """Return the URL of a page inside a packed docset."""
+    return (
+        f"{ARCHIVE_URL_SCHEME}:///{archive_path.resolve().as_posix().lstrip('/')}"
+        f";protocol=zip/{page}"
+    )
+
+
+def _add_archive_fs_handler() -> None:
+    """Let wx.FileSystem read zip members, once per process."""
+    global _archive_fs_handler_added  # noqa: PLW0603
+    if not _archive_fs_handler_added:
+        wx.FileSystem.AddHandler(wx.ArchiveFSHandler())
+        _archive_fs_handler_added = True
+
 
 class DocumentViewPanel(wx.Panel):
     """A panel that displays a docset using a WebView and provides navigation."""
@@ -47,6 +67,8 @@ class DocumentViewPanel(wx.Panel):
         sizer.Add(nav_sizer, 0, wx.ALIGN_CENTER_HORIZONTAL | wx.ALL, 5)
 
         self.webview = wx.html2.WebView.New(self)
+        _add_archive_fs_handler()
+        self.webview.RegisterHandler(wx.html2.WebViewArchiveHandler(ARCHIVE_URL_SCHEME))
         self.webview.Bind(wx.html2.EVT_WEBVIEW_NAVIGATING, self._on_webview_event)
         self.webview.Bind(wx.html2.EVT_WEBVIEW_NAVIGATED, self._on_webview_event)
         self.webview.Bind(wx.html2.EVT_WEBVIEW_LOADED, self._on_webview_event)
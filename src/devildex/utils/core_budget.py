@@ -0,0 +1,100 @@
+"""core budget module."""
+
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+from devildex.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+BUILD_STAGE = "build"
+
+
+class CoreBudget:
+    """Hand out CPU cores to concurrent builds without oversubscribing.
+
+    Each build gets a fair share of the cores: the total divided by the
+    number of builds running with it, or by expected_builds if that is
+    larger, so the first of several concurrent builds does not take every
+    core. A build waits while no core is free, and the cores handed out
+    never exceed the total.
+    """
+
+    def __init__(
+        self, total_cores: Optional[int] = None, expected_builds: int = 1
+    ) -> None:
+        """Initialize the CoreBudget."""
+        self.total_cores = max(1, total_cores or os.cpu_count() or 1)
+        self.expected_builds = max(1, expected_builds)
+        self._in_use = 0
+        self._active_builds = 0
+        self._available = threading.Condition()
+
+    @property
+    def free_cores(self) -> int:
+        """Return the number of cores not reserved by running builds."""
+        with self._available:
+            return self.total_cores - self._in_use
+
+    def acquire(self, max_cores: Optional[int] = None) -> int:
+        """Reserve up to max_cores cores, waiting until at least one is free."""
+        with self._available:
+            self._available.wait_for(lambda: self._in_use < self.total_cores)
+            builds = max(self.expected_builds, self._active_builds + 1)
+            fair_share = max(1, self.total_cores // builds)
+            wanted = fair_share if max_cores is None else max(1, max_cores)
+            granted = min(wanted, fair_share, self.total_cores - self._in_use)
+            self._in_use += granted
+            self._active_builds += 1
+        logger.debug("Reserved %d core(s), %d in use", granted, self._in_use)
+        return granted
+
+    def release(self, cores: int) -> None:
+        """Return cores previously handed out by acquire."""
+        with self._available:
+            self._in_use = max(0, self._in_use - cores)
+            self._active_builds = max(0, self._active_builds - 1)
+            self._available.notify_all()
+
+    @contextmanager
+    def reserve(self, max_cores: Optional[int] = None) -> Iterator[int]:
+        """Reserve cores for the duration of a with block.
+
+        Args:
+            max_cores: Upper bound of cores the caller can use. None means
+                its fair share.
+
+        Yields:
+            The number of cores reserved.
+
+        """
+        cores = self.acquire(max_cores)
+        try:
+            yield cores
+        finally:
+            self.release(cores)
+
+
+_core_budget: Optional[CoreBudget] = None
+_core_budget_guard = threading.Lock()
+
+
+def get_core_budget() -> CoreBudget:
+    """Return the process-wide core budget.
+
+    Its size is ``[build] max_build_cores``, where 0 means every core, and
+    it expects as many concurrent builds as the pipeline has build workers.
+    """
+    global _core_budget  # noqa: PLW0603
+    with _core_budget_guard:
+        if _core_budget is None:
+            config = ConfigManager()
+            _core_budget = CoreBudget(
+                config.get_max_build_cores() or None,
+                config.get_pipeline_workers(BUILD_STAGE),
+            )
+        return _core_budget
@@ -0,0 +1,194 @@
+"""docset archive module."""
+
+import logging
+import os
+import shutil
+import threading
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".zip"
+ARCHIVE_TMP_SUFFIX = ".zip.tmp"
+INDEX_PAGE = "index.html"
+ZIP_COMPRESS_LEVEL = 6
+STORED_SUFFIXES = frozenset(
+    {
+        ".br",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".zip",
+    }
+)
+MAX_OPEN_ARCHIVES = 32
+
+_open_archives: dict[Path, tuple[float, "DocsetArchive"]] = {}
+_open_archives_lock = threading.Lock()
+
+
+def archive_path_for(docset_dir: Path) -> Path:
+    """Return the archive that replaces a packed docset directory."""
+    return docset_dir.with_name(docset_dir.name + ARCHIVE_SUFFIX)
+
+
+def is_docset_archive(path: Path) -> bool:
+    """Check whether path is a packed docset."""
+    return path.suffix == ARCHIVE_SUFFIX and path.is_file()
+
+
+def normalize_member(page: str) -> Optional[str]:
+    """Return the archive member name of a page, or None if it escapes the root."""
+    parts = PurePosixPath(page.replace("\\", "/")).parts
+    if not parts or parts[0] == "/" or ".." in parts:
+        return None
+    return "/".join(part for part in parts if part != ".")
+
+
+def _docset_files(docset_dir: Path) -> list[Path]:
+    """Return every file of a docset, following linked asset directories."""
+    files = [
+        Path(dir_path) / file_name
+        for dir_path, _dir_names, file_names in os.walk(docset_dir, followlinks=True)
+        for file_name in file_names
+    ]
+    return sorted(path for path in files if path.is_file())
+
+
+def pack_docset(docset_dir: Path, remove_tree: bool = True) -> Path:
+    """Pack a finished docset into a single indexed zip archive.
+
+    Text is deflated and already compressed formats are stored, so any page
+    can be read by path through the zip central directory. Linked shared
+    assets are packed too, which makes the archive self-contained. The
+    archive is written next to the docset and renamed into place.
+
+    Args:
+        docset_dir: The docset directory to pack.
+        remove_tree: Whether to delete the directory once packed.
+
+    Returns:
+        The path of the archive.
+
+    """
+    archive_path = archive_path_for(docset_dir)
+    tmp_path = docset_dir.with_name(docset_dir.name + ARCHIVE_TMP_SUFFIX)
+    files = _docset_files(docset_dir)
+    try:
+        with zipfile.ZipFile(
+            tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL
+        ) as archive:
+            for path in files:
+                compression = (
+                    zipfile.ZIP_STORED
+                    if path.suffix.lower() in STORED_SUFFIXES
+                    else zipfile.ZIP_DEFLATED
+                )
+                archive.write(
+                    path,
+                    path.relative_to(docset_dir).as_posix(),
+                    compress_type=compression,
+                )
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    forget_archive(archive_path)
+    logger.info("Packed %d files of %s into %s", len(files), docset_dir, archive_path)
+    if remove_tree:
+        shutil.rmtree(docset_dir)
+    return archive_path
+
+
+class DocsetArchive:
+    """Random access to the pages of a packed docset.
+
+    The zip file stays open and its central directory is read once, so
+    each page costs a seek and a read. Reads are serialised because a
+    ZipFile must not be read concurrently.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the DocsetArchive."""
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._members = {
+            info.filename: info for info in self._zip.infolist() if not info.is_dir()
+        }
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the archive."""
+        with self._lock:
+            self._zip.close()
+
+    def has_page(self, page: str) -> bool:
+        """Check whether the archive contains the page."""
+        member = normalize_member(page)
+        return member is not None and member in self._members
+
+    def info(self, page: str) -> Optional[zipfile.ZipInfo]:
+        """Return the zip entry of a page, or None if it is not in the archive."""
+        member = normalize_member(page)
+        return self._members.get(member) if member is not None else None
+
+    def page_names(self) -> list[str]:
+        """Return the names of all files in the archive."""
+        return list(self._members)
+
+    def read(self, page: str) -> bytes:
+        """Return the content of a page.
+
+        Raises:
+            KeyError: If the page is not in the archive.
+
+        """
+        member = normalize_member(page)
+        if member is None or member not in self._members:
+            raise KeyError(page)
+        with self._lock:
+            return self._zip.read(self._members[member])
+
+    def entry_page(self) -> Optional[str]:
+        """Return index.html, or the first top-level page if there is none."""
+        if INDEX_PAGE in self._members:
+            return INDEX_PAGE
+        top_level_pages = sorted(
+            name for name in self._members if "/" not in name and name.endswith(".html")
+        )
+        return top_level_pages[0] if top_level_pages else None
+
+
+def open_archive(path: Path) -> DocsetArchive:
+    """Return an open DocsetArchive for path, reusing it while unchanged."""
+    path = path.resolve()
+    mtime = path.stat().st_mtime
+    with _open_archives_lock:
+        cached = _open_archives.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        if cached:
+            cached[1].close()
+        elif len(_open_archives) >= MAX_OPEN_ARCHIVES:
+            _, (_, oldest) = next(iter(_open_archives.items()))
+            oldest.close()
+            del _open_archives[oldest.path]
+        archive = DocsetArchive(path)
+        _open_archives[path] = (mtime, archive)
+        return archive
+
+
+def forget_archive(path: Path) -> None:
+    """Close the cached handle of an archive that is replaced or deleted."""
+    with _open_archives_lock:
+        cached = _open_archives.pop(path.resolve(), None)
+    if cached:
+        cached[1].close()
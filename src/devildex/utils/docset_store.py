@@ -0,0 +1,192 @@
+"""content-addressed docset store module."""
+
+import hashlib
+import logging
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_SUBDIR = "objects"
+HASH_CHUNK_SIZE = 1024 * 1024
+LINK_TMP_SUFFIX = ".devildex-link"
+
+
+def file_digest(path: Path) -> str:
+    """Return the sha256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class IngestResult:
+    """Outcome of storing one docset tree."""
+
+    manifest: dict[str, str] = field(default_factory=dict)
+    linked_files: int = 0
+    new_objects: int = 0
+    saved_bytes: int = 0
+
+
+class DocsetStore:
+    """A content-addressed store shared by all docset versions.
+
+    Every file of a generated docset is hashed and kept once under
+    ``objects/<aa>/<digest>``. The docset tree itself stays a normal
+    directory, but its files become hardlinks to the stored objects, so
+    versions that share pages, CSS or fonts share the disk blocks too.
+    An object is garbage once no docset tree links to it any more.
+
+    Hardlinks need the store and the docsets on the same filesystem. Files
+    that cannot be linked are left as they are and only recorded in the
+    manifest.
+    """
+
+    def __init__(self, store_dir: Path) -> None:
+        """Initialize the DocsetStore."""
+        self.store_dir = store_dir
+        self.objects_dir = store_dir / OBJECTS_SUBDIR
+
+    def object_path(self, digest: str) -> Path:
+        """Return where the object with the given digest is stored."""
+        return self.objects_dir / digest[:2] / digest
+
+    def ingest_tree(self, tree_dir: Path) -> IngestResult:
+        """Store every file of tree_dir and hardlink the tree to the objects.
+
+        Args:
+            tree_dir: The generated docset directory.
+
+        Returns:
+            The manifest mapping each relative POSIX path to its digest,
+            with counters of what was deduplicated.
+
+        """
+        result = IngestResult()
+        for path in sorted(tree_dir.rglob("*")):
+            if path.is_symlink() or not path.is_file():
+                continue
+            relative_path = path.relative_to(tree_dir).as_posix()
+            try:
+                digest = file_digest(path)
+            except OSError:
+                logger.warning("Could not hash docset file %s", path)
+                continue
+            result.manifest[relative_path] = digest
+            self._store_file(path, digest, result)
+        logger.info(
+            "Stored docset %s: %d files, %d new objects, %d files deduplicated "
+            "(%d bytes saved)",
+            tree_dir,
+            len(result.manifest),
+            result.new_objects,
+            result.linked_files,
+            result.saved_bytes,
+        )
+        return result
+
+    def _store_file(self, path: Path, digest: str, result: IngestResult) -> None:
+        """Make path a hardlink of the object for digest, creating it if new."""
+        object_path = self.object_path(digest)
+        try:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            if object_path.exists():
+                if object_path.samefile(path):
+                    return
+                self._replace_with_link(object_path, path)
+                result.linked_files += 1
+                result.saved_bytes += object_path.stat().st_size
+                return
+            try:
+                os.link(path, object_path)
+                result.new_objects += 1
+            except FileExistsError:
+                self._replace_with_link(object_path, path)
+                result.linked_files += 1
+                result.saved_bytes += object_path.stat().st_size
+        except OSError as e:
+            logger.debug("Could not deduplicate %s: %s", path, e)
+
+    @staticmethod
+    def _replace_with_link(object_path: Path, path: Path) -> None:
+        """Atomically replace path with a hardlink to object_path."""
+        tmp_path = path.with_name(path.name + LINK_TMP_SUFFIX)
+        if tmp_path.exists():
+            tmp_path.unlink()
+        os.link(object_path, tmp_path)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def release(self, digests: Iterable[str]) -> int:
+        """Remove the given objects if no docset tree links to them any more.
+
+        Args:
+            digests: Digests of a deleted or replaced docset's manifest.
+
+        Returns:
+            The number of objects removed.
+
+        """
+        removed = 0
+        for digest in set(digests):
+            if self._remove_if_unreferenced(self.object_path(digest)):
+                removed += 1
+        return removed
+
+    def collect_garbage(self) -> int:
+        """Remove every object that no docset tree links to.
+
+        Returns:
+            The number of objects removed.
+
+        """
+        if not self.objects_dir.is_dir():
+            return 0
+        removed = 0
+        for object_path in self.objects_dir.glob("*/*"):
+            if self._remove_if_unreferenced(object_path):
+                removed += 1
+        return removed
+
+    @staticmethod
+    def _remove_if_unreferenced(object_path: Path) -> bool:
+        """Remove an object whose only link is the store's own."""
+        try:
+            if object_path.stat().st_nlink > 1:
+                return False
+            object_path.unlink()
+        except OSError:
+            return False
+        return True
+
+
+def store_docset_tree(
+    store_dir: Path,
+    tree_dir: Path,
+    previous_manifest: Optional[dict[str, str]] = None,
+) -> dict[str, str]:
+    """Store a freshly generated docset and release what it replaced.
+
+    Args:
+        store_dir: The store directory.
+        tree_dir: The generated docset directory.
+        previous_manifest: The manifest of the build this one replaced.
+
+    Returns:
+        The manifest of the new docset.
+
+    """
+    store = DocsetStore(store_dir)
+    manifest = store.ingest_tree(tree_dir).manifest
+    if previous_manifest:
+        store.release(set(previous_manifest.values()) - set(manifest.values()))
+    return manifest
@@ -0,0 +1,148 @@
+"""installer backend module."""
+
+import logging
+import shutil
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from devildex.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+INSTALLER_BACKEND_AUTO = "auto"
+INSTALLER_BACKEND_PIP = "pip"
+INSTALLER_BACKEND_UV = "uv"
+PYVENV_CFG_FILENAME = "pyvenv.cfg"
+PIP_QUIET_FLAGS = ["--disable-pip-version-check", "--no-python-version-warning"]
+
+
+class InstallerBackend(ABC):
+    """Abstract base class for tools that create venvs and install packages."""
+
+    name: str = ""
+    needs_pip_upgrade: bool = False
+
+    @abstractmethod
+    def venv_command(self, venv_path: Path) -> list[str]:
+        """Return the command that creates a virtual environment at venv_path."""
+
+    @abstractmethod
+    def install_command(
+        self, pip_executable: str, install_args: list[str]
+    ) -> list[str]:
+        """Return the command that installs install_args into the venv.
+
+        :param pip_executable: The pip executable of the target venv. It also
+            identifies the venv for backends that do not run pip itself.
+        :param install_args: Requirement specifiers and options such as
+            ``-r`` or ``-e``.
+        """
+
+
+class PipBackend(InstallerBackend):
+    """Installer backend based on ``python -m venv`` and pip."""
+
+    name = INSTALLER_BACKEND_PIP
+    needs_pip_upgrade = True
+
+    def venv_command(self, venv_path: Path) -> list[str]:
+        """Return the ``python -m venv`` command."""
+        return [sys.executable, "-m", "venv", str(venv_path)]
+
+    def install_command(
+        self, pip_executable: str, install_args: list[str]
+    ) -> list[str]:
+        """Return the ``pip install`` command."""
+        return [pip_executable, "install", *PIP_QUIET_FLAGS, *install_args]
+
+
+class UvBackend(InstallerBackend):
+    """Installer backend based on ``uv venv`` and ``uv pip install``.
+
+    The venv is seeded with pip so code paths that still call pip directly
+    keep working. Installs go through uv's global cache and resolver.
+    """
+
+    name = INSTALLER_BACKEND_UV
+
+    def __init__(self, uv_executable: str) -> None:
+        """Initialize UvBackend."""
+        self.uv_executable = uv_executable
+
+    def venv_command(self, venv_path: Path) -> list[str]:
+        """Return the ``uv venv`` command."""
+        return [
+            self.uv_executable,
+            "venv",
+            "--seed",
+            "--python",
+            sys.executable,
+            str(venv_path),
+        ]
+
+    def install_command(
+        self, pip_executable: str, install_args: list[str]
+    ) -> list[str]:
+        """Return the ``uv pip install`` command targeting the venv's python."""
+        bin_dir = Path(pip_executable).parent
+        python_executable = bin_dir / (
+            "python.exe" if sys.platform == "win32" else "python"
+        )
+        return [
+            self.uv_executable,
+            "pip",
+            "install",
+            "--python",
+            str(python_executable),
+            *install_args,
+        ]
+
+
+def resolve_installer_backend(preference: Optional[str] = None) -> InstallerBackend:
+    """Return the installer backend to use for a new build environment.
+
+    The preference defaults to the ``[build] installer_backend`` setting.
+    "auto" picks uv when it is on PATH, "uv" falls back to pip with a warning
+    when uv is missing and "pip" always uses pip.
+    """
+    if preference is None:
+        preference = ConfigManager().get_installer_backend()
+    preference = (preference or INSTALLER_BACKEND_AUTO).strip().lower()
+    if preference == INSTALLER_BACKEND_PIP:
+        return PipBackend()
+    if preference not in (INSTALLER_BACKEND_AUTO, INSTALLER_BACKEND_UV):
+        logger.warning(
+            "Unknown installer backend '%s'. Falling back to pip.", preference
+        )
+        return PipBackend()
+    uv_executable = shutil.which("uv")
+    if uv_executable:
+        return UvBackend(uv_executable)
+    if preference == INSTALLER_BACKEND_UV:
+        logger.warning("Installer backend 'uv' requested but uv is not on PATH.")
+    return PipBackend()
+
+
+def _venv_created_by_uv(venv_path: Path) -> bool:
+    """Check whether the venv's pyvenv.cfg was written by uv."""
+    pyvenv_cfg = venv_path / PYVENV_CFG_FILENAME
+    try:
+        lines = pyvenv_cfg.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+    return any(line.split("=")[0].strip() == "uv" for line in lines)
+
+
+def backend_for_pip_executable(pip_executable: str) -> InstallerBackend:
+    """Return the backend matching the venv that owns pip_executable.
+
+    Venvs created by uv are installed into with uv, everything else with pip.
+    """
+    venv_path = Path(pip_executable).parent.parent
+    if _venv_created_by_uv(venv_path):
+        uv_executable = shutil.which("uv")
+        if uv_executable:
+            return UvBackend(uv_executable)
+    return PipBackend()
@@ -0,0 +1,142 @@
+"""docset precompression module."""
+
+import gzip
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+GZIP_SUFFIX = ".gz"
+BROTLI_SUFFIX = ".br"
+GZIP_ENCODING = "gzip"
+BROTLI_ENCODING = "br"
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+MIN_PRECOMPRESS_BYTES = 1024
+VARIANT_TMP_SUFFIX = ".tmp"
+COMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        ".css",
+        ".htm",
+        ".html",
+        ".js",
+        ".json",
+        ".map",
+        ".svg",
+        ".txt",
+        ".xml",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Encoding:
+    """A content encoding with the suffix of its precompressed variant."""
+
+    name: str
+    suffix: str
+    compress: Callable[[bytes], bytes]
+
+
+def _gzip(data: bytes) -> bytes:
+    """Gzip data reproducibly, without a timestamp in the header."""
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def available_encodings() -> list[Encoding]:
+    """Return the supported encodings, the preferred one first."""
+    encodings = [Encoding(GZIP_ENCODING, GZIP_SUFFIX, _gzip)]
+    if brotli is not None:
+        encodings.insert(
+            0,
+            Encoding(
+                BROTLI_ENCODING,
+                BROTLI_SUFFIX,
+                lambda data: brotli.compress(data, quality=BROTLI_QUALITY),
+            ),
+        )
+    return encodings
+
+
+def variant_path(path: Path, encoding: Encoding) -> Path:
+    """Return where the precompressed variant of path is stored."""
+    return path.with_name(path.name + encoding.suffix)
+
+
+def fresh_variant(path: Path, encoding: Encoding) -> Optional[Path]:
+    """Return the variant of path if it exists and is not older than path."""
+    variant = variant_path(path, encoding)
+    try:
+        if variant.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return variant
+    except OSError:
+        return None
+    return None
+
+
+def is_compressible(path: Path) -> bool:
+    """Check whether path is a text file worth precompressing."""
+    return path.suffix.lower() in COMPRESSIBLE_SUFFIXES
+
+
+def _write_variant(variant: Path, data: bytes) -> None:
+    """Write a variant next to its file and rename it into place."""
+    tmp_path = variant.with_name(variant.name + VARIANT_TMP_SUFFIX)
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, variant)
+
+
+def precompress_docset(docset_dir: Path) -> int:
+    """Store gzip and brotli variants next to a docset's text files.
+
+    Variants are only written when missing or older than their file, and
+    only when they are actually smaller. Linked shared asset bundles are
+    compressed in place, so each bundle is compressed once for all the
+    docsets that use it.
+
+    Args:
+        docset_dir: The finished docset directory.
+
+    Returns:
+        The number of variants written.
+
+    """
+    encodings = available_encodings()
+    written = 0
+    for dir_path, _dir_names, file_names in os.walk(docset_dir, followlinks=True):
+        for file_name in file_names:
+            path = Path(dir_path) / file_name
+            if not is_compressible(path):
+                continue
+            try:
+                written += _precompress_file(path, encodings)
+            except OSError as e:
+                logger.debug("Could not precompress %s: %s", path, e)
+    logger.info("Wrote %d precompressed variants for %s", written, docset_dir)
+    return written
+
+
+def _precompress_file(path: Path, encodings: list[Encoding]) -> int:
+    """Write the missing or outdated variants of one file."""
+    stale = [encoding for encoding in encodings if not fresh_variant(path, encoding)]
+    if not stale or path.stat().st_size < MIN_PRECOMPRESS_BYTES:
+        return 0
+    data = path.read_bytes()
+    written = 0
+    for encoding in stale:
+        compressed = encoding.compress(data)
+        variant = variant_path(path, encoding)
+        if len(compressed) >= len(data):
+            variant.unlink(missing_ok=True)
+            continue
+        _write_variant(variant, compressed)
+        written += 1
+    return written
@@ -0,0 +1,130 @@
+"""build progress module."""
+
+import contextvars
+import logging
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+TASK_LOGS_SUBDIR = "tasks"
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+PROGRESS_MARKER_RE = re.compile(
+    r"(?P<phase>reading sources|writing output|copying images|"
+    r"copying downloadable files)\.\.\. \[\s*(?P<percent>\d{1,3})%\]"
+)
+
+_current_progress: contextvars.ContextVar[Optional["TaskProgress"]] = (
+    contextvars.ContextVar("devildex_task_progress", default=None)
+)
+
+
+def parse_progress_line(line: str) -> Optional[tuple[str, int]]:
+    """Extract a progress marker such as Sphinx's "reading sources... [ 42%]".
+
+    Returns:
+        The phase and its percentage, or None if the line has no marker.
+
+    """
+    match = PROGRESS_MARKER_RE.search(ANSI_ESCAPE_RE.sub("", line))
+    if not match:
+        return None
+    return match.group("phase"), min(100, int(match.group("percent")))
+
+
+class TaskProgress:
+    """Live progress of one generation task.
+
+    Command output is appended to the task's log file as it arrives, and
+    the latest progress marker is kept for get_task_status. The log file is
+    only created once a command produces output.
+    """
+
+    def __init__(self, task_id: str, log_file: Optional[Path] = None) -> None:
+        """Initialize the TaskProgress."""
+        self.task_id = task_id
+        self.log_file = log_file
+        self.step: Optional[str] = None
+        self.phase: Optional[str] = None
+        self.percent: Optional[int] = None
+        self._lock = threading.Lock()
+        self._log_handle: Optional[TextIO] = None
+
+    def _write(self, text: str) -> None:
+        """Append text to the log file, opening it on first use."""
+        if self.log_file is None:
+            return
+        if self._log_handle is None:
+            try:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                self._log_handle = self.log_file.open("a", encoding="utf-8")
+            except OSError:
+                logger.exception("Could not open task log file %s", self.log_file)
+                self.log_file = None
+                return
+        self._log_handle.write(text)
+        self._log_handle.flush()
+
+    def close(self) -> None:
+        """Close the log file."""
+        with self._lock:
+            if self._log_handle is not None:
+                self._log_handle.close()
+                self._log_handle = None
+
+    def start_step(self, description: str) -> None:
+        """Record the start of a command and reset the progress marker."""
+        with self._lock:
+            self.step = description
+            self.phase = None
+            self.percent = None
+            self._write(f"=== {description} ===\n")
+
+    def add_line(self, line: str) -> None:
+        """Record one line of command output."""
+        parsed = parse_progress_line(line)
+        with self._lock:
+            if parsed is not None:
+                self.phase, self.percent = parsed
+            self._write(line if line.endswith("\n") else line + "\n")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current progress as a JSON-serialisable dict."""
+        with self._lock:
+            return {
+                "step": self.step,
+                "phase": self.phase,
+                "percent": self.percent,
+                "log_file": str(self.log_file) if self.log_file else None,
+            }
+
+
+def current_task_progress() -> Optional[TaskProgress]:
+    """Return the progress of the task running in this context, if any."""
+    return _current_progress.get()
+
+
+@contextmanager
+def bind_task_progress(progress: TaskProgress) -> Iterator[TaskProgress]:
+    """Report command output of the current thread to progress."""
+    token = _current_progress.set(progress)
+    try:
+        yield progress
+    finally:
+        _current_progress.reset(token)
+        progress.close()
+
+
+def task_context(progress: TaskProgress) -> contextvars.Context:
+    """Return a copy of the current context with progress bound in it.
+
+    Work for one task that hops between worker threads runs each step with
+    ``context.run`` so command output keeps reaching the task's progress.
+    """
+    context = contextvars.copy_context()
+    context.run(_current_progress.set, progress)
+    return context
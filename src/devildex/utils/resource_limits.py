@@ -0,0 +1,99 @@
+"""resource limits module."""
+
+import contextlib
+import logging
+import os
+import signal
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from devildex.config_manager import ConfigManager
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+STAGE_INSTALL = "install"
+STAGE_BUILD = "build"
+KILL_GRACE_SECONDS = 5.0
+BYTES_PER_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits applied to one builder subprocess. None means unlimited."""
+
+    timeout_seconds: Optional[float] = None
+    memory_limit_mb: Optional[int] = None
+    cpu_limit_seconds: Optional[int] = None
+
+    @classmethod
+    def for_stage(cls, stage: str = STAGE_BUILD) -> "ResourceLimits":
+        """Return the configured limits for an install or build stage."""
+        config = ConfigManager()
+        return cls(
+            timeout_seconds=config.get_stage_timeout(stage) or None,
+            memory_limit_mb=config.get_memory_limit_mb() or None,
+            cpu_limit_seconds=config.get_cpu_limit_seconds() or None,
+        )
+
+
+def popen_isolation_kwargs() -> dict[str, Any]:
+    """Return Popen arguments that put the child in its own process group."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def apply_resource_limits(pid: int, limits: ResourceLimits) -> None:
+    """Apply RLIMIT_AS and RLIMIT_CPU to a running process.
+
+    The limits are set with prlimit right after the process starts, which is
+    safe from worker threads unlike a preexec_fn. Processes it spawns later
+    inherit them. Platforms without prlimit only get the wall-clock timeout.
+    """
+    if not limits.memory_limit_mb and not limits.cpu_limit_seconds:
+        return
+    if resource is None or not hasattr(resource, "prlimit"):
+        logger.debug("prlimit not available; only the timeout applies to %s", pid)
+        return
+    try:
+        if limits.memory_limit_mb:
+            memory_bytes = limits.memory_limit_mb * BYTES_PER_MB
+            resource.prlimit(pid, resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        if limits.cpu_limit_seconds:
+            resource.prlimit(
+                pid,
+                resource.RLIMIT_CPU,
+                (limits.cpu_limit_seconds, limits.cpu_limit_seconds),
+            )
+    except (OSError, ValueError) as e:
+        logger.warning("Could not apply resource limits to process %s: %s", pid, e)
+
+
+def kill_process_group(process: subprocess.Popen) -> None:
+    """Terminate a process and everything it spawned.
+
+    The group gets SIGTERM, then SIGKILL after KILL_GRACE_SECONDS so no
+    straggler keeps the output pipes open.
+    """
+    if sys.platform == "win32":
+        process.kill()
+        process.wait()
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        process.wait(timeout=KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        logger.warning("Process group %s ignored SIGTERM.", process.pid)
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGKILL)
+    process.wait()
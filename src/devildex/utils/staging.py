@@ -0,0 +1,143 @@
+"""staging directory module."""
+
+import ctypes
+import errno
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+STAGING_SUFFIX = ".staging"
+PREVIOUS_SUFFIX = ".previous"
+AT_FDCWD = -100
+LINUX_RENAME_EXCHANGE = 2
+DARWIN_RENAME_SWAP = 2
+UNSUPPORTED_EXCHANGE_ERRORS = {errno.EINVAL, errno.ENOSYS, errno.ENOTSUP}
+
+
+def _libc() -> Optional[ctypes.CDLL]:
+    """Return the C library on platforms with an atomic rename exchange."""
+    if sys.platform not in {"linux", "darwin"}:
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+
+def _exchange_paths(first: Path, second: Path) -> bool:
+    """Atomically exchange two paths on the same filesystem.
+
+    Uses renameat2 with RENAME_EXCHANGE on Linux and renamex_np with
+    RENAME_SWAP on macOS.
+
+    Returns:
+        True if the paths were exchanged, False if the platform or the
+        filesystem cannot do it.
+
+    """
+    libc = _libc()
+    if libc is None:
+        return False
+    first_name, second_name = os.fsencode(first), os.fsencode(second)
+    try:
+        if sys.platform == "linux":
+            result = libc.renameat2(
+                AT_FDCWD, first_name, AT_FDCWD, second_name, LINUX_RENAME_EXCHANGE
+            )
+        else:
+            result = libc.renamex_np(first_name, second_name, DARWIN_RENAME_SWAP)
+    except AttributeError:
+        return False
+    if result == 0:
+        return True
+    error = ctypes.get_errno()
+    if error in UNSUPPORTED_EXCHANGE_ERRORS:
+        return False
+    raise OSError(error, os.strerror(error), str(first), None, str(second))
+
+
+def previous_dir_for(final_dir: Path) -> Path:
+    """Return where swap_into_place parks the output it replaces."""
+    return final_dir.with_name(f".{final_dir.name}{PREVIOUS_SUFFIX}")
+
+
+def swap_in_progress(final_dir: Path) -> bool:
+    """Tell whether final_dir is missing only because it is being replaced."""
+    return not final_dir.exists() and previous_dir_for(final_dir).is_dir()
+
+
+def staging_dir_for(final_dir: Path) -> Path:
+    """Return the staging directory used to build final_dir."""
+    return final_dir.with_name(f".{final_dir.name}{STAGING_SUFFIX}")
+
+
+def prepare_staging_dir(final_dir: Path, seed_from_final: bool = True) -> Path:
+    """Create a fresh staging directory next to final_dir.
+
+    When seed_from_final is set the current output is copied in with its
+    timestamps, so incremental builders only rewrite the pages that changed.
+    The copy costs a full read and write of the previous output on every
+    rebuild. Hardlinks would be cheaper, but builders rewrite pages in place
+    and the finished files are also linked into the docset store, so a
+    linked seed would let a build modify the output being served.
+
+    Args:
+        final_dir: The directory the finished output will be swapped into.
+        seed_from_final: Whether to start from a copy of the current output.
+
+    Returns:
+        The path of the staging directory.
+
+    """
+    staging_dir = staging_dir_for(final_dir)
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.parent.mkdir(parents=True, exist_ok=True)
+    if seed_from_final and final_dir.is_dir():
+        shutil.copytree(final_dir, staging_dir, symlinks=True)
+        logger.info("Seeded staging directory %s from %s", staging_dir, final_dir)
+    else:
+        staging_dir.mkdir()
+    return staging_dir
+
+
+def swap_into_place(staging_dir: Path, final_dir: Path) -> None:
+    """Atomically replace final_dir with staging_dir.
+
+    Where the platform and filesystem can exchange two directories in one
+    rename, readers see either the old or the new output, never a partial
+    or missing one. Elsewhere the old output is first renamed aside, so
+    final_dir is briefly missing; swap_in_progress tells readers when that
+    is the case. If the second rename fails the previous output is restored.
+    """
+    if final_dir.is_dir() and _exchange_paths(staging_dir, final_dir):
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        logger.info("Swapped new output into place: %s", final_dir)
+        return
+    previous_dir = previous_dir_for(final_dir)
+    if previous_dir.exists():
+        shutil.rmtree(previous_dir)
+    had_previous = final_dir.exists()
+    if had_previous:
+        final_dir.rename(previous_dir)
+    try:
+        staging_dir.rename(final_dir)
+    except OSError:
+        if had_previous:
+            previous_dir.rename(final_dir)
+        raise
+    if had_previous:
+        shutil.rmtree(previous_dir, ignore_errors=True)
+    logger.info("Swapped new output into place: %s", final_dir)
+
+
+def discard_staging_dir(staging_dir: Path) -> None:
+    """Remove a staging directory left by a failed build."""
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        logger.info("Discarded staging directory: %s", staging_dir)
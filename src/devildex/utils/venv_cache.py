@@ -0,0 +1,452 @@
+"""build environment cache module."""
+
+import hashlib
+import json
+import logging
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Optional
+
+from devildex.app_paths import AppPaths
+from devildex.config_manager import ConfigManager
+from devildex.constants import (
+    DOCSTRINGS_ENV_NAME,
+    DOCSTRINGS_TOOL_PACKAGES,
+    PYDOCTOR_TOOL_ENV_NAME,
+    PYDOCTOR_TOOL_PACKAGES,
+)
+from devildex.utils.deps_utils import filter_requirements_lines
+from devildex.utils.installer_backend import InstallerBackend
+from devildex.utils.venv_cm import IsolatedVenvManager
+from devildex.utils.venv_utils import COMMON_PROJECT_REQUIREMENTS_FILES, InstallConfig
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+ENV_METADATA_FILENAME = "devildex_env.json"
+ENV_KEY_LENGTH = 16
+
+ENV_LOCKS_DIRNAME = ".locks"
+LOCK_RETRY_SECONDS = 0.1
+
+_key_locks: dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+
+def _key_lock(lock_path: Path) -> threading.Lock:
+    """Return the process-wide thread lock for a cache entry's lock file."""
+    with _key_locks_guard:
+        return _key_locks.setdefault(str(lock_path), threading.Lock())
+
+
+def _try_lock_file(handle: BinaryIO) -> bool:
+    """Take an exclusive advisory lock on an open file without waiting."""
+    try:
+        if sys.platform == "win32":
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock_file(handle: BinaryIO) -> None:
+    """Release the advisory lock taken by _try_lock_file."""
+    if sys.platform == "win32":
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class EntryLock:
+    """Exclusive lock on one cache entry, across threads and processes.
+
+    The GUI and the MCP server are separate processes sharing the cache, so
+    besides a thread lock the holder keeps an advisory lock on the entry's
+    file in the cache's lock directory. Lock files are never removed, so
+    every process always locks the same file.
+    """
+
+    def __init__(self, lock_path: Path) -> None:
+        """Initialize the EntryLock."""
+        self.lock_path = lock_path
+        self._thread_lock = _key_lock(lock_path)
+        self._handle: Optional[BinaryIO] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock, waiting for other holders unless blocking is False.
+
+        Returns:
+            True if the lock is now held.
+
+        """
+        if not self._thread_lock.acquire(blocking=blocking):
+            return False
+        try:
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            handle = self.lock_path.open("a+b")
+            while not _try_lock_file(handle):
+                if not blocking:
+                    handle.close()
+                    self._thread_lock.release()
+                    return False
+                time.sleep(LOCK_RETRY_SECONDS)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._handle = handle
+        return True
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._handle is not None:
+            try:
+                _unlock_file(self._handle)
+            finally:
+                self._handle.close()
+                self._handle = None
+        self._thread_lock.release()
+
+
+def _requirements_fingerprint(requirements_file: Path) -> str:
+    """Return a stable digest of a requirements file.
+
+    The filtered lines are hashed rather than the raw bytes because the
+    installer rewrites doc requirements files with their filtered content.
+    """
+    filtered_lines = filter_requirements_lines(str(requirements_file))
+    if filtered_lines is not None:
+        content = "\n".join(line.strip() for line in filtered_lines).encode("utf-8")
+    else:
+        try:
+            content = requirements_file.read_bytes()
+        except OSError:
+            content = b""
+    return hashlib.sha256(content).hexdigest()
+
+
+def compute_env_key(  # noqa: PLR0913
+    builder: str,
+    project_name: str,
+    project_version: Optional[str],
+    base_packages: list[str],
+    requirements_files: Optional[list[Path]] = None,
+    project_root: Optional[Path] = None,
+) -> str:
+    """Compute the cache key of a build environment.
+
+    Args:
+        builder: The builder (or builder family) the environment is for.
+        project_name: The name of the documented project.
+        project_version: The version of the documented project.
+        base_packages: Tool packages installed in the environment.
+        requirements_files: Requirement files installed in the environment.
+            Missing files are ignored.
+        project_root: The project root installed in editable mode, if any.
+
+    Returns:
+        A short hexadecimal digest identifying the environment.
+
+    """
+    requirements = [
+        [str(req_file), _requirements_fingerprint(req_file)]
+        for req_file in requirements_files or []
+        if req_file and req_file.is_file()
+    ]
+    payload = {
+        "builder": builder,
+        "project_name": project_name,
+        "project_version": project_version,
+        "base_packages": sorted(set(base_packages)),
+        "requirements": requirements,
+        "project_root": str(project_root.resolve()) if project_root else None,
+        "python": sys.version,
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:ENV_KEY_LENGTH]
+
+
+class BuildEnvCache:
+    """Directory of reusable build environments with LRU eviction."""
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, max_entries: Optional[int] = None
+    ) -> None:
+        """Initialize the BuildEnvCache."""
+        self.cache_dir = cache_dir or AppPaths().build_env_cache_dir
+        if max_entries is None:
+            max_entries = ConfigManager().get_env_cache_max_entries()
+        self.max_entries = max(1, max_entries)
+
+    def env_path(self, cache_key: str) -> Path:
+        """Return the directory of the environment for cache_key."""
+        return self.cache_dir / cache_key
+
+    def entry_lock(self, cache_key: str) -> EntryLock:
+        """Return the lock guarding the environment for cache_key."""
+        return EntryLock(self.cache_dir / ENV_LOCKS_DIRNAME / f"{cache_key}.lock")
+
+    def _metadata_path(self, cache_key: str) -> Path:
+        return self.env_path(cache_key) / ENV_METADATA_FILENAME
+
+    def _read_metadata(self, cache_key: str) -> dict[str, Any]:
+        try:
+            return json.loads(self._metadata_path(cache_key).read_text("utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def is_ready(self, cache_key: str) -> bool:
+        """Check whether a fully installed environment exists for cache_key."""
+        return self._metadata_path(cache_key).is_file()
+
+    def mark_ready(self, cache_key: str, metadata: dict[str, Any]) -> None:
+        """Record that the environment for cache_key is fully installed."""
+        now = time.time()
+        record = {**metadata, "created": now, "last_used": now}
+        self._metadata_path(cache_key).write_text(
+            json.dumps(record, indent=2), encoding="utf-8"
+        )
+
+    def touch(self, cache_key: str) -> None:
+        """Update the last-used time of the environment for cache_key."""
+        record = self._read_metadata(cache_key)
+        record["last_used"] = time.time()
+        try:
+            self._metadata_path(cache_key).write_text(
+                json.dumps(record, indent=2), encoding="utf-8"
+            )
+        except OSError:
+            logger.warning("Could not update last-used time of env %s", cache_key)
+
+    def discard(self, cache_key: str) -> None:
+        """Remove the environment for cache_key."""
+        env_path = self.env_path(cache_key)
+        if env_path.exists():
+            shutil.rmtree(env_path, ignore_errors=True)
+            logger.info("Removed cached build environment: %s", env_path)
+
+    def free_slots(self) -> int:
+        """Return how many more environments fit before eviction starts."""
+        if not self.cache_dir.is_dir():
+            return self.max_entries
+        ready = sum(
+            1
+            for entry in self.cache_dir.iterdir()
+            if entry.is_dir()
+            and entry.name != ENV_LOCKS_DIRNAME
+            and self.is_ready(entry.name)
+        )
+        return max(0, self.max_entries - ready)
+
+    def evict(self) -> list[str]:
+        """Remove least recently used environments above max_entries.
+
+        Environments in use by any process are never evicted, and leftovers
+        of interrupted installs are removed first.
+
+        Returns:
+            The cache keys that were removed.
+
+        """
+        if not self.cache_dir.is_dir():
+            return []
+        evicted: list[str] = []
+        ready_entries: list[tuple[float, str]] = []
+        for entry in self.cache_dir.iterdir():
+            if not entry.is_dir() or entry.name == ENV_LOCKS_DIRNAME:
+                continue
+            lock = self.entry_lock(entry.name)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                if self.is_ready(entry.name):
+                    last_used = self._read_metadata(entry.name).get("last_used", 0.0)
+                    ready_entries.append((float(last_used), entry.name))
+                else:
+                    self.discard(entry.name)
+                    evicted.append(entry.name)
+            finally:
+                lock.release()
+        ready_entries.sort()
+        excess = len(ready_entries) - self.max_entries
+        for _, cache_key in ready_entries:
+            if excess <= 0:
+                break
+            if self._discard_if_unused(cache_key):
+                evicted.append(cache_key)
+                excess -= 1
+        return evicted
+
+    def _discard_if_unused(self, cache_key: str) -> bool:
+        """Remove the environment unless another build holds it."""
+        lock = self.entry_lock(cache_key)
+        if not lock.acquire(blocking=False):
+            return False
+        try:
+            self.discard(cache_key)
+        finally:
+            lock.release()
+        return True
+
+
+class CachedVenvManager(IsolatedVenvManager):
+    """A venv context manager whose environment persists in a BuildEnvCache.
+
+    On entry an already installed environment for cache_key is reused and
+    ``reused`` is set. Otherwise a new venv is created in the cache; callers
+    install into it and call ``mark_ready`` once it is complete. Environments
+    that were never marked ready are removed on exit.
+    """
+
+    def __init__(
+        self,
+        project_name: str,
+        cache_key: str,
+        cache: Optional[BuildEnvCache] = None,
+        installer: Optional[InstallerBackend] = None,
+    ) -> None:
+        """Initialize the CachedVenvManager."""
+        super().__init__(project_name, installer=installer)
+        self.cache = cache or BuildEnvCache()
+        self.cache_key = cache_key
+        self._ready = False
+        self._lock = self.cache.entry_lock(cache_key)
+
+    def _allocate_venv_path(self) -> Path:
+        """Return the cache directory for this environment, emptied first."""
+        env_path = self.cache.env_path(self.cache_key)
+        if env_path.exists():
+            shutil.rmtree(env_path)
+        env_path.mkdir(parents=True)
+        return env_path
+
+    def _reuse_cached_venv(self) -> bool:
+        """Point this manager at the cached environment if it is usable."""
+        if not self.cache.is_ready(self.cache_key):
+            return False
+        self.venv_path = self.cache.env_path(self.cache_key)
+        self._set_executables()
+        if not Path(self.python_executable).exists():
+            logger.warning(
+                "Cached build environment %s is broken. Recreating it.",
+                self.venv_path,
+            )
+            self.cache.discard(self.cache_key)
+            self.venv_path = None
+            return False
+        self.cache.touch(self.cache_key)
+        logger.info(
+            "Reusing cached build environment for '%s' at: %s",
+            self.project_name,
+            self.venv_path,
+        )
+        return True
+
+    def mark_ready(self) -> None:
+        """Record the environment as fully installed so it can be reused."""
+        if self.reused or self.venv_path is None:
+            return
+        self.cache.mark_ready(
+            self.cache_key,
+            {"project_name": self.project_name, "installer": self.installer.name},
+        )
+        self._ready = True
+
+    def __enter__(self) -> "CachedVenvManager":
+        """Reuse or create the cached virtual environment."""
+        self._lock.acquire()
+        try:
+            if self._reuse_cached_venv():
+                self.reused = True
+                self._ready = True
+                return self
+            super().__enter__()
+        except BaseException:
+            self._lock.release()
+            raise
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        """Keep a ready environment, remove an incomplete one, then evict."""
+        _ = exc_type, exc_val, exc_tb
+        try:
+            if not self._ready:
+                self._cleanup()
+        finally:
+            self._lock.release()
+        self.cache.evict()
+        return False
+
+
+def build_env_manager(project_name: str, cache_key: str) -> IsolatedVenvManager:
+    """Return the venv manager for a build, cached unless disabled in config."""
+    if ConfigManager().get_env_cache_enabled():
+        return CachedVenvManager(project_name=project_name, cache_key=cache_key)
+    return IsolatedVenvManager(project_name=project_name)
+
+
+def docstrings_env_manager(
+    project_name: str, project_version: Optional[str], project_root: Path
+) -> IsolatedVenvManager:
+    """Return the venv manager shared by the docstrings builders.
+
+    pdoc3 and pydoctor install the same tools and project requirements, so a
+    pydoctor fallback after a failed pdoc3 build reuses the pdoc3 environment.
+    """
+    cache_key = compute_env_key(
+        DOCSTRINGS_ENV_NAME,
+        project_name,
+        project_version,
+        DOCSTRINGS_TOOL_PACKAGES,
+        [project_root / req_file for req_file in COMMON_PROJECT_REQUIREMENTS_FILES],
+        project_root=project_root,
+    )
+    return build_env_manager(project_name=project_name, cache_key=cache_key)
+
+
+def docstrings_install_config(project_root: Path) -> InstallConfig:
+    """Return the install config of the shared docstrings environment."""
+    return InstallConfig(
+        project_root_for_install=project_root,
+        tool_specific_packages=list(DOCSTRINGS_TOOL_PACKAGES),
+        scan_for_project_requirements=True,
+        install_project_editable=True,
+    )
+
+
+def pydoctor_tool_env_manager() -> IsolatedVenvManager:
+    """Return the venv manager of the shared pydoctor tool environment.
+
+    pydoctor only parses sources, so one environment holding pydoctor alone
+    serves every project. Its key does not depend on any project.
+    """
+    cache_key = compute_env_key(
+        PYDOCTOR_TOOL_ENV_NAME, PYDOCTOR_TOOL_ENV_NAME, None, PYDOCTOR_TOOL_PACKAGES
+    )
+    return build_env_manager(project_name=PYDOCTOR_TOOL_ENV_NAME, cache_key=cache_key)
+
+
+def pydoctor_tool_install_config(project_root: Path) -> InstallConfig:
+    """Return the install config of the shared pydoctor tool environment."""
+    return InstallConfig(
+        project_root_for_install=project_root,
+        tool_specific_packages=list(PYDOCTOR_TOOL_PACKAGES),
+        scan_for_project_requirements=False,
+        install_project_editable=False,
+    )
@@ -9,6 +9,12 @@ from pathlib import Path
 from types import TracebackType
 from typing import Optional
 
+from devildex.utils.installer_backend import (
+    InstallerBackend,
+    resolve_installer_backend,
+)
+from devildex.utils.resource_limits import STAGE_INSTALL, ResourceLimits
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,41 +30,71 @@ class VenvInitializationError(RuntimeError):
 class IsolatedVenvManager:
     """A context manager to create and manage a Python virtual environment."""
 
-    def __init__(self, project_name: str, base_temp_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        project_name: str,
+        base_temp_dir: Path | None = None,
+        installer: InstallerBackend | None = None,
+    ) -> None:
         """Initialize the IsolatedVenvManager."""
         self.project_name = project_name
         self.base_temp_dir = base_temp_dir or Path(tempfile.gettempdir())
+        self.installer = installer or resolve_installer_backend()
         self.venv_path: Path | None = None
         self.python_executable: str | None = None
         self.pip_executable: str | None = None
+        self.reused = False
 
-    def _create_venv(self) -> None:
-        """Create the virtual environment."""
-        self.venv_path = Path(
+    def mark_ready(self) -> None:
+        """Mark the installed environment as complete.
+
+        Temporary venvs are never reused, so this is a no-op here.
+        """
+
+    def _allocate_venv_path(self) -> Path:
+        """Return the directory in which the venv will be created."""
+        return Path(
             tempfile.mkdtemp(
                 prefix=f"devildex_venv_{self.project_name}_", dir=self.base_temp_dir
             )
         )
+
+    def _set_executables(self) -> None:
+        """Set the python and pip executable paths from venv_path."""
+        bin_dir = self.venv_path / ("Scripts" if sys.platform == "win32" else "bin")
+        self.python_executable = str(
+            bin_dir / ("python.exe" if sys.platform == "win32" else "python")
+        )
+        self.pip_executable = str(
+            bin_dir / ("pip.exe" if sys.platform == "win32" else "pip")
+        )
+
+    @staticmethod
+    def _install_timeout() -> float | None:
+        """Return the configured timeout of install steps."""
+        return ResourceLimits.for_stage(STAGE_INSTALL).timeout_seconds
+
+    def _create_venv(self) -> None:
+        """Create the virtual environment."""
+        self.venv_path = self._allocate_venv_path()
         logger.info(
-            "Creating temporary venv for '%s' at: %s", self.project_name, self.venv_path
+            "Creating temporary venv for '%s' at: %s (installer: %s)",
+            self.project_name,
+            self.venv_path,
+            self.installer.name,
         )
         logger.debug(f"DEBUG VENV_CM: Attempting to create venv at: {self.venv_path}")
 
         try:
             subprocess.run(  # noqa: S603
-                [sys.executable, "-m", "venv", str(self.venv_path)],
+                self.installer.venv_command(self.venv_path),
                 check=True,
                 capture_output=True,
                 text=True,
+                timeout=self._install_timeout(),
             )
 
-            bin_dir = self.venv_path / ("Scripts" if sys.platform == "win32" else "bin")
-            self.python_executable = str(
-                bin_dir / ("python.exe" if sys.platform == "win32" else "python")
-            )
-            self.pip_executable = str(
-                bin_dir / ("pip.exe" if sys.platform == "win32" else "pip")
-            )
+            self._set_executables()
             logger.debug(
                 f"DEBUG VENV_CM: VENV CREATED. Python executable: "
                 f"{self.python_executable}"
@@ -79,7 +115,8 @@ class IsolatedVenvManager:
             logger.info("  Python executable: %s", self.python_executable)
             logger.info("  Pip executable: %s", self.pip_executable)
 
-            self._upgrade_pip()
+            if self.installer.needs_pip_upgrade:
+                self._upgrade_pip()
 
         except subprocess.CalledProcessError:
             logger.exception("Failed to create venv for '%s'", self.project_name)
@@ -106,12 +143,15 @@ class IsolatedVenvManager:
                 capture_output=True,
                 text=True,
                 cwd=self.venv_path,
+                timeout=self._install_timeout(),
             )
             logger.info("Pip upgraded successfully in venv.")
         except subprocess.CalledProcessError as e:
             logger.warning(
                 "Failed to upgrade pip in venv '%s': %s", self.venv_path, e.stderr
             )
+        except subprocess.TimeoutExpired:
+            logger.warning("Upgrading pip in venv '%s' timed out.", self.venv_path)
 
     def _cleanup(self) -> None:
         """Remove the temporary virtual environment directory."""
@@ -3,14 +3,39 @@
 import logging
 import os
 import subprocess
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
 from devildex.utils.deps_utils import filter_requirements_lines
+from devildex.utils.installer_backend import backend_for_pip_executable
+from devildex.utils.progress import TaskProgress, current_task_progress
+from devildex.utils.resource_limits import (
+    KILL_GRACE_SECONDS,
+    STAGE_BUILD,
+    STAGE_INSTALL,
+    ResourceLimits,
+    apply_resource_limits,
+    kill_process_group,
+    popen_isolation_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_TAIL_LINES = 200
+COMMAND_TIMEOUT_RETURN_CODE = -6
+COMMON_PROJECT_REQUIREMENTS_FILES = [
+    "requirements.txt",
+    "docs/requirements.txt",
+    "doc/requirements.txt",
+    "requirements/docs.txt",
+    "requirements/doc.txt",
+    "requirements-docs.txt",
+    "dev-requirements.txt",
+]
+
 
 @dataclass
 class InstallConfig:
@@ -22,6 +47,12 @@ class InstallConfig:
     install_project_editable: bool = True
 
 
+def _build_install_command(pip_executable: str, install_args: list[str]) -> list[str]:
+    """Build the install command with the backend that created the venv."""
+    backend = backend_for_pip_executable(pip_executable)
+    return backend.install_command(pip_executable, install_args)
+
+
 def _install_base_packages_in_venv(
     pip_executable: str, project_name: str, packages_list: list[str]
 ) -> bool:
@@ -31,15 +62,11 @@ def _install_base_packages_in_venv(
         ", ".join(packages_list),
         project_name,
     )
-    install_cmd = [
-        pip_executable,
-        "install",
-        "--disable-pip-version-check",
-        "--no-python-version-warning",
-        *packages_list,
-    ]
+    install_cmd = _build_install_command(pip_executable, packages_list)
     stdout, stderr, ret_code = execute_command(
-        install_cmd, f"Install/Verify base packages for {project_name}"
+        install_cmd,
+        f"Install/Verify base packages for {project_name}",
+        stage=STAGE_INSTALL,
     )
     if ret_code != 0:
         logger.error(
@@ -106,18 +133,14 @@ def _install_project_editable_in_venv(
         project_name,
         project_root_for_install,
     )
-    install_cmd = [
-        pip_executable,
-        "install",
-        "--disable-pip-version-check",
-        "--no-python-version-warning",
-        "-e",
-        str(project_root_for_install),
-    ]
+    install_cmd = _build_install_command(
+        pip_executable, ["-e", str(project_root_for_install)]
+    )
     _, _, ret_code = execute_command(
         install_cmd,
         f"Editable install of {project_name}",
         cwd=project_root_for_install,
+        stage=STAGE_INSTALL,
     )
     if ret_code == 0:
         logger.info(
@@ -195,18 +218,14 @@ def _install_doc_requirements_in_venv(
         )
         return False
 
-    req_install_cmd = [
-        pip_executable,
-        "install",
-        "--disable-pip-version-check",
-        "--no-python-version-warning",
-        "-r",
-        requirements_filename_to_use,
-    ]
+    req_install_cmd = _build_install_command(
+        pip_executable, ["-r", requirements_filename_to_use]
+    )
     _, _, ret_code = execute_command(
         req_install_cmd,
         f"Install doc requirements for {project_name}",
         cwd=doc_requirements_path.parent,
+        stage=STAGE_INSTALL,
     )
     if ret_code == 0:
         logger.info(
@@ -333,28 +352,104 @@ def _handle_command_result(
     return process.returncode
 
 
+def _pump_stream(
+    stream: IO[str], tail: deque[str], progress: Optional[TaskProgress]
+) -> None:
+    """Read a pipe line by line into a bounded tail and the task progress."""
+    for line in stream:
+        tail.append(line)
+        if progress is not None:
+            progress.add_line(line)
+    stream.close()
+
+
+def _run_streaming(
+    command: list[str],
+    cwd: str | None,
+    env: dict[str, str],
+    limits: ResourceLimits,
+) -> subprocess.CompletedProcess:
+    """Run command while streaming its output.
+
+    Only the last OUTPUT_TAIL_LINES lines of each stream are kept in memory.
+    The full output goes to the log file of the task running the command.
+    The command runs in its own process group under limits; on timeout the
+    whole group is killed.
+    """
+    progress = current_task_progress()
+    stdout_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    timed_out = False
+    with subprocess.Popen(  # noqa: S603
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+        **popen_isolation_kwargs(),
+    ) as process:
+        apply_resource_limits(process.pid, limits)
+        readers = [
+            threading.Thread(
+                target=_pump_stream, args=(pipe, tail, progress), daemon=True
+            )
+            for pipe, tail in (
+                (process.stdout, stdout_tail),
+                (process.stderr, stderr_tail),
+            )
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            return_code = process.wait(timeout=limits.timeout_seconds)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            kill_process_group(process)
+            return_code = COMMAND_TIMEOUT_RETURN_CODE
+        for reader in readers:
+            reader.join(timeout=KILL_GRACE_SECONDS)
+        if any(reader.is_alive() for reader in readers):
+            logger.warning("Killing processes left behind by: %s", " ".join(command))
+            kill_process_group(process)
+            for reader in readers:
+                reader.join()
+    if timed_out:
+        message = f"Command timed out after {limits.timeout_seconds:g} seconds.\n"
+        logger.error("%s %s", " ".join(command), message.strip())
+        stderr_tail.append(message)
+    return subprocess.CompletedProcess(
+        command, return_code, "".join(stdout_tail), "".join(stderr_tail)
+    )
+
+
 def execute_command(
     command: list[str],
     description: str,
     cwd: str | Path | None = None,
     env: Optional[dict] = None,
+    stage: str = STAGE_BUILD,
 ) -> tuple[str, str, int]:
-    """Execute a command of shell and returns stdout, stderr and return code."""
+    """Execute a command of shell and returns stdout, stderr and return code.
+
+    Output is streamed, so stdout and stderr only hold the last
+    OUTPUT_TAIL_LINES lines of each stream. The timeout and resource limits
+    configured for stage apply; a timed out command returns
+    COMMAND_TIMEOUT_RETURN_CODE.
+    """
     if not command:
         return "", "empty command list", -1
     cwd_str = str(cwd) if cwd else None
     command_str_for_log = " ".join(command)
+    progress = current_task_progress()
+    if progress is not None:
+        progress.start_step(description)
     try:
         current_env = _prepare_command_env(os.environ.copy(), env)
-        process = subprocess.run(  # noqa: S603
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=cwd_str,
-            encoding="utf-8",
-            errors="replace",
-            env=current_env,
+        process = _run_streaming(
+            command, cwd_str, current_env, ResourceLimits.for_stage(stage)
         )
 
         ret_code = _handle_command_result(process, command, description, cwd_str)
@@ -400,19 +495,10 @@ def _install_common_project_requirements(
         project_name,
         project_root,
     )
-    potential_req_files_relative = [
-        "requirements.txt",
-        "docs/requirements.txt",
-        "doc/requirements.txt",
-        "requirements/docs.txt",
-        "requirements/doc.txt",
-        "requirements-docs.txt",
-        "dev-requirements.txt",
-    ]
     all_installations_successful = True
     found_any_req_file = False
 
-    for req_file_rel_path in potential_req_files_relative:
+    for req_file_rel_path in COMMON_PROJECT_REQUIREMENTS_FILES:
         req_file_abs_path = project_root / req_file_rel_path
         if req_file_abs_path.is_file():
             found_any_req_file = True
@@ -421,18 +507,14 @@ def _install_common_project_requirements(
                 project_name,
                 req_file_abs_path,
             )
-            pip_command_reqs = [
-                pip_executable,
-                "install",
-                "--disable-pip-version-check",
-                "--no-python-version-warning",
-                "-r",
-                str(req_file_abs_path),
-            ]
+            pip_command_reqs = _build_install_command(
+                pip_executable, ["-r", str(req_file_abs_path)]
+            )
             stdout_req, stderr_req, return_code_reqs = execute_command(
                 pip_command_reqs,
                 f"Install project requirements from {req_file_abs_path.name} "
                 f"for {project_name}",
+                stage=STAGE_INSTALL,
             )
             if return_code_reqs != 0:
                 logger.warning(
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
+import platformdirs
 import pytest
 import wx
 from pytest_mock import MockerFixture
@@ -40,6 +41,25 @@ def configure_logging() -> None:
     logging.basicConfig(level=logging.DEBUG)
 
 
+@pytest.fixture(autouse=True)
+def isolated_app_dirs(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Point the application's data, cache and log dirs at a temporary dir.
+
+    Build environments, doctrees, the docset store and theme assets then
+    never land in the developer's real directories.
+    """
+    root = tmp_path_factory.mktemp("app_dirs")
+    for name in ("user_data_dir", "user_cache_dir", "user_log_dir"):
+        monkeypatch.setattr(
+            platformdirs.PlatformDirs,
+            name,
+            property(lambda _self, path=str(root / name): path),
+        )
+    return root
+
+
 @pytest.fixture(scope="session")
 def free_port() -> int:
     """Fixture to provide a free port for testing."""
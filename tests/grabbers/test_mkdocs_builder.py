@@ -9,6 +9,7 @@ import yaml
 from pytest_mock import MockerFixture
 
 from devildex.grabbers.mkdocs_builder import (
+    MkDocsBuildCache,
     MkDocsBuilder,
     _find_mkdocs_config_file,
     _find_mkdocs_doc_requirements_file,
@@ -35,6 +36,12 @@ def mock_build_context(tmp_path: Path) -> BuildContext:
     )
 
 
+@pytest.fixture(autouse=True)
+def no_build_cache(mocker: MockerFixture) -> None:
+    """Build without the persistent MkDocs cache unless a test enables it."""
+    mocker.patch.object(MkDocsBuilder, "_build_cache", return_value=None)
+
+
 @pytest.fixture
 def mkdocs_project_setup(tmp_path: Path) -> Path:
     """Set up a basic MkDocs project in a temporary directory."""
@@ -115,8 +122,9 @@ class TestMkDocsBuilder:
         mock_venv_instance = MagicMock()
         mock_venv_instance.python_executable = str(Path("/mock/venv/bin/python"))
         mock_venv_instance.pip_executable = str(Path("/mock/venv/bin/pip"))
+        mock_venv_instance.reused = False
         mock_venv_manager = mocker.patch(
-            "devildex.grabbers.mkdocs_builder.IsolatedVenvManager"
+            "devildex.grabbers.mkdocs_builder.build_env_manager"
         )
         mock_venv_manager.return_value.__enter__.return_value = mock_venv_instance
         mock_install_deps = mocker.patch(
@@ -208,8 +216,9 @@ class TestMkDocsBuilder:
         mock_venv_instance = MagicMock()
         mock_venv_instance.python_executable = str(Path("/mock/venv/bin/python"))
         mock_venv_instance.pip_executable = str(Path("/mock/venv/bin/pip"))
+        mock_venv_instance.reused = False
         mock_venv_manager = mocker.patch(
-            "devildex.grabbers.mkdocs_builder.IsolatedVenvManager"
+            "devildex.grabbers.mkdocs_builder.build_env_manager"
         )
         mock_venv_manager.return_value.__enter__.return_value = mock_venv_instance
         mocker.patch(
@@ -352,3 +361,102 @@ class TestMkDocsBuilder:
             parsed_config = _parse_mkdocs_config(non_existent_file)
         assert parsed_config is None
         assert "Error reading MkDocs Config file" in caplog.text
+
+
+@pytest.fixture
+def incremental_build(
+    mocker: MockerFixture, tmp_path: Path
+) -> tuple[MkDocsBuildCache, MagicMock]:
+    """Enable the build cache and fake the venv and the mkdocs command."""
+    build_cache = MkDocsBuildCache(tmp_path / "mkdocs_cache")
+    mocker.patch.object(MkDocsBuilder, "_build_cache", return_value=build_cache)
+    mock_venv_instance = MagicMock()
+    mock_venv_instance.python_executable = "python"
+    mock_venv_instance.reused = True
+    mocker.patch(
+        "devildex.grabbers.mkdocs_builder.build_env_manager"
+    ).return_value.__enter__.return_value = mock_venv_instance
+
+    def _fake_mkdocs(command: list[str], *_args: object, **_kwargs: object) -> tuple:
+        site_dir = Path(command[command.index("--site-dir") + 1])
+        site_dir.mkdir(parents=True, exist_ok=True)
+        (site_dir / "index.html").write_text("<html></html>")
+        return "", "", 0
+
+    mock_execute = mocker.patch(
+        "devildex.grabbers.mkdocs_builder.execute_command", side_effect=_fake_mkdocs
+    )
+    return build_cache, mock_execute
+
+
+def test_incremental_build_reuses_config_and_builds_dirty(
+    mocker: MockerFixture,
+    mkdocs_project_setup: Path,
+    mock_build_context: BuildContext,
+    incremental_build: tuple[MkDocsBuildCache, MagicMock],
+    tmp_path: Path,
+) -> None:
+    """Verify a second unchanged build reuses the config and runs --dirty."""
+    build_cache, mock_execute = incremental_build
+    spy_parse = mocker.spy(MkDocsBuilder, "_get_and_parse_mkdocs_config")
+    builder = MkDocsBuilder()
+    output_path = tmp_path / "output"
+    final_dir = output_path / "test-mkdocs-project" / "1.0.0"
+
+    assert builder.generate_docset(
+        mkdocs_project_setup, output_path, mock_build_context
+    )
+    assert builder.generate_docset(
+        mkdocs_project_setup, output_path, mock_build_context
+    )
+
+    assert spy_parse.call_count == 1
+    first_command = mock_execute.call_args_list[0].args[0]
+    second_command = mock_execute.call_args_list[1].args[0]
+    assert "--dirty" not in first_command
+    assert "--dirty" in second_command
+    assert str(build_cache.config_file) in second_command
+    assert (final_dir / "index.html").is_file()
+    assert (build_cache.site_dir / "index.html").is_file()
+
+
+def test_incremental_build_is_clean_after_page_added(
+    mkdocs_project_setup: Path,
+    mock_build_context: BuildContext,
+    incremental_build: tuple[MkDocsBuildCache, MagicMock],
+    tmp_path: Path,
+) -> None:
+    """Verify adding a page forces a clean build, since the nav changes."""
+    _build_cache, mock_execute = incremental_build
+    builder = MkDocsBuilder()
+    output_path = tmp_path / "output"
+
+    builder.generate_docset(mkdocs_project_setup, output_path, mock_build_context)
+    (mkdocs_project_setup / "docs" / "new_page.md").write_text("# New")
+    builder.generate_docset(mkdocs_project_setup, output_path, mock_build_context)
+
+    assert "--dirty" not in mock_execute.call_args_list[1].args[0]
+
+
+def test_incremental_build_failure_keeps_previous_output(
+    mkdocs_project_setup: Path,
+    mock_build_context: BuildContext,
+    incremental_build: tuple[MkDocsBuildCache, MagicMock],
+    tmp_path: Path,
+) -> None:
+    """Verify a failed build leaves the published site and forces a clean build."""
+    build_cache, mock_execute = incremental_build
+    builder = MkDocsBuilder()
+    output_path = tmp_path / "output"
+    final_dir = output_path / "test-mkdocs-project" / "1.0.0"
+    builder.generate_docset(mkdocs_project_setup, output_path, mock_build_context)
+
+    mock_execute.side_effect = None
+    mock_execute.return_value = ("", "error", 1)
+    result = builder.generate_docset(
+        mkdocs_project_setup, output_path, mock_build_context
+    )
+
+    assert result is False
+    assert (final_dir / "index.html").is_file()
+    assert not build_cache.can_build_dirty(build_cache.load_state()["docs_fingerprint"])
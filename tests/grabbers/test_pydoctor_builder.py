@@ -0,0 +1,108 @@
+"""Test pydoctor builder."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.grabbers.pydoctor_builder import PydoctorBuilder
+from devildex.orchestrator.context import BuildContext
+from devildex.utils.venv_cache import pydoctor_tool_install_config
+
+
+@pytest.fixture
+def package_dir(tmp_path: Path) -> Path:
+    """Create a small package."""
+    package = tmp_path / "source" / "tinypkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Tiny package."""\n')
+    return package
+
+
+@pytest.fixture
+def build_context(tmp_path: Path) -> BuildContext:
+    """Fixture for a BuildContext."""
+    return BuildContext(
+        project_name="tinypkg",
+        project_version="1.0.0",
+        base_output_dir=tmp_path / "output",
+        source_root=tmp_path / "source",
+    )
+
+
+def _mock_env(mocker: MockerFixture, target: str, reused: bool) -> MagicMock:
+    """Patch a venv manager factory to yield a fake environment."""
+    venv = MagicMock(
+        python_executable="/env/bin/python",
+        pip_executable="/env/bin/pip",
+        reused=reused,
+    )
+    manager = mocker.patch(f"devildex.utils.venv_cache.{target}")
+    manager.return_value.__enter__.return_value = venv
+    return venv
+
+
+@pytest.mark.parametrize("fast_path", [True, False])
+def test_generate_docset_environment_by_fast_path(
+    mocker: MockerFixture,
+    package_dir: Path,
+    build_context: BuildContext,
+    tmp_path: Path,
+    fast_path: bool,
+) -> None:
+    """Verify the fast path uses the shared tool env and never installs the project."""
+    mocker.patch(
+        "devildex.grabbers.pydoctor_builder.ConfigManager"
+    ).return_value.get_pydoctor_fast_path.return_value = fast_path
+    tool_venv = _mock_env(mocker, "pydoctor_tool_env_manager", reused=False)
+    project_venv = _mock_env(mocker, "docstrings_env_manager", reused=False)
+    install = mocker.patch(
+        "devildex.utils.venv_utils.install_environment_dependencies",
+        return_value=True,
+    )
+    execute = mocker.patch(
+        "devildex.utils.venv_utils.execute_command", return_value=("", "", 0)
+    )
+
+    assert PydoctorBuilder().generate_docset(
+        package_dir, tmp_path / "output", build_context
+    )
+
+    install_config = install.call_args.args[2]
+    assert install_config.install_project_editable is not fast_path
+    assert install_config.scan_for_project_requirements is not fast_path
+    used_venv = tool_venv if fast_path else project_venv
+    used_venv.mark_ready.assert_called_once()
+    command = execute.call_args.args[0]
+    assert command[0] == "/env/bin/python"
+    assert command[-1] == "tinypkg"
+    assert execute.call_args.kwargs["cwd"] == package_dir.parent
+
+
+def test_generate_docset_reuses_ready_tool_env(
+    mocker: MockerFixture,
+    package_dir: Path,
+    build_context: BuildContext,
+    tmp_path: Path,
+) -> None:
+    """Verify a ready tool environment is used without installing anything."""
+    mocker.patch(
+        "devildex.grabbers.pydoctor_builder.ConfigManager"
+    ).return_value.get_pydoctor_fast_path.return_value = True
+    _mock_env(mocker, "pydoctor_tool_env_manager", reused=True)
+    install = mocker.patch("devildex.utils.venv_utils.install_environment_dependencies")
+    mocker.patch("devildex.utils.venv_utils.execute_command", return_value=("", "", 0))
+
+    assert PydoctorBuilder().generate_docset(
+        package_dir, tmp_path / "output", build_context
+    )
+    install.assert_not_called()
+
+
+def test_pydoctor_tool_install_config_skips_project(tmp_path: Path) -> None:
+    """Verify the tool environment only installs pydoctor."""
+    config = pydoctor_tool_install_config(tmp_path)
+    assert config.tool_specific_packages == ["pydoctor"]
+    assert not config.install_project_editable
+    assert not config.scan_for_project_requirements
@@ -1,17 +1,60 @@
 """Test for readthedocs api."""
 
 import logging
+import zipfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pytest_mock import MockerFixture
 
-from devildex.grabbers.readthedocs_downloader import ReadTheDocsDownloader
+from devildex.grabbers.readthedocs_downloader import (
+    ReadTheDocsDownloader,
+    clear_versions_cache,
+    rtd_project_slug,
+)
 from devildex.orchestrator.context import BuildContext
 
 logger = logging.getLogger(__name__)
 
+TOTAL_VERSIONS = 7
+PAGE_SIZE = 2
+EXPECTED_PAGE_REQUESTS = 4
+HTMLZIP_URL = "https://example.org/media/htmlzip/project/v1.2.zip"
+
+
+@pytest.fixture(autouse=True)
+def fresh_versions_cache() -> Iterator[None]:
+    """Forget version lists cached by earlier tests."""
+    clear_versions_cache()
+    yield
+    clear_versions_cache()
+
+
+def _version(slug: str, built: bool = True) -> dict:
+    """Return an RTD API version entry."""
+    return {
+        "slug": slug,
+        "verbose_name": slug,
+        "active": True,
+        "built": built,
+        "downloads": {"htmlzip": f"//example.org/media/htmlzip/{slug}.zip"},
+    }
+
+
+def _paged_versions_response(url: str, params: dict, timeout: int) -> MagicMock:
+    """Answer a versions API call with one page of a fake version list."""
+    versions = [_version(f"{number}.0") for number in range(TOTAL_VERSIONS)]
+    offset = params["offset"]
+    response = MagicMock()
+    response.json.return_value = {
+        "count": TOTAL_VERSIONS,
+        "results": versions[offset : offset + PAGE_SIZE],
+    }
+    return response
+
 
 @pytest.fixture
 def rtd_downloader() -> ReadTheDocsDownloader:
@@ -93,3 +136,79 @@ def test_can_handle_returns_false_for_other_doc_types(
         rtd_downloader.can_handle(mock_build_context.source_root, mock_build_context)
         is False
     )
+
+
+@pytest.mark.parametrize(
+    ("urls", "expected"),
+    [
+        (["https://requests.readthedocs.io/en/latest/"], "requests"),
+        (["https://github.com/x/y", "https://Black.ReadTheDocs.io"], "black"),
+        (["https://readthedocs.org/projects/six/"], "six"),
+        (["https://docs.pytest.org/", None], None),
+        (["https://readthedocs.io/"], None),
+    ],
+)
+def test_rtd_project_slug(urls: list[Optional[str]], expected: Optional[str]) -> None:
+    """Verify the RTD project is read from its documentation URLs."""
+    assert rtd_project_slug(urls) == expected
+
+
+def test_fetch_available_versions_pages_concurrently_and_caches(
+    rtd_downloader: ReadTheDocsDownloader, mocker: MockerFixture
+) -> None:
+    """Verify every page is fetched once and the list is then cached."""
+    mock_get = mocker.patch(
+        "devildex.grabbers.readthedocs_downloader.requests.get",
+        side_effect=_paged_versions_response,
+    )
+
+    versions = rtd_downloader._fetch_available_versions("project")
+    cached = rtd_downloader._fetch_available_versions("project")
+
+    assert [version["slug"] for version in versions] == [
+        f"{number}.0" for number in range(TOTAL_VERSIONS)
+    ]
+    assert cached == versions
+    assert mock_get.call_count == EXPECTED_PAGE_REQUESTS
+    offsets = sorted(call.kwargs["params"]["offset"] for call in mock_get.mock_calls)
+    assert offsets == [0, 2, 4, 6]
+
+
+def test_find_prebuilt_download_matches_exact_version(
+    rtd_downloader: ReadTheDocsDownloader, mocker: MockerFixture
+) -> None:
+    """Verify only a built RTD version named like the package version is used."""
+    mocker.patch.object(
+        rtd_downloader,
+        "_fetch_available_versions",
+        return_value=[_version("latest"), _version("v1.2"), _version("1.3", False)],
+    )
+
+    assert rtd_downloader.find_prebuilt_download("project", "1.2") == (
+        "https://example.org/media/htmlzip/v1.2.zip"
+    )
+    assert rtd_downloader.find_prebuilt_download("project", "1.3") is None
+    assert rtd_downloader.find_prebuilt_download("project", "9.9") is None
+
+
+def test_fetch_prebuilt_docset_flattens_archive(
+    rtd_downloader: ReadTheDocsDownloader, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify the htmlzip's top-level folder is dropped when extracting."""
+
+    def fake_download(file_url: str, local_filepath: Path) -> bool:
+        with zipfile.ZipFile(local_filepath, "w") as archive:
+            archive.writestr("project-v1.2/index.html", "<html></html>")
+            archive.writestr("project-v1.2/api/module.html", "<html></html>")
+        return True
+
+    mocker.patch.object(rtd_downloader, "_download_file", side_effect=fake_download)
+    target_dir = tmp_path / "project" / "1.2"
+    target_dir.mkdir(parents=True)
+    (target_dir / "stale.html").touch()
+
+    assert rtd_downloader.fetch_prebuilt_docset(HTMLZIP_URL, target_dir) is True
+    assert (target_dir / "index.html").is_file()
+    assert (target_dir / "api" / "module.html").is_file()
+    assert not (target_dir / "stale.html").exists()
+    assert sorted(path.name for path in target_dir.parent.iterdir()) == ["1.2"]
@@ -9,11 +9,15 @@ import pytest
 import requests
 from pytest_mock import MockerFixture
 
+from devildex.grabbers import sphinx_builder
 from devildex.grabbers.sphinx_builder import (
     CloneAttemptStatus,
     RtdCloningConfig,
+    SphinxBuildContext,
     SphinxBuilder,
 )
+from devildex.orchestrator.context import BuildContext
+from devildex.utils.core_budget import CoreBudget
 
 EXPECTED_CLONE_ATTEMPTS = 2
 
@@ -736,3 +740,117 @@ def test_handle_repository_cloning_new_clone_failure(
     assert clone_path is None
     assert effective_branch == "main"
     assert "Repository directory for 'test_project' not found" in caplog.text
+
+
+def _incremental_build_ctx(tmp_path: Path) -> SphinxBuildContext:
+    """Return a Sphinx build context with a persistent doctree dir."""
+    return SphinxBuildContext(
+        source_dir=tmp_path / "src",
+        clone_root=tmp_path,
+        doc_requirements_file=None,
+        project_install_root=tmp_path,
+        project_slug="proj",
+        version_identifier="1.0",
+        base_output_dir=tmp_path / "out",
+        doctree_dir=tmp_path / "doctrees",
+    )
+
+
+def test_run_sphinx_build_incremental_swaps_output(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify incremental builds keep doctrees and swap staging into place."""
+    builder = SphinxBuilder()
+    build_ctx = _incremental_build_ctx(tmp_path)
+    build_ctx.final_output_dir.mkdir(parents=True)
+    (build_ctx.final_output_dir / "index.html").write_text("old")
+    assert builder._prepare_output_dir(build_ctx)
+
+    def fake_sphinx(command: list[str], *_args: object, **_kwargs: object) -> tuple:
+        (Path(command[-1]) / "index.html").write_text("new")
+        return "", "", 0
+
+    mock_execute = mocker.patch(
+        "devildex.grabbers.sphinx_builder.execute_command", side_effect=fake_sphinx
+    )
+
+    result = builder._run_sphinx_build("/venv/bin/python", build_ctx)
+
+    command = mock_execute.call_args.args[0]
+    assert command[command.index("-d") + 1] == str(tmp_path / "doctrees")
+    assert command[-1] == str(build_ctx.build_output_dir)
+    assert result == str(build_ctx.final_output_dir)
+    assert (build_ctx.final_output_dir / "index.html").read_text() == "new"
+    assert not build_ctx.build_output_dir.exists()
+
+
+def test_run_sphinx_build_incremental_failure_keeps_output(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify a failed incremental build leaves the previous output in place."""
+    builder = SphinxBuilder()
+    build_ctx = _incremental_build_ctx(tmp_path)
+    build_ctx.final_output_dir.mkdir(parents=True)
+    (build_ctx.final_output_dir / "index.html").write_text("old")
+    assert builder._prepare_output_dir(build_ctx)
+    mocker.patch(
+        "devildex.grabbers.sphinx_builder.execute_command",
+        return_value=("", "error", 1),
+    )
+
+    assert builder._run_sphinx_build("/venv/bin/python", build_ctx) is False
+    assert (build_ctx.final_output_dir / "index.html").read_text() == "old"
+
+
+def test_execute_sphinx_retries_serially_when_parallel_unsafe(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify a failed -j build caused by an unsafe extension reruns serially."""
+    builder = SphinxBuilder()
+    mocker.patch.object(SphinxBuilder, "_serial_only_projects", set())
+    mocker.patch.object(sphinx_builder, "get_core_budget", return_value=CoreBudget(4))
+    build_ctx = _incremental_build_ctx(tmp_path)
+    mock_execute = mocker.patch(
+        "devildex.grabbers.sphinx_builder.execute_command",
+        side_effect=[
+            ("", "the foo extension is not safe for parallel reading", 1),
+            ("", "", 0),
+        ],
+    )
+
+    _, _, return_code = builder._execute_sphinx("/venv/bin/python", build_ctx)
+
+    parallel_command = mock_execute.call_args_list[0].args[0]
+    serial_command = mock_execute.call_args_list[1].args[0]
+    assert parallel_command[parallel_command.index("-j") + 1] == "4"
+    assert "-j" not in serial_command
+    assert return_code == 0
+    assert "proj" in SphinxBuilder._serial_only_projects
+
+
+def test_prepare_environment_installs_into_cached_env(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify the build environment is installed ahead of the build."""
+    source_dir = tmp_path / "docs"
+    source_dir.mkdir()
+    (source_dir / "conf.py").touch()
+    context = BuildContext(
+        project_name="proj",
+        project_version="1.0",
+        base_output_dir=tmp_path / "out",
+        project_slug="proj",
+        version_identifier="1.0",
+        project_root_for_install=tmp_path,
+    )
+    mocker.patch.object(
+        sphinx_builder.ConfigManager, "get_env_cache_enabled", return_value=True
+    )
+    mock_env_manager = mocker.patch.object(sphinx_builder, "build_env_manager")
+    mock_install = mocker.patch.object(
+        SphinxBuilder, "_prepare_build_env", return_value=True
+    )
+
+    assert SphinxBuilder().prepare_environment(source_dir, context) is True
+    mock_env_manager.return_value.__enter__.assert_called_once()
+    assert mock_install.call_args.args[1].source_dir == source_dir
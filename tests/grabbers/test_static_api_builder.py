@@ -0,0 +1,73 @@
+"""Test static API builder."""
+
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.grabbers.static_api_builder import StaticApiBuilder
+from devildex.orchestrator.context import BuildContext
+
+THEME_DIR = (
+    Path(__file__).parent.parent.parent
+    / "src"
+    / "devildex"
+    / "theming"
+    / "devildex_pdoc3_theme"
+)
+
+
+@pytest.fixture(autouse=True)
+def assets_root(mocker: MockerFixture, tmp_path: Path) -> Path:
+    """Publish shared theme assets below tmp_path."""
+    root = tmp_path / "theme_assets"
+    mocker.patch("devildex.theming.asset_bundle.default_assets_root", return_value=root)
+    return root
+
+
+@pytest.fixture
+def package_dir(tmp_path: Path) -> Path:
+    """Create a small package."""
+    package = tmp_path / "source" / "tinypkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Tiny package."""\n')
+    (package / "core.py").write_text('def run() -> None:\n    """Run."""\n')
+    return package
+
+
+@pytest.fixture
+def build_context(tmp_path: Path) -> BuildContext:
+    """Fixture for a BuildContext."""
+    return BuildContext(
+        project_name="tinypkg",
+        project_version="1.0.0",
+        base_output_dir=tmp_path / "output",
+        source_root=tmp_path / "source",
+    )
+
+
+def test_generate_docset_writes_pages_and_static_files(
+    package_dir: Path, build_context: BuildContext, tmp_path: Path, assets_root: Path
+) -> None:
+    """Verify the package is documented together with the theme assets."""
+    builder = StaticApiBuilder(template_dir=THEME_DIR)
+    output_path = tmp_path / "output"
+
+    assert builder.can_handle(package_dir, build_context)
+    assert builder.generate_docset(package_dir, output_path, build_context)
+    assert (output_path / "tinypkg" / "index.html").is_file()
+    assert (output_path / "tinypkg" / "core.html").is_file()
+    assert (output_path / "tinypkg" / "static" / "pdoc3_devildex.css").is_file()
+    assert (output_path / "tinypkg" / "static").resolve().parent == assets_root
+
+
+def test_generate_docset_without_package_fails(
+    build_context: BuildContext, tmp_path: Path
+) -> None:
+    """Verify a directory without a package is rejected."""
+    empty_dir = tmp_path / "source"
+    empty_dir.mkdir()
+    builder = StaticApiBuilder(template_dir=THEME_DIR)
+
+    assert not builder.can_handle(empty_dir, build_context)
+    assert not builder.generate_docset(empty_dir, tmp_path / "output", build_context)
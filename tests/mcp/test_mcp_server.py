@@ -7,6 +7,7 @@ import re
 import socket
 import subprocess
 import tempfile
+import threading
 import time
 from collections.abc import Generator
 from pathlib import Path
@@ -14,14 +15,20 @@ from typing import Any
 
 import pytest
 from fastmcp import Client
+from pytest_mock import MockerFixture
 
 from devildex.core import DevilDexCore
 from devildex.database.models import PackageDetails
 from devildex.local_data_parse import registered_project_parser
 from devildex.local_data_parse.registered_project_parser import RegisteredProjectData
+from devildex.mcp_server import server
 
 logger = logging.getLogger(__name__)
 
+WAIT_SECONDS = 5
+BLOCKING_WORKERS = 2
+CONCURRENT_CLIENTS = 6
+
 
 @pytest.fixture(scope="module")
 def free_port() -> int:
@@ -396,3 +403,70 @@ async def test_generate_and_delete_docset(mcp_server_process: tuple[int, str]) -
         )
         assert "error" in delete_again_response.data
         assert "No docset found" in delete_again_response.data["error"]
+
+
+@pytest.fixture
+def blocking_pool(mocker: MockerFixture) -> Generator[None, Any, None]:
+    """Give the tools a fresh blocking pool of BLOCKING_WORKERS threads."""
+    config = mocker.patch("devildex.mcp_server.server.ConfigManager").return_value
+    config.get_mcp_db_workers.return_value = BLOCKING_WORKERS
+    server._blocking_executor.cache_clear()
+    yield
+    server._blocking_executor().shutdown()
+    server._blocking_executor.cache_clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("blocking_pool")
+async def test_slow_database_read_does_not_block_other_tools(
+    mocker: MockerFixture,
+) -> None:
+    """Verify a tool waiting on the database leaves other tools responsive."""
+    release = threading.Event()
+    core = mocker.MagicMock(spec=DevilDexCore)
+    core.get_all_docsets_info.side_effect = lambda: (
+        [{"name": "requests"}] if release.wait(WAIT_SECONDS) else []
+    )
+    core.get_task_status.return_value = {"status": "COMPLETED"}
+    mocker.patch.object(server, "_core_instance", core)
+
+    slow_listing = asyncio.create_task(server.get_docsets_list.fn(all_projects=True))
+    status = await asyncio.wait_for(server.get_task_status.fn("task"), WAIT_SECONDS)
+
+    assert status == {"status": "COMPLETED"}
+    assert not slow_listing.done()
+    release.set()
+    assert await slow_listing == ["requests"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("blocking_pool")
+async def test_blocking_calls_are_bounded_by_the_pool(mocker: MockerFixture) -> None:
+    """Verify no more database reads run at once than the pool has threads."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def search(package: str, version: str | None) -> list[dict[str, str]]:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return []
+
+    core = mocker.MagicMock(spec=DevilDexCore)
+    core.search_for_docset.side_effect = search
+    mocker.patch.object(server, "_core_instance", core)
+
+    results = await asyncio.gather(
+        *(
+            server.delete_docset.fn(f"package-{index}")
+            for index in range(CONCURRENT_CLIENTS)
+        )
+    )
+
+    assert all("error" in result for result in results)
+    assert peak == BLOCKING_WORKERS
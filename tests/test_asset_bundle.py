@@ -0,0 +1,71 @@
+"""Tests for the shared theme asset bundles."""
+
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.theming.asset_bundle import (
+    bundle_fingerprint,
+    install_theme_assets,
+    publish_asset_bundle,
+)
+
+
+@pytest.fixture
+def theme_static(tmp_path: Path) -> Path:
+    """Create a small theme static directory."""
+    static_dir = tmp_path / "theme" / "static"
+    (static_dir / "css").mkdir(parents=True)
+    (static_dir / "css" / "theme.css").write_text("body {}\n")
+    return static_dir
+
+
+def test_publish_asset_bundle_is_fingerprinted_and_reused(
+    theme_static: Path, tmp_path: Path
+) -> None:
+    """Verify a theme is published once under a name derived from its content."""
+    assets_root = tmp_path / "assets"
+
+    bundle_dir = publish_asset_bundle("demo", theme_static, assets_root)
+    again = publish_asset_bundle("demo", theme_static, assets_root)
+
+    assert bundle_dir == again
+    assert bundle_dir.name == f"demo-{bundle_fingerprint(theme_static)}"
+    assert (bundle_dir / "css" / "theme.css").read_text() == "body {}\n"
+    assert [p.name for p in assets_root.iterdir()] == [bundle_dir.name]
+
+
+def test_install_theme_assets_links_docsets_to_one_bundle(
+    theme_static: Path, tmp_path: Path
+) -> None:
+    """Verify two docsets reference the same bundle instead of copies."""
+    assets_root = tmp_path / "assets"
+    first = tmp_path / "docsets" / "a" / "static"
+    second = tmp_path / "docsets" / "b" / "static"
+
+    install_theme_assets("demo", theme_static, first, assets_root)
+    install_theme_assets("demo", theme_static, second, assets_root)
+
+    assert first.is_symlink()
+    assert first.resolve() == second.resolve()
+    assert (second / "css" / "theme.css").is_file()
+
+
+def test_install_theme_assets_copies_when_disabled(
+    mocker: MockerFixture, theme_static: Path, tmp_path: Path
+) -> None:
+    """Verify the files are copied into the docset when sharing is off."""
+    mocker.patch(
+        "devildex.theming.asset_bundle.ConfigManager"
+    ).return_value.get_shared_theme_assets.return_value = False
+    target = tmp_path / "docset" / "static"
+    target.mkdir(parents=True)
+    (target / "stale.css").write_text("old")
+
+    install_theme_assets("demo", theme_static, target, tmp_path / "assets")
+
+    assert not target.is_symlink()
+    assert (target / "css" / "theme.css").is_file()
+    assert not (target / "stale.css").exists()
+    assert not (tmp_path / "assets").exists()
@@ -167,3 +167,37 @@ def test_resolve_package_source_path_project_name_variations(tmp_path: Path) ->
     )
     result_another = context_another.resolve_package_source_path("Another-Module")
     assert result_another == project_root.resolve()
+
+
+def test_select_requirements_installs_recorded_recipe(
+    mock_build_context: BuildContext,
+) -> None:
+    """Verify recorded requirements replace the base packages and file search."""
+    mock_build_context.doc_requirements = ["sphinx==7.2.6", "furo"]
+
+    def find_requirements_file() -> Path:
+        raise AssertionError
+
+    packages, requirements_file = mock_build_context.select_requirements(
+        ["sphinx"], find_requirements_file
+    )
+
+    assert packages == ["sphinx==7.2.6", "furo"]
+    assert requirements_file is None
+    assert mock_build_context.resolved_requirements == ["sphinx==7.2.6", "furo"]
+
+
+def test_select_requirements_resolves_found_file(
+    mock_build_context: BuildContext, tmp_path: Path
+) -> None:
+    """Verify the resolved requirements join base packages and the file's lines."""
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("sphinx\nfuro>=2024.1\n-e .\n", encoding="utf-8")
+
+    packages, found_file = mock_build_context.select_requirements(
+        ["sphinx"], lambda: requirements_file
+    )
+
+    assert packages == ["sphinx"]
+    assert found_file == requirements_file
+    assert mock_build_context.resolved_requirements == ["sphinx", "furo>=2024.1"]
@@ -0,0 +1,116 @@
+"""Tests for the builder registry."""
+
+from collections.abc import Iterator
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.grabbers.mkdocs_builder import MkDocsBuilder
+from devildex.grabbers.sphinx_builder import SphinxBuilder
+from devildex.orchestrator.builder_registry import (
+    BUILDER_ENTRY_POINT_GROUP,
+    BUILTIN_BUILDERS,
+    BuilderRegistry,
+    BuilderSpec,
+    discover_builder_specs,
+)
+from devildex.orchestrator.context import BuildContext
+
+
+@pytest.fixture
+def context(tmp_path: Path) -> BuildContext:
+    """Provide a minimal build context."""
+    return BuildContext(
+        project_name="project",
+        project_version="1.0",
+        base_output_dir=tmp_path / "output",
+        source_root=tmp_path,
+    )
+
+
+@pytest.fixture
+def fresh_specs() -> Iterator[None]:
+    """Forget the builder specs discovered by earlier tests."""
+    discover_builder_specs.cache_clear()
+    yield
+    discover_builder_specs.cache_clear()
+
+
+def test_detect_creates_only_consulted_builders(
+    mocker: MockerFixture, tmp_path: Path, context: BuildContext
+) -> None:
+    """Verify builders after the detected one are never created."""
+    mocker.patch.object(SphinxBuilder, "can_handle", return_value=tmp_path / "docs")
+    registry = BuilderRegistry(BUILTIN_BUILDERS)
+
+    detection = registry.detect(tmp_path, context)
+
+    assert detection is not None
+    assert detection.doc_type == "sphinx"
+    assert detection.evidence == tmp_path / "docs"
+    assert list(registry._builders) == ["sphinx"]
+
+
+def test_can_handle_is_asked_once_per_path(
+    mocker: MockerFixture, tmp_path: Path, context: BuildContext
+) -> None:
+    """Verify repeated detection reuses the builders' answers."""
+    sphinx = mocker.patch.object(SphinxBuilder, "can_handle", return_value=None)
+    mkdocs = mocker.patch.object(MkDocsBuilder, "can_handle", return_value=True)
+    registry = BuilderRegistry(BUILTIN_BUILDERS)
+
+    first = registry.detect(tmp_path, context)
+    second = registry.detect(tmp_path, context)
+
+    assert first == second
+    assert first is not None
+    assert first.doc_type == "mkdocs"
+    sphinx.assert_called_once()
+    mkdocs.assert_called_once()
+
+
+def test_unknown_doc_type_has_no_builder() -> None:
+    """Verify an unregistered or unloadable doc type gives no builder."""
+    registry = BuilderRegistry(
+        [BuilderSpec("broken", "devildex.grabbers.sphinx_builder:Missing")]
+    )
+
+    assert registry.builder("unknown") is None
+    assert registry.builder("broken") is None
+
+
+@pytest.mark.usefixtures("fresh_specs")
+def test_plugins_extend_and_override_builtins(mocker: MockerFixture) -> None:
+    """Verify entry point builders are added and replace built-ins by name."""
+    plugin_target = "devildex.grabbers.mkdocs_builder:MkDocsBuilder"
+    mocker.patch(
+        "devildex.orchestrator.builder_registry.entry_points",
+        return_value=[
+            EntryPoint("sphinx", plugin_target, BUILDER_ENTRY_POINT_GROUP),
+            EntryPoint("asciidoc", plugin_target, BUILDER_ENTRY_POINT_GROUP),
+        ],
+    )
+
+    specs = {spec.doc_type: spec for spec in discover_builder_specs()}
+
+    assert list(specs) == ["sphinx", "mkdocs", "docstrings", "asciidoc"]
+    assert specs["sphinx"].target == plugin_target
+    assert specs["asciidoc"].load() is MkDocsBuilder
+
+
+def test_detect_asks_preferred_doc_type_first(
+    mocker: MockerFixture, tmp_path: Path, context: BuildContext
+) -> None:
+    """Verify a recipe's doc type is asked before, and instead of, the others."""
+    sphinx = mocker.patch.object(SphinxBuilder, "can_handle", return_value=True)
+    mkdocs = mocker.patch.object(MkDocsBuilder, "can_handle", return_value=True)
+    registry = BuilderRegistry(BUILTIN_BUILDERS)
+
+    detection = registry.detect(tmp_path, context, preferred="mkdocs")
+
+    assert detection is not None
+    assert detection.doc_type == "mkdocs"
+    mkdocs.assert_called_once()
+    sphinx.assert_not_called()
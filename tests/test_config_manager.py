@@ -0,0 +1,23 @@
+"""Tests for the ConfigManager class."""
+
+from pytest_mock import MockerFixture
+
+from devildex.config_manager import DEFAULT_CONFIG, ConfigManager
+
+
+def test_getters_fall_back_to_defaults_without_loaded_config(
+    mocker: MockerFixture,
+) -> None:
+    """Verify the getters return the defaults when no config is loaded."""
+    mocker.patch.object(ConfigManager, "_instance", new=None)
+    mocker.patch.object(ConfigManager, "_initialize")
+    config = ConfigManager()
+    config._config = None
+
+    assert config.get_prebuilt_docs() is True
+    assert config.get_env_cache_max_entries() == int(
+        DEFAULT_CONFIG["build"]["env_cache_max_entries"]
+    )
+    assert (
+        config.get_installer_backend() == DEFAULT_CONFIG["build"]["installer_backend"]
+    )
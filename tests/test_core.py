@@ -1,17 +1,42 @@
 """Tests for the DevilDexCore class."""
 
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from devildex.core import DevilDexCore
-from devildex.database.models import PackageDetails
+from devildex.database import db_manager as database
+from devildex.database.models import (
+    Base,
+    DocRecipe,
+    Docset,
+    PackageDetails,
+    PackageInfo,
+    StageCheckpoint,
+)
+from devildex.orchestrator.documentation_orchestrator import (
+    BUILD_STAGE,
+    FETCH_STAGE,
+    StageFailure,
+)
+from devildex.utils.docset_store import DocsetStore
+from devildex.utils.venv_cache import ENV_METADATA_FILENAME
 
 EXPECTED_SCANNED_PACKAGES_NO_EXPLICIT = 3
 EXPECTED_RMTEE_CALL_COUNT = 2
 EXPECTED_SCANNED_PACKAGES_EXPLICIT = 2
+PIPELINE_WAIT_SECONDS = 10
+PREWARM_HOLD_SECONDS = 0.2
+PREWARM_CANDIDATES = 5
+ENV_CACHE_MAX_ENTRIES = 3
 
 
 @pytest.fixture
@@ -47,6 +72,7 @@ def core_with_db(
     mock_app_paths_instance = mock_app_paths_class.return_value
     mock_app_paths_instance.docsets_base_dir = tmp_path / "docsets"
     mock_app_paths_instance.database_path = db_url.replace("sqlite:///", "")
+    mock_app_paths_instance.user_log_dir = tmp_path
     mocker.patch.dict("os.environ", {"DEVILDEX_DEV_MODE": "0"})
     instance = DevilDexCore(database_url=db_url)
     return instance
@@ -62,16 +88,43 @@ def test_bootstrap_database_and_load_data(
         "devildex.core.DevilDexCore._bootstrap_database_read_db", return_value=[]
     )
     mock_ensure_pkg = mocker.patch(
-        "devildex.core.database.ensure_package_entities_exist"
+        "devildex.core.database.bulk_ensure_package_entities"
     )
     core.bootstrap_database_and_load_data(
         initial_package_source=mock_installed_packages, is_fallback_data=False
     )
-    assert mock_ensure_pkg.call_count == len(mock_installed_packages)
-    requests_call_args = mock_ensure_pkg.call_args_list[0].kwargs
-    assert requests_call_args["package_name"] == "requests"
-    assert requests_call_args["package_version"] == "2.25.1"
-    assert requests_call_args["summary"] == "N/A"
+    mock_ensure_pkg.assert_called_once()
+    stored_packages = mock_ensure_pkg.call_args.args[0]
+    assert len(stored_packages) == len(mock_installed_packages)
+    assert stored_packages[0]["package_name"] == "requests"
+    assert stored_packages[0]["package_version"] == "2.25.1"
+    assert stored_packages[0]["summary"] == "N/A"
+
+
+def test_bootstrap_collects_unreferenced_store_objects(
+    core: DevilDexCore, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Verify that bootstrap removes store objects no docset links to."""
+    store = DocsetStore(tmp_path / "store")
+    orphan = store.object_path("aa" * 32)
+    linked = store.object_path("bb" * 32)
+    orphan.parent.mkdir(parents=True)
+    linked.parent.mkdir(parents=True)
+    orphan.write_text("orphan")
+    linked.write_text("linked")
+    (tmp_path / "docset_file.html").hardlink_to(linked)
+    core.app_paths.docset_store_dir = store.store_dir
+    mocker.patch(
+        "devildex.core.DevilDexCore._bootstrap_database_read_db", return_value=[]
+    )
+    mocker.patch("devildex.core.database.bulk_ensure_package_entities")
+
+    core.bootstrap_database_and_load_data(
+        initial_package_source=[], is_fallback_data=False
+    )
+
+    assert not orphan.exists()
+    assert linked.exists()
 
 
 def test_set_active_project_success(core: DevilDexCore, mocker: MockerFixture) -> None:
@@ -134,6 +187,51 @@ def test_delete_docset_build_success_and_removes_empty_parent(
     mock_rmtree.assert_any_call(docset_version_path.parent)
 
 
+def test_archived_docset_is_found_and_deleted(
+    core: DevilDexCore, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify a packed docset is resolved to its archive and can be deleted."""
+    mocker.patch(
+        "devildex.core.ConfigManager"
+    ).return_value.get_archive_docsets.return_value = True
+    docset_version_path = tmp_path / "docsets" / "requests" / "2.25.1"
+    docset_version_path.mkdir(parents=True)
+    (docset_version_path / "index.html").write_text("<p>requests</p>")
+
+    archive_path = core._finalize_docset_output(docset_version_path)
+
+    assert archive_path == docset_version_path.with_name("2.25.1.zip")
+    assert core.get_docset_path("requests", "2.25.1") == archive_path
+    assert core.get_docset_path("requests") == archive_path
+    success, _ = core.delete_docset_build(str(archive_path))
+    assert success is True
+    assert not archive_path.exists()
+    assert not archive_path.parent.exists()
+
+
+def test_docset_server_serves_docsets(
+    core: DevilDexCore, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify the core runs the docset server and builds page URLs for it."""
+    config = mocker.patch("devildex.core.ConfigManager").return_value
+    config.get_docset_server_enabled.return_value = True
+    config.get_docset_server_port.return_value = 0
+    core.app_paths.theme_assets_dir = tmp_path / "theme_assets"
+    docset_path = core.docset_base_output_path / "requests" / "2.25.1"
+    docset_path.mkdir(parents=True)
+
+    assert core.get_docset_url(docset_path) is None
+    assert core.start_docset_server_if_enabled()
+    try:
+        url = core.get_docset_url(docset_path, "api.html")
+    finally:
+        core.shutdown()
+
+    assert url.startswith("http://127.0.0.1:")
+    assert url.endswith("/docsets/requests/2.25.1/api.html")
+    assert core.docset_server is None
+
+
 def test_delete_docset_build_path_not_exist(core: DevilDexCore, tmp_path: Path) -> None:
     """Verify deletion fails if the target path does not exist."""
     non_existent_path = tmp_path / "non" / "existent" / "path"
@@ -157,6 +255,88 @@ def test_delete_docset_build_os_error(
     mock_rmtree.assert_called_once_with(docset_version_path)
 
 
+@pytest.fixture
+def docset_db() -> Iterator[Session]:
+    """Bind the database manager to an in-memory database for a test."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    database.DatabaseManager._engine = engine
+    database.DatabaseManager._session_local = session_local
+    try:
+        with session_local() as session:
+            yield session
+    finally:
+        database.DatabaseManager.close_db()
+
+
+def _stored_docset(
+    session: Session, store: DocsetStore, docset_dir: Path
+) -> tuple[Docset, Path]:
+    """Store a one-page docset and record it as completed in the database."""
+    docset_dir.mkdir(parents=True)
+    (docset_dir / "index.html").write_text("<html></html>")
+    manifest = store.ingest_tree(docset_dir).manifest
+    session.add(PackageInfo(package_name="requests", summary=""))
+    docset = Docset(
+        package_name="requests", package_version="2.25.1", status="COMPLETED"
+    )
+    docset.manifest = manifest
+    session.add(docset)
+    session.commit()
+    return docset, store.object_path(manifest["index.html"])
+
+
+def test_delete_docset_files_keeps_record_and_releases_store(
+    core: DevilDexCore, docset_db: Session, tmp_path: Path
+) -> None:
+    """Verify deleting from the GUI keeps the record but frees its files."""
+    store = DocsetStore(tmp_path / "store")
+    core.app_paths.docset_store_dir = store.store_dir
+    docset_dir = tmp_path / "docsets" / "requests" / "2.25.1"
+    docset, object_path = _stored_docset(docset_db, store, docset_dir)
+
+    success, _ = core.delete_docset_files("requests", "2.25.1", str(docset_dir))
+
+    assert success is True
+    assert not docset_dir.exists()
+    assert not object_path.exists()
+    docset_db.refresh(docset)
+    assert docset.manifest == {}
+    assert docset.status == "unknown"
+
+
+def test_delete_docset_files_without_record(
+    core: DevilDexCore, docset_db: Session, tmp_path: Path
+) -> None:
+    """Verify a docset found only on disk can still be deleted."""
+    _ = docset_db
+    docset_dir = tmp_path / "docsets" / "requests" / "2.25.1"
+    docset_dir.mkdir(parents=True)
+
+    success, _ = core.delete_docset_files("requests", "2.25.1", str(docset_dir))
+
+    assert success is True
+    assert not docset_dir.exists()
+
+
+def test_delete_docset_reports_file_failure(
+    core: DevilDexCore, docset_db: Session, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Verify delete_docset fails and keeps the record if files remain."""
+    store = DocsetStore(tmp_path / "store")
+    core.app_paths.docset_store_dir = store.store_dir
+    docset_dir = tmp_path / "docsets" / "requests" / "2.25.1"
+    _stored_docset(docset_db, store, docset_dir)
+    mocker.patch.object(core, "get_docset_path", return_value=docset_dir)
+    mocker.patch.object(
+        core, "delete_docset_build", return_value=(False, "Permission denied")
+    )
+
+    assert core.delete_docset("requests", "2.25.1") is False
+    assert docset_db.query(Docset).count() == 1
+
+
 """Tests for the DevilDexCore class."""
 
 
@@ -168,6 +348,7 @@ def test_generate_docset_success(
     mock_orchestrator_instance = mock_orchestrator_class.return_value
     mock_orchestrator_instance.get_detected_doc_type.return_value = "pydoctor"
     mock_orchestrator_instance.grab_build_doc.return_value = "/path/to/generated/docset"
+    mock_orchestrator_instance.resolved_recipe = None
     package_data = {"name": "requests", "version": "2.25.1", "project_urls": {}}
 
     # Mock the threading.Thread to prevent actual thread creation and execution
@@ -201,6 +382,7 @@ def test_generate_docset_unknown_type_failure(
     mock_orchestrator_instance.get_last_operation_result.return_value = (
         "No config file found"
     )
+    mock_orchestrator_instance.failure = StageFailure(FETCH_STAGE, "UnknownDocType")
 
     package_data = {"name": "requests", "version": "2.25.1"}
 
@@ -220,6 +402,8 @@ def test_generate_docset_unknown_type_failure(
     assert success is False
     assert "unable to determine" in msg
     assert "No config file found" in msg
+    assert task_status["failure"]["stage"] == FETCH_STAGE
+    assert task_status["failure"]["failures"] == 1
 
 
 def test_generate_docset_build_failure(
@@ -233,6 +417,7 @@ def test_generate_docset_build_failure(
     mock_orchestrator_instance.get_last_operation_result.return_value = (
         "pydoctor command failed"
     )
+    mock_orchestrator_instance.failure = StageFailure(BUILD_STAGE, "BuildFailed")
 
     package_data = {"name": "requests", "version": "2.25.1"}
 
@@ -252,6 +437,274 @@ def test_generate_docset_build_failure(
     assert success is False
     assert "Failure nella generation" in msg
     assert "pydoctor command failed" in msg
+    assert task_status["failure"]["error_class"] == "BuildFailed"
+
+
+def test_get_task_status_reports_progress(
+    core_with_db: DevilDexCore, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify task status carries the live progress and the task log file."""
+    mocker.patch("devildex.core.threading.Thread")
+    task_id = core_with_db.generate_docset({"name": "requests", "version": "1.0"})
+    task_progress = core_with_db._tasks[task_id]["progress"]
+    task_progress.start_step("Fetching sources")
+    task_progress.close()
+
+    progress = core_with_db.get_task_status(task_id)["progress"]
+
+    log_file = tmp_path / "tasks" / f"{task_id}.log"
+    assert progress["percent"] is None
+    assert progress["log_file"] == str(log_file)
+    assert "Fetching sources" in log_file.read_text(encoding="utf-8")
+
+
+def test_generate_docsets_runs_packages_through_pipeline(
+    core: DevilDexCore, mocker: MockerFixture
+) -> None:
+    """Verify each package of a batch gets a task finished by the pipeline."""
+    recipe = DocRecipe("sphinx", ["sphinx", "furo"])
+    mock_orchestrator_class = mocker.patch("devildex.core.Orchestrator")
+    mock_orchestrator_instance = mock_orchestrator_class.return_value
+    mock_orchestrator_instance.get_detected_doc_type.return_value = "sphinx"
+    mock_orchestrator_instance.prepare_environment.return_value = True
+    mock_orchestrator_instance.grab_build_doc.return_value = "/path/to/docset"
+    mock_orchestrator_instance.resolved_recipe = recipe
+    mocker.patch("devildex.core.DevilDexCore.search_for_docset", return_value=[])
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_doc_recipe", return_value=recipe
+    )
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_active_generation_failure",
+        return_value=None,
+    )
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_generation_checkpoint",
+        return_value=None,
+    )
+    mock_update_db = mocker.patch(
+        "devildex.core.DevilDexCore._update_database_on_success"
+    )
+
+    task_ids = core.generate_docsets(
+        [{"name": "requests", "version": "2.25.1"}, {"name": "no-version"}]
+    )
+    assert core.generation_pipeline.wait(PIPELINE_WAIT_SECONDS)
+    statuses = [core.get_task_status(task_id) for task_id in task_ids]
+    core.shutdown()
+
+    assert statuses[0]["status"] == "COMPLETED"
+    assert statuses[0]["result"] == (True, "/path/to/docset")
+    assert statuses[1]["status"] == "FAILED"
+    mock_orchestrator_instance.start_scan.assert_called_once()
+    mock_orchestrator_instance.prepare_environment.assert_called_once()
+    mock_update_db.assert_called_once()
+    assert mock_update_db.call_args.args[-1] == recipe
+    details = mock_orchestrator_class.call_args.kwargs["package_details"]
+    assert details.doc_recipe == recipe
+
+
+def test_recent_failure_skips_generation_unless_forced(
+    core: DevilDexCore, mocker: MockerFixture
+) -> None:
+    """Verify a package in backoff is skipped, reported, and retried on force."""
+    failure = {
+        "package": "requests",
+        "version": "2.25.1",
+        "stage": BUILD_STAGE,
+        "error_class": "BuildFailed",
+        "failures": 2,
+        "last_failure": "2026-01-01T00:00:00+00:00",
+        "retry_after": "2026-01-01T00:10:00+00:00",
+    }
+    mocker.patch("devildex.core.threading.Thread")
+    mocker.patch("devildex.core.DevilDexCore.search_for_docset", return_value=[])
+    get_failure = mocker.patch(
+        "devildex.core.database.DatabaseManager.get_active_generation_failure",
+        return_value=failure,
+    )
+    package_data = {"name": "requests", "version": "2.25.1"}
+
+    task_id = core.generate_docset(package_data)
+    skipped = core._validate_generation_inputs(task_id, package_data, force=False)
+    forced = core._validate_generation_inputs(task_id, package_data, force=True)
+
+    assert skipped is None
+    status = core.get_task_status(task_id)
+    assert status["status"] == "FAILED"
+    assert status["failure"] == failure
+    assert "force=True" in status["result"][1]
+    assert forced == ("requests", "2.25.1", None)
+    get_failure.assert_called_once_with("requests", "2.25.1")
+
+
+def test_orchestrators_resume_from_and_save_checkpoints(
+    core: DevilDexCore, mocker: MockerFixture
+) -> None:
+    """Verify the stored checkpoint is handed over and new ones are saved."""
+    stored = StageCheckpoint("fetch", "/sources/requests", "digest", "sphinx")
+    installed = StageCheckpoint("env", "/sources/requests", "digest", "sphinx")
+    mock_orchestrator_class = mocker.patch("devildex.core.Orchestrator")
+    get_checkpoint = mocker.patch(
+        "devildex.core.database.DatabaseManager.get_generation_checkpoint",
+        return_value=stored,
+    )
+    save_checkpoint = mocker.patch("devildex.core.database.save_generation_checkpoint")
+    details = PackageDetails(name="requests", version="2.25.1")
+
+    core._create_orchestrator(details)
+    kwargs = mock_orchestrator_class.call_args.kwargs
+    kwargs["on_checkpoint"](installed)
+
+    assert kwargs["package_details"].checkpoint == stored
+    get_checkpoint.assert_called_once_with("requests", "2.25.1")
+    save_checkpoint.assert_called_once_with("requests", "2.25.1", installed)
+
+
+def test_prewarm_environments_queues_env_only_jobs(
+    core: DevilDexCore, mocker: MockerFixture
+) -> None:
+    """Verify recipe packages without a docset get their env built, once."""
+    mock_orchestrator_class = mocker.patch("devildex.core.Orchestrator")
+    mock_orchestrator_instance = mock_orchestrator_class.return_value
+    mock_orchestrator_instance.get_detected_doc_type.return_value = "sphinx"
+    mock_orchestrator_instance.prepare_environment.return_value = True
+    recipe = DocRecipe("sphinx", ["sphinx"])
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_project_packages_with_recipes",
+        return_value=[
+            PackageDetails(name="attrs", version="23.1.0", doc_recipe=recipe),
+            PackageDetails(
+                name="click", version="8.1.7", status="COMPLETED", doc_recipe=recipe
+            ),
+        ],
+    )
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_generation_checkpoint",
+        return_value=None,
+    )
+    core.registered_project_name = "TestProject"
+
+    assert core.prewarm_environments() == 1
+    assert core.generation_pipeline.wait(PIPELINE_WAIT_SECONDS)
+    assert core.prewarm_environments() == 0
+    core.shutdown()
+
+    details = mock_orchestrator_class.call_args.kwargs["package_details"]
+    assert details.name == "attrs"
+    mock_orchestrator_instance.prepare_environment.assert_called_once()
+    mock_orchestrator_instance.grab_build_doc.assert_not_called()
+
+
+def _mock_prewarm_database(mocker: MockerFixture, details: PackageDetails) -> None:
+    """Mock the database calls of pre-warming and generating details."""
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_project_packages_with_recipes",
+        return_value=[details],
+    )
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_doc_recipe",
+        return_value=details.doc_recipe,
+    )
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_generation_checkpoint",
+        return_value=None,
+    )
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_active_generation_failure",
+        return_value=None,
+    )
+    mocker.patch("devildex.core.DevilDexCore.search_for_docset", return_value=[])
+    mocker.patch("devildex.core.DevilDexCore._update_database_on_success")
+
+
+def test_prewarm_skips_packages_being_generated(
+    core: DevilDexCore, mocker: MockerFixture
+) -> None:
+    """Verify a package is not pre-warmed while a generation of it runs."""
+    details = PackageDetails(
+        name="attrs", version="23.1.0", doc_recipe=DocRecipe("sphinx")
+    )
+    mocker.patch("devildex.core.Orchestrator")
+    mocker.patch("devildex.core.GenerationPipeline")
+    _mock_prewarm_database(mocker, details)
+    core.registered_project_name = "TestProject"
+
+    assert core._claim_generation(details) is None
+    assert core.prewarm_environments() == 0
+    core._release_generation(details)
+    assert core.prewarm_environments() == 1
+
+
+def test_prewarm_is_capped_at_free_cache_slots(
+    core: DevilDexCore, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Verify no more packages are pre-warmed than the env cache can keep."""
+    recipe = DocRecipe("sphinx")
+    mocker.patch(
+        "devildex.core.database.DatabaseManager.get_project_packages_with_recipes",
+        return_value=[
+            PackageDetails(name=f"package-{index}", version="1.0", doc_recipe=recipe)
+            for index in range(PREWARM_CANDIDATES)
+        ],
+    )
+    mock_orchestrator_class = mocker.patch("devildex.core.Orchestrator")
+    mock_pipeline = mocker.patch("devildex.core.GenerationPipeline").return_value
+    cache_config = mocker.patch("devildex.utils.venv_cache.ConfigManager")
+    cache_config.return_value.get_env_cache_max_entries.return_value = (
+        ENV_CACHE_MAX_ENTRIES
+    )
+    core.app_paths.build_env_cache_dir = tmp_path
+    (tmp_path / "ready-env").mkdir()
+    (tmp_path / "ready-env" / ENV_METADATA_FILENAME).write_text("{}")
+    core.registered_project_name = "TestProject"
+
+    assert core.prewarm_environments() == ENV_CACHE_MAX_ENTRIES - 1
+    assert mock_pipeline.submit.call_count == ENV_CACHE_MAX_ENTRIES - 1
+    assert mock_orchestrator_class.call_count == ENV_CACHE_MAX_ENTRIES - 1
+
+
+def test_generation_waits_for_in_flight_prewarm(
+    core: DevilDexCore, mocker: MockerFixture
+) -> None:
+    """Verify a generation fetches only after the package's pre-warm ended."""
+    details = PackageDetails(
+        name="attrs", version="23.1.0", doc_recipe=DocRecipe("sphinx")
+    )
+    env_started = threading.Event()
+    release_env = threading.Event()
+    events: list[str] = []
+
+    def prepare_prewarm_env() -> bool:
+        env_started.set()
+        release_env.wait(PIPELINE_WAIT_SECONDS)
+        events.append("prewarm env ready")
+        return True
+
+    prewarm = MagicMock()
+    prewarm.get_detected_doc_type.return_value = "sphinx"
+    prewarm.prepare_environment.side_effect = prepare_prewarm_env
+    generation = MagicMock()
+    generation.get_detected_doc_type.return_value = "sphinx"
+    generation.start_scan.side_effect = lambda: events.append("generation fetch")
+    generation.prepare_environment.return_value = True
+    generation.grab_build_doc.return_value = "/path/to/docset"
+    mocker.patch("devildex.core.Orchestrator", side_effect=[prewarm, generation])
+    _mock_prewarm_database(mocker, details)
+    core.registered_project_name = "TestProject"
+
+    assert core.prewarm_environments() == 1
+    assert env_started.wait(PIPELINE_WAIT_SECONDS)
+    (task_id,) = core.generate_docsets([{"name": "attrs", "version": "23.1.0"}])
+    time.sleep(PREWARM_HOLD_SECONDS)
+    held_status = core.get_task_status(task_id)["status"]
+    release_env.set()
+    assert core.generation_pipeline.wait(PIPELINE_WAIT_SECONDS)
+    status = core.get_task_status(task_id)["status"]
+    core.shutdown()
+
+    assert held_status == "PENDING"
+    assert status == "COMPLETED"
+    assert events == ["prewarm env ready", "generation fetch"]
 
 
 def test_generate_docset_missing_input_data(
@@ -337,13 +790,14 @@ def test_bootstrap_database_and_load_data_fallback(
         "devildex.core.DevilDexCore._bootstrap_database_read_db", return_value=[]
     )
     mock_ensure_pkg = mocker.patch(
-        "devildex.core.database.ensure_package_entities_exist"
+        "devildex.core.database.bulk_ensure_package_entities"
     )
     core.bootstrap_database_and_load_data(
         initial_package_source=mock_installed_packages, is_fallback_data=True
     )
-    requests_call_args = mock_ensure_pkg.call_args_list[0].kwargs
-    assert "project_name" not in requests_call_args
+    mock_ensure_pkg.assert_called_once()
+    assert "project_name" not in mock_ensure_pkg.call_args.kwargs
+    assert "project_name" not in mock_ensure_pkg.call_args.args[0][0]
 
 
 def test_bootstrap_database_and_load_data_missing_pkg_data(
@@ -354,14 +808,14 @@ def test_bootstrap_database_and_load_data_missing_pkg_data(
         "devildex.core.DevilDexCore._bootstrap_database_read_db", return_value=[]
     )
     mock_ensure_pkg = mocker.patch(
-        "devildex.core.database.ensure_package_entities_exist"
+        "devildex.core.database.bulk_ensure_package_entities"
     )
     packages = [PackageDetails(name="requests", version=None, project_urls={})]
     core.bootstrap_database_and_load_data(
         initial_package_source=packages, is_fallback_data=False
     )
 
-    mock_ensure_pkg.assert_not_called()
+    mock_ensure_pkg.assert_called_once_with([])
 
 
 def test_list_package_dirs_no_base_dir(core: DevilDexCore, tmp_path: Path) -> None:
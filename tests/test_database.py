@@ -1,14 +1,42 @@
 """Tests for the database module."""
 
+import importlib.util
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
 import pytest
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
 from pytest_mock import MockerFixture
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 
+from devildex.core import DevilDexCore
 from devildex.database import db_manager as database
-from devildex.database.models import Base, Docset, PackageInfo, RegisteredProject
+from devildex.database.models import (
+    Base,
+    DocRecipe,
+    Docset,
+    GenerationCheckpoint,
+    GenerationFailure,
+    PackageInfo,
+    RegisteredProject,
+    StageCheckpoint,
+)
 
 LEN_DATA = 2
+BACKOFF_SECONDS = 60
+MAX_BACKOFF_SECONDS = 150
+BUSY_TIMEOUT_MS = 200
+POOL_SIZE = 3
+SYNCHRONOUS_NORMAL = 1
+SMALL_BATCH = 10
+LARGE_BATCH = 300
+CATALOG_SIZE = 10_000
+MIGRATIONS_DIR = Path(__file__).parents[1] / "src" / "devildex" / "alembic" / "versions"
 
 
 @pytest.fixture
@@ -194,8 +222,10 @@ def test_get_session_raises_database_not_initialized_error(
         "devildex.database.db_manager.DatabaseManager.init_db",
         side_effect=lambda *args, **kwargs: None,
     )
-    with pytest.raises(database.DatabaseNotInitializedError) as excinfo, \
-            database.DatabaseManager.get_session():
+    with (
+        pytest.raises(database.DatabaseNotInitializedError) as excinfo,
+        database.DatabaseManager.get_session(),
+    ):
         pass
     assert (
         "Failed to initialize SessionLocal even after attempting default init."
@@ -530,3 +560,450 @@ def test_ensure_package_entities_exist_no_project_name(db_session: Session) -> N
     assert registered_project is None
     project_count = db_session.query(RegisteredProject).count()
     assert project_count == 0
+
+
+def test_save_doc_recipe_updates_and_returns_latest(db_session: Session) -> None:
+    """Verify recipes are upserted per builder and the newest one is returned."""
+    database.save_doc_recipe("attrs", DocRecipe("sphinx", ["sphinx"]))
+    database.save_doc_recipe("attrs", DocRecipe("mkdocs", ["mkdocs"]))
+    database.save_doc_recipe("attrs", DocRecipe("mkdocs", ["mkdocs==1.6.0"]))
+
+    assert database.DatabaseManager.get_doc_recipe("attrs") == DocRecipe(
+        "mkdocs", ["mkdocs==1.6.0"]
+    )
+    assert database.DatabaseManager.get_doc_recipe("missing") is None
+    assert db_session.query(PackageInfo).filter_by(package_name="attrs").count() == 1
+
+
+def test_get_project_packages_with_recipes(db_session: Session) -> None:
+    """Verify only the project's packages with a recipe are returned."""
+    project = {
+        "project_name": "RecipeProject",
+        "project_path": "/path/to/project",
+        "python_executable": "/path/to/python",
+    }
+    database.ensure_package_entities_exist("attrs", "23.1.0", **project)
+    database.ensure_package_entities_exist("click", "8.1.7", **project)
+    database.ensure_package_entities_exist("rich", "13.7.0")
+    database.save_doc_recipe("attrs", DocRecipe("sphinx", ["sphinx", "furo"]))
+    database.save_doc_recipe("rich", DocRecipe("sphinx", ["sphinx"]))
+
+    packages = database.DatabaseManager.get_project_packages_with_recipes(
+        "RecipeProject"
+    )
+
+    assert [(p.name, p.version, p.status) for p in packages] == [
+        ("attrs", "23.1.0", "unknown")
+    ]
+    assert packages[0].doc_recipe == DocRecipe("sphinx", ["sphinx", "furo"])
+
+
+def test_record_generation_failure_backs_off_exponentially(
+    db_session: Session,
+) -> None:
+    """Verify repeated failures of a stage double the wait up to the maximum."""
+    waits = []
+    for _ in range(3):
+        failure = database.record_generation_failure(
+            "attrs",
+            "23.1.0",
+            "build",
+            "BuildFailed",
+            BACKOFF_SECONDS,
+            MAX_BACKOFF_SECONDS,
+        )
+        row = db_session.query(GenerationFailure).one()
+        db_session.refresh(row)
+        waits.append((row.retry_after_utc - row.last_failure_utc).total_seconds())
+
+    assert waits == [BACKOFF_SECONDS, 2 * BACKOFF_SECONDS, MAX_BACKOFF_SECONDS]
+    assert failure["failures"] == len(waits)
+    assert failure["stage"] == "build"
+    assert (
+        database.DatabaseManager.get_active_generation_failure("attrs", "23.1.0")
+        == failure
+    )
+    assert (
+        database.DatabaseManager.get_active_generation_failure("attrs", "23.2.0")
+        is None
+    )
+
+
+def test_expired_generation_failure_is_not_active(db_session: Session) -> None:
+    """Verify a failure stops holding the package back once its wait is over."""
+    database.record_generation_failure("attrs", "23.1.0", "fetch", "OSError", 0, 0)
+
+    assert (
+        database.DatabaseManager.get_active_generation_failure("attrs", "23.1.0")
+        is None
+    )
+
+
+def test_save_generation_checkpoint_replaces_previous_stage(
+    db_session: Session,
+) -> None:
+    """Verify one checkpoint is kept per package version, the latest stage."""
+    fetched = StageCheckpoint("fetch", "/sources/attrs", "digest", "sphinx", "/docs")
+    installed = StageCheckpoint(
+        "env", "/sources/attrs", "digest", "sphinx", "/docs", env_key="0123abcd"
+    )
+
+    database.save_generation_checkpoint("attrs", "23.1.0", fetched)
+    database.save_generation_checkpoint("attrs", "23.1.0", installed)
+
+    assert (
+        database.DatabaseManager.get_generation_checkpoint("attrs", "23.1.0")
+        == installed
+    )
+    assert database.DatabaseManager.get_generation_checkpoint("attrs", "23.2.0") is None
+    assert db_session.query(GenerationCheckpoint).count() == 1
+
+
+@pytest.fixture
+def file_database(tmp_path: Path, mocker: MockerFixture) -> Iterator[str]:
+    """Initialize a file database tuned with a short busy timeout."""
+    mocker.patch.dict("os.environ", {"DEVILDEX_TESTING": "1"})
+    config = mocker.patch("devildex.database.db_manager.ConfigManager").return_value
+    config.get_db_wal.return_value = True
+    config.get_db_busy_timeout_ms.return_value = BUSY_TIMEOUT_MS
+    config.get_db_mmap_size_mb.return_value = 1
+    config.get_db_cache_size_mb.return_value = 2
+    config.get_db_pool_size.return_value = POOL_SIZE
+    config.get_db_max_overflow.return_value = 0
+    database.DatabaseManager.close_db()
+    db_url = f"sqlite:///{tmp_path / 'tuned.db'}"
+    database.init_db(db_url)
+    yield db_url
+    database.DatabaseManager.close_db()
+
+
+def test_init_db_tunes_sqlite_connections(file_database: str) -> None:
+    """Verify connections use WAL, the busy timeout and the configured pool."""
+    engine = database.DatabaseManager._engine
+    assert engine is not None
+    with engine.connect() as connection:
+        pragma = connection.exec_driver_sql
+        assert pragma("PRAGMA journal_mode").scalar() == "wal"
+        assert pragma("PRAGMA synchronous").scalar() == SYNCHRONOUS_NORMAL
+        assert pragma("PRAGMA busy_timeout").scalar() == BUSY_TIMEOUT_MS
+        assert pragma("PRAGMA cache_size").scalar() == -2 * 1024
+    assert engine.pool.size() == POOL_SIZE
+
+
+def test_open_read_transaction_does_not_block_writer(file_database: str) -> None:
+    """Verify a writer commits while another connection is mid-read."""
+    engine = database.DatabaseManager._engine
+    assert engine is not None
+    Base.metadata.create_all(engine)
+    count = "SELECT COUNT(*) FROM package_info"
+    reader = engine.raw_connection()
+    try:
+        cursor = reader.cursor()
+        cursor.execute("BEGIN")
+        assert cursor.execute(count).fetchone() == (0,)
+        with engine.begin() as writer:
+            writer.execute(
+                text("INSERT INTO package_info (package_name) VALUES ('attrs')")
+            )
+        assert cursor.execute(count).fetchone() == (0,)
+        cursor.execute("COMMIT")
+        assert cursor.execute(count).fetchone() == (1,)
+    finally:
+        reader.close()
+
+
+BULK_PROJECT = {
+    "project_name": "BulkProject",
+    "project_path": "/path/to/project",
+    "python_executable": "/path/to/python",
+}
+
+
+def test_bulk_ensure_package_entities_upserts(db_session: Session) -> None:
+    """Verify bulk ensuring creates, updates and associates without duplicates."""
+    database.ensure_package_entities_exist(
+        "pytest", "7.0.0", summary="old", initial_docset_status="COMPLETED"
+    )
+    packages = [
+        {
+            "package_name": "pytest",
+            "package_version": "7.0.0",
+            "summary": "testing framework",
+            "project_urls": {"Homepage": "https://pytest.org"},
+        },
+        {"package_name": "pytest", "package_version": "8.0.0", "summary": ""},
+        {"package_name": "attrs", "package_version": "23.1.0"},
+    ]
+
+    assert database.bulk_ensure_package_entities(packages, **BULK_PROJECT) == len(
+        packages
+    )
+    assert database.bulk_ensure_package_entities(packages, **BULK_PROJECT) == len(
+        packages
+    )
+
+    pytest_info = db_session.query(PackageInfo).filter_by(package_name="pytest").one()
+    assert pytest_info.summary == "testing framework"
+    assert pytest_info.project_urls == {"Homepage": "https://pytest.org"}
+    assert db_session.query(Docset).count() == len(packages)
+    statuses = {
+        (docset.package_name, docset.package_version): docset.status
+        for docset in db_session.query(Docset)
+    }
+    assert statuses[("pytest", "7.0.0")] == "COMPLETED"
+    assert statuses[("attrs", "23.1.0")] == "unknown"
+    project = db_session.query(RegisteredProject).one()
+    assert len(project.docsets) == len(packages)
+
+
+def test_bulk_ensure_package_entities_requires_new_project_paths(
+    db_session: Session,
+) -> None:
+    """Verify a new project without its paths is refused and nothing is stored."""
+    with pytest.raises(ValueError, match="project_path and python_executable"):
+        database.bulk_ensure_package_entities(
+            [{"package_name": "attrs", "package_version": "23.1.0"}],
+            project_name="NewProject",
+        )
+
+    assert db_session.query(Docset).count() == 0
+
+
+def test_bulk_ensure_package_entities_statement_count_is_flat(
+    db_session: Session,
+) -> None:
+    """Verify the statements issued do not grow with the number of packages."""
+    engine = database.DatabaseManager._engine
+    assert engine is not None
+    database.ensure_package_entities_exist("seed", "1.0", **BULK_PROJECT)
+
+    def count_statements(batch_size: int) -> int:
+        statements: list[str] = []
+
+        def record(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        packages = [
+            {"package_name": f"pkg-{batch_size}-{index}", "package_version": "1.0"}
+            for index in range(batch_size)
+        ]
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            database.bulk_ensure_package_entities(packages, **BULK_PROJECT)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return len(statements)
+
+    assert count_statements(SMALL_BATCH) == count_statements(LARGE_BATCH)
+
+
+def _query_plans(engine: Engine, action: Callable[[], object]) -> list[str]:
+    """Run action and return the query plan steps of the SELECTs it issued."""
+    statements: list[tuple[str, object]] = []
+
+    def record(*args: object) -> None:
+        statement = str(args[2])
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, args[3]))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    with engine.connect() as connection:
+        return [
+            row[3]
+            for statement, parameters in statements
+            for row in connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+        ]
+
+
+def _assert_no_full_table_scan(plan: list[str]) -> None:
+    """Assert docsets and their associations are only read through indexes."""
+    for step in plan:
+        scans_table = step.startswith(("SCAN docset", "SCAN project_docset"))
+        assert not scans_table or " USING " in step, step
+
+
+def test_docset_lookups_use_indexes(db_session: Session, tmp_path: Path) -> None:
+    """Verify docset searches and project views are answered from indexes."""
+    engine = database.DatabaseManager._engine
+    assert engine is not None
+    database.ensure_package_entities_exist(
+        "attrs", "1.0", initial_docset_status="COMPLETED", **BULK_PROJECT
+    )
+    database.bulk_ensure_package_entities(
+        [
+            {"package_name": f"pkg-{index}", "package_version": "1.0"}
+            for index in range(CATALOG_SIZE)
+        ],
+        **BULK_PROJECT,
+    )
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    core = DevilDexCore(docset_base_output_path=tmp_path)
+
+    search_plan = _query_plans(engine, lambda: core.search_for_docset("attrs"))
+    version_plan = _query_plans(engine, lambda: core.search_for_docset("attrs", "1.0"))
+    view_plan = _query_plans(
+        engine,
+        lambda: database.DatabaseManager.get_docsets_for_project_view(
+            BULK_PROJECT["project_name"]
+        ),
+    )
+    grid_plan = _query_plans(
+        engine, lambda: database.DatabaseManager.get_docsets_for_project_view(None)
+    )
+
+    assert search_plan == [
+        "SEARCH docset USING COVERING INDEX ix_docset_package_name_status_version"
+        " (package_name=? AND status=?)"
+    ]
+    for plan in (search_plan, version_plan, view_plan, grid_plan):
+        _assert_no_full_table_scan(plan)
+    for plan in (view_plan, grid_plan):
+        assert any(
+            "COVERING INDEX ix_project_docset_association_docset_id" in step
+            for step in plan
+        )
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+
+def _run_lookup_indexes_migration(engine: Engine) -> None:
+    """Upgrade engine's database with the docset lookup indexes revision."""
+    path = next(MIGRATIONS_DIR.glob("*_add_docset_lookup_indexes.py"))
+    spec = importlib.util.spec_from_file_location("lookup_indexes", path)
+    assert spec is not None
+    assert spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with (
+        engine.begin() as connection,
+        Operations.context(MigrationContext.configure(connection)),
+    ):
+        migration.upgrade()
+
+
+def test_lookup_indexes_migration_adds_missing_indexes() -> None:
+    """Verify the migration adds the indexes to an older schema only once."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_docset_package_name_status_version")
+        connection.exec_driver_sql("DROP INDEX ix_project_docset_association_docset_id")
+
+    _run_lookup_indexes_migration(engine)
+    _run_lookup_indexes_migration(engine)
+
+    inspector = inspect(engine)
+    docset_indexes = {index["name"] for index in inspector.get_indexes("docset")}
+    association_indexes = {
+        index["name"] for index in inspector.get_indexes("project_docset_association")
+    }
+    assert "ix_docset_package_name_status_version" in docset_indexes
+    assert "ix_docset_package_name_version" not in docset_indexes
+    assert "ix_project_docset_association_docset_id" in association_indexes
+    engine.dispose()
+
+
+def test_docset_listings_issue_constant_queries(
+    db_session: Session, tmp_path: Path
+) -> None:
+    """Verify listing docsets issues the same queries however many there are."""
+    engine = database.DatabaseManager._engine
+    assert engine is not None
+    core = DevilDexCore(docset_base_output_path=tmp_path)
+    project_name = BULK_PROJECT["project_name"]
+
+    def listings() -> list:
+        return [
+            database.DatabaseManager.get_docsets_for_project_view(project_name),
+            database.DatabaseManager.get_docsets_for_project_view(None),
+            core.get_all_docsets_info(),
+            core.get_docsets_info_for_project(project_name),
+            core._bootstrap_database_loop_docsets(
+                core._bootstrap_database_read_db(project_name, db_session)
+            ),
+        ]
+
+    def count_queries(catalog_size: int) -> int:
+        database.bulk_ensure_package_entities(
+            [
+                {
+                    "package_name": f"pkg-{index}",
+                    "package_version": "1.0",
+                    "summary": f"summary {index}",
+                    "project_urls": {"Homepage": f"https://pkg-{index}.org"},
+                }
+                for index in range(catalog_size)
+            ],
+            **BULK_PROJECT,
+        )
+        statements: list[str] = []
+
+        def record(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            results = listings()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert all(len(result) == catalog_size for result in results)
+        return len(statements)
+
+    assert count_queries(SMALL_BATCH) == count_queries(LARGE_BATCH)
+    view_row, _, info_row, _, grid_row = (result[0] for result in listings())
+    assert view_row == grid_row | {"project_name": project_name}
+    assert grid_row["description"] == "summary 0"
+    assert grid_row["project_urls"] == {"Homepage": "https://pkg-0.org"}
+    assert info_row == {"name": "pkg-0", "version": "1.0", "status": "unknown"}
+
+
+def test_schema_head_revision_matches_migrations() -> None:
+    """Verify the bundled head revision is the head of the migration scripts."""
+    alembic_cfg = Config()
+    alembic_cfg.set_main_option("script_location", str(MIGRATIONS_DIR.parent))
+
+    assert ScriptDirectory.from_config(alembic_cfg).get_heads() == [
+        database.SCHEMA_HEAD_REVISION
+    ]
+
+
+@pytest.mark.parametrize(
+    ("stored_revision", "migrated"),
+    [(database.SCHEMA_HEAD_REVISION, False), ("d81e6b3f0a27", True), (None, True)],
+)
+def test_init_db_runs_migrations_only_when_schema_is_behind(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    stored_revision: str | None,
+    migrated: bool,
+) -> None:
+    """Verify startup skips Alembic when the database is stamped with the head."""
+    db_url = f"sqlite:///{tmp_path / 'stamped.db'}"
+    if stored_revision:
+        engine = create_engine(db_url)
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"
+            )
+            connection.execute(
+                text("INSERT INTO alembic_version VALUES (:revision)"),
+                {"revision": stored_revision},
+            )
+        engine.dispose()
+    mocker.patch.dict("os.environ")
+    os.environ.pop("DEVILDEX_TESTING", None)
+    run_migrations = mocker.patch.object(database.DatabaseManager, "_run_migrations")
+    database.DatabaseManager.close_db()
+
+    try:
+        database.init_db(db_url)
+    finally:
+        database.DatabaseManager.close_db()
+
+    assert run_migrations.called is migrated
@@ -0,0 +1,172 @@
+"""Tests for the local docset HTTP server."""
+
+import gzip
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+import requests
+
+from devildex.docset_server.server import (
+    DocsetServer,
+    UnsatisfiableRangeError,
+    parse_accept_encoding,
+    parse_byte_range,
+)
+from devildex.utils.docset_archive import pack_docset
+from devildex.utils.precompress import precompress_docset
+from devildex.utils.staging import previous_dir_for
+
+INDEX_HTML = "<html><body>" + "documentation " * 200 + "</body></html>"
+PAGE_HTML = "<p>page</p>"
+REQUEST_TIMEOUT = 5
+RANGE_LENGTH = 10
+FILE_SIZE = 100
+
+
+@pytest.fixture
+def docsets_dir(tmp_path: Path) -> Path:
+    """Create a docset directory and a packed docset."""
+    root = tmp_path / "docsets"
+    plain = root / "plain" / "1.0"
+    plain.mkdir(parents=True)
+    (plain / "index.html").write_text(INDEX_HTML)
+    (plain / "page.html").write_text(PAGE_HTML)
+    precompress_docset(plain)
+    packed = root / "packed" / "2.0"
+    packed.mkdir(parents=True)
+    (packed / "index.html").write_text(INDEX_HTML)
+    precompress_docset(packed)
+    pack_docset(packed)
+    return root
+
+
+@pytest.fixture
+def server(docsets_dir: Path) -> Iterator[DocsetServer]:
+    """Run a docset server on a free port."""
+    docset_server = DocsetServer(docsets_dir)
+    assert docset_server.start()
+    yield docset_server
+    docset_server.stop()
+
+
+def _get(url: str, **headers: str) -> requests.Response:
+    """Fetch a URL without following redirects."""
+    return requests.get(
+        url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=False
+    )
+
+
+def test_serves_page_with_validators(server: DocsetServer, docsets_dir: Path) -> None:
+    """Verify a page is served with ETag and revalidated with a 304."""
+    url = server.url_for(docsets_dir / "plain" / "1.0", "page.html")
+
+    response = _get(url)
+    revalidated = _get(url, **{"If-None-Match": response.headers["ETag"]})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == PAGE_HTML
+    assert response.headers["Content-Type"].startswith("text/html")
+    assert "Last-Modified" in response.headers
+    assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
+    assert not revalidated.content
+
+
+def test_serves_precompressed_variant(server: DocsetServer, docsets_dir: Path) -> None:
+    """Verify the stored gzip variant is sent to clients that accept it."""
+    url = server.url_for(docsets_dir / "plain" / "1.0")
+
+    response = requests.get(
+        url, headers={"Accept-Encoding": "gzip"}, timeout=REQUEST_TIMEOUT, stream=True
+    )
+    raw = response.raw.read()
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(raw) < len(INDEX_HTML)
+    assert gzip.decompress(raw).decode() == INDEX_HTML
+
+
+def test_serves_byte_range(server: DocsetServer, docsets_dir: Path) -> None:
+    """Verify a byte range request gets a partial response."""
+    url = server.url_for(docsets_dir / "plain" / "1.0")
+
+    response = _get(
+        url, Range=f"bytes=0-{RANGE_LENGTH - 1}", **{"Accept-Encoding": "identity"}
+    )
+    unsatisfiable = _get(url, Range="bytes=100000-")
+
+    assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+    assert response.text == INDEX_HTML[:RANGE_LENGTH]
+    assert response.headers["Content-Range"].startswith(f"bytes 0-{RANGE_LENGTH - 1}/")
+    assert unsatisfiable.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+
+
+def test_serves_packed_docset(server: DocsetServer, docsets_dir: Path) -> None:
+    """Verify pages of a packed docset are served from the archive."""
+    archive_path = docsets_dir / "packed" / "2.0.zip"
+    url = server.url_for(archive_path)
+
+    response = _get(url)
+    redirect = _get(url.removesuffix("/index.html"))
+
+    assert url.endswith("/docsets/packed/2.0/index.html")
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == INDEX_HTML
+    assert redirect.status_code == HTTPStatus.MOVED_PERMANENTLY
+    assert redirect.headers["Location"] == "/docsets/packed/2.0/"
+
+
+def test_rejects_paths_outside_docsets(server: DocsetServer, tmp_path: Path) -> None:
+    """Verify files outside the docsets directory are not served."""
+    (tmp_path / "secret.txt").write_text("secret")
+    (tmp_path / "docsets" / "link.txt").symlink_to(tmp_path / "secret.txt")
+
+    escaped = _get(server.base_url + "../secret.txt")
+    linked = _get(server.base_url + "link.txt")
+
+    assert escaped.status_code == HTTPStatus.NOT_FOUND
+    assert linked.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-9", (0, 9)),
+        ("bytes=90-", (90, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=50-500", (50, 99)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=9-1", None),
+    ],
+)
+def test_parse_byte_range(header: str, expected: tuple[int, int] | None) -> None:
+    """Verify single byte ranges are parsed and others are ignored."""
+    assert parse_byte_range(header, FILE_SIZE) == expected
+
+
+def test_parse_byte_range_unsatisfiable() -> None:
+    """Verify a range past the end of the file is rejected."""
+    with pytest.raises(UnsatisfiableRangeError):
+        parse_byte_range(f"bytes={FILE_SIZE}-", FILE_SIZE)
+
+
+def test_parse_accept_encoding_skips_refused_codings() -> None:
+    """Verify codings with a zero quality are not accepted."""
+    assert parse_accept_encoding("gzip;q=0, br, deflate") == {"br", "deflate"}
+
+
+def test_docset_being_replaced_is_unavailable(
+    server: DocsetServer, docsets_dir: Path
+) -> None:
+    """Verify a docset missing mid-swap answers 503 instead of 404."""
+    final_dir = docsets_dir / "swapping" / "1.0"
+    previous_dir_for(final_dir).mkdir(parents=True)
+    url = server.url_for(docsets_dir / "plain" / "1.0").replace(
+        "plain/1.0", "swapping/1.0"
+    )
+
+    response = _get(url)
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
@@ -6,8 +6,15 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 from pytest_mock import MockerFixture
 
-from devildex.database.models import PackageDetails
-from devildex.orchestrator.documentation_orchestrator import Orchestrator
+from devildex.database.models import DocRecipe, PackageDetails
+from devildex.grabbers.mkdocs_builder import MkDocsBuilder
+from devildex.orchestrator.context import BuildContext
+from devildex.orchestrator.documentation_orchestrator import (
+    ENV_STAGE,
+    FETCH_STAGE,
+    Orchestrator,
+    StageFailure,
+)
 
 
 @pytest.fixture
@@ -316,15 +323,15 @@ def mock_scan_dependencies(mocker: MockerFixture) -> dict[str, MagicMock]:
         return_value=True,
     )
     mock_is_sphinx_project = mocker.patch(
-        "devildex.orchestrator.documentation_orchestrator.is_sphinx_project",
+        "devildex.grabbers.sphinx_builder.is_sphinx_project",
         return_value=False,
     )
     mock_is_mkdocs_project = mocker.patch(
-        "devildex.orchestrator.documentation_orchestrator.is_mkdocs_project",
-        return_value=False,
+        "devildex.grabbers.mkdocs_builder._find_mkdocs_config_file",
+        return_value=None,
     )
     mock_has_docstrings = mocker.patch(
-        "devildex.orchestrator.documentation_orchestrator.has_docstrings",
+        "devildex.grabbers.docstrings_builder.has_docstrings",
         return_value=False,
     )
     return {
@@ -354,7 +361,7 @@ def test_start_scan_detects_sphinx(
     """Test start_scan detects sphinx."""
     mock_scan_dependencies["fetch_repo"].return_value = True
     mock_scan_dependencies["is_sphinx_project"].return_value = True
-    mock_scan_dependencies["is_mkdocs_project"].return_value = False
+    mock_scan_dependencies["is_mkdocs_project"].return_value = None
     mock_scan_dependencies["has_docstrings"].return_value = False
 
     mock_orchestrator._effective_source_path = tmp_path / "source"
@@ -383,7 +390,7 @@ def test_start_scan_detects_mkdocs(
     assert mock_orchestrator.detected_doc_type == "mkdocs"
     mock_scan_dependencies["is_sphinx_project"].assert_called_once()
     mock_scan_dependencies["is_mkdocs_project"].assert_called_once_with(
-        str(tmp_path / "source")
+        tmp_path / "source"
     )
     mock_scan_dependencies["has_docstrings"].assert_not_called()
 
@@ -396,7 +403,7 @@ def test_start_scan_detects_docstrings(
     """Test start_scan detects docstrings."""
     mock_scan_dependencies["fetch_repo"].return_value = True
     mock_scan_dependencies["is_sphinx_project"].return_value = False
-    mock_scan_dependencies["is_mkdocs_project"].return_value = False
+    mock_scan_dependencies["is_mkdocs_project"].return_value = None
     mock_scan_dependencies["has_docstrings"].return_value = True
 
     mock_orchestrator._effective_source_path = tmp_path / "source"
@@ -417,7 +424,7 @@ def test_start_scan_detects_unknown(
     """Test start_scan detects unknown."""
     mock_scan_dependencies["fetch_repo"].return_value = True
     mock_scan_dependencies["is_sphinx_project"].return_value = False
-    mock_scan_dependencies["is_mkdocs_project"].return_value = False
+    mock_scan_dependencies["is_mkdocs_project"].return_value = None
     mock_scan_dependencies["has_docstrings"].return_value = False
 
     mock_orchestrator._effective_source_path = tmp_path / "source"
@@ -428,6 +435,23 @@ def test_start_scan_detects_unknown(
     mock_scan_dependencies["has_docstrings"].assert_called_once()
 
 
+def test_start_scan_records_fetch_failure(
+    mock_scan_dependencies: dict[str, MagicMock],
+    mock_orchestrator: Orchestrator,
+    tmp_path: Path,
+) -> None:
+    """Verify an undetected project is reported as a fetch stage failure."""
+    mock_scan_dependencies["fetch_repo"].return_value = True
+    mock_scan_dependencies["is_sphinx_project"].return_value = False
+    mock_scan_dependencies["is_mkdocs_project"].return_value = None
+    mock_scan_dependencies["has_docstrings"].return_value = False
+
+    mock_orchestrator._effective_source_path = tmp_path / "source"
+    mock_orchestrator.start_scan()
+
+    assert mock_orchestrator.failure == StageFailure(FETCH_STAGE, "UnknownDocType")
+
+
 def test_start_scan_effective_source_path_none(
     mock_scan_dependencies: dict[str, MagicMock],
     mock_orchestrator: Orchestrator,
@@ -435,7 +459,7 @@ def test_start_scan_effective_source_path_none(
     """Test start_scan with no effective source path."""
     mock_scan_dependencies["fetch_repo"].return_value = True
     mock_scan_dependencies["is_sphinx_project"].return_value = False
-    mock_scan_dependencies["is_mkdocs_project"].return_value = False
+    mock_scan_dependencies["is_mkdocs_project"].return_value = None
     mock_scan_dependencies["has_docstrings"].return_value = False
 
     mock_orchestrator._effective_source_path = None
@@ -528,6 +552,40 @@ def test_grab_build_doc_mkdocs(
     )
 
 
+def test_doc_recipe_picks_builder_and_is_resolved_after_build(
+    mock_scan_dependencies: dict[str, MagicMock],
+    mock_orchestrator: Orchestrator,
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    """Verify a recipe chooses the builder, pins its install and is resolved."""
+    recipe = DocRecipe("mkdocs", ["mkdocs==1.6.0", "mkdocs-material"])
+    mock_orchestrator.package_details.doc_recipe = recipe
+    mock_scan_dependencies["is_sphinx_project"].return_value = True
+    mock_scan_dependencies["is_mkdocs_project"].return_value = tmp_path / "mkdocs.yml"
+    mock_orchestrator._effective_source_path = tmp_path / "source"
+
+    def generate_docset(
+        source_path: Path, output_path: Path, context: BuildContext
+    ) -> str:
+        packages, _ = context.select_requirements(["mkdocs"], lambda: None)
+        assert packages == recipe.requirements
+        return "mkdocs_output_path"
+
+    mocker.patch(
+        "devildex.grabbers.mkdocs_builder.MkDocsBuilder.generate_docset",
+        side_effect=generate_docset,
+    )
+
+    mock_orchestrator.start_scan()
+    result = mock_orchestrator.grab_build_doc()
+
+    assert mock_orchestrator.detected_doc_type == "mkdocs"
+    mock_scan_dependencies["is_sphinx_project"].assert_not_called()
+    assert result == "mkdocs_output_path"
+    assert mock_orchestrator.resolved_recipe == recipe
+
+
 @patch(
     "devildex.grabbers.pdoc3_builder.Pdoc3Builder.generate_docset"
 )
@@ -587,6 +645,31 @@ def test_grab_build_doc_pdoc3_fails_pydoctor_succeeds(
     )
 
 
+@patch("devildex.grabbers.pdoc3_builder.Pdoc3Builder.generate_docset")
+@patch("devildex.grabbers.static_api_builder.StaticApiBuilder.generate_docset")
+def test_grab_build_doc_static_api_skips_pdoc3(
+    mock_static_generate_docset: MagicMock,
+    mock_pdoc3_generate_docset: MagicMock,
+    mock_orchestrator: Orchestrator,
+    tmp_path: Path,
+) -> None:
+    """Test the static API engine is tried first and pdoc3 is then skipped."""
+    mock_orchestrator.detected_doc_type = "docstrings"
+    (tmp_path / "source").mkdir()
+    mock_orchestrator._effective_source_path = tmp_path / "source"
+    mock_static_generate_docset.return_value = True
+
+    result = mock_orchestrator.grab_build_doc()
+
+    assert isinstance(result, str)
+    mock_static_generate_docset.assert_called_once_with(
+        source_path=ANY,
+        output_path=mock_orchestrator.base_output_dir,
+        context=ANY,
+    )
+    mock_pdoc3_generate_docset.assert_not_called()
+
+
 def test_grab_build_doc_key_error(mock_orchestrator: Orchestrator) -> None:
     """Test grab build doc key error."""
     mock_orchestrator.detected_doc_type = "non_existent_type"
@@ -595,6 +678,191 @@ def test_grab_build_doc_key_error(mock_orchestrator: Orchestrator) -> None:
     assert mock_orchestrator.last_operation_result is False
 
 
+RTD_HTMLZIP_URL = "https://example.org/media/htmlzip/test-package/1.0.0.zip"
+
+
+@pytest.fixture
+def rtd_orchestrator(
+    mock_package_details: PackageDetails, tmp_path: Path
+) -> Orchestrator:
+    """Orchestrator for a package whose docs are hosted on Read the Docs."""
+    mock_package_details.project_urls["Documentation"] = (
+        "https://test-package.readthedocs.io/"
+    )
+    return Orchestrator(
+        package_details=mock_package_details, base_output_dir=tmp_path / "docset_output"
+    )
+
+
+def test_start_scan_prefers_prebuilt_docs(
+    mocker: MockerFixture, rtd_orchestrator: Orchestrator
+) -> None:
+    """Verify a matching Read the Docs build skips fetching the sources."""
+    mock_find = mocker.patch(
+        "devildex.grabbers.readthedocs_downloader.ReadTheDocsDownloader"
+        ".find_prebuilt_download",
+        return_value=RTD_HTMLZIP_URL,
+    )
+    mock_fetch_repo = mocker.patch.object(Orchestrator, "fetch_repo")
+    mock_fetch = mocker.patch(
+        "devildex.grabbers.readthedocs_downloader.ReadTheDocsDownloader"
+        ".fetch_prebuilt_docset",
+        return_value=True,
+    )
+    mock_theme = mocker.patch(
+        "devildex.orchestrator.documentation_orchestrator.apply_prebuilt_theme"
+    )
+
+    rtd_orchestrator.start_scan()
+    result = rtd_orchestrator.grab_build_doc()
+
+    expected_dir = rtd_orchestrator.base_output_dir / "test_package" / "1.0.0"
+    assert rtd_orchestrator.detected_doc_type == "readthedocs"
+    assert result == str(expected_dir)
+    mock_find.assert_called_once_with("test-package", "1.0.0")
+    mock_fetch_repo.assert_not_called()
+    mock_fetch.assert_called_once_with(RTD_HTMLZIP_URL, expected_dir)
+    mock_theme.assert_called_once_with(expected_dir)
+
+
+def test_grab_build_doc_falls_back_when_prebuilt_download_fails(
+    mocker: MockerFixture,
+    mock_scan_dependencies: dict[str, MagicMock],
+    rtd_orchestrator: Orchestrator,
+    tmp_path: Path,
+) -> None:
+    """Verify a failed download falls back to scanning and building."""
+    mocker.patch(
+        "devildex.grabbers.readthedocs_downloader.ReadTheDocsDownloader"
+        ".find_prebuilt_download",
+        return_value=RTD_HTMLZIP_URL,
+    )
+    mocker.patch(
+        "devildex.grabbers.readthedocs_downloader.ReadTheDocsDownloader"
+        ".fetch_prebuilt_docset",
+        return_value=False,
+    )
+    mock_scan_dependencies["is_mkdocs_project"].return_value = tmp_path / "mkdocs.yml"
+    mock_mkdocs = mocker.patch(
+        "devildex.grabbers.mkdocs_builder.MkDocsBuilder.generate_docset",
+        return_value="mkdocs_output",
+    )
+    rtd_orchestrator._effective_source_path = tmp_path
+
+    rtd_orchestrator.start_scan()
+    result = rtd_orchestrator.grab_build_doc()
+
+    assert result == "mkdocs_output"
+    assert rtd_orchestrator.detected_doc_type == "mkdocs"
+    mock_scan_dependencies["fetch_repo"].assert_called_once()
+    mock_mkdocs.assert_called_once()
+
+
+def test_start_scan_skips_prebuilt_docs_for_local_sources(
+    mocker: MockerFixture,
+    mock_scan_dependencies: dict[str, MagicMock],
+    rtd_orchestrator: Orchestrator,
+) -> None:
+    """Verify packages with local sources are always built from them."""
+    mock_find = mocker.patch(
+        "devildex.grabbers.readthedocs_downloader.ReadTheDocsDownloader"
+        ".find_prebuilt_download"
+    )
+    rtd_orchestrator.package_details.initial_source_path = "/local/sources"
+
+    rtd_orchestrator.start_scan()
+
+    mock_find.assert_not_called()
+    mock_scan_dependencies["fetch_repo"].assert_called_once()
+
+
+CHECKPOINT_ENV_KEY = "0123456789abcdef"
+EXPECTED_FETCHES_AFTER_CHANGE = 2
+EXPECTED_ENV_PREPARES = 2
+
+
+def test_start_scan_resumes_from_fetch_checkpoint(
+    mock_scan_dependencies: dict[str, MagicMock],
+    mock_package_details: PackageDetails,
+    tmp_path: Path,
+) -> None:
+    """Verify a checkpoint skips fetching and scanning unchanged sources."""
+    source_path = tmp_path / "source"
+    source_path.mkdir()
+    (source_path / "mkdocs.yml").write_text("site_name: test")
+    mock_scan_dependencies["is_mkdocs_project"].return_value = (
+        source_path / "mkdocs.yml"
+    )
+    saved: list = []
+    first = Orchestrator(
+        package_details=mock_package_details,
+        base_output_dir=tmp_path / "output",
+        on_checkpoint=saved.append,
+    )
+    first._effective_source_path = source_path
+    first.start_scan()
+
+    mock_package_details.checkpoint = saved[-1]
+    resumed = Orchestrator(mock_package_details, base_output_dir=tmp_path / "output")
+    resumed.start_scan()
+
+    assert saved[-1].stage == FETCH_STAGE
+    assert resumed.detected_doc_type == "mkdocs"
+    assert resumed._effective_source_path == source_path
+    mock_scan_dependencies["fetch_repo"].assert_called_once()
+    mock_scan_dependencies["is_mkdocs_project"].assert_called_once()
+
+    (source_path / "docs").mkdir()
+    (source_path / "docs" / "index.md").write_text("# Test")
+    Orchestrator(mock_package_details, base_output_dir=tmp_path).start_scan()
+
+    assert (
+        mock_scan_dependencies["fetch_repo"].call_count == EXPECTED_FETCHES_AFTER_CHANGE
+    )
+
+
+def test_prepare_environment_resumes_from_env_checkpoint(
+    mocker: MockerFixture, mock_package_details: PackageDetails, tmp_path: Path
+) -> None:
+    """Verify an installed checkpointed environment is not prepared again."""
+
+    def prepare(
+        _builder: MkDocsBuilder, _source_path: Path, context: BuildContext
+    ) -> bool:
+        context.env_key = CHECKPOINT_ENV_KEY
+        return True
+
+    mock_prepare = mocker.patch.object(
+        MkDocsBuilder, "prepare_environment", autospec=True, side_effect=prepare
+    )
+    mock_cache = mocker.patch(
+        "devildex.orchestrator.documentation_orchestrator.BuildEnvCache"
+    )
+    saved: list = []
+
+    def orchestrator() -> Orchestrator:
+        created = Orchestrator(
+            package_details=mock_package_details,
+            base_output_dir=tmp_path / "output",
+            on_checkpoint=saved.append,
+        )
+        created.detected_doc_type = "mkdocs"
+        created._effective_source_path = tmp_path
+        return created
+
+    assert orchestrator().prepare_environment()
+    mock_package_details.checkpoint = saved[-1]
+    mock_cache.return_value.is_ready.return_value = True
+    assert orchestrator().prepare_environment()
+    mock_cache.return_value.is_ready.return_value = False
+    assert orchestrator().prepare_environment()
+
+    assert saved[0].stage == ENV_STAGE
+    assert saved[0].env_key == CHECKPOINT_ENV_KEY
+    assert mock_prepare.call_count == EXPECTED_ENV_PREPARES
+    mock_cache.return_value.is_ready.assert_called_with(CHECKPOINT_ENV_KEY)
+
+
 def test_get_detected_doc_type(mock_orchestrator: Orchestrator) -> None:
     """Test get detected doc type."""
     mock_orchestrator.detected_doc_type = "sphinx"
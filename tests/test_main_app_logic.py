@@ -24,6 +24,7 @@ def app(mocker: MockerFixture) -> DevilDexApp:
     """
     mocker.patch("wx.App.__init__", return_value=None)
     mock_core = mocker.MagicMock(name="DevilDexCore")
+    mock_core.get_docset_url.return_value = None
     app_instance = DevilDexApp(core=mock_core)
     app_instance.actions_panel = mocker.MagicMock(name="ActionsPanel")
     mocker.patch("wx.MessageBox")
@@ -64,11 +65,13 @@ def test_on_delete_docset_success(app: DevilDexApp, mocker: MockerFixture) -> No
     selected_data = {"name": "test-package", "docset_path": "/fake/path/docset"}
     mocker.patch.object(app, "get_selected_row", return_value=selected_data)
     mocker.patch.object(app, "_confirm_deletion", return_value=True)
-    app.core.delete_docset_build.return_value = (True, "Success")
+    app.core.delete_docset_files.return_value = (True, "Success")
     mock_handle_success = mocker.patch.object(app, "_handle_delete_success")
     mock_update_buttons = mocker.patch.object(app, "_update_action_buttons_state")
     app.on_delete_docset(event=None)
-    app.core.delete_docset_build.assert_called_once_with("/fake/path/docset")
+    app.core.delete_docset_files.assert_called_once_with(
+        "test-package", None, "/fake/path/docset"
+    )
     mock_handle_success.assert_called_once_with("test-package")
     mock_update_buttons.assert_called_once()
 
@@ -79,7 +82,7 @@ def test_on_delete_docset_user_cancels(app: DevilDexApp, mocker: MockerFixture)
     mocker.patch.object(app, "get_selected_row", return_value=selected_data)
     mocker.patch.object(app, "_confirm_deletion", return_value=False)
     app.on_delete_docset(event=None)
-    app.core.delete_docset_build.assert_not_called()
+    app.core.delete_docset_files.assert_not_called()
 
 
 def test_on_delete_docset_core_fails(app: DevilDexApp, mocker: MockerFixture) -> None:
@@ -87,11 +90,13 @@ def test_on_delete_docset_core_fails(app: DevilDexApp, mocker: MockerFixture) ->
     selected_data = {"name": "test-package", "docset_path": "/fake/path/docset"}
     mocker.patch.object(app, "get_selected_row", return_value=selected_data)
     mocker.patch.object(app, "_confirm_deletion", return_value=True)
-    app.core.delete_docset_build.return_value = (False, "Permission denied")
+    app.core.delete_docset_files.return_value = (False, "Permission denied")
     mock_handle_failure = mocker.patch.object(app, "_handle_delete_failure")
     mock_update_buttons = mocker.patch.object(app, "_update_action_buttons_state")
     app.on_delete_docset(event=None)
-    app.core.delete_docset_build.assert_called_once_with("/fake/path/docset")
+    app.core.delete_docset_files.assert_called_once_with(
+        "test-package", None, "/fake/path/docset"
+    )
     mock_handle_failure.assert_called_once_with("test-package", "Permission denied")
     mock_update_buttons.assert_called_once()
 
@@ -105,7 +110,7 @@ def test_on_delete_docset_no_path_in_data(
     app.on_delete_docset(event=None)
     wx.MessageBox.assert_called_once()
     assert "No docset path found" in wx.MessageBox.call_args[0][0]
-    app.core.delete_docset_build.assert_not_called()
+    app.core.delete_docset_files.assert_not_called()
 
 
 def test_on_generate_docset_success(app: DevilDexApp, mocker: MockerFixture) -> None:
@@ -190,6 +195,25 @@ def test_on_open_docset_success(app: DevilDexApp, mocker: MockerFixture) -> None
     )
 
 
+def test_on_open_docset_prefers_docset_server(
+    app: DevilDexApp, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify a docset is opened from the local docset server when it runs."""
+    app.selected_row_index = 0
+    docset_path = tmp_path / "test-package" / "1.0"
+    docset_path.mkdir(parents=True)
+    (docset_path / "index.html").write_text("<p>docs</p>")
+    selected_data = {"name": "test-package", "docset_path": str(docset_path)}
+    mocker.patch.object(app, "get_selected_row", return_value=selected_data)
+    mocker.patch.object(app, "show_document")
+    server_url = "http://127.0.0.1:8002/docsets/test-package/1.0/index.html"
+    app.core.get_docset_url.return_value = server_url
+    app.document_view_panel = mocker.MagicMock()
+    app.on_open_docset(event=mocker.MagicMock())
+    app.core.get_docset_url.assert_called_once_with(docset_path, "index.html")
+    app.document_view_panel.load_url.assert_called_once_with(server_url)
+
+
 def test_on_open_docset_no_selection(app: DevilDexApp, mocker: MockerFixture) -> None:
     """Verify it shows a message box if no package is selected."""
     app.selected_row_index = None
@@ -0,0 +1,156 @@
+"""Tests for the generation pipeline."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from devildex.orchestrator.documentation_orchestrator import Orchestrator
+from devildex.orchestrator.pipeline import ENV_STAGE, GenerationPipeline, PipelineJob
+from devildex.utils.progress import TaskProgress, current_task_progress, task_context
+
+WAIT_SECONDS = 5
+CLOSE_TIMEOUT_SECONDS = 0.5
+
+
+@pytest.fixture
+def pipeline() -> Iterator[GenerationPipeline]:
+    """Run a pipeline with one worker per stage."""
+    generation_pipeline = GenerationPipeline(
+        fetch_workers=1, env_workers=1, build_workers=1
+    )
+    yield generation_pipeline
+    generation_pipeline.close()
+
+
+def _orchestrator(name: str, doc_type: str = "sphinx") -> MagicMock:
+    """Return a fake orchestrator detecting doc_type."""
+    orchestrator = MagicMock(spec=Orchestrator)
+    orchestrator.package_details = MagicMock()
+    orchestrator.package_details.name = name
+    orchestrator.get_detected_doc_type.return_value = doc_type
+    orchestrator.prepare_environment.return_value = True
+    orchestrator.grab_build_doc.return_value = f"/docsets/{name}"
+    return orchestrator
+
+
+def _collect(results: dict) -> Callable[[Orchestrator, str | bool], None]:
+    """Return the on_done callback storing results by package name."""
+
+    def on_done(orchestrator: Orchestrator, result: str | bool) -> None:
+        results[orchestrator.package_details.name] = result
+
+    return on_done
+
+
+def test_pipeline_fetches_next_package_while_building(
+    pipeline: GenerationPipeline,
+) -> None:
+    """Verify a package is fetched while the previous one is still building."""
+    second_fetched = threading.Event()
+    first = _orchestrator("first")
+    second = _orchestrator("second")
+    first.grab_build_doc.side_effect = lambda: (
+        "/docsets/first" if second_fetched.wait(WAIT_SECONDS) else False
+    )
+    second.start_scan.side_effect = second_fetched.set
+    results: dict = {}
+
+    pipeline.submit(PipelineJob(first, _collect(results)))
+    pipeline.submit(PipelineJob(second, _collect(results)))
+
+    assert pipeline.wait(WAIT_SECONDS)
+    assert results == {"first": "/docsets/first", "second": "/docsets/second"}
+
+
+def test_pipeline_runs_stages_in_task_context(pipeline: GenerationPipeline) -> None:
+    """Verify every stage of a job sees the progress bound for its task."""
+    progress = TaskProgress("task")
+    orchestrator = _orchestrator("package")
+    seen: list = []
+    orchestrator.start_scan.side_effect = lambda: seen.append(current_task_progress())
+    orchestrator.prepare_environment.side_effect = lambda: (
+        seen.append(current_task_progress()) or True
+    )
+    orchestrator.grab_build_doc.side_effect = lambda: (
+        seen.append(current_task_progress()) or "/docsets/package"
+    )
+    started = threading.Event()
+
+    pipeline.submit(
+        PipelineJob(
+            orchestrator,
+            _collect({}),
+            context=task_context(progress),
+            on_start=started.set,
+        )
+    )
+
+    assert pipeline.wait(WAIT_SECONDS)
+    assert started.is_set()
+    assert seen == [progress, progress, progress]
+    assert current_task_progress() is None
+
+
+def test_pipeline_stops_jobs_early(pipeline: GenerationPipeline) -> None:
+    """Verify undetected packages and failing stages end without building."""
+    undetected = _orchestrator("undetected", doc_type="unknown")
+    broken = _orchestrator("broken")
+    broken.prepare_environment.side_effect = RuntimeError("boom")
+    results: dict = {}
+
+    pipeline.submit(PipelineJob(undetected, _collect(results)))
+    pipeline.submit(PipelineJob(broken, _collect(results)))
+
+    assert pipeline.wait(WAIT_SECONDS)
+    assert results == {"undetected": False, "broken": False}
+    undetected.prepare_environment.assert_not_called()
+    broken.grab_build_doc.assert_not_called()
+
+
+def test_pipeline_stops_jobs_after_requested_stage(
+    pipeline: GenerationPipeline,
+) -> None:
+    """Verify a job stopping after the env stage is never built."""
+    orchestrator = _orchestrator("prewarmed")
+    results: dict = {}
+
+    pipeline.submit(PipelineJob(orchestrator, _collect(results), stop_after=ENV_STAGE))
+
+    assert pipeline.wait(WAIT_SECONDS)
+    assert results == {"prewarmed": True}
+    orchestrator.prepare_environment.assert_called_once()
+    orchestrator.grab_build_doc.assert_not_called()
+
+
+def test_pipeline_close_cancels_queued_jobs(pipeline: GenerationPipeline) -> None:
+    """Verify close returns promptly and fails the jobs that have not started."""
+    release_build = threading.Event()
+    building = threading.Event()
+
+    def build_until_released() -> str | bool:
+        building.set()
+        return "/docsets/running" if release_build.wait(WAIT_SECONDS) else False
+
+    running = _orchestrator("running")
+    running.grab_build_doc.side_effect = build_until_released
+    queued = [_orchestrator(f"queued-{index}") for index in range(3)]
+    results: dict = {}
+    pipeline.submit(PipelineJob(running, _collect(results)))
+    assert building.wait(WAIT_SECONDS)
+    for orchestrator in queued:
+        pipeline.submit(PipelineJob(orchestrator, _collect(results)))
+
+    started = time.monotonic()
+    pipeline.close(timeout=CLOSE_TIMEOUT_SECONDS)
+    elapsed = time.monotonic() - started
+    release_build.set()
+
+    assert elapsed < WAIT_SECONDS
+    assert all(results[o.package_details.name] is False for o in queued)
+    for orchestrator in queued:
+        orchestrator.grab_build_doc.assert_not_called()
+    assert pipeline.wait(WAIT_SECONDS)
+    assert results["running"] == "/docsets/running"
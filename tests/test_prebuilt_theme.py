@@ -0,0 +1,46 @@
+"""Tests for theming prebuilt documentation."""
+
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from devildex.theming.prebuilt import (
+    PREBUILT_STATIC_DIRNAME,
+    PREBUILT_STYLESHEET,
+    apply_prebuilt_theme,
+    theme_page,
+)
+
+THEMED_PAGES = 2
+RTD_PAGE = (
+    "<html><head><title>Docs</title>\n"
+    '<script src="/_/static/javascript/readthedocs-doc-embed.js"></script>\n'
+    "</head><body>Docs</body></html>"
+)
+
+
+def test_theme_page_links_stylesheet_and_drops_online_scripts() -> None:
+    """Verify the stylesheet is linked once and RTD-only scripts removed."""
+    themed = theme_page(RTD_PAGE, "_devildex/style.css")
+
+    assert 'href="_devildex/style.css"' in themed
+    assert "readthedocs-doc-embed" not in themed
+    assert theme_page(themed, "_devildex/style.css") == themed
+    assert theme_page("<p>fragment</p>", "style.css") == "<p>fragment</p>"
+
+
+def test_apply_prebuilt_theme(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Verify every page links the installed stylesheet relative to itself."""
+    mocker.patch(
+        "devildex.theming.asset_bundle.ConfigManager.get_shared_theme_assets",
+        return_value=False,
+    )
+    (tmp_path / "api").mkdir()
+    (tmp_path / "index.html").write_text(RTD_PAGE)
+    (tmp_path / "api" / "module.html").write_text(RTD_PAGE)
+
+    assert apply_prebuilt_theme(tmp_path) == THEMED_PAGES
+    assert (tmp_path / PREBUILT_STATIC_DIRNAME / PREBUILT_STYLESHEET).is_file()
+    nested_href = f"../{PREBUILT_STATIC_DIRNAME}/{PREBUILT_STYLESHEET}"
+    assert nested_href in (tmp_path / "api" / "module.html").read_text()
+    assert apply_prebuilt_theme(tmp_path) == 0
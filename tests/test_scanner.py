@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 from devildex.scanner.scanner import (
+    cached_scans,
     has_docstrings,
     is_mkdocs_project,
     is_sphinx_project,
@@ -191,3 +192,14 @@ def test_has_docstrings_handles_os_error_in_file(
     py_file.touch()
     mocker.patch("builtins.open", side_effect=OSError("Permission denied"))
     assert has_docstrings(str(tmp_path)) is False
+
+
+def test_cached_scans_memoizes_within_block(tmp_path: Path) -> None:
+    """Verify scan results are reused only while a cache is bound."""
+    (tmp_path / "module.py").write_text('"""Docstring."""\n')
+    with cached_scans() as cache:
+        assert has_docstrings(str(tmp_path)) is True
+        (tmp_path / "module.py").unlink()
+        assert has_docstrings(str(tmp_path)) is True
+    assert ("has_docstrings", str(tmp_path)) in cache
+    assert has_docstrings(str(tmp_path)) is False
@@ -0,0 +1,158 @@
+"""Tests for the static API documentation engine."""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.docstrings.static_api import (
+    PARAM_KEYWORD_ONLY,
+    discover_modules,
+    generate_api_docs,
+    parse_module,
+)
+
+THEME_DIR = (
+    Path(__file__).parent.parent
+    / "src"
+    / "devildex"
+    / "theming"
+    / "devildex_pdoc3_theme"
+)
+EXPECTED_MODULE_COUNT = 3
+
+SAMPLE_MODULE = '''
+"""Sample module."""
+
+import missing_dependency_that_is_never_installed
+from .base import Base
+
+__all__ = ["Widget", "make_widget", "DEFAULT_SIZE"]
+
+DEFAULT_SIZE = 3
+"""Size used when none is given."""
+
+UNDOCUMENTED = 4
+
+
+class Widget(Base):
+    """A widget."""
+
+    kind: str = "plain"
+
+    def __init__(self, size: int = DEFAULT_SIZE) -> None:
+        """Create a widget."""
+        self.size = size
+        """The widget size."""
+
+    @property
+    def area(self) -> int:
+        """The widget area."""
+        return self.size * self.size
+
+    @staticmethod
+    def build(*, size: int) -> "Widget":
+        """Build a widget."""
+        return Widget(size)
+
+    def resize(self, factor: float, /, *args, strict=False, **kwargs) -> None:
+        """Resize the widget."""
+
+
+async def make_widget(size: int = 1) -> Widget:
+    """Make a widget asynchronously."""
+    return Widget(size)
+
+
+def hidden() -> None:
+    """Not exported by __all__."""
+'''
+
+
+@pytest.fixture
+def sample_package(tmp_path: Path) -> Path:
+    """Create a package whose import would fail."""
+    package_dir = tmp_path / "samplepkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text('"""Sample package."""\n')
+    (package_dir / "base.py").write_text(
+        'class Base:\n    """Base class."""\n\n    def ping(self) -> str:\n'
+        '        """Answer."""\n        return "pong"\n'
+    )
+    (package_dir / "widgets.py").write_text(textwrap.dedent(SAMPLE_MODULE))
+    (package_dir / "_private.py").write_text("X = 1\n")
+    (package_dir / "broken.py").write_text("def broken(:\n")
+    return package_dir
+
+
+def test_discover_modules_skips_private(sample_package: Path) -> None:
+    """Verify private modules are not documented."""
+    names = {name for name, _path, _is_pkg in discover_modules(sample_package)}
+    assert names == {
+        "samplepkg",
+        "samplepkg.base",
+        "samplepkg.widgets",
+        "samplepkg.broken",
+    }
+
+
+def test_parse_module_extracts_api(sample_package: Path) -> None:
+    """Verify the AST yields the public API without importing the module."""
+    info = parse_module("samplepkg.widgets", sample_package / "widgets.py", False)
+
+    assert info is not None
+    assert "samplepkg.widgets" not in sys.modules
+    assert [f.name for f in info.functions] == ["make_widget"]
+    assert info.functions[0].is_async
+    assert [v.name for v in info.variables] == ["DEFAULT_SIZE"]
+    widget = info.classes[0]
+    assert widget.bases == ["samplepkg.base.Base"]
+    assert widget.docstring == "A widget.\n\nCreate a widget."
+    members = {m.name: m for m in [*widget.functions, *widget.variables]}
+    assert members["area"].kind == "prop"
+    assert members["size"].instance_var
+    assert not members["build"].is_method
+    assert members["build"].params[0].kind == PARAM_KEYWORD_ONLY
+    assert members["resize"].is_method
+
+
+def test_parse_module_returns_none_on_syntax_error(sample_package: Path) -> None:
+    """Verify an unparsable file is skipped instead of failing the build."""
+    assert parse_module("samplepkg.broken", sample_package / "broken.py", False) is None
+
+
+def test_generate_api_docs_renders_pdoc_pages(
+    sample_package: Path, tmp_path: Path
+) -> None:
+    """Verify pages are written at pdoc's URLs with signatures and links."""
+    output_dir = tmp_path / "out"
+
+    pages = generate_api_docs(sample_package, output_dir, THEME_DIR)
+
+    assert len(pages) == EXPECTED_MODULE_COUNT
+    assert (output_dir / "samplepkg" / "index.html").is_file()
+    widgets_page = (output_dir / "samplepkg" / "widgets.html").read_text()
+    assert "async def" in widgets_page
+    assert "factor: float, /, *args, strict=False, **kwargs" in widgets_page
+    assert 'href="base.html#samplepkg.base.Base"' in widgets_page
+    assert "hidden" not in widgets_page
+    base_page = (output_dir / "samplepkg" / "base.html").read_text()
+    assert "samplepkg.widgets.Widget" in base_page
+
+
+def test_generate_api_docs_in_worker_processes(
+    mocker: MockerFixture, sample_package: Path, tmp_path: Path
+) -> None:
+    """Verify the process pool produces the same pages as a serial run."""
+    mocker.patch("devildex.docstrings.static_api.PARALLEL_MIN_MODULES", 1)
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+
+    generate_api_docs(sample_package, serial_dir, THEME_DIR, workers=1)
+    generate_api_docs(sample_package, parallel_dir, THEME_DIR, workers=2)
+
+    for page in serial_dir.rglob("*.html"):
+        parallel_page = parallel_dir / page.relative_to(serial_dir)
+        assert parallel_page.read_text() == page.read_text()
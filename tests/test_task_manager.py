@@ -122,6 +122,24 @@ def test_on_animation_tick_updates_grid_for_active_tasks(
     )
 
 
+def test_on_animation_tick_shows_reported_percent(
+    task_manager: GenerationTaskManager, mock_callbacks: dict, mock_owner: MagicMock
+) -> None:
+    """Verify the status cell shows the build percentage once it is known."""
+    task_manager.active_tasks = {"pkg-123": 1}
+    task_manager._record_progress(
+        "pkg-123", {"phase": "reading sources", "percent": 42}
+    )
+
+    task_manager._on_animation_tick(None)
+
+    mock_callbacks["update_grid"].assert_called_once_with(
+        1,
+        mock_owner.docset_status_col_grid_idx,
+        f"{task_manager.animation_frames[1]} 42%",
+    )
+
+
 def test_perform_generation_in_thread_handles_success(
     task_manager: GenerationTaskManager, mock_core: MagicMock, mocker: MockerFixture
 ) -> None:
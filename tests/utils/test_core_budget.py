@@ -0,0 +1,52 @@
+"""Tests for the core_budget module."""
+
+import threading
+
+from devildex.utils.core_budget import CoreBudget
+
+TOTAL_CORES = 8
+FIRST_BUILD_CORES = 6
+SHARED_CORES = 9
+CONCURRENT_BUILDS = 3
+WAIT_SECONDS = 5
+
+
+def test_reserve_grants_free_cores() -> None:
+    """Verify concurrent reservations share the cores without oversubscribing."""
+    budget = CoreBudget(TOTAL_CORES)
+    with budget.reserve(FIRST_BUILD_CORES) as first:
+        assert first == FIRST_BUILD_CORES
+        with budget.reserve() as second:
+            assert second == TOTAL_CORES - FIRST_BUILD_CORES
+            assert budget.free_cores == 0
+    assert budget.free_cores == TOTAL_CORES
+
+
+def test_reserve_shares_cores_between_concurrent_builds() -> None:
+    """Verify three concurrent builds get a fair share and never oversubscribe."""
+    budget = CoreBudget(SHARED_CORES, expected_builds=CONCURRENT_BUILDS)
+    granted = [budget.acquire() for _ in range(CONCURRENT_BUILDS)]
+
+    assert granted == [SHARED_CORES // CONCURRENT_BUILDS] * CONCURRENT_BUILDS
+    assert budget.free_cores == 0
+    for cores in granted:
+        budget.release(cores)
+    assert budget.free_cores == SHARED_CORES
+
+
+def test_reserve_waits_for_a_free_core() -> None:
+    """Verify a build waits instead of running beyond the total cores."""
+    budget = CoreBudget(1)
+    reserved: list[int] = []
+    first = budget.acquire()
+    waiter = threading.Thread(target=lambda: reserved.append(budget.acquire()))
+    waiter.start()
+    waiter.join(timeout=0.1)
+
+    assert waiter.is_alive()
+    assert budget.free_cores == 0
+    budget.release(first)
+    waiter.join(timeout=WAIT_SECONDS)
+    assert reserved == [1]
+    budget.release(reserved[0])
+    assert budget.free_cores == 1
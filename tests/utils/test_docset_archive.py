@@ -0,0 +1,82 @@
+"""Tests for the docset_archive module."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from devildex.utils.docset_archive import (
+    archive_path_for,
+    forget_archive,
+    is_docset_archive,
+    normalize_member,
+    open_archive,
+    pack_docset,
+)
+
+INDEX_HTML = "<html><body>index</body></html>"
+THEME_CSS = "body { color: black; }\n"
+
+
+@pytest.fixture
+def docset_dir(tmp_path: Path) -> Path:
+    """Create a docset whose static directory links to a shared bundle."""
+    bundle = tmp_path / "theme_assets" / "pdoc3-abc"
+    bundle.mkdir(parents=True)
+    (bundle / "theme.css").write_text(THEME_CSS)
+    docset = tmp_path / "docsets" / "pkg" / "1.0"
+    (docset / "sub").mkdir(parents=True)
+    (docset / "index.html").write_text(INDEX_HTML)
+    (docset / "sub" / "page.html").write_text("<p>page</p>")
+    (docset / "static").symlink_to(bundle.resolve(), target_is_directory=True)
+    return docset
+
+
+def test_pack_docset_replaces_tree_with_archive(docset_dir: Path) -> None:
+    """Verify packing leaves a self-contained archive instead of the tree."""
+    archive_path = pack_docset(docset_dir)
+
+    assert archive_path == archive_path_for(docset_dir)
+    assert is_docset_archive(archive_path)
+    assert not docset_dir.exists()
+    with zipfile.ZipFile(archive_path) as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == [
+            "index.html",
+            "static/theme.css",
+            "sub/page.html",
+        ]
+
+
+def test_open_archive_reads_pages_by_path(docset_dir: Path) -> None:
+    """Verify pages are read by path and the handle is reused."""
+    archive_path = pack_docset(docset_dir)
+
+    archive = open_archive(archive_path)
+
+    assert archive is open_archive(archive_path)
+    assert archive.entry_page() == "index.html"
+    assert archive.read("index.html").decode() == INDEX_HTML
+    assert archive.read("./static/theme.css").decode() == THEME_CSS
+    assert archive.has_page("sub/page.html")
+    with pytest.raises(KeyError):
+        archive.read("missing.html")
+    forget_archive(archive_path)
+
+
+def test_entry_page_falls_back_to_top_level_html(tmp_path: Path) -> None:
+    """Verify an archive without index.html opens its first top-level page."""
+    docset = tmp_path / "pkg"
+    docset.mkdir()
+    (docset / "pkg.html").write_text("<p>pkg</p>")
+    archive_path = pack_docset(docset, remove_tree=False)
+
+    assert docset.is_dir()
+    assert open_archive(archive_path).entry_page() == "pkg.html"
+    forget_archive(archive_path)
+
+
+@pytest.mark.parametrize("page", ["../secret.html", "/etc/passwd", "a/../../b"])
+def test_normalize_member_rejects_escaping_paths(page: str) -> None:
+    """Verify pages outside the archive root are rejected."""
+    assert normalize_member(page) is None
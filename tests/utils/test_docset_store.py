@@ -0,0 +1,90 @@
+"""Tests for the docset_store module."""
+
+from pathlib import Path
+
+import pytest
+
+from devildex.utils.docset_store import DocsetStore, file_digest, store_docset_tree
+
+SHARED_CSS = "body { color: black; }\n"
+
+
+def _make_docset(root: Path, version: str, page: str) -> Path:
+    """Create a small docset tree with one shared and one unique file."""
+    tree = root / "docsets" / "pkg" / version
+    (tree / "_static").mkdir(parents=True)
+    (tree / "_static" / "theme.css").write_text(SHARED_CSS)
+    (tree / "index.html").write_text(page)
+    return tree
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> DocsetStore:
+    """Provide a store next to the docsets."""
+    return DocsetStore(tmp_path / "store")
+
+
+def test_ingest_tree_deduplicates_across_versions(
+    store: DocsetStore, tmp_path: Path
+) -> None:
+    """Verify identical files of two versions end up as one stored object."""
+    first = _make_docset(tmp_path, "1.0", "<p>one</p>")
+    second = _make_docset(tmp_path, "2.0", "<p>two</p>")
+
+    first_result = store.ingest_tree(first)
+    second_result = store.ingest_tree(second)
+
+    assert set(first_result.manifest) == {"_static/theme.css", "index.html"}
+    assert second_result.new_objects == 1
+    assert second_result.linked_files == 1
+    assert second_result.saved_bytes == len(SHARED_CSS)
+    css_digest = file_digest(first / "_static" / "theme.css")
+    assert (first / "_static" / "theme.css").samefile(second / "_static" / "theme.css")
+    assert store.object_path(css_digest).samefile(second / "_static" / "theme.css")
+    assert (second / "index.html").read_text() == "<p>two</p>"
+
+
+def test_ingest_tree_again_is_a_no_op(store: DocsetStore, tmp_path: Path) -> None:
+    """Verify re-storing an already stored tree links nothing new."""
+    tree = _make_docset(tmp_path, "1.0", "<p>one</p>")
+    store.ingest_tree(tree)
+
+    result = store.ingest_tree(tree)
+
+    assert result.new_objects == 0
+    assert result.linked_files == 0
+
+
+def test_release_removes_only_unreferenced_objects(
+    store: DocsetStore, tmp_path: Path
+) -> None:
+    """Verify objects still linked by another docset survive a deletion."""
+    first = _make_docset(tmp_path, "1.0", "<p>one</p>")
+    second = _make_docset(tmp_path, "2.0", "<p>two</p>")
+    manifest = store.ingest_tree(first).manifest
+    store.ingest_tree(second)
+
+    for path in first.rglob("*"):
+        if path.is_file():
+            path.unlink()
+    removed = store.release(manifest.values())
+
+    assert removed == 1
+    assert not store.object_path(manifest["index.html"]).exists()
+    assert store.object_path(manifest["_static/theme.css"]).exists()
+
+
+def test_store_docset_tree_releases_replaced_content(
+    store: DocsetStore, tmp_path: Path
+) -> None:
+    """Verify a rebuild drops the objects only the previous build used."""
+    tree = _make_docset(tmp_path, "1.0", "<p>old</p>")
+    old_manifest = store_docset_tree(store.store_dir, tree)
+
+    (tree / "index.html").unlink()
+    (tree / "index.html").write_text("<p>new</p>")
+    new_manifest = store_docset_tree(store.store_dir, tree, old_manifest)
+
+    assert not store.object_path(old_manifest["index.html"]).exists()
+    assert store.object_path(new_manifest["index.html"]).exists()
+    assert store.collect_garbage() == 0
@@ -0,0 +1,101 @@
+"""Tests for the installer_backend module."""
+
+import sys
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from devildex.utils.installer_backend import (
+    PipBackend,
+    UvBackend,
+    backend_for_pip_executable,
+    resolve_installer_backend,
+)
+from devildex.utils.venv_utils import _build_install_command
+
+UV_PATH = "/usr/bin/uv"
+
+
+def test_resolve_auto_prefers_uv_when_available(mocker: MockerFixture) -> None:
+    """Verify 'auto' selects uv when it is on PATH."""
+    mocker.patch("shutil.which", return_value=UV_PATH)
+    backend = resolve_installer_backend("auto")
+    assert isinstance(backend, UvBackend)
+    assert backend.uv_executable == UV_PATH
+
+
+def test_resolve_auto_falls_back_to_pip(mocker: MockerFixture) -> None:
+    """Verify 'auto' falls back to pip when uv is missing."""
+    mocker.patch("shutil.which", return_value=None)
+    assert isinstance(resolve_installer_backend("auto"), PipBackend)
+
+
+def test_resolve_uv_missing_falls_back_to_pip(mocker: MockerFixture) -> None:
+    """Verify an explicit 'uv' preference still works without uv installed."""
+    mocker.patch("shutil.which", return_value=None)
+    assert isinstance(resolve_installer_backend("uv"), PipBackend)
+
+
+def test_resolve_pip_ignores_uv(mocker: MockerFixture) -> None:
+    """Verify 'pip' is honoured even when uv is available."""
+    mocker.patch("shutil.which", return_value=UV_PATH)
+    assert isinstance(resolve_installer_backend("pip"), PipBackend)
+
+
+def test_resolve_reads_config_when_no_preference(mocker: MockerFixture) -> None:
+    """Verify the configured backend is used when no preference is passed."""
+    mock_config = mocker.patch("devildex.utils.installer_backend.ConfigManager")
+    mock_config.return_value.get_installer_backend.return_value = "pip"
+    mocker.patch("shutil.which", return_value=UV_PATH)
+    assert isinstance(resolve_installer_backend(), PipBackend)
+
+
+def test_uv_commands(tmp_path: Path) -> None:
+    """Verify uv venv and install commands target the venv's interpreter."""
+    backend = UvBackend(UV_PATH)
+    venv_cmd = backend.venv_command(tmp_path / "venv")
+    assert venv_cmd[:3] == [UV_PATH, "venv", "--seed"]
+    assert venv_cmd[-1] == str(tmp_path / "venv")
+
+    pip_executable = str(tmp_path / "venv" / "bin" / "pip")
+    install_cmd = backend.install_command(pip_executable, ["sphinx"])
+    assert install_cmd[:4] == [UV_PATH, "pip", "install", "--python"]
+    assert install_cmd[-1] == "sphinx"
+    assert not backend.needs_pip_upgrade
+
+
+def test_pip_commands(tmp_path: Path) -> None:
+    """Verify pip venv and install commands keep the historical flags."""
+    backend = PipBackend()
+    assert backend.venv_command(tmp_path) == [
+        sys.executable,
+        "-m",
+        "venv",
+        str(tmp_path),
+    ]
+    assert backend.install_command("/venv/bin/pip", ["-e", "."]) == [
+        "/venv/bin/pip",
+        "install",
+        "--disable-pip-version-check",
+        "--no-python-version-warning",
+        "-e",
+        ".",
+    ]
+
+
+def test_backend_for_uv_created_venv(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Verify installs into a uv-created venv go through uv."""
+    (tmp_path / "pyvenv.cfg").write_text("home = /usr/bin\nuv = 0.5.0\n")
+    mocker.patch("shutil.which", return_value=UV_PATH)
+    pip_executable = str(tmp_path / "bin" / "pip")
+    assert isinstance(backend_for_pip_executable(pip_executable), UvBackend)
+    assert _build_install_command(pip_executable, ["sphinx"])[0] == UV_PATH
+
+
+def test_backend_for_pip_created_venv(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Verify installs into a venv created by python -m venv use pip."""
+    (tmp_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.13.0\n")
+    mocker.patch("shutil.which", return_value=UV_PATH)
+    pip_executable = str(tmp_path / "bin" / "pip")
+    assert isinstance(backend_for_pip_executable(pip_executable), PipBackend)
+    assert _build_install_command(pip_executable, ["sphinx"])[0] == pip_executable
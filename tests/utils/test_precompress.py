@@ -0,0 +1,44 @@
+"""Tests for the precompress module."""
+
+import gzip
+import os
+from pathlib import Path
+
+from devildex.utils.precompress import (
+    GZIP_SUFFIX,
+    MIN_PRECOMPRESS_BYTES,
+    precompress_docset,
+)
+
+LARGE_CSS = "body { color: black; }\n" * 100
+
+
+def test_precompress_docset_writes_variants_once(tmp_path: Path) -> None:
+    """Verify large text files get a variant and unchanged ones are skipped."""
+    (tmp_path / "style.css").write_text(LARGE_CSS)
+    (tmp_path / "small.html").write_text("<p>x</p>")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" * MIN_PRECOMPRESS_BYTES)
+
+    written = precompress_docset(tmp_path)
+
+    variant = tmp_path / f"style.css{GZIP_SUFFIX}"
+    assert written >= 1
+    assert gzip.decompress(variant.read_bytes()).decode() == LARGE_CSS
+    assert not (tmp_path / f"small.html{GZIP_SUFFIX}").exists()
+    assert not (tmp_path / f"logo.png{GZIP_SUFFIX}").exists()
+    assert precompress_docset(tmp_path) == 0
+
+
+def test_precompress_docset_refreshes_outdated_variant(tmp_path: Path) -> None:
+    """Verify a variant older than its file is rebuilt."""
+    css = tmp_path / "style.css"
+    css.write_text(LARGE_CSS)
+    precompress_docset(tmp_path)
+    variant = tmp_path / f"style.css{GZIP_SUFFIX}"
+    stat = variant.stat()
+    css.write_text(LARGE_CSS * 2)
+    css_stat = css.stat()
+    os.utime(variant, ns=(stat.st_atime_ns, css_stat.st_mtime_ns - 1))
+
+    assert precompress_docset(tmp_path) >= 1
+    assert gzip.decompress(variant.read_bytes()).decode() == LARGE_CSS * 2
@@ -0,0 +1,76 @@
+"""Tests for the progress module and streaming command execution."""
+
+import sys
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from devildex.utils import venv_utils
+from devildex.utils.progress import (
+    TaskProgress,
+    bind_task_progress,
+    current_task_progress,
+    parse_progress_line,
+)
+from devildex.utils.venv_utils import execute_command
+
+HALF_DONE = 50
+TAIL_LINES = 5
+
+
+def test_parse_progress_line_sphinx_marker() -> None:
+    """Verify Sphinx progress markers are parsed, colours included."""
+    assert parse_progress_line("reading sources... [ 42%] index") == (
+        "reading sources",
+        42,
+    )
+    assert parse_progress_line(
+        "\x1b[2K\x1b[01mwriting output... \x1b[39;49;00m[100%] api"
+    ) == ("writing output", 100)
+    assert parse_progress_line("building [html]: targets for 3 source files") is None
+
+
+def test_task_progress_writes_log_lazily(tmp_path: Path) -> None:
+    """Verify the log file is created on first output and records every line."""
+    log_file = tmp_path / "tasks" / "task.log"
+    progress = TaskProgress("task", log_file)
+    assert not log_file.exists()
+
+    with bind_task_progress(progress):
+        assert current_task_progress() is progress
+        progress.start_step("Sphinx build")
+        progress.add_line("reading sources... [ 50%] index\n")
+    assert current_task_progress() is None
+
+    snapshot = progress.snapshot()
+    assert snapshot["step"] == "Sphinx build"
+    assert snapshot["percent"] == HALF_DONE
+    assert "reading sources... [ 50%] index" in log_file.read_text()
+
+
+def test_execute_command_streams_with_bounded_tail(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Verify output goes to the task log while only a tail stays in memory."""
+    mocker.patch.object(venv_utils, "OUTPUT_TAIL_LINES", TAIL_LINES)
+    log_file = tmp_path / "task.log"
+    progress = TaskProgress("task", log_file)
+    script = (
+        "import sys\n"
+        "for i in range(20):\n"
+        "    print(f'line {i}')\n"
+        "print('reading sources... [ 50%] index', end='\\r')\n"
+        "print('boom', file=sys.stderr)\n"
+    )
+
+    with bind_task_progress(progress):
+        stdout, stderr, return_code = execute_command(
+            [sys.executable, "-c", script], "Streaming test"
+        )
+
+    assert return_code == 0
+    assert len(stdout.splitlines()) == TAIL_LINES
+    assert "line 0\n" not in stdout
+    assert stderr == "boom\n"
+    assert progress.snapshot()["percent"] == HALF_DONE
+    assert "line 0" in log_file.read_text()
@@ -0,0 +1,72 @@
+"""Tests for the resource_limits module and limited command execution."""
+
+import sys
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.utils.resource_limits import ResourceLimits
+from devildex.utils.venv_utils import COMMAND_TIMEOUT_RETURN_CODE, execute_command
+
+MAX_ELAPSED_SECONDS = 20
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="needs process groups and prlimit"
+)
+
+
+def _patch_limits(mocker: MockerFixture, limits: ResourceLimits) -> None:
+    """Make execute_command use limits for every stage."""
+    mocker.patch(
+        "devildex.utils.venv_utils.ResourceLimits.for_stage", return_value=limits
+    )
+
+
+@linux_only
+def test_timeout_kills_whole_process_group(mocker: MockerFixture) -> None:
+    """Verify a hung command and the children it spawned are killed."""
+    _patch_limits(mocker, ResourceLimits(timeout_seconds=1))
+    script = (
+        "import subprocess, sys, time\n"
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        "print('started', flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    start = time.monotonic()
+
+    stdout, stderr, return_code = execute_command(
+        [sys.executable, "-c", script], "Hanging build"
+    )
+
+    assert time.monotonic() - start < MAX_ELAPSED_SECONDS
+    assert return_code == COMMAND_TIMEOUT_RETURN_CODE
+    assert stdout == "started\n"
+    assert "timed out" in stderr
+
+
+@linux_only
+def test_memory_limit_stops_runaway_allocation(mocker: MockerFixture) -> None:
+    """Verify RLIMIT_AS makes an oversized allocation fail."""
+    _patch_limits(mocker, ResourceLimits(timeout_seconds=30, memory_limit_mb=512))
+    script = "import time\ntime.sleep(0.5)\nblob = bytearray(2 * 1024 ** 3)\n"
+
+    _, stderr, return_code = execute_command(
+        [sys.executable, "-c", script], "Greedy build"
+    )
+
+    assert return_code != 0
+    assert "MemoryError" in stderr
+
+
+def test_for_stage_reads_config(mocker: MockerFixture) -> None:
+    """Verify zero values in the configuration mean unlimited."""
+    mock_config = mocker.patch("devildex.utils.resource_limits.ConfigManager")
+    mock_config.return_value.get_stage_timeout.return_value = 0
+    mock_config.return_value.get_memory_limit_mb.return_value = 1024
+    mock_config.return_value.get_cpu_limit_seconds.return_value = 0
+
+    limits = ResourceLimits.for_stage("install")
+
+    mock_config.return_value.get_stage_timeout.assert_called_once_with("install")
+    assert limits == ResourceLimits(memory_limit_mb=1024)
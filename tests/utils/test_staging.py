@@ -0,0 +1,120 @@
+"""Tests for the staging module."""
+
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.utils.staging import (
+    _exchange_paths,
+    discard_staging_dir,
+    prepare_staging_dir,
+    previous_dir_for,
+    staging_dir_for,
+    swap_in_progress,
+    swap_into_place,
+)
+
+OLD_MTIME = 1_000_000
+
+
+def test_prepare_staging_dir_seeds_with_timestamps(tmp_path: Path) -> None:
+    """Verify the staging dir starts as a copy of the output with its mtimes."""
+    final_dir = tmp_path / "docs" / "1.0"
+    final_dir.mkdir(parents=True)
+    page = final_dir / "index.html"
+    page.write_text("old")
+    os.utime(page, (OLD_MTIME, OLD_MTIME))
+
+    staging_dir = prepare_staging_dir(final_dir)
+
+    assert staging_dir == staging_dir_for(final_dir)
+    assert (staging_dir / "index.html").read_text() == "old"
+    assert (staging_dir / "index.html").stat().st_mtime == OLD_MTIME
+
+
+def test_prepare_staging_dir_without_seed(tmp_path: Path) -> None:
+    """Verify an unseeded staging dir is empty."""
+    final_dir = tmp_path / "1.0"
+    final_dir.mkdir()
+    (final_dir / "index.html").write_text("old")
+    staging_dir = prepare_staging_dir(final_dir, seed_from_final=False)
+    assert list(staging_dir.iterdir()) == []
+
+
+def test_swap_into_place_replaces_output(tmp_path: Path) -> None:
+    """Verify the staging dir replaces the output and leaves nothing behind."""
+    final_dir = tmp_path / "1.0"
+    final_dir.mkdir()
+    (final_dir / "index.html").write_text("old")
+    staging_dir = prepare_staging_dir(final_dir)
+    (staging_dir / "index.html").write_text("new")
+
+    swap_into_place(staging_dir, final_dir)
+
+    assert (final_dir / "index.html").read_text() == "new"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["1.0"]
+
+
+def test_discard_staging_dir_keeps_output(tmp_path: Path) -> None:
+    """Verify discarding a failed build leaves the previous output intact."""
+    final_dir = tmp_path / "1.0"
+    final_dir.mkdir()
+    (final_dir / "index.html").write_text("old")
+    staging_dir = prepare_staging_dir(final_dir)
+
+    discard_staging_dir(staging_dir)
+
+    assert not staging_dir.exists()
+    assert (final_dir / "index.html").read_text() == "old"
+
+
+def test_swap_into_place_exchanges_without_renaming_aside(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Verify a supported platform swaps the directories in one step."""
+    probe = tmp_path / "probe"
+    (probe / "a").mkdir(parents=True)
+    (probe / "b").mkdir()
+    if not _exchange_paths(probe / "a", probe / "b"):
+        pytest.skip("Atomic directory exchange is not supported here.")
+    final_dir = tmp_path / "1.0"
+    final_dir.mkdir()
+    (final_dir / "index.html").write_text("old")
+    staging_dir = prepare_staging_dir(final_dir)
+    (staging_dir / "index.html").write_text("new")
+    rename = mocker.spy(Path, "rename")
+
+    swap_into_place(staging_dir, final_dir)
+
+    rename.assert_not_called()
+    assert (final_dir / "index.html").read_text() == "new"
+    assert not staging_dir.exists()
+
+
+def test_swap_into_place_falls_back_to_renames(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Verify the output is still replaced where no exchange is available."""
+    mocker.patch("devildex.utils.staging._exchange_paths", return_value=False)
+    final_dir = tmp_path / "1.0"
+    final_dir.mkdir()
+    (final_dir / "index.html").write_text("old")
+    staging_dir = prepare_staging_dir(final_dir)
+    (staging_dir / "index.html").write_text("new")
+
+    swap_into_place(staging_dir, final_dir)
+
+    assert (final_dir / "index.html").read_text() == "new"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["1.0"]
+
+
+def test_swap_in_progress(tmp_path: Path) -> None:
+    """Verify a missing output with a parked previous one counts as busy."""
+    final_dir = tmp_path / "1.0"
+    assert not swap_in_progress(final_dir)
+    previous_dir_for(final_dir).mkdir()
+    assert swap_in_progress(final_dir)
+    final_dir.mkdir()
+    assert not swap_in_progress(final_dir)
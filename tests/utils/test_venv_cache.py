@@ -0,0 +1,148 @@
+"""Tests for the venv_cache module."""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from devildex.utils.installer_backend import PipBackend
+from devildex.utils.venv_cache import (
+    ENV_LOCKS_DIRNAME,
+    ENV_METADATA_FILENAME,
+    BuildEnvCache,
+    CachedVenvManager,
+    build_env_manager,
+    compute_env_key,
+)
+from devildex.utils.venv_cm import IsolatedVenvManager
+
+
+def _fake_venv_run(
+    command: list[str], **_kwargs: object
+) -> subprocess.CompletedProcess:
+    """Simulate venv creation by creating the interpreter file."""
+    if "venv" in command:
+        bin_dir = Path(command[-1]) / "bin"
+        bin_dir.mkdir(parents=True, exist_ok=True)
+        (bin_dir / "python").touch()
+        (bin_dir / "pip").touch()
+    return subprocess.CompletedProcess(command, 0, "", "")
+
+
+def _make_ready_entry(cache: BuildEnvCache, cache_key: str, last_used: float) -> None:
+    """Create a fully installed cache entry with the given last-used time."""
+    env_path = cache.env_path(cache_key)
+    (env_path / "bin").mkdir(parents=True)
+    (env_path / "bin" / "python").touch()
+    (env_path / ENV_METADATA_FILENAME).write_text(
+        json.dumps({"last_used": last_used}), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def mock_venv_run(mocker: MockerFixture) -> object:
+    """Patch subprocess.run in venv_cm to create a fake venv."""
+    return mocker.patch(
+        "devildex.utils.venv_cm.subprocess.run", side_effect=_fake_venv_run
+    )
+
+
+def test_compute_env_key_is_stable(tmp_path: Path) -> None:
+    """Verify the same inputs give the same key regardless of package order."""
+    key_a = compute_env_key("sphinx", "proj", "1.0", ["sphinx", "furo"], [], tmp_path)
+    key_b = compute_env_key("sphinx", "proj", "1.0", ["furo", "sphinx"], [], tmp_path)
+    assert key_a == key_b
+    assert key_a != compute_env_key(
+        "sphinx", "proj", "2.0", ["sphinx", "furo"], [], tmp_path
+    )
+
+
+def test_compute_env_key_tracks_requirements(tmp_path: Path) -> None:
+    """Verify changing a requirements file changes the key."""
+    req_file = tmp_path / "requirements.txt"
+    req_file.write_text("requests==2.0\n")
+    key_before = compute_env_key("mkdocs", "proj", "1.0", ["mkdocs"], [req_file])
+    req_file.write_text("requests==2.1\n")
+    key_after = compute_env_key("mkdocs", "proj", "1.0", ["mkdocs"], [req_file])
+    assert key_before != key_after
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path) -> None:
+    """Verify eviction keeps the newest entries and drops incomplete ones."""
+    cache = BuildEnvCache(cache_dir=tmp_path, max_entries=2)
+    _make_ready_entry(cache, "oldest", 1.0)
+    _make_ready_entry(cache, "middle", 2.0)
+    _make_ready_entry(cache, "newest", 3.0)
+    (tmp_path / "incomplete").mkdir()
+
+    evicted = cache.evict()
+
+    assert sorted(evicted) == ["incomplete", "oldest"]
+    remaining = [p.name for p in tmp_path.iterdir() if p.name != ENV_LOCKS_DIRNAME]
+    assert sorted(remaining) == ["middle", "newest"]
+
+
+def test_evict_skips_entries_locked_by_another_process(tmp_path: Path) -> None:
+    """Verify an entry locked through its lock file by someone else is kept."""
+    fcntl = pytest.importorskip("fcntl")
+    cache = BuildEnvCache(cache_dir=tmp_path, max_entries=1)
+    _make_ready_entry(cache, "older", 1.0)
+    _make_ready_entry(cache, "newer", 2.0)
+    (tmp_path / "installing").mkdir()
+    lock_path = cache.entry_lock("installing").lock_path
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+b") as other_holder:
+        fcntl.flock(other_holder.fileno(), fcntl.LOCK_EX)
+
+        evicted = cache.evict()
+
+    assert evicted == ["older"]
+    assert (tmp_path / "installing").is_dir()
+
+
+def test_entry_lock_is_exclusive(tmp_path: Path) -> None:
+    """Verify a held entry lock cannot be taken again until released."""
+    cache = BuildEnvCache(cache_dir=tmp_path, max_entries=1)
+    holder = cache.entry_lock("key")
+    assert holder.acquire()
+    other = cache.entry_lock("key")
+    assert not other.acquire(blocking=False)
+    holder.release()
+    assert other.acquire(blocking=False)
+    other.release()
+
+
+def test_cached_venv_is_kept_and_reused(tmp_path: Path, mock_venv_run: object) -> None:
+    """Verify a venv marked ready survives exit and is reused next time."""
+    cache = BuildEnvCache(cache_dir=tmp_path, max_entries=4)
+    with CachedVenvManager("proj", "key1", cache=cache, installer=PipBackend()) as venv:
+        assert not venv.reused
+        venv.mark_ready()
+    assert cache.is_ready("key1")
+    calls_after_first_build = mock_venv_run.call_count
+
+    with CachedVenvManager("proj", "key1", cache=cache, installer=PipBackend()) as venv:
+        assert venv.reused
+        assert venv.venv_path == cache.env_path("key1")
+    assert mock_venv_run.call_count == calls_after_first_build
+
+
+def test_cached_venv_not_ready_is_removed(
+    tmp_path: Path, mock_venv_run: object
+) -> None:
+    """Verify a venv whose install never completed is removed on exit."""
+    _ = mock_venv_run
+    cache = BuildEnvCache(cache_dir=tmp_path, max_entries=4)
+    with CachedVenvManager("proj", "key2", cache=cache, installer=PipBackend()):
+        pass
+    assert not cache.env_path("key2").exists()
+
+
+def test_build_env_manager_respects_config(mocker: MockerFixture) -> None:
+    """Verify caching can be disabled in the configuration."""
+    mock_config = mocker.patch("devildex.utils.venv_cache.ConfigManager")
+    mock_config.return_value.get_env_cache_enabled.return_value = False
+    manager = build_env_manager("proj", "key3")
+    assert type(manager) is IsolatedVenvManager